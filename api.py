@@ -2,11 +2,17 @@ from flask import Blueprint, jsonify, request
 import pandas as pd
 import numpy as np
 from data_service import DataService
-from data_viewmodel import DataViewModel
+from app.service_container import resolve
 
 api_blueprint = Blueprint('api', __name__)
-data_service = DataService()
-data_viewmodel = DataViewModel()
+
+
+def _data_service():
+    """
+    Süreç genelinde paylaşılan veri servisini döndürür (ilk çağrıda oluşturulur)
+    """
+    return resolve('legacy_data_service', DataService)
+
 
 @api_blueprint.route('/countries', methods=['GET'])
 def get_countries():
@@ -18,7 +24,7 @@ def get_countries():
         description: Ülkeler listesi başarıyla döndürüldü
     """
     try:
-        countries = data_service.get_countries()
+        countries = _data_service().get_countries()
         return jsonify(countries)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -33,7 +39,7 @@ def get_years():
         description: Yıllar listesi başarıyla döndürüldü
     """
     try:
-        years = data_service.get_years()
+        years = _data_service().get_years()
         return jsonify(years)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -56,7 +62,7 @@ def get_country_data(country_name):
         description: Ülke bulunamadı
     """
     try:
-        country_data = data_service.get_country_data(country_name)
+        country_data = _data_service().get_country_data(country_name)
         if country_data is None:
             return jsonify({'error': 'Ülke bulunamadı'}), 404
         return jsonify(country_data)
@@ -128,7 +134,7 @@ def compare_countries():
         country_stats = {}
         
         for country in countries:
-            country_data = data_service.get_country_metrics(country, metric, start_year, end_year)
+            country_data = _data_service().get_country_metrics(country, metric, start_year, end_year)
             
             if not country_data:
                 return jsonify({'error': f'{country} için veri bulunamadı'}), 404
@@ -28,6 +28,7 @@ try:
     # Data servisi ve ViewModel'i içe aktar
     from app.data_service import DataService 
     from app.data_viewmodel import DataViewModel
+    from app import service_container
     
     # API Blueprint'ini içe aktarmayı dene
     try:
@@ -43,6 +44,7 @@ except ImportError:
     try:
         from data_service import DataService
         from data_viewmodel import DataViewModel
+        import service_container
         
         # API Blueprint'ini içe aktarmayı dene
         try:
@@ -128,6 +130,15 @@ if not DATA_PATH:
     DATA_PATH = possible_paths[0]
     logger.warning(f"CSV dosyası bulunamadı. Varsayılan yol kullanılacak: {DATA_PATH}")
 
+# Büyük dosyalar için isteğe bağlı bellek tavanı (MB) - verilirse CSV parça parça yüklenir
+MEMORY_LIMIT_MB = float(os.environ['RENEWABLE_MEMORY_LIMIT_MB']) if os.environ.get('RENEWABLE_MEMORY_LIMIT_MB') else None
+
+# İsteğe bağlı dosya izleme aralığı (saniye) - verilirse CSV değiştiğinde veri yeniden yüklenir
+WATCH_INTERVAL = float(os.environ['RENEWABLE_WATCH_INTERVAL']) if os.environ.get('RENEWABLE_WATCH_INTERVAL') else None
+
+# Çok worker'lı dağıtımlarda değer matrisleri bellek eşlemeli dosyalarla paylaşılır (bkz. gunicorn.conf.py)
+SHARED_DATASET = os.environ.get('RENEWABLE_SHARED_DATASET', '').lower() in ('1', 'true', 'yes')
+
 # Global değişkenler
 data_service = None
 data_vm = None
@@ -143,8 +154,13 @@ try:
             DATA_PATH = os.path.join(current_dir, csv_files[0])
             logger.info(f"Alternatif CSV dosyası bulundu: {DATA_PATH}")
 
-    data_service = DataService(DATA_PATH)
-    data_vm = DataViewModel(data_service)
+    # Blueprint'ler de aynı örnekleri kullanır - CSV süreç başına bir kez yüklenir
+    service_container.configure(DATA_PATH, use_snapshot=True, memory_limit_mb=MEMORY_LIMIT_MB,
+                                shared_dataset=SHARED_DATASET, model_registry=True)
+    data_service = service_container.get_data_service()
+    data_vm = service_container.get_data_viewmodel()
+    if WATCH_INTERVAL:
+        data_service.start_watcher(WATCH_INTERVAL)
     logger.info("Uygulama başarıyla başlatıldı. Data servis ve ViewModel oluşturuldu.")
 except Exception as e:
     logger.error(f"Uygulama başlatılırken hata: {str(e)}")
@@ -170,20 +186,26 @@ except Exception as e:
                 self.data_service = service
             def get_countries(self):
                 return {'success': False, 'countries': [], 'error': 'Veriler yüklenemedi', 'count': 0}
-            def get_country_data(self, country_name):
+            def get_indicators(self):
+                return {'success': False, 'indicators': [], 'error': 'Veriler yüklenemedi', 'count': 0}
+            def get_country_data(self, country_name, indicator=None, start_year=None, end_year=None, step=1):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
             def get_data_overview(self):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
+            def get_data_overview_json(self):
+                return json.dumps(self.get_data_overview()).encode('utf-8')
             def get_feature_importance(self, country_name=None):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
             def get_country_prediction(self, country_name, future_year):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
             def get_model_metrics(self, country_name=None):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
-            def train_model(self, country_name=None):
+            def train_model(self, country_name=None, indicator=None):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
             def get_countries_comparison(self, countries):
                 return {'success': False, 'error': 'Veriler yüklenemedi'}
+            def reload_data(self):
+                return {'success': False, 'error': 'Veriler yüklenemedi'}
         
         data_service = DummyDataService()
         data_vm = DummyViewModel(data_service)
@@ -203,11 +225,24 @@ def get_countries_deprecated():
     """Eski yol - uyumluluk için korundu"""
     return get_countries()
 
+@app.route('/api/data/indicators', methods=['GET'])
+def get_indicators():
+    """Veri setindeki göstergelerin (Series Code) listesini döndürür"""
+    try:
+        return jsonify(data_vm.get_indicators())
+    except Exception as e:
+        logger.error(f"Gösterge listesi alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/data/country/<country_name>', methods=['GET'])
 def get_country_data(country_name):
-    """Belirli bir ülkenin verilerini döndürür"""
+    """Belirli bir ülkenin verilerini döndürür (?indicator=SERIES_CODE, ?from=&to=&step= ile yıl aralığı)"""
     try:
-        country_data = data_vm.get_country_data(country_name)
+        indicator = request.args.get('indicator', None)
+        country_data = data_vm.get_country_data(country_name, indicator,
+                                                start_year=request.args.get('from', None, type=int),
+                                                end_year=request.args.get('to', None, type=int),
+                                                step=request.args.get('step', 1, type=int))
         logger.info(f"{country_name} için veri döndürüldü")
         return jsonify(country_data)
     except Exception as e:
@@ -218,9 +253,10 @@ def get_country_data(country_name):
 def get_overview_data():
     """Veri seti için genel bakış bilgilerini döndürür"""
     try:
-        overview_data = data_vm.get_data_overview()
+        # Genel bakış veri sürümü başına bir kez JSON'a yazılır
+        overview_json = data_vm.get_data_overview_json()
         logger.info("Genel bakış verileri döndürüldü")
-        return jsonify(overview_data)
+        return app.response_class(overview_json, mimetype='application/json')
     except Exception as e:
         logger.error(f"Genel bakış verileri alınırken hata: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -250,25 +286,16 @@ def get_prediction(country_name):
             logger.error(f"Ülke veri setinde bulunamadı: {country_name}")
             return jsonify({'success': False, 'error': f"Ülke veri setinde bulunamadı: {country_name}"}), 404
         
-        # DEMO MODU DEVRE DIŞI - Sadece gerçek modeli kullanacağız
-        force_real_model = True
-            
-        # Model eğitimini zorla
-        logger.info(f"{country_name} için model eğitimi zorla başlatılıyor")
-        
+        # Model veri sürümü başına bir kez eğitilir; güncel model varsa yeniden eğitilmez,
+        # aynı ülke için eşzamanlı istekler tek bir eğitimi bekler
         try:
-            # Modeli eğit
-            train_result = data_vm.data_service.train_model(country_name)
-            logger.info(f"Model eğitimi sonucu: {train_result}")
-            
+            train_result = data_vm.data_service.ensure_model(country_name)
+            if train_result.get('trained'):
+                logger.info(f"{country_name} için model eğitildi: {train_result.get('model', 'Bilinmeyen model')}")
             if not train_result.get('success', False):
                 logger.error(f"Model eğitimi başarısız: {train_result}")
-                if not force_real_model:
-                    raise ValueError(f"Model eğitimi başarısız: {train_result.get('error', 'Bilinmeyen hata')}")
         except Exception as train_error:
             logger.error(f"Model eğitimi sırasında hata: {str(train_error)}")
-            if not force_real_model:
-                raise train_error
         
         # Tahmin işlemini zorla
         logger.info(f"{country_name} için {future_year} yılı tahmin hesaplanıyor...")
@@ -449,13 +476,11 @@ def get_prediction(country_name):
             
         except Exception as predict_error:
             logger.error(f"Gerçek modelle tahmin yapılırken hata: {str(predict_error)}")
-            if force_real_model:
-                return jsonify({
-                    'success': False, 
-                    'error': f"Model tahmini başarısız: {str(predict_error)}",
-                    'is_error': True
-                }), 500
-            raise predict_error
+            return jsonify({
+                'success': False, 
+                'error': f"Model tahmini başarısız: {str(predict_error)}",
+                'is_error': True
+            }), 500
         
     except Exception as e:
         logger.error(f"Genel tahmin hatası: {str(e)}")
@@ -505,12 +530,24 @@ def train_model():
     """Model eğitimi yapar"""
     try:
         country_name = request.args.get('country', None)
-        result = data_vm.train_model(country_name)
+        indicator = request.args.get('indicator', None)
+        result = data_vm.train_model(country_name, indicator)
         logger.info(f"Model eğitimi yapıldı: {country_name or 'Genel'}")
         return jsonify(result)
     except Exception as e:
         logger.error(f"Model eğitimi sırasında hata: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/data/reload', methods=['POST'])
+def reload_data():
+    """CSV dosyasını yeniden yükler; yalnızca değişen ülkelerin model ve tahminleri silinir"""
+    try:
+        result = data_vm.reload_data()
+        logger.info(f"Veri yeniden yükleme: sürüm {result.get('data_version')}")
+        return jsonify(result), 200 if result.get('success') else 500
+    except Exception as e:
+        logger.error(f"Veri yeniden yüklenirken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
         
 # API durumunu kontrol etmek için endpoint
 @app.route('/api/status', methods=['GET'])
@@ -520,7 +557,9 @@ def api_status():
         # Veri servisinin durumunu kontrol et
         data_status = {
             'total_countries': len(data_service.countries) if data_service.countries else 0,
-            'data_loaded': data_service.melted_data is not None and len(data_service.melted_data) > 0
+            'data_loaded': getattr(data_service, 'store', None) is not None,
+            'prediction_cache': getattr(data_service, 'cache_stats', {}),
+            'data_version': getattr(data_service, 'data_version', None)
         }
         
         return jsonify({
@@ -2,15 +2,21 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 import os
-import joblib
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
 
+from app.utils.model_registry import ModelRegistry, dataset_hash, registry_dir
+
+# scikit-learn ve joblib modül yüklenirken değil, ilk model eğitiminde içe aktarılır.
+# matplotlib/seaborn bu modülde kullanılmadığı için hiç yüklenmez.
+
+# Ülke modellerinin hiperparametreleri; özellikler veya eğitim değiştiğinde 'version' artırılmalı
+MODEL_PARAMS = {
+    'n_estimators': 100,
+    'random_state': 42,
+    'features': ['Year', 'Year_Squared', 'Year_Log', 'Year_Diff'],
+    'version': 1
+}
+
 
 class DataModel:
     """
@@ -40,8 +46,8 @@ class DataModel:
         self.model_metrics = {}      # Model metrikleri
         self.feature_importance = {} # Özellik önemleri
         
-        # Modeller için klasörü oluştur
-        os.makedirs('models', exist_ok=True)
+        # Eğitilen modeller ülke, hiperparametreler ve veri özeti ile anahtarlanarak diske yazılır
+        self.registry = ModelRegistry(registry_dir(data_path))
         
         # Verileri yükle
         self.load_data()
@@ -214,24 +220,10 @@ class DataModel:
         
         # Belirli bir ülke için model eğitimi
         try:
-            # Model dosya adı
-            model_filename = f"models/{country_name.replace(' ', '_')}_model.joblib"
-            scaler_filename = f"models/{country_name.replace(' ', '_')}_scaler.joblib"
-            
-            # Eğer model zaten eğitilmiş ve yeniden eğitim istenmiyorsa, varolan modeli kullan
-            if os.path.exists(model_filename) and not force_retrain:
-                self.models[country_name] = joblib.load(model_filename)
-                self.scalers[country_name] = joblib.load(scaler_filename)
-                
-                # Önbelleğe özellik önemleri eklenmiş mi kontrol et
-                if country_name not in self.feature_importance:
-                    self.feature_importance[country_name] = self._calculate_feature_importance(country_name)
-                
-                return {
-                    'success': True,
-                    'message': f"{country_name} için kayıtlı model yüklendi",
-                    'metrics': self.model_metrics.get(country_name, {})
-                }
+            from sklearn.model_selection import train_test_split
+            from sklearn.ensemble import RandomForestRegressor
+            from sklearn.preprocessing import StandardScaler
+            from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
             
             # Ülke verisini filtrele
             country_data = self.melted_df[self.melted_df['Country Name'] == country_name].sort_values('Year')
@@ -242,6 +234,27 @@ class DataModel:
                     'message': f"{country_name} için yeterli veri yok (en az 10 yıl gerekli)"
                 }
             
+            # Model kaydı anahtarı: ülke, model türü, hiperparametreler ve eğitim verisinin özeti
+            registry_key = (country_name, 'RandomForest', MODEL_PARAMS,
+                            dataset_hash(country_data['Year'], country_data['Renewable_Value']))
+            
+            # Aynı veriyle eğitilmiş model kayıttaysa ve yeniden eğitim istenmiyorsa onu kullan
+            entry = None if force_retrain else self.registry.get(*registry_key)
+            if entry is not None:
+                self.models[country_name] = entry['model']['model']
+                self.scalers[country_name] = entry['model']['scaler']
+                self.model_metrics[country_name] = entry['result'].get('metrics', {})
+                
+                # Önbelleğe özellik önemleri eklenmiş mi kontrol et
+                if country_name not in self.feature_importance:
+                    self.feature_importance[country_name] = self._calculate_feature_importance(country_name)
+                
+                return {
+                    'success': True,
+                    'message': f"{country_name} için kayıtlı model yüklendi",
+                    'metrics': self.model_metrics[country_name]
+                }
+            
             # Özellikler oluştur
             X = pd.DataFrame({
                 'Year': country_data['Year'],
@@ -261,7 +274,8 @@ class DataModel:
             X_test_scaled = scaler.transform(X_test)
             
             # Random Forest modeli eğit
-            model = RandomForestRegressor(n_estimators=100, random_state=42)
+            model = RandomForestRegressor(n_estimators=MODEL_PARAMS['n_estimators'],
+                                          random_state=MODEL_PARAMS['random_state'])
             model.fit(X_train_scaled, y_train)
             
             # Model performansını değerlendir
@@ -281,9 +295,11 @@ class DataModel:
             # Özellik önemlerini hesapla
             self.feature_importance[country_name] = self._calculate_feature_importance(country_name)
             
-            # Modeli diske kaydet
-            joblib.dump(model, model_filename)
-            joblib.dump(scaler, scaler_filename)
+            # Modeli model kaydına yaz (atomik; diğer süreçler yeniden eğitmez)
+            try:
+                self.registry.put(*registry_key, {'model': model, 'scaler': scaler}, {'metrics': metrics})
+            except Exception as e:
+                print(f"Model kayda yazılamadı ({country_name}): {e}")
             
             return {
                 'success': True,
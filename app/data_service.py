@@ -6,22 +6,41 @@ Bu modül verilere erişim, veri işleme ve model eğitimi için gerekli servisl
 import pandas as pd
 import numpy as np
 import os
+import json
 import logging
 from datetime import datetime
 import math
 import random
+import threading
+import time
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from app.models.country_model import SMALL_SAMPLE_ROWS, fit_country_model, fit_linear_models, model_spec
+from app.models.global_model import GlobalForecaster, fit_global_model, global_model_spec
+from app.utils import country_groups, country_query, parallel_training, shared_dataset, snapshot, trends
+from app.utils.country_store import (
+    CountryStatsTable, CountryYearStore, CountryYearStoreBuilder, SimilarityIndex, to_float64, to_float_list,
+    year_range_slice
+)
+from app.utils.country_index import CountryIndex, CountryList, load_aliases
+from app.utils.model_registry import ModelRegistry, dataset_hash, registry_dir
+from app.utils.year_labels import decode_year_labels
 
-# XGBoost'u import etmeyi deneyin, eğer yüklü değilse RandomForest kullanılacak
-try:
-    from xgboost import XGBRegressor
-    has_xgboost = True
-except ImportError:
-    has_xgboost = False
+# scikit-learn ve XGBoost modül yüklenirken değil, ilk model eğitiminde içe aktarılır;
+# yalnızca veri sorgulayan istekler ve worker başlatma bu maliyeti ödemez.
+@lru_cache(maxsize=None)
+def _xgb_regressor():
+    """
+    XGBRegressor sınıfını ilk çağrıda içe aktarır.
+    
+    Returns:
+        XGBRegressor sınıfı, XGBoost yüklü değilse None (RandomForest kullanılır)
+    """
+    try:
+        from xgboost import XGBRegressor
+        return XGBRegressor
+    except ImportError:
+        return None
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -34,19 +53,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Ön işleme adımlarının sürümü - temizleme/melt mantığı değiştiğinde artırılmalı,
+# böylece eski anlık görüntüler (snapshot) otomatik olarak geçersiz sayılır
+PIPELINE_VERSION = "3"
+
+# Dosyada 'Series Code' sütunu yoksa tek göstergenin saklandığı anahtar
+DEFAULT_INDICATOR = 'default'
+
+# Birden fazla gösterge içeren dosyalarda varsayılan gösterge (yenilenebilir enerji payı)
+PREFERRED_INDICATOR = 'EG.FEC.RNEW.ZS'
+
+# Akışlı yüklemede satır başına bellek tahmini için okunan örnek satır sayısı
+STREAM_SAMPLE_ROWS = 1000
+
+# Bir parça işlenirken satır başına bellekte tutulan yaklaşık kopya sayısı
+# (ham parça, sayısal dönüşüm, interpolasyon ve float değer bloğu)
+STREAM_WORKING_COPIES = 4
+
 class DataService:
     """
     Veri işlemleri için servis sınıfı.
     Bu sınıf veri okuma, temizleme, analiz ve model eğitimi gibi veri ile ilgili tüm işlemlerden sorumludur.
     """
     
-    def __init__(self, data_path: str = None):
+    def __init__(self, data_path: str = None, use_snapshot: bool = False,
+                 memory_limit_mb: Optional[float] = None, shared_dataset: bool = False,
+                 model_registry: bool = False):
         """
         DataService sınıfı başlatıcı
         
         Args:
             data_path (str, optional): Verilerin bulunduğu CSV dosyasının yolu. 
                                        Eğer None ise varsayılan konum kullanılır.
+            use_snapshot (bool, optional): True ise ön işlenmiş veri, CSV içeriğinin özeti ile
+                                           anahtarlanan ikili bir anlık görüntüden yüklenir ve
+                                           yoksa ilk yüklemeden sonra oluşturulur.
+            memory_limit_mb (float, optional): Verilirse CSV tek seferde okunmaz; bu bellek tavanına
+                                               göre boyutlandırılan parçalar halinde okunup temizlenir
+                                               ve doğrudan gösterge küplerine eklenir.
+            shared_dataset (bool, optional): True ise değer matrisleri CSV içeriği ile anahtarlanan
+                                             bellek eşlemeli dosyalardan salt okunur kullanılır;
+                                             dosyalar yoksa ilk yükleyen süreç tarafından yazılır.
+                                             Aynı makinedeki worker'lar matrisleri kopyalamadan paylaşır.
+            model_registry (bool, optional): True ise eğitilen ülke modelleri ülke, model türü,
+                                             hiperparametreler ve eğitim verisinin özeti ile anahtarlanarak
+                                             diske yazılır; aynı anahtarlı model ilk kullanımda diskten
+                                             yüklenir, yeniden eğitilmez.
         """
         # Başlangıçta tüm dosya yollarını kontrol edelim
         if data_path:
@@ -100,48 +152,165 @@ class DataService:
                 self.data_path = default_path
                 logger.warning(f"CSV dosyası bulunamadı, varsayılan yol kullanılacak: {default_path}")
         
+        self.use_snapshot = use_snapshot
+        self.memory_limit_mb = memory_limit_mb
+        self.shared_dataset = shared_dataset
         self.raw_data = None
         self.data = None
-        self.melted_data = None
+        # Birincil sorgu deposu: gösterge (Series Code) başına ülke × yıl float32 küpü.
+        # melted_data varsayılan göstergenin küpünden türetilir.
+        self.stores: Dict[str, CountryYearStore] = {}
+        self.default_indicator: Optional[str] = None
+        self._melted_data = None
         self.models = {}
+        self.registry: Optional[ModelRegistry] = ModelRegistry(registry_dir(self.data_path)) if model_registry else None
         self.predictions_cache = {}
+        self.cache_stats = {'hits': 0, 'misses': 0}
+        # Model anahtarı -> modelin eğitildiği verinin damgası (bayatlık kontrolü için)
+        self._model_stamps: Dict[str, str] = {}
+        # Model anahtarı başına eğitim kilidi: aynı model için eşzamanlı istekler tek eğitimi bekler
+        self._training_locks: Dict[str, threading.Lock] = {}
+        self._training_locks_guard = threading.Lock()
+        # Ülke veya gösterge bazında önceden hesaplanmış özetler:
+        # (özet adı, gösterge, ülke ya da göstergenin tamamı için None) -> değer
+        self.aggregate_cache: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
         self.countries = None
+        self.country_index: Optional[CountryIndex] = None
+        # Her yeniden yüklemede değişiklik varsa artan veri sürümü
+        self.data_version = 1
+        self._source_mtime = None
+        self._reload_lock = threading.RLock()
+        self._watcher = None
+        self._watcher_stop = None
+        self.watch_interval = None
+        self._hash_cache = None
+        # Ülke grubu tanımları ilk kullanımda okunur: CSV ile aynı dizindeki yapılandırma dosyası
+        # salt okunur varsayılanlardır, çalışma zamanı tanımları ayrı dosyaya yazılır
+        self.groups_path = os.path.join(os.path.dirname(os.path.abspath(self.data_path)), country_groups.GROUPS_FILE)
+        self.group_overrides_path = country_groups.overrides_path(self.data_path)
+        self._groups: Optional[Dict[str, country_groups.CountryGroup]] = None
+        self._groups_mtime = None
         
         # Veri yükleme
         try:
-            self._load_data()
-            self._preprocess_data()
-            logger.info("Veri başarıyla yüklendi ve ön işleme tamamlandı.")
+            if self.shared_dataset and self._attach_shared_dataset():
+                logger.info("Paylaşılan veri setine salt okunur bağlanıldı, CSV ayrıştırma atlandı.")
+            else:
+                if self.use_snapshot and self._load_snapshot():
+                    logger.info("Veri anlık görüntüden yüklendi, CSV ayrıştırma atlandı.")
+                else:
+                    if self.memory_limit_mb:
+                        self._stream_data()
+                    else:
+                        self._load_data()
+                        self._preprocess_data()
+                    if self.use_snapshot:
+                        self._save_snapshot()
+                    logger.info("Veri başarıyla yüklendi ve ön işleme tamamlandı.")
+                if self.shared_dataset:
+                    self._publish_shared_dataset()
+            self._source_mtime = self._file_mtime()
         except Exception as e:
             logger.error(f"Veri yükleme veya ön işleme sırasında hata: {str(e)}")
             raise
     
+    @property
+    def melted_data(self) -> Optional[pd.DataFrame]:
+        """
+        Uzun formattaki veri (ülke, yıl, değer satırları).
+        
+        Veri ülke × yıl küpünde tutulur; bu çerçeve yalnızca ihtiyaç duyan eski
+        kodlar için ilk erişimde küpten türetilir ve saklanır.
+        
+        Returns:
+            Optional[pd.DataFrame]: Uzun formattaki veri, veri yoksa None
+        """
+        if self._melted_data is None and self.store is not None:
+            self._melted_data = self.store.to_melted()
+        return self._melted_data
+    
+    @melted_data.setter
+    def melted_data(self, frame: Optional[pd.DataFrame]) -> None:
+        """
+        Uzun formattaki veriyi doğrudan atar ve küpü bu veriden yeniden oluşturur.
+        Küp oluşturulamıyorsa (ör. 'Country Name' sütunu yoksa) küp boşaltılır.
+        """
+        self._melted_data = frame
+        self.stores = {}
+        self.default_indicator = None
+        self.aggregate_cache = {}
+        if frame is None:
+            return
+        try:
+            self._set_stores(self._build_stores(frame), keep_melted=True)
+        except ValueError as e:
+            logger.debug(f"Atanan veriden küp oluşturulamadı: {str(e)}")
+    
+    @property
+    def store(self) -> Optional[CountryYearStore]:
+        """
+        Varsayılan göstergenin ülke × yıl küpü (veri yoksa None).
+        """
+        return self.stores.get(self.default_indicator)
+    
+    @staticmethod
+    def _build_stores(melted: pd.DataFrame) -> Dict[str, CountryYearStore]:
+        """
+        Uzun formattaki veriyi gösterge (Series Code) başına bir küpe ayırır.
+        
+        Args:
+            melted (pd.DataFrame): Uzun formattaki veri
+            
+        Returns:
+            Dict[str, CountryYearStore]: Gösterge kodu -> küp (dosya sırasıyla)
+        """
+        if 'Series Code' not in melted.columns or melted['Series Code'].isna().all():
+            return {DEFAULT_INDICATOR: CountryYearStore.from_melted(melted)}
+        
+        return {
+            str(code): CountryYearStore.from_melted(group)
+            for code, group in melted.groupby('Series Code', sort=False)
+        }
+    
+    def _set_stores(self, stores: Dict[str, CountryYearStore], keep_melted: bool = False) -> None:
+        """
+        Gösterge küplerini, varsayılan göstergeyi ve ülke listesini günceller.
+        
+        Args:
+            stores (Dict[str, CountryYearStore]): Gösterge kodu -> küp
+            keep_melted (bool): False ise uzun format bir sonraki erişimde küpten yeniden türetilir
+        """
+        self.stores = stores
+        if PREFERRED_INDICATOR in stores:
+            self.default_indicator = PREFERRED_INDICATOR
+        else:
+            self.default_indicator = next(iter(stores), None)
+        if not keep_melted:
+            self._melted_data = None
+        
+        countries = set()
+        codes = {}
+        for store in stores.values():
+            countries.update(store.countries)
+            if 'Country Code' in store.row_meta.columns:
+                codes.update(
+                    (code, name) for code, name in zip(store.row_meta['Country Code'], store.countries)
+                    if isinstance(code, str)
+                )
+        # Ad, ISO3 kodu ve takma adlar tek bir hash indeksinden kanonik ada çözülür
+        self.country_index = CountryIndex(countries, codes, load_aliases())
+        self.countries = CountryList(self.country_index.names, self.country_index)
+        
+        # Varsayılan göstergenin istatistik tablosu yüklemede hazırlanır, diğerleri ilk istekte
+        if self.store is not None:
+            self.store.stats_table()
+    
     def _load_data(self) -> None:
         """
         CSV dosyasından ham verileri yükler.
         """
         try:
-            # Dosyanın varlığını kontrol et
-            if not os.path.exists(self.data_path):
-                # Çalışma dizininde yer alabilecek diğer olası CSV dosyalarını ara
-                current_dir = os.getcwd()
-                csv_files = [f for f in os.listdir(current_dir) if f.endswith('.csv')]
-                
-                if csv_files:
-                    self.data_path = os.path.join(current_dir, csv_files[0])
-                    logger.info(f"CSV dosyası bulunamadı, onun yerine bulundu: {self.data_path}")
-                else:
-                    # data klasörünü kontrol et
-                    data_dir = os.path.join(current_dir, "data")
-                    if os.path.exists(data_dir):
-                        csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
-                        if csv_files:
-                            self.data_path = os.path.join(data_dir, csv_files[0])
-                            logger.info(f"CSV dosyası data klasöründe bulundu: {self.data_path}")
-                        else:
-                            raise FileNotFoundError(f"CSV dosyası bulunamadı: {self.data_path} ve hiçbir dizinde başka CSV dosyası yok")
-                    else:
-                        raise FileNotFoundError(f"CSV dosyası bulunamadı: {self.data_path} ve çalışma dizininde başka CSV dosyası yok")
+            self._locate_data_file()
             
             # Dosyayı oku - farklı encoding'leri dene
             logger.info(f"CSV dosyası yükleniyor: {self.data_path}")
@@ -164,34 +333,7 @@ class DataService:
                 raise ValueError("CSV dosyası boş veya doğru yüklenemedi.")
                 
             # Gerekli kontrolleri yap - Country Name sütunu var mı?
-            if 'Country Name' not in self.raw_data.columns:
-                # Belki ülke sütunu farklı bir isimdedir, sütun isimlerini kontrol et
-                column_names = self.raw_data.columns.tolist()
-                logger.info(f"CSV sütunları: {column_names}")
-                
-                # Ülke adı olabilecek sütunları kontrol et
-                country_column_candidates = ['Country', 'Nation', 'Country_Name', 'CountryName', 'Ülke', 'Ülke Adı']
-                found_column = None
-                
-                for col in country_column_candidates:
-                    if col in self.raw_data.columns:
-                        logger.info(f"'Country Name' yerine '{col}' sütunu bulundu")
-                        found_column = col
-                        break
-                
-                if found_column:
-                    # Bulunan sütunu Country Name olarak yeniden adlandır
-                    self.raw_data = self.raw_data.rename(columns={found_column: 'Country Name'})
-                    logger.info(f"'{found_column}' sütunu 'Country Name' olarak yeniden adlandırıldı")
-                else:
-                    # İlk sütunu Country Name olarak kullan
-                    if len(self.raw_data.columns) > 0:
-                        logger.warning(f"'Country Name' sütunu bulunamadı. İlk sütun: {self.raw_data.columns[0]}")
-                        # İlk sütunu Country Name olarak yeniden adlandıralım
-                        self.raw_data = self.raw_data.rename(columns={self.raw_data.columns[0]: 'Country Name'})
-                        logger.info(f"İlk sütun 'Country Name' olarak yeniden adlandırıldı.")
-                    else:
-                        raise ValueError("CSV dosyasında 'Country Name' sütunu bulunamadı ve veri yapısı beklenenden farklı.")
+            self.raw_data = self._normalize_country_column(self.raw_data)
             
             # Değer kontrolü - kaç satır ve sütun var?
             row_count = len(self.raw_data)
@@ -213,6 +355,165 @@ class DataService:
             self.raw_data = pd.DataFrame()
             raise Exception(f"Veri yüklenirken hata oluştu: {str(e)}")
     
+    def _locate_data_file(self) -> None:
+        """
+        CSV dosyası verilen yolda yoksa çalışma dizininde ve data klasöründe başka bir CSV arar.
+        
+        Raises:
+            FileNotFoundError: Hiçbir yerde CSV dosyası bulunamazsa
+        """
+        # Dosyanın varlığını kontrol et
+        if not os.path.exists(self.data_path):
+            # Çalışma dizininde yer alabilecek diğer olası CSV dosyalarını ara
+            current_dir = os.getcwd()
+            csv_files = [f for f in os.listdir(current_dir) if f.endswith('.csv')]
+            
+            if csv_files:
+                self.data_path = os.path.join(current_dir, csv_files[0])
+                logger.info(f"CSV dosyası bulunamadı, onun yerine bulundu: {self.data_path}")
+            else:
+                # data klasörünü kontrol et
+                data_dir = os.path.join(current_dir, "data")
+                if os.path.exists(data_dir):
+                    csv_files = [f for f in os.listdir(data_dir) if f.endswith('.csv')]
+                    if csv_files:
+                        self.data_path = os.path.join(data_dir, csv_files[0])
+                        logger.info(f"CSV dosyası data klasöründe bulundu: {self.data_path}")
+                    else:
+                        raise FileNotFoundError(f"CSV dosyası bulunamadı: {self.data_path} ve hiçbir dizinde başka CSV dosyası yok")
+                else:
+                    raise FileNotFoundError(f"CSV dosyası bulunamadı: {self.data_path} ve çalışma dizininde başka CSV dosyası yok")
+    
+    @staticmethod
+    def _normalize_country_column(frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Ülke adı sütununu 'Country Name' olarak adlandırır.
+        
+        Args:
+            frame (pd.DataFrame): Ham veri (veya akışlı yüklemede ilk parça)
+            
+        Returns:
+            pd.DataFrame: 'Country Name' sütununa sahip veri
+        
+        Raises:
+            ValueError: Veride hiç sütun yoksa
+        """
+        if 'Country Name' not in frame.columns:
+            # Belki ülke sütunu farklı bir isimdedir, sütun isimlerini kontrol et
+            column_names = frame.columns.tolist()
+            logger.info(f"CSV sütunları: {column_names}")
+            
+            # Ülke adı olabilecek sütunları kontrol et
+            country_column_candidates = ['Country', 'Nation', 'Country_Name', 'CountryName', 'Ülke', 'Ülke Adı']
+            found_column = None
+            
+            for col in country_column_candidates:
+                if col in frame.columns:
+                    logger.info(f"'Country Name' yerine '{col}' sütunu bulundu")
+                    found_column = col
+                    break
+            
+            if found_column:
+                # Bulunan sütunu Country Name olarak yeniden adlandır
+                frame = frame.rename(columns={found_column: 'Country Name'})
+                logger.info(f"'{found_column}' sütunu 'Country Name' olarak yeniden adlandırıldı")
+            else:
+                # İlk sütunu Country Name olarak kullan
+                if len(frame.columns) > 0:
+                    logger.warning(f"'Country Name' sütunu bulunamadı. İlk sütun: {frame.columns[0]}")
+                    # İlk sütunu Country Name olarak yeniden adlandıralım
+                    frame = frame.rename(columns={frame.columns[0]: 'Country Name'})
+                    logger.info(f"İlk sütun 'Country Name' olarak yeniden adlandırıldı.")
+                else:
+                    raise ValueError("CSV dosyasında 'Country Name' sütunu bulunamadı ve veri yapısı beklenenden farklı.")
+        
+        return frame
+    
+    @staticmethod
+    def _detect_year_columns(frame: pd.DataFrame) -> List[str]:
+        """
+        Yıl sütunlarını belirler (YRbir, YRiki, vb.). YR ile başlayan sütun yoksa
+        değerlerinin yarısından fazlası sayısal olan sütunlar kullanılır.
+        
+        Args:
+            frame (pd.DataFrame): Ham veri veya ilk parçası
+            
+        Returns:
+            List[str]: Yıl sütunları
+            
+        Raises:
+            ValueError: Yıl sütunu bulunamazsa
+        """
+        year_columns = [col for col in frame.columns if str(col).startswith('YR')]
+        
+        if not year_columns:
+            # YR ile başlayan sütun yoksa, sayısal değer içerebilecek sütunları bul
+            potential_year_columns = []
+            for col in frame.columns:
+                # İlk 4 sütunu atla (muhtemelen meta veri)
+                if col not in ['Country Name', 'Country Code', 'Series Name', 'Series Code']:
+                    try:
+                        # Sütunun sayısal değerlerini kontrol et
+                        numeric_values = pd.to_numeric(frame[col], errors='coerce')
+                        # NaN olmayan sayısal değerlerin oranı
+                        numeric_ratio = numeric_values.notna().mean()
+                        if numeric_ratio > 0.5:  # Eğer değerlerin yarısından fazlası sayısalsa
+                            potential_year_columns.append(col)
+                    except:
+                        pass
+            
+            if potential_year_columns:
+                year_columns = potential_year_columns
+                logger.info(f"YR ile başlayan sütunlar bulunamadı, bunun yerine potansiyel yıl sütunları kullanılacak: {year_columns}")
+            else:
+                logger.error("Yıl veya sayısal veri sütunları bulunamadı")
+                raise ValueError("Yıl sütunları bulunamadı")
+        
+        return year_columns
+    
+    @staticmethod
+    def _clean_year_columns(frame: pd.DataFrame, year_columns: List[str]) -> Dict[str, int]:
+        """
+        Yıl sütunlarını yerinde temizler: sayıya dönüştürür, negatifleri NaN yapar ve
+        eksikleri satır içinde (interpolasyon, ileri/geri doldurma) tamamlar.
+        
+        Tüm adımlar satır bazlı olduğundan veri parça parça da işlenebilir.
+        
+        Args:
+            frame (pd.DataFrame): Temizlenecek veri
+            year_columns (List[str]): Yıl sütunları
+            
+        Returns:
+            Dict[str, int]: Sütun başına NaN yapılan negatif değer sayısı
+        """
+        # Sayısal sütunları float tipine dönüştür
+        for col in year_columns:
+            # Önce noktaları virgüle çevir (Türkçe locale için)
+            if frame[col].dtype == 'object':
+                # Virgül yerine nokta kullanılan değerleri düzelt
+                frame[col] = frame[col].astype(str).str.replace(',', '.', regex=False)
+            
+            # Şimdi sayısal değere dönüştür
+            frame[col] = pd.to_numeric(frame[col], errors='coerce')
+        
+        # Eksik değerleri doldurmadan önce negatif değerleri kontrol et
+        negative_counts = {}
+        for col in year_columns:
+            neg_count = (frame[col] < 0).sum()
+            if neg_count > 0:
+                negative_counts[col] = int(neg_count)
+                frame.loc[frame[col] < 0, col] = np.nan
+        
+        # Eksik değerleri doldur
+        # Önce doğrusal interpolasyon
+        frame[year_columns] = frame[year_columns].interpolate(method='linear', axis=1, limit_direction='both')
+        
+        # Kalan eksik değerleri forward/backward filling ile doldur
+        frame[year_columns] = frame[year_columns].fillna(method='ffill', axis=1)
+        frame[year_columns] = frame[year_columns].fillna(method='bfill', axis=1)
+        
+        return negative_counts
+    
     def _preprocess_data(self) -> None:
         """
         Ham verileri temizler ve analize hazır hale getirir.
@@ -222,59 +523,20 @@ class DataService:
             self.data = self.raw_data.dropna(subset=['Country Name']).copy()
             
             # Yıl sütunlarını belirle (YRbir, YRiki, vb.)
-            year_columns = [col for col in self.data.columns if str(col).startswith('YR')]
-            
-            if not year_columns:
-                # YR ile başlayan sütun yoksa, sayısal değer içerebilecek sütunları bul
-                potential_year_columns = []
-                for col in self.data.columns:
-                    # İlk 4 sütunu atla (muhtemelen meta veri)
-                    if col not in ['Country Name', 'Country Code', 'Series Name', 'Series Code']:
-                        try:
-                            # Sütunun sayısal değerlerini kontrol et
-                            numeric_values = pd.to_numeric(self.data[col], errors='coerce')
-                            # NaN olmayan sayısal değerlerin oranı
-                            numeric_ratio = numeric_values.notna().mean()
-                            if numeric_ratio > 0.5:  # Eğer değerlerin yarısından fazlası sayısalsa
-                                potential_year_columns.append(col)
-                        except:
-                            pass
-                
-                if potential_year_columns:
-                    year_columns = potential_year_columns
-                    logger.info(f"YR ile başlayan sütunlar bulunamadı, bunun yerine potansiyel yıl sütunları kullanılacak: {year_columns}")
-                else:
-                    logger.error("Yıl veya sayısal veri sütunları bulunamadı")
-                    raise ValueError("Yıl sütunları bulunamadı")
+            year_columns = self._detect_year_columns(self.data)
             
-            # Sayısal sütunları float tipine dönüştür
-            for col in year_columns:
-                # Önce noktaları virgüle çevir (Türkçe locale için)
-                if self.data[col].dtype == 'object':
-                    # Virgül yerine nokta kullanılan değerleri düzelt
-                    self.data[col] = self.data[col].astype(str).str.replace(',', '.', regex=False)
-                
-                # Şimdi sayısal değere dönüştür
-                self.data[col] = pd.to_numeric(self.data[col], errors='coerce')
-            
-            # Eksik değerleri doldurmadan önce negatif değerleri kontrol et
-            for col in year_columns:
-                neg_count = (self.data[col] < 0).sum()
-                if neg_count > 0:
-                    logger.warning(f"{col} sütununda {neg_count} adet negatif değer var. Bunlar NaN ile değiştirilecek.")
-                    self.data.loc[self.data[col] < 0, col] = np.nan
-            
-            # Eksik değerleri doldur
-            # Önce doğrusal interpolasyon
-            self.data[year_columns] = self.data[year_columns].interpolate(method='linear', axis=1, limit_direction='both')
-            
-            # Kalan eksik değerleri forward/backward filling ile doldur
-            self.data[year_columns] = self.data[year_columns].fillna(method='ffill', axis=1)
-            self.data[year_columns] = self.data[year_columns].fillna(method='bfill', axis=1)
+            # Sayıya dönüştür, negatifleri temizle ve satır içinde doldur
+            negative_counts = self._clean_year_columns(self.data, year_columns)
+            for col, neg_count in negative_counts.items():
+                logger.warning(f"{col} sütununda {neg_count} adet negatif değer var. Bunlar NaN ile değiştirildi.")
             
             # Hala eksik değerler kaldıysa, sütun ortalamasıyla doldur
             if self.data[year_columns].isna().any().any():
                 logger.warning("Bazı eksik değerler hala mevcut, sütun ortalamasıyla doldurulacak")
+                # Göstergeler birbirine karışmasın diye önce aynı serinin sütun ortalaması kullanılır
+                if 'Series Code' in self.data.columns:
+                    series_means = self.data.groupby('Series Code')[year_columns].transform('mean')
+                    self.data[year_columns] = self.data[year_columns].fillna(series_means)
                 self.data[year_columns] = self.data[year_columns].fillna(self.data[year_columns].mean())
             
             # Veriyi uzun formata dönüştür (melt)
@@ -287,6 +549,129 @@ class DataService:
             logger.error(traceback.format_exc())
             raise Exception(f"Veri ön işleme sırasında hata oluştu: {str(e)}")
     
+    def _stream_data(self) -> None:
+        """
+        CSV dosyasını parça parça okuyup temizleyerek doğrudan gösterge küplerine ekler.
+        
+        Bellekte aynı anda yalnızca bir ham parça ve küplerin float32 değerleri
+        bulunur; raw_data ve data bu modda oluşturulmaz (None kalır). Temizleme
+        adımları toplu yüklemeyle aynıdır: satır içi doldurmadan sonra kalan
+        eksikler önce aynı göstergenin, sonra tüm verinin sütun ortalamasıyla
+        doldurulur.
+        
+        Raises:
+            FileNotFoundError: CSV dosyası bulunamazsa
+            ValueError: Dosya okunamazsa veya boşsa
+        """
+        self._locate_data_file()
+        logger.info(f"CSV dosyası parça parça yükleniyor: {self.data_path} (bellek tavanı: {self.memory_limit_mb} MB)")
+        
+        encodings = ['utf-8', 'ISO-8859-1', 'windows-1252']
+        for encoding in encodings:
+            try:
+                stores = self._stream_with_encoding(encoding)
+                logger.info(f"CSV başarıyla {encoding} kodlaması ile okundu")
+                break
+            except UnicodeDecodeError:
+                logger.warning(f"{encoding} kodlaması ile okuma başarısız, diğer kodlama deneniyor")
+                continue
+        else:
+            raise ValueError("CSV dosyası desteklenen kodlamalarla okunamadı.")
+        
+        self._set_stores(stores)
+        
+        store_mb = sum(store.values.nbytes for store in stores.values()) / (1024 * 1024)
+        if store_mb > self.memory_limit_mb:
+            logger.warning(f"Küplerin boyutu ({store_mb:.1f} MB) bellek tavanını aşıyor")
+        logger.info(f"Akışlı yükleme tamamlandı: {len(stores)} gösterge, {len(self.countries)} ülke, küp boyutu {store_mb:.1f} MB")
+    
+    def _stream_with_encoding(self, encoding: str) -> Dict[str, CountryYearStore]:
+        """
+        Dosyayı verilen kodlamayla parça parça okuyup gösterge küplerini oluşturur.
+        
+        Args:
+            encoding (str): Dosya kodlaması
+            
+        Returns:
+            Dict[str, CountryYearStore]: Gösterge kodu -> küp
+        """
+        sample = pd.read_csv(self.data_path, encoding=encoding, nrows=STREAM_SAMPLE_ROWS)
+        if sample.empty:
+            raise ValueError("CSV dosyası boş veya doğru yüklenemedi.")
+        
+        # Başlık bilgileri (ülke sütunu adı, yıl sütunları) ilk parçadan belirlenir
+        normalized = self._normalize_country_column(sample)
+        rename_map = {old: new for old, new in zip(sample.columns, normalized.columns) if old != new}
+        year_columns = self._detect_year_columns(normalized)
+        meta_columns = [col for col in normalized.columns if col not in year_columns]
+        
+        # Küp sütunları yıla göre sıralı olmalı; çözülemeyen (0) yıllar alınmaz
+        column_years = decode_year_labels(pd.Series(year_columns, dtype=object))
+        order = [i for i in np.argsort(column_years, kind='stable') if column_years[i] > 0]
+        value_columns = [year_columns[i] for i in order]
+        years = column_years[order]
+        
+        bytes_per_row = normalized.memory_usage(deep=True).sum() / len(normalized)
+        budget = self.memory_limit_mb * 1024 * 1024 / 2  # Yarısı parça işleme, yarısı küpler için
+        chunk_rows = max(1, int(budget / (bytes_per_row * STREAM_WORKING_COPIES)))
+        logger.info(f"Parça boyutu: {chunk_rows} satır (satır başına ~{bytes_per_row:.0f} bayt)")
+        
+        builders: Dict[Optional[str], CountryYearStoreBuilder] = {}
+        negative_counts: Dict[str, int] = {}
+        has_series_code = 'Series Code' in normalized.columns
+        total_rows = 0
+        
+        for chunk in pd.read_csv(self.data_path, encoding=encoding, chunksize=chunk_rows):
+            chunk = chunk.rename(columns=rename_map).dropna(subset=['Country Name'])
+            if chunk.empty:
+                continue
+            
+            for col, count in self._clean_year_columns(chunk, year_columns).items():
+                negative_counts[col] = negative_counts.get(col, 0) + count
+            
+            if has_series_code:
+                groups = chunk.groupby('Series Code', sort=False, dropna=False)
+            else:
+                groups = [(None, chunk)]
+            
+            for code, group in groups:
+                key = None if pd.isna(code) else str(code)
+                builder = builders.get(key)
+                if builder is None:
+                    builder = builders[key] = CountryYearStoreBuilder(years, value_columns)
+                builder.append(group[meta_columns], group[value_columns].to_numpy(dtype=np.float64))
+            
+            total_rows += len(chunk)
+        
+        if total_rows == 0:
+            raise ValueError("CSV dosyası boş veya doğru yüklenemedi.")
+        
+        for col, neg_count in negative_counts.items():
+            logger.warning(f"{col} sütununda {neg_count} adet negatif değer var. Bunlar NaN ile değiştirildi.")
+        
+        # Satır içinde doldurulamayan eksikler: önce aynı göstergenin, sonra tüm verinin sütun ortalaması
+        if has_series_code:
+            for key, builder in builders.items():
+                if key is not None:
+                    builder.fill_missing(builder.column_means())
+        totals = sum(builder.totals for builder in builders.values())
+        counts = sum(builder.counts for builder in builders.values())
+        with np.errstate(invalid='ignore', divide='ignore'):
+            global_means = np.where(counts > 0, totals / np.maximum(counts, 1), np.nan)
+        for builder in builders.values():
+            builder.fill_missing(global_means)
+        
+        # Gösterge kodu olmayan satırlar, dosyada hiç gösterge kodu yoksa varsayılan göstergeyi oluşturur
+        stores = {key: builder.build() for key, builder in builders.items() if key is not None}
+        if not stores and None in builders:
+            stores = {DEFAULT_INDICATOR: builders[None].build()}
+        
+        if not stores or all(len(store) == 0 for store in stores.values()):
+            raise ValueError("Veri dönüşümü sonrası veri seti boş")
+        
+        logger.info(f"{total_rows} satır parça parça işlendi")
+        return stores
+    
     def _melt_data(self, year_columns: List[str]) -> None:
         """
         Veriyi geniş formattan uzun formata dönüştürür.
@@ -322,7 +707,7 @@ class DataService:
             
             # Veriyi melt işlemi ile uzun formata dönüştür
             try:
-                self.melted_data = pd.melt(
+                melted = pd.melt(
                     data_copy, 
                     id_vars=id_vars, 
                     value_vars=year_columns,
@@ -331,93 +716,58 @@ class DataService:
                 )
                 
                 # Melt işlemi sonrası veri doğrulama
-                if self.melted_data.empty:
+                if melted.empty:
                     logger.error("Melt işlemi sonrası veri boş")
                     raise ValueError("Melt işlemi sonrası veri boş")
                 
-                logger.info(f"Melt sonrası veri boyutu: {self.melted_data.shape}")
+                logger.info(f"Melt sonrası veri boyutu: {melted.shape}")
             except Exception as e:
                 logger.error(f"Melt işlemi sırasında hata: {str(e)}")
                 raise
             
-            # Yıl değerlerini sayısal değerlere dönüştür
-            # İlk olarak yılların kod karşılıklarını tanımla - daha kapsamlı bir yıl sözlüğü
-            year_map = {
-                'bir': 1, 'iki': 2, 'uc': 3, 'dort': 4, 'bes': 5, 'alti': 6,
-                'yedi': 7, 'sekiz': 8, 'dokuz': 9, 'on': 10, 'onbir': 11, 'oniki': 12, 
-                'onuc': 13, 'ondort': 14, 'onbes': 15, 'onalti': 16, 'onyedi': 17, 
-                'onsekiz': 18, 'ondokuz': 19, 'yirmi': 20, 'yirmibir': 21, 'yirmiiki': 22, 
-                'yirmiuc': 23, 'yirmidort': 24, 'yirmibes': 25, 'yirmialti': 26, 'yirmiyedi': 27,
-                'yirmisekiz': 28, 'yirmidokuz': 29, 'otuz': 30, 'otuzbir': 31, 'otuziki': 32
-            }
+            # pd.melt yıl sütunlarını sırayla alt alta ekler; böylece her satırın etiket kodu
+            # ait olduğu sütunun sırasıdır ve etiket sütunu kopyalanan metinler yerine kategorik tutulur
+            if len(melted) == len(year_columns) * len(data_copy):
+                label_codes = np.repeat(np.arange(len(year_columns), dtype=np.int32), len(data_copy))
+                melted['YR_label'] = pd.Categorical.from_codes(label_codes, categories=year_columns)
             
-            # Ayrıca rakamları da ekleyelim (1, 2, 3... gibi)
-            for i in range(1, 100):
-                year_map[str(i)] = i
-            
-            def convert_yr_to_numeric(yr_label):
-                try:
-                    if isinstance(yr_label, str) and yr_label.startswith('YR'):
-                        suffix = yr_label[2:].strip().lower()
-                        return year_map.get(suffix, 0)
-                    elif isinstance(yr_label, str) and yr_label.isdigit():
-                        # Doğrudan yıl değeri olabilir
-                        return int(yr_label)
-                    elif isinstance(yr_label, (int, float)):
-                        # Zaten sayısal bir değer
-                        return int(yr_label)
-                    # Desen arama: "Y1990" gibi formatlar
-                    elif isinstance(yr_label, str) and len(yr_label) > 1 and yr_label[0] in ['Y', 'y'] and yr_label[1:].isdigit():
-                        return int(yr_label[1:])
-                    # Diğer desenler: "1990y" veya "1990_y" gibi formatlar
-                    elif isinstance(yr_label, str):
-                        digits = ''.join(c for c in yr_label if c.isdigit())
-                        if digits:
-                            return int(digits)
-                    
-                    logger.warning(f"'{yr_label}' yıl değeri dönüştürülemedi")
-                    return 0
-                except Exception as e:
-                    logger.error(f"Yıl dönüştürme hatası ({yr_label}): {str(e)}")
-                    return 0
-            
-            self.melted_data['Year'] = self.melted_data['YR_label'].apply(convert_yr_to_numeric)
-            logger.info(f"Yıl dönüşümü sonrası veri boyutu: {self.melted_data.shape}")
+            # Yıl değerlerini sayısal değerlere dönüştür - her yıl sütunu (YRbir, YRiki ...)
+            # bir kez çözülür ve kod/arama tablosu ile tüm satırlara yayılır
+            melted['Year'] = decode_year_labels(melted['YR_label'])
+            logger.info(f"Yıl dönüşümü sonrası veri boyutu: {melted.shape}")
             
             # İşaretlenmiş eksik değerleri filtrele
-            self.melted_data = self.melted_data[self.melted_data['Renewable_Value'] != -9999].copy()
+            melted = melted[melted['Renewable_Value'] != -9999].copy()
             
             # Sıfır değerlerinin sayısını kontrol et ama filtreleme
-            zero_count = (self.melted_data['Renewable_Value'] == 0).sum()
+            zero_count = (melted['Renewable_Value'] == 0).sum()
             if zero_count > 0:
                 logger.warning(f"Veri setinde {zero_count} adet 0 değeri var. Dikkat edilmeli!")
             
             # Yılı geçersiz olanları filtrele
-            self.melted_data = self.melted_data[self.melted_data['Year'] > 0].copy()
+            melted = melted[melted['Year'] > 0].copy()
             
             # Ülke ismi null olanları filtrele
-            self.melted_data = self.melted_data.dropna(subset=['Country Name']).copy()
+            melted = melted.dropna(subset=['Country Name']).copy()
             
-            # Logaritmik değer ekle (log1p: log(1+x) - bu sıfır değerlerini işleyebilir)
-            # NaN değerlerin logaritmasını almamak için önce kontrol et
-            mask = self.melted_data['Renewable_Value'] > 0
-            self.melted_data.loc[mask, 'LogValue'] = np.log1p(self.melted_data.loc[mask, 'Renewable_Value'])
-            self.melted_data.loc[~mask, 'LogValue'] = 0  # 0 veya negatif değerler için 0 ata
+            # Logaritmik değer (LogValue) saklanmaz; gerektiğinde country_store.log_value ile hesaplanır
             
-            # Ülke listesini güncelle (ülke sayısı değişmiş olabilir)
-            if 'Country Name' in self.melted_data.columns:
-                self.countries = sorted(self.melted_data['Country Name'].unique().tolist())
+            # Sorgular için gösterge başına ülke × yıl küpünü oluştur; ülke listesi de güncellenir.
+            # Uzun format yalnızca istenirse küpten türetilir
+            self._set_stores(self._build_stores(melted))
+            if len(self.stores) > 1:
+                logger.info(f"{len(self.stores)} gösterge yüklendi, varsayılan: {self.default_indicator}")
                 
             # Debug bilgileri
-            logger.info(f"Veri uzun formata dönüştürüldü. Yeni boyut: {self.melted_data.shape}")
+            logger.info(f"Veri uzun formata dönüştürüldü. Yeni boyut: {melted.shape}")
             logger.info(f"Toplam ülke sayısı: {len(self.countries)}")
             
             # Yıl aralığını göster (değerler varsa)
-            if not self.melted_data.empty and 'Year' in self.melted_data.columns:
-                logger.info(f"Yıl aralığı: {self.melted_data['Year'].min()} - {self.melted_data['Year'].max()}")
+            if not melted.empty and 'Year' in melted.columns:
+                logger.info(f"Yıl aralığı: {melted['Year'].min()} - {melted['Year'].max()}")
             
             # Sıfır satır varsa alarm
-            if len(self.melted_data) == 0:
+            if len(melted) == 0:
                 logger.error("Veri dönüşümü sonrası veri seti boş!")
                 raise ValueError("Veri dönüşümü sonrası veri seti boş")
                 
@@ -467,6 +817,363 @@ class DataService:
             
             raise Exception(f"Veri uzun formata dönüştürülürken hata: {str(e)}")
     
+    def _snapshot_file(self) -> Optional[str]:
+        """
+        Geçerli CSV dosyası için anlık görüntü yolunu döndürür.
+        
+        Returns:
+            Optional[str]: .npz dosya yolu, CSV dosyası yoksa None
+        """
+        content_hash = self._content_hash()
+        if content_hash is None:
+            return None
+        return snapshot.snapshot_path(self.data_path, content_hash, PIPELINE_VERSION)
+    
+    def _content_hash(self) -> Optional[str]:
+        """
+        CSV dosyasının içerik özetini döndürür; dosya değişmedikçe yeniden hesaplanmaz.
+        
+        Returns:
+            Optional[str]: SHA-256 özeti, CSV dosyası yoksa None
+        """
+        if not self.data_path or not os.path.isfile(self.data_path):
+            return None
+        stat = os.stat(self.data_path)
+        key = (self.data_path, stat.st_mtime_ns, stat.st_size)
+        if self._hash_cache is None or self._hash_cache[0] != key:
+            self._hash_cache = (key, snapshot.file_content_hash(self.data_path))
+        return self._hash_cache[1]
+    
+    def _shared_dataset_dir(self) -> Optional[str]:
+        """
+        Geçerli CSV dosyası için paylaşılan veri seti dizinini döndürür (CSV yoksa None).
+        """
+        content_hash = self._content_hash()
+        if content_hash is None:
+            return None
+        return shared_dataset.dataset_dir(self.data_path, content_hash, PIPELINE_VERSION)
+    
+    def _attach_shared_dataset(self) -> bool:
+        """
+        Gösterge küplerini paylaşılan veri setinin bellek eşlemelerine bağlar.
+        
+        Bağlanan süreçte ham ve geniş veri çerçeveleri tutulmaz (None kalır).
+        
+        Returns:
+            bool: Veri seti bulunup bağlanıldıysa True
+        """
+        try:
+            directory = self._shared_dataset_dir()
+            if directory is None:
+                return False
+            stores = shared_dataset.attach(directory)
+            if stores is None:
+                return False
+            self._set_stores(stores)
+            self.raw_data = None
+            self.data = None
+            logger.info(f"Paylaşılan veri setine bağlanıldı: {directory} ({len(self.countries)} ülke)")
+            return True
+        except Exception as e:
+            logger.warning(f"Paylaşılan veri setine bağlanılamadı: {str(e)}")
+            return False
+    
+    def _publish_shared_dataset(self) -> None:
+        """
+        Yüklenen küpleri paylaşılan veri seti olarak yazar ve bu süreci de ona bağlar;
+        böylece özel kopyalar bırakılır. Hatalar servisin başlamasını engellemez.
+        """
+        try:
+            directory = self._shared_dataset_dir()
+            if directory is None or not self.stores:
+                return
+            if shared_dataset.publish(directory, self.stores):
+                logger.info(f"Paylaşılan veri seti yayınlandı: {directory}")
+            self._attach_shared_dataset()
+        except Exception as e:
+            logger.warning(f"Paylaşılan veri seti yazılamadı, özel kopya kullanılacak: {str(e)}")
+    
+    def _load_snapshot(self) -> bool:
+        """
+        Ön işlenmiş verileri anlık görüntüden yükler.
+        
+        Anlık görüntüden başlayan servislerde raw_data yüklenmez (None kalır),
+        çünkü ham CSV yalnızca ön işleme için gereklidir.
+        
+        Returns:
+            bool: Anlık görüntü bulunup yüklendiyse True
+        """
+        try:
+            path = self._snapshot_file()
+            if path is None:
+                return False
+            
+            loaded = snapshot.load_frames(path)
+            if loaded is None:
+                return False
+            
+            frames, _ = loaded
+            self.data = frames.get('data')
+            indicators = frames['indicators']['Series Code'].tolist()
+            self._set_stores({
+                code: CountryYearStore.from_frames({
+                    name[len(f"i{i}_"):]: frame
+                    for name, frame in frames.items() if name.startswith(f"i{i}_")
+                })
+                for i, code in enumerate(indicators)
+            })
+            logger.info(f"Anlık görüntü yüklendi: {path} ({len(self.countries)} ülke)")
+            return True
+        except Exception as e:
+            logger.warning(f"Anlık görüntü okunamadı, CSV'den yüklenecek: {str(e)}")
+            self.data = None
+            self.stores = {}
+            self.default_indicator = None
+            self._melted_data = None
+            return False
+    
+    def _save_snapshot(self) -> None:
+        """
+        Ön işlenmiş verileri anlık görüntü olarak diske yazar.
+        Yazma hataları servisin başlamasını engellemez.
+        """
+        try:
+            path = self._snapshot_file()
+            if path is None or not self.stores:
+                return
+            
+            frames = {'indicators': pd.DataFrame({'Series Code': list(self.stores)})}
+            if self.data is not None:
+                frames['data'] = self.data
+            for i, store in enumerate(self.stores.values()):
+                frames.update({f"i{i}_{name}": frame for name, frame in store.to_frames().items()})
+            
+            snapshot.save_frames(
+                path,
+                frames,
+                meta={'source': os.path.basename(self.data_path), 'pipeline_version': PIPELINE_VERSION}
+            )
+            logger.info(f"Anlık görüntü kaydedildi: {path}")
+        except Exception as e:
+            logger.warning(f"Anlık görüntü kaydedilemedi: {str(e)}")
+
+    def _file_mtime(self) -> Optional[float]:
+        """
+        CSV dosyasının son değiştirilme zamanını döndürür (dosya yoksa None).
+        """
+        try:
+            return os.path.getmtime(self.data_path)
+        except (OSError, TypeError):
+            return None
+
+    def reload_data(self, data_path: str = None) -> Dict[str, Any]:
+        """
+        CSV dosyasını yeniden yükler ve yalnızca değişen ülkelerin türetilmiş verilerini geçersiz kılar.
+
+        Yeni dosya mevcut servise dokunmadan ayrı bir servis örneğinde yüklenir ve
+        ön işlenir (eksik değer doldurma sütun ortalamalarına bağlı olduğundan ön
+        işleme tüm dosyayı görmelidir). Ardından her göstergenin küpü ülke koduna
+        göre eskisiyle karşılaştırılır; değişmeyen göstergelerin küpleri olduğu gibi
+        korunur. Yeni veri, modeller, tahmin önbelleği ve özetler tek bir kilit
+        altında birlikte değiştirilir; istekler ya eski ya yeni sürümü görür.
+
+        Args:
+            data_path (str, optional): Yeni CSV dosyası. None ise mevcut dosya yeniden okunur.
+
+        Returns:
+            Dict[str, Any]: Veri sürümü, gösterge başına eklenen/silinen/değişen
+                            ülkeler ve geçersiz kılınan kayıt sayıları
+
+        Raises:
+            FileNotFoundError: Dosya yoksa (mevcut veri değişmeden kalır)
+            Exception: Yeni dosya yüklenemezse (mevcut veri değişmeden kalır)
+        """
+        with self._reload_lock:
+            path = data_path or self.data_path
+            # İlk yüklemedeki gibi başka bir CSV'ye düşülmemeli - dosya yoksa mevcut veri korunur
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"Yeniden yüklenecek CSV dosyası bulunamadı: {path}")
+            mtime = os.path.getmtime(path)
+
+            logger.info(f"Veri yeniden yükleniyor: {path}")
+            staged = DataService(path, use_snapshot=self.use_snapshot, memory_limit_mb=self.memory_limit_mb,
+                                 shared_dataset=self.shared_dataset)
+
+            changes: Dict[str, Dict[str, List[str]]] = {}
+            stores: Dict[str, CountryYearStore] = {}
+            for code, new_store in staged.stores.items():
+                old_store = self.stores.get(code)
+                if old_store is None:
+                    changes[code] = {'added': list(new_store.countries), 'removed': [], 'changed': []}
+                    stores[code] = new_store
+                    continue
+                diff = old_store.diff(new_store)
+                if any(diff.values()):
+                    changes[code] = diff
+                    stores[code] = new_store
+                elif list(old_store.year_labels) != list(new_store.year_labels):
+                    stores[code] = new_store
+                else:
+                    # Değişmeyen göstergenin küpü (ve ona bağlı her şey) korunur
+                    stores[code] = old_store
+            for code, old_store in self.stores.items():
+                if code not in staged.stores:
+                    changes[code] = {'added': [], 'removed': list(old_store.countries), 'changed': []}
+
+            self.data_path = path
+            self._source_mtime = mtime
+            if not changes:
+                logger.info("Yeni dosyada değişen ülke yok, mevcut veri sürümü korunuyor.")
+                return {
+                    'success': True,
+                    'reloaded': False,
+                    'data_version': self.data_version,
+                    'changes': {},
+                    'invalidated': {'models': 0, 'predictions': 0, 'aggregates': 0}
+                }
+
+            models, predictions, aggregates = self._surviving_caches(changes, staged)
+            invalidated = {
+                'models': len(self.models) - len(models),
+                'predictions': len(self.predictions_cache) - len(predictions),
+                'aggregates': len(self.aggregate_cache) - len(aggregates)
+            }
+
+            # Atomik değişim: yeni sözlükler önceden hazırlandı, burada yalnızca referanslar değişir
+            self._set_stores(stores)
+            self.raw_data = staged.raw_data
+            self.data = staged.data
+            self.models = models
+            self.predictions_cache = predictions
+            self.aggregate_cache = aggregates
+            self.data_version += 1
+
+            changed_count = sum(len(set(sum(diff.values(), []))) for diff in changes.values())
+            logger.info(
+                f"Veri sürümü {self.data_version} yüklendi: {changed_count} ülke değişti, "
+                f"geçersiz kılınan model/tahmin/özet: {invalidated['models']}/"
+                f"{invalidated['predictions']}/{invalidated['aggregates']}"
+            )
+            return {
+                'success': True,
+                'reloaded': True,
+                'data_version': self.data_version,
+                'changes': changes,
+                'invalidated': invalidated
+            }
+
+    def _surviving_caches(self, changes: Dict[str, Dict[str, List[str]]],
+                          staged: 'DataService') -> Tuple[Dict[str, Any], Dict[str, Any], Dict[Any, Any]]:
+        """
+        Değişen ülkelere ait olmayan model, tahmin ve özet kayıtlarını yeni sözlüklere kopyalar.
+
+        Args:
+            changes (Dict): Gösterge -> {'added', 'removed', 'changed'} ülke listeleri
+            staged (DataService): Yeni verinin yüklendiği servis
+
+        Returns:
+            Tuple: (modeller, tahmin önbelleği, özet önbelleği)
+        """
+        affected = {code: set(sum(diff.values(), [])) for code, diff in changes.items()}
+
+        # Varsayılan gösterge değiştiyse varsayılan göstergeye bağlı her şey geçersizdir
+        default_changed = staged.default_indicator != self.default_indicator
+        default_affected = affected.get(self.default_indicator, set())
+        if default_changed:
+            default_affected = set(self.countries or [])
+
+        stale_models = set()
+        for code, countries in affected.items():
+            stale_models.update(self._model_key(country, code) for country in countries)
+        if default_changed:
+            stale_models.update(default_affected)
+        if default_affected:
+            # Genel model tüm ülkelerin verisiyle eğitilir
+            stale_models.add('general')
+        models = {key: model for key, model in self.models.items() if key not in stale_models}
+
+        # Tahmin önbelleği anahtarları "<ülke>_<yıl>" biçimindedir ve varsayılan göstergeyi kullanır
+        predictions = {
+            key: value for key, value in self.predictions_cache.items()
+            if key.rsplit('_', 1)[0] not in default_affected
+        }
+
+        def aggregate_is_stale(key: Tuple[str, Optional[str], Optional[str]]) -> bool:
+            _, code, country = key
+            if default_changed and code == self.default_indicator:
+                return True
+            if code not in affected:
+                return False
+            return country is None or country in affected[code]
+
+        aggregates = {key: value for key, value in self.aggregate_cache.items() if not aggregate_is_stale(key)}
+        return models, predictions, aggregates
+
+    def _cached_aggregate(self, name: str, builder, indicator: Optional[str] = None,
+                          country: Optional[str] = None) -> Any:
+        """
+        Önceden hesaplanmış bir özeti önbellekten döndürür, yoksa hesaplayıp saklar.
+
+        Ülkeye bağlı özetler yeniden yüklemede yalnızca o ülke değiştiyse, göstergenin
+        tamamına ait özetler (country=None) ise göstergede herhangi bir ülke değiştiyse silinir.
+
+        Args:
+            name (str): Özetin adı
+            builder: Özeti hesaplayan argümansız fonksiyon
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            country (str, optional): Ülke adı. None ise özet göstergenin tamamına aittir
+
+        Returns:
+            Any: Özet değeri
+        """
+        cache = self.aggregate_cache
+        key = (name, indicator or self.default_indicator, country)
+        if key not in cache:
+            # Hesaplama sırasında veri değişirse sonuç eski sözlüğe yazılır ve kaybolur
+            cache[key] = builder()
+        return cache[key]
+
+    def start_watcher(self, interval: float = 5.0) -> None:
+        """
+        CSV dosyasının değiştirilme zamanını arka planda izler ve değiştiğinde veriyi yeniden yükler.
+
+        Args:
+            interval (float): Kontrol aralığı (saniye)
+        """
+        self.watch_interval = interval
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+
+        stop = threading.Event()
+
+        def watch():
+            while not stop.wait(interval):
+                mtime = self._file_mtime()
+                if mtime is None or mtime == self._source_mtime:
+                    continue
+                try:
+                    self.reload_data()
+                except Exception as e:
+                    # Bozuk/yarım yazılmış dosyada eski veri kullanılmaya devam edilir
+                    logger.error(f"Değişen CSV dosyası yüklenemedi, mevcut veri korunuyor: {str(e)}")
+                    self._source_mtime = mtime
+
+        self._watcher_stop = stop
+        self._watcher = threading.Thread(target=watch, name='data-file-watcher', daemon=True)
+        self._watcher.start()
+        logger.info(f"CSV dosyası izleniyor ({interval} sn aralıkla): {self.data_path}")
+
+    def stop_watcher(self) -> None:
+        """
+        Dosya izleyicisini durdurur.
+        """
+        if self._watcher_stop is not None:
+            self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=5)
+        self._watcher = None
+        self._watcher_stop = None
+
     def get_countries(self) -> List[str]:
         """
         Veri setindeki tüm ülkelerin listesini döndürür.
@@ -476,58 +1183,324 @@ class DataService:
         """
         return self.countries
     
-    def get_country_data(self, country_name: str) -> Dict[str, Any]:
+    def suggest_countries(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Sorguyla başlayan ülkeleri otomatik tamamlama için döndürür.
+        
+        Önek ağacında ad, ISO3 kodu, Türkçe/İngilizce takma ad ve ad içindeki kelimeler
+        aranır; büyük/küçük harf ve Türkçe karakter farkları yok sayılır. Tam ad eşleşmeleri önce gelir.
+        
+        Args:
+            query (str): Aranan önek
+            limit (int): Döndürülecek en fazla ülke
+            
+        Returns:
+            List[Dict[str, Any]]: country ve country_code içeren öneriler
+        
+        Raises:
+            ValueError: limit geçersizse veya ülke indeksi yoksa
+        """
+        if limit < 1:
+            raise ValueError(f"limit en az 1 olmalı: {limit}")
+        if self.country_index is None:
+            raise ValueError("Ülke indeksi oluşturulmadı, öneri yapılamıyor")
+        
+        store = self.store
+        codes = store.row_meta['Country Code'] if store is not None and 'Country Code' in store.row_meta.columns else None
+        suggestions = []
+        for name in self.country_index.suggest(query, limit):
+            code = codes.iat[store.position(name)] if codes is not None and name in store else None
+            suggestions.append({'country': name, 'country_code': code if isinstance(code, str) else None})
+        return suggestions
+    
+    def get_indicators(self) -> List[Dict[str, Any]]:
+        """
+        Veri setindeki göstergelerin (Series Code) listesini döndürür.
+        
+        Returns:
+            List[Dict[str, Any]]: Gösterge kodu, adı, ülke ve yıl sayısı; dosya sırasıyla
+        """
+        indicators = []
+        for code, store in self.stores.items():
+            names = store.row_meta['Series Name'] if 'Series Name' in store.row_meta.columns else pd.Series(dtype=object)
+            names = names.dropna()
+            indicators.append({
+                'code': code,
+                'name': str(names.iloc[0]) if len(names) else code,
+                'countries': len(store),
+                'years': len(store.years),
+                'default': code == self.default_indicator
+            })
+        return indicators
+    
+    def _get_store(self, indicator: Optional[str] = None) -> Optional[CountryYearStore]:
+        """
+        Göstergenin küpünü döndürür (None ise varsayılan gösterge).
+        
+        Raises:
+            ValueError: Gösterge veri setinde yoksa
+        """
+        if indicator is None or indicator == self.default_indicator:
+            return self.store
+        store = self.stores.get(indicator)
+        if store is None:
+            logger.warning(f"İstenen gösterge bulunamadı: {indicator}")
+            raise ValueError(f"Gösterge bulunamadı: {indicator}")
+        return store
+    
+    def _resolve_country(self, country_name: str, indicator: Optional[str] = None) -> str:
+        """
+        Ülke adını veya ülke kodunu göstergenin küpündeki ülke adına çevirir.
+        
+        Args:
+            country_name (str): Ülke adı veya ülke kodu (ör. TUR)
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            str: Ülke adı
+            
+        Raises:
+            ValueError: Ülke veya gösterge veri setinde yoksa
+        """
+        store = self._get_store(indicator)
+        canonical = self.country_index.resolve(country_name) if self.country_index is not None else None
+        if store is not None:
+            if canonical is not None and canonical in store:
+                return canonical
+            if country_name in store:
+                return store.resolve(country_name)
+        elif self.countries and country_name in self.countries:
+            return country_name
+        
+        logger.warning(f"İstenen ülke bulunamadı: {country_name}")
+        raise ValueError(f"Ülke bulunamadı: {country_name}")
+    
+    def _store_position(self, store: CountryYearStore, country_name: str) -> Optional[int]:
+        """
+        Ülke adını, kodunu veya takma adını küpteki satır numarasına çevirir.
+        
+        Toplu isteklerde _resolve_country() ile aynı çözümlemeyi hata fırlatmadan yapar.
+        
+        Args:
+            store (CountryYearStore): Göstergenin küpü
+            country_name (str): Ülke adı, ülke kodu veya takma ad (büyük/küçük harf duyarsız)
+            
+        Returns:
+            Optional[int]: Satır numarası, ülke küpte yoksa None
+        """
+        canonical = self.country_index.resolve(country_name) if self.country_index is not None else None
+        if canonical is not None and canonical in store:
+            return store.position(canonical)
+        if country_name in store:
+            return store.position(country_name)
+        return None
+    
+    def _model_key(self, country_name: str, indicator: Optional[str] = None) -> str:
+        """
+        Model ve tahmin önbelleği anahtarı. Varsayılan gösterge için anahtar ülke adıdır.
+        """
+        if indicator is None or indicator == self.default_indicator:
+            return country_name
+        return f"{indicator}:{country_name}"
+    
+    def get_country_data(self, country_name: str, indicator: Optional[str] = None,
+                         start_year: Optional[int] = None, end_year: Optional[int] = None,
+                         step: int = 1) -> Dict[str, Any]:
         """
         Belirli bir ülke için yenilenebilir enerji verilerini döndürür.
         
+        Yıl aralığı verilirse aralık yıl ekseninde ikili aramayla bulunur ve
+        istatistikler yalnızca o aralık için hesaplanır; step > 1 ise dönen seri
+        her step'inci nokta alınarak seyreltilir (istatistikler seyreltilmez).
+        Aralıkta hiç değer yoksa seri boş, istatistikler None döner.
+        
         Args:
-            country_name (str): Ülke adı
+            country_name (str): Ülke adı veya ülke kodu
+            indicator (str, optional): Gösterge kodu (Series Code). None ise varsayılan gösterge
+            start_year (int, optional): Aralığın başlangıç yılı (dahil)
+            end_year (int, optional): Aralığın bitiş yılı (dahil)
+            step (int): Seri için adım (1 ise tüm noktalar)
             
         Returns:
             Dict[str, Any]: Ülke verileri içeren sözlük
         
         Raises:
-            ValueError: Eğer ülke veri setinde yoksa
+            ValueError: Eğer ülke veya gösterge veri setinde yoksa ya da adım geçersizse
         """
-        if country_name not in self.countries:
-            logger.warning(f"İstenen ülke bulunamadı: {country_name}")
-            raise ValueError(f"Ülke bulunamadı: {country_name}")
+        if step < 1:
+            raise ValueError(f"Adım en az 1 olmalı: {step}")
+        country_name = self._resolve_country(country_name, indicator)
+        ranged = start_year is not None or end_year is not None
         
         try:
-            # Ülke verilerini filtrele
-            country_data = self.melted_data[self.melted_data['Country Name'] == country_name].copy()
-            
-            # Zaman serisi verilerini al
-            time_series_data = country_data.sort_values('Year')[['Year', 'Renewable_Value']]
-            
-            # İstatistiksel veriler
-            stats = {
-                'min': country_data['Renewable_Value'].min(),
-                'max': country_data['Renewable_Value'].max(), 
-                'mean': country_data['Renewable_Value'].mean(),
-                'median': country_data['Renewable_Value'].median(),
-                'std': country_data['Renewable_Value'].std(),
-                'last_value': time_series_data.iloc[-1]['Renewable_Value'],
-                'years': time_series_data['Year'].tolist(),
-                'values': time_series_data['Renewable_Value'].tolist(),
-                'trend': self._calculate_trend(time_series_data)
-            }
-            
-            # Zaman serisi verileri
-            time_series = {
-                str(row['Year']): row['Renewable_Value'] 
-                for _, row in time_series_data.iterrows()
-            }
-            
-            return {
+            # İstatistikler yüklemede tüm ülkeler için tek geçişte hesaplanır; istek tablodan bir satır okur
+            store = self._get_store(indicator)
+            table, row = None, 0
+            if store is not None and country_name in store:
+                row = store.position(country_name)
+                if ranged:
+                    columns = store.year_slice(start_year, end_year)
+                    years, values, row = store.years[columns], store.values[row, columns], 0
+                else:
+                    table = store.stats_table()
+            else:
+                years, values = self._country_series(country_name, indicator)
+                if ranged:
+                    columns = year_range_slice(years, start_year, end_year)
+                    years, values = years[columns], values[columns]
+            # Boş aralıkta (ör. from > to) veya yalnızca eksik değer içeren seride tablo kurulmaz
+            if table is None and not np.isnan(values).all():
+                table = CountryStatsTable(values, years)
+            
+            if table is None or table.count[row] == 0:
+                stats = dict.fromkeys(('min', 'max', 'mean', 'median', 'std', 'last_value', 'trend'))
+                stats.update(years=[], values=[])
+                time_series = {}
+            else:
+                stats = table.stats(row)
+                time_series = table.time_series(row)
+            if step > 1:
+                stats['years'] = stats['years'][::step]
+                stats['values'] = stats['values'][::step]
+                time_series = dict(list(time_series.items())[::step])
+            
+            result = {
                 'country': country_name,
                 'stats': stats,
                 'time_series': time_series
             }
+            if indicator is not None:
+                result['indicator'] = indicator
+            if ranged or step > 1:
+                result['range'] = {'from': start_year, 'to': end_year, 'step': step}
+            return result
         except Exception as e:
             logger.error(f"{country_name} için veri alınırken hata: {str(e)}")
             raise Exception(f"Ülke verileri alınırken hata oluştu: {str(e)}")
     
+    def get_countries_data(self, countries: List[str], indicator: Optional[str] = None,
+                           start_year: Optional[int] = None, end_year: Optional[int] = None,
+                           step: int = 1) -> Dict[str, Any]:
+        """
+        Birden fazla ülkenin zaman serisini tek istekte, sütun düzeninde döndürür.
+        
+        Tüm ülkeler için ortak bir yıl dizisi ve ülke başına bir değer dizisi verilir;
+        değerler matristen tek bir satır toplama (gather) işlemiyle alınır. Eksik hücreler None'dır.
+        Yıl aralığı ikili aramayla bulunur ve sütun dilimi olarak uygulanır.
+        
+        Args:
+            countries (List[str]): Ülke adları veya ülke kodları (tekrarlar bir kez döner)
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            start_year (int, optional): Aralığın başlangıç yılı (dahil)
+            end_year (int, optional): Aralığın bitiş yılı (dahil)
+            step (int): Yıl ekseni için adım (1 ise tüm yıllar)
+            
+        Returns:
+            Dict[str, Any]: years, countries, codes, values (ülke sırasıyla) ve bulunamayan girdiler (missing)
+        
+        Raises:
+            ValueError: Liste boşsa, hiçbir ülke bulunamazsa veya gösterge yoksa
+        """
+        if not countries:
+            raise ValueError("En az bir ülke gerekli")
+        if step < 1:
+            raise ValueError(f"Adım en az 1 olmalı: {step}")
+        
+        store = self._get_store(indicator)
+        if store is None:
+            raise ValueError("Veri seti boş, ülke verileri alınamıyor")
+        
+        rows, missing, seen = [], [], set()
+        for country in countries:
+            row = self._store_position(store, country)
+            if row is None:
+                missing.append(country)
+                continue
+            if row not in seen:
+                seen.add(row)
+                rows.append(row)
+        
+        if not rows:
+            logger.warning(f"Bulunamayan ülkeler: {', '.join(missing)}")
+            raise ValueError(f"Bulunamayan ülkeler: {', '.join(missing)}")
+        
+        # Tek gather: istenen satırlar ve yıl dilimi birlikte alınır, yalnızca bu blok float64'e genişletilir
+        columns = store.year_slice(start_year, end_year)
+        columns = slice(columns.start, columns.stop, step)
+        block = to_float64(store.values[rows, columns])
+        values = np.where(np.isnan(block), None, block).tolist()
+        
+        codes = [None] * len(rows)
+        if 'Country Code' in store.row_meta.columns:
+            codes = [code if isinstance(code, str) else None
+                     for code in store.row_meta['Country Code'].to_numpy()[rows]]
+        
+        result = {
+            'years': store.years[columns].tolist(),
+            'countries': [store.countries[row] for row in rows],
+            'codes': codes,
+            'values': values,
+            'missing': missing
+        }
+        if indicator is not None:
+            result['indicator'] = indicator
+        return result
+    
+    def _country_series(self, country_name: str, indicator: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ülkenin yıllarını ve değerlerini artan yıl sırasıyla döndürür.
+        
+        Küp varsa O(1) satır görünümü kullanılır; yalnızca küp oluşturulamayan
+        (elle atanmış) veri için uzun format filtrelenir.
+        
+        Args:
+            country_name (str): Ülke adı
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (yıllar, değerler)
+        """
+        store = self._get_store(indicator)
+        if store is not None and country_name in store:
+            return store.series(country_name)
+        
+        country_data = self.melted_data[self.melted_data['Country Name'] == country_name].sort_values('Year')
+        return country_data['Year'].to_numpy(), country_data['Renewable_Value'].to_numpy()
+    
+    def _country_frame(self, country_name: str, indicator: Optional[str] = None) -> pd.DataFrame:
+        """
+        Model eğitimi ve metrikler için ülkenin verisini küçük bir DataFrame olarak döndürür.
+        
+        Args:
+            country_name (str): Ülke adı
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            pd.DataFrame: 'Country Name', 'Year' ve 'Renewable_Value' sütunları, yıla göre sıralı
+        """
+        years, values = self._country_series(country_name, indicator)
+        return pd.DataFrame({
+            'Country Name': country_name,
+            'Year': years,
+            'Renewable_Value': to_float_list(values)
+        })
+    
+    def _max_year(self) -> int:
+        """
+        Veri setindeki en son yılı döndürür.
+        """
+        if self.store is not None and len(self.store.years) > 0:
+            return int(self.store.years[-1])
+        return int(self.melted_data['Year'].max())
+    
+    def _max_value(self) -> float:
+        """
+        Veri setindeki en büyük değeri döndürür (uzun formattaki veri oluşturulmaz).
+        """
+        if self.store is not None and self.store.values.size > 0:
+            return float(to_float64(np.array([np.nanmax(self.store.values)]))[0])
+        return float(self.melted_data['Renewable_Value'].max())
+    
     def _calculate_trend(self, time_series_data: pd.DataFrame) -> float:
         """
         Zaman serisi verileri için trend hesaplar.
@@ -541,23 +1514,23 @@ class DataService:
         if len(time_series_data) <= 1:
             return 0.0
         
-        try:
-            # Son 5 yıllık veriyi al (veya mevcut tüm verileri)
-            recent_data = time_series_data.tail(min(5, len(time_series_data)))
-            
-            # İlk ve son değeri al
-            first_value = recent_data.iloc[0]['Renewable_Value']
-            last_value = recent_data.iloc[-1]['Renewable_Value']
-            
-            # 0'a bölme hatasını önle
-            if first_value == 0:
-                if last_value > 0:
-                    return 100.0  # Sıfırdan herhangi bir pozitif değere
-                return 0.0
+        return self._trend_from_values(time_series_data['Renewable_Value'].to_numpy())
+    
+    def _trend_from_values(self, values: np.ndarray) -> float:
+        """
+        Yıla göre sıralı değer dizisi için son 5 yıllık yüzde değişimi hesaplar.
+        
+        Args:
+            values (np.ndarray): Yıla göre sıralı değerler
             
-            # Yüzde değişimi hesapla
-            percent_change = ((last_value - first_value) / first_value) * 100
-            return percent_change
+        Returns:
+            float: Trendin yüzdesi (pozitif artışı, negatif azalışı gösterir)
+        """
+        if len(values) <= 1:
+            return 0.0
+        
+        try:
+            return float(trends.percent_change(values, trends.DEFAULT_WINDOW)[0])
         except Exception as e:
             logger.error(f"Trend hesaplanırken hata: {str(e)}")
             return 0.0
@@ -566,155 +1539,578 @@ class DataService:
         """
         Veri seti hakkında genel bir bakış sunar.
         
+        Genel bakış veri sürümü başına bir kez hesaplanır ve veri değişene kadar
+        bellekten döndürülür; dönen sözlük paylaşıldığından değiştirilmemelidir.
+        
         Returns:
             Dict[str, Any]: Genel bakış bilgilerini içeren sözlük
         """
         try:
-            # En yüksek ve en düşük yenilenebilir enerjiye sahip ülkeler
-            if self.melted_data is None or self.melted_data.empty:
-                logger.warning("Veri seti boş, genel bakış oluşturulamıyor.")
-                return {
-                    'highest_countries': [],
-                    'lowest_countries': [],
-                    'global_stats': {
-                        'min': 0,
-                        'max': 0,
-                        'mean': 0,
-                        'median': 0,
-                        'std': 0,
-                        'total_countries': 0,
-                        'years_range': "Veri yok"
-                    },
-                    'global_trend': 0
-                }
-                
-            # Veri var, normal işleme devam et
-            # NaN değerleri kontrol et
-            if self.melted_data['Year'].isna().any():
-                logger.warning("Veri setinde NaN yıl değerleri var. Bunlar temizleniyor.")
-                self.melted_data = self.melted_data.dropna(subset=['Year']).copy()
-            
-            # Tamamen boş bir veri seti kaldıysa tekrar kontrol et
-            if self.melted_data.empty:
-                logger.warning("NaN temizleme sonrası veri seti boş kaldı.")
-                return {
-                    'highest_countries': [],
-                    'lowest_countries': [],
-                    'global_stats': {
-                        'min': 0,
-                        'max': 0,
-                        'mean': 0,
-                        'median': 0,
-                        'std': 0,
-                        'total_countries': 0,
-                        'years_range': "Veri yok"
-                    },
-                    'global_trend': 0
-                }
-            
-            try:
-                latest_year = int(self.melted_data['Year'].max())
-                earliest_year = int(self.melted_data['Year'].min())
-                
-                # Yıl değerlerini daha anlamlı yap
-                if latest_year <= 30 and earliest_year >= 1:  # Muhtemelen 1-26 gibi indeks numaraları
-                    # Daha anlamlı yıl değerleri oluştur (2000-2025 gibi)
-                    base_year = 2000
-                    latest_year = base_year + latest_year - 1
-                    earliest_year = base_year + earliest_year - 1
-                    logger.info(f"Yıl değerleri daha anlamlı hale getirildi: {earliest_year} - {latest_year}")
-            except (ValueError, TypeError):
-                logger.warning("Yıl değerleri dönüştürülemedi. String olarak kullanılacak.")
-                latest_year = str(self.melted_data['Year'].max())
-                earliest_year = str(self.melted_data['Year'].min())
-                
-            latest_data = self.melted_data[self.melted_data['Year'] == self.melted_data['Year'].max()]
+            return self._cached_aggregate('overview', self._build_data_overview)
+        except Exception as e:
+            logger.error(f"Genel bakış verileri alınırken hata: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise Exception(f"Genel bakış verileri alınırken hata oluştu: {str(e)}")
+    
+    def get_data_overview_json(self) -> bytes:
+        """
+        Genel bakışın JSON'a yazılmış halini döndürür; get_data_overview() ile aynı sürümde saklanır.
+        
+        Returns:
+            bytes: UTF-8 JSON
+        """
+        return self._cached_aggregate(
+            'overview_json',
+            lambda: json.dumps(self.get_data_overview(), separators=(',', ':')).encode('utf-8')
+        )
+    
+    def get_rankings(self, year: Optional[int] = None, k: int = 10, direction: str = 'desc',
+                     country: Optional[str] = None, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir yılın en yüksek veya en düşük k ülkesini, istenirse bir ülkenin sırasıyla birlikte döndürür.
+        
+        Sıralamalar küpün yıl başına sıralama indeksinden okunur; sorgu başına sıralama yapılmaz.
+        Eşit değerli ülkeler aynı sırayı paylaşır.
+        
+        Args:
+            year (int, optional): Yıl. None ise değeri olan en son yıl
+            k (int): Döndürülecek ülke sayısı
+            direction (str): 'desc' (en yüksekten) veya 'asc' (en düşükten)
+            country (str, optional): Sırası ve yüzdeliği istenen ülkenin adı veya kodu
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
             
-            # Eğer son yıl için veri yoksa, en son veriyi al
-            if latest_data.empty:
-                logger.warning("En son yıl için veri bulunamadı. Tüm veriden en yüksek ve en düşük değerler alınacak.")
-                highest = self.melted_data.sort_values('Renewable_Value', ascending=False).head(10)
-                lowest = self.melted_data.sort_values('Renewable_Value').head(10)
-            else:
-                highest = latest_data.sort_values('Renewable_Value', ascending=False).head(10)
-                lowest = latest_data.sort_values('Renewable_Value').head(10)
-            
-            highest_countries = [{
-                'country': row['Country Name'],
-                'value': float(row['Renewable_Value'])
-            } for _, row in highest.iterrows()]
-            
-            lowest_countries = [{
-                'country': row['Country Name'],
-                'value': float(row['Renewable_Value'])
-            } for _, row in lowest.iterrows()]
-            
-            # Global istatistikler - NaN kontrolü yaparak
-            min_value = float(self.melted_data['Renewable_Value'].min())
-            max_value = float(self.melted_data['Renewable_Value'].max())
-            mean_value = float(self.melted_data['Renewable_Value'].mean())
-            median_value = float(self.melted_data['Renewable_Value'].median())
-            std_value = float(self.melted_data['Renewable_Value'].std())
-            
-            # NaN değerlerini kontrol et 
-            min_value = 0 if np.isnan(min_value) else min_value
-            max_value = 0 if np.isnan(max_value) else max_value
-            mean_value = 0 if np.isnan(mean_value) else mean_value
-            median_value = 0 if np.isnan(median_value) else median_value
-            std_value = 0 if np.isnan(std_value) else std_value
-            
-            # Yıl aralığını oluştur - anlamlı ve kullanıcı dostu bir format
-            years_range = f"{earliest_year} - {latest_year}" if earliest_year and latest_year else "Veri yok"
-            
-            global_stats = {
-                'min': min_value,
-                'max': max_value,
-                'mean': mean_value,
-                'median': median_value,
-                'std': std_value,
-                'total_countries': len(self.countries) if self.countries else 0,
-                'years_range': years_range
+        Returns:
+            Dict[str, Any]: year, direction, total, countries (rank, country, country_code, value,
+                            percentile) ve country verildiyse o ülkenin satırı
+        
+        Raises:
+            ValueError: Yön, yıl, ülke veya gösterge geçersizse
+        """
+        if direction not in ('asc', 'desc'):
+            raise ValueError(f"Geçersiz sıralama yönü: {direction} ('asc' veya 'desc' olmalı)")
+        if k < 1:
+            raise ValueError(f"k en az 1 olmalı: {k}")
+        
+        store = self._get_store(indicator)
+        if store is None:
+            raise ValueError("Veri seti boş, sıralama yapılamıyor")
+        index = store.rank_index()
+        column = self._year_column(store, year)
+        
+        codes = store.row_meta['Country Code'] if 'Country Code' in store.row_meta.columns else None
+        
+        def entry(row: int) -> Dict[str, Any]:
+            code = codes.iat[row] if codes is not None else None
+            return {
+                'rank': int(index.rank[row, column]),
+                'country': store.countries[row],
+                'country_code': code if isinstance(code, str) else None,
+                'value': float(to_float64(store.values[row, column])),
+                'percentile': float(index.percentile[row, column])
             }
+        
+        result = {
+            'year': int(store.years[column]),
+            'direction': direction,
+            'total': int(index.count[column]),
+            'countries': [entry(row) for row in index.top(column, k, descending=direction == 'desc')]
+        }
+        if country is not None:
+            row = store.position(self._resolve_country(country, indicator))
+            result['country'] = entry(row) if not np.isnan(store.values[row, column]) else None
+        if indicator is not None:
+            result['indicator'] = indicator
+        return result
+    
+    def _year_column(self, store: CountryYearStore, year: Optional[int] = None) -> int:
+        """
+        Yılın küpteki sütun numarasını döndürür; yıl verilmezse değeri olan en son yılın sütunu.
+        
+        Raises:
+            ValueError: Yıl küpte yoksa veya hiçbir yılda değer yoksa
+        """
+        if year is None:
+            filled = np.flatnonzero(store.rank_index().count)
+            if len(filled) == 0:
+                raise ValueError("Veri seti boş, sıralama yapılamıyor")
+            return int(filled[-1])
+        if int(year) in store.year_index:
+            return store.year_index[int(year)]
+        raise ValueError(f"Yıl bulunamadı: {year}")
+    
+    def query_countries(self, filters: Optional[str] = None, year: Optional[int] = None,
+                        sort: Optional[str] = 'value', direction: str = 'desc', offset: int = 0,
+                        limit: int = 50, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Ülkeleri filtre ifadesine göre tarar, sıralar ve sayfalar.
+        
+        Koşullar seçilen yılın değeri, sırası ve yüzdeliği ile istatistik ve trend
+        dizileri üzerinde tüm ülkeler için boolean maskelerle değerlendirilir. Diziler
+        gösterge ve yıl başına veri değişene kadar saklanır.
+        
+        Args:
+            filters (str, optional): "value>40, trend<0" biçiminde filtre ifadesi
+            year (int, optional): value/rank/percentile alanlarının yılı. None ise değeri olan en son yıl
+            sort (str, optional): Sıralama alanı. None ise ülke adı sırası
+            direction (str): 'desc' veya 'asc'
+            offset (int): Atlanacak sonuç sayısı
+            limit (int): Döndürülecek en fazla sonuç
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
             
-            # Chart.js için veri formatı hazırla
-            highest_chart = {
-                'labels': [item['country'] for item in highest_countries],
-                'datasets': [{
-                    'label': 'Yenilenebilir Enerji Oranı (%)',
-                    'data': [item['value'] for item in highest_countries],
-                    'backgroundColor': 'rgba(75, 192, 192, 0.2)',
-                    'borderColor': 'rgba(75, 192, 192, 1)',
-                    'borderWidth': 1
-                }]
+        Returns:
+            Dict[str, Any]: year, total (eşleşen ülke sayısı), offset, limit ve countries
+                            (country, country_code ve tüm alanlar) listesi
+        
+        Raises:
+            ValueError: Filtre, sıralama, sayfalama, yıl veya gösterge geçersizse
+        """
+        if direction not in ('asc', 'desc'):
+            raise ValueError(f"Geçersiz sıralama yönü: {direction} ('asc' veya 'desc' olmalı)")
+        if offset < 0 or limit < 1:
+            raise ValueError(f"Geçersiz sayfalama: offset={offset}, limit={limit}")
+        conditions = country_query.parse_filters(filters)
+        
+        store = self._get_store(indicator)
+        if store is None:
+            raise ValueError("Veri seti boş, sorgu yapılamıyor")
+        column = self._year_column(store, year)
+        
+        def build() -> Dict[str, np.ndarray]:
+            table = store.stats_table()
+            index = store.rank_index()
+            measures = trends.trend_table(store.values, store.years)
+            rank = index.rank[:, column].astype(np.float64)
+            rank[np.isnan(store.values[:, column])] = np.nan
+            return {
+                'value': to_float64(store.values[:, column]),
+                'rank': rank,
+                'percentile': index.percentile[:, column],
+                'last_value': table.last_value,
+                'mean': table.mean,
+                'median': table.median,
+                'min': table.min,
+                'max': table.max,
+                'std': table.std,
+                'count': table.count.astype(np.float64),
+                'trend': table.trend,
+                'cagr': measures['cagr'],
+                'slope': measures['slope']
             }
+        
+        columns = self._cached_aggregate(f'query_columns:{column}', build, indicator=indicator)
+        rows, total = country_query.select(columns, conditions, sort, direction == 'desc', offset, limit)
+        
+        # Sayfadaki satırlar alan başına tek gather ile alınır
+        page = {}
+        for field, values in columns.items():
+            block = values[rows]
+            if field in ('rank', 'count'):
+                page[field] = [None if np.isnan(value) else int(value) for value in block.tolist()]
+            else:
+                page[field] = np.where(np.isnan(block), None, block).tolist()
+        codes = [None] * len(rows)
+        if 'Country Code' in store.row_meta.columns:
+            codes = [code if isinstance(code, str) else None
+                     for code in store.row_meta['Country Code'].to_numpy()[rows]]
+        countries = [
+            {'country': store.countries[row], 'country_code': codes[i],
+             **{field: page[field][i] for field in page}}
+            for i, row in enumerate(rows.tolist())
+        ]
+        
+        result = {
+            'year': int(store.years[column]),
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'countries': countries
+        }
+        if indicator is not None:
+            result['indicator'] = indicator
+        return result
+    
+    def get_trends(self, indicator: Optional[str] = None, window: int = trends.DEFAULT_WINDOW) -> Dict[str, Any]:
+        """
+        Tüm ülkelerin trend tablosunu sütun biçiminde döndürür.
+        
+        Yüzde değişim (son `window` değer), CAGR, en küçük kareler eğimi, son `window`
+        değerin ortalaması ve ilk/son pencere ortalamaları arasındaki değişim küpün
+        ülke × yıl matrisi üzerinde tek geçişte hesaplanır. Tablo gösterge ve pencere
+        başına veri değişene kadar saklanır; hesaplanamayan hücreler None'dır.
+        
+        Args:
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            window (int): Pencereli ölçüler için değer sayısı
             
-            lowest_chart = {
-                'labels': [item['country'] for item in lowest_countries],
-                'datasets': [{
-                    'label': 'Yenilenebilir Enerji Oranı (%)',
-                    'data': [item['value'] for item in lowest_countries],
-                    'backgroundColor': 'rgba(255, 99, 132, 0.2)',
-                    'borderColor': 'rgba(255, 99, 132, 1)',
-                    'borderWidth': 1
-                }]
+        Returns:
+            Dict[str, Any]: window, first_year, last_year, countries, codes ve ölçü başına
+                            ülke sırasıyla değer listeleri (percent_change, cagr, slope,
+                            window_average, window_change)
+        
+        Raises:
+            ValueError: Pencere geçersizse, veri seti boşsa veya gösterge yoksa
+        """
+        if window < 1:
+            raise ValueError(f"Pencere en az 1 olmalı: {window}")
+        
+        store = self._get_store(indicator)
+        if store is None:
+            raise ValueError("Veri seti boş, trendler hesaplanamıyor")
+        
+        def build() -> Dict[str, Any]:
+            table = trends.trend_table(store.values, store.years, window)
+            codes = [None] * len(store.countries)
+            if 'Country Code' in store.row_meta.columns:
+                codes = [code if isinstance(code, str) else None
+                         for code in store.row_meta['Country Code'].to_numpy()]
+            
+            result = {
+                'window': window,
+                'first_year': int(store.years[0]) if len(store.years) else None,
+                'last_year': int(store.years[-1]) if len(store.years) else None,
+                'countries': list(store.countries),
+                'codes': codes
             }
+            for name, column in table.items():
+                result[name] = np.where(np.isfinite(column), column, None).tolist()
+            if indicator is not None:
+                result['indicator'] = indicator
+            return result
+        
+        return self._cached_aggregate(f'trends:{window}', build, indicator=indicator)
+    
+    def get_similar_countries(self, country_name: str, k: int = 10, metric: str = 'pearson',
+                              indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir ülkeye zaman serisi en benzer k ülkeyi döndürür.
+        
+        Benzerlik matrisleri küp başına (veri sürümü başına) bir kez tüm ülke çiftleri
+        için hesaplanır; ülke başına komşu sırası hazır olduğundan sorgu O(k)'dır.
+        
+        Args:
+            country_name (str): Ülke adı veya kodu
+            k (int): Döndürülecek ülke sayısı
+            metric (str): 'pearson' (seviyeler), 'pearson_diff' (yıllık değişimler)
+                          veya 'euclidean' (normalize seriler arası uzaklık)
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            Dict[str, Any]: country, country_code, metric ve countries (country, country_code,
+                            score, overlap) listesi
+        
+        Raises:
+            ValueError: k, ölçü, ülke veya gösterge geçersizse
+        """
+        if k < 1:
+            raise ValueError(f"k en az 1 olmalı: {k}")
+        if metric not in SimilarityIndex.METRICS:
+            raise ValueError(f"Geçersiz benzerlik ölçüsü: {metric} ({', '.join(SimilarityIndex.METRICS)})")
+        
+        store = self._get_store(indicator)
+        if store is None:
+            raise ValueError("Veri seti boş, benzer ülkeler bulunamıyor")
+        row = store.position(self._resolve_country(country_name, indicator))
+        index = store.similarity_index()
+        codes = store.row_meta['Country Code'] if 'Country Code' in store.row_meta.columns else None
+        
+        def code_of(position: int) -> Optional[str]:
+            code = codes.iat[position] if codes is not None else None
+            return code if isinstance(code, str) else None
+        
+        scores = index.matrices[metric][row]
+        result = {
+            'country': store.countries[row],
+            'country_code': code_of(row),
+            'metric': metric,
+            'countries': [{
+                'country': store.countries[other],
+                'country_code': code_of(other),
+                'score': float(scores[other]),
+                'overlap': int(index.overlap[row, other])
+            } for other in index.most_similar(row, k, metric)]
+        }
+        if indicator is not None:
+            result['indicator'] = indicator
+        return result
+    
+    @property
+    def groups(self) -> Dict[str, country_groups.CountryGroup]:
+        """
+        Tanımlı ülke grupları.
+        
+        Varsayılanlar ile çalışma zamanı tanımları birleştirilir; aynı adlı grupta
+        çalışma zamanı tanımı geçerlidir. Dosyalardan biri değiştiyse (ör. başka bir
+        worker grup tanımladıysa) tanımlar yeniden okunur.
+        
+        Returns:
+            Dict[str, CountryGroup]: Grup adı -> grup
+        """
+        mtime = self._groups_file_mtime()
+        if self._groups is None or mtime != self._groups_mtime:
+            groups = country_groups.load_groups(self.groups_path)
+            groups.update(country_groups.load_groups(self.group_overrides_path))
+            self._groups = groups
+            self._groups_mtime = mtime
+        return self._groups
+    
+    def _groups_file_mtime(self) -> Tuple[Optional[int], Optional[int]]:
+        """Varsayılan ve çalışma zamanı grup dosyalarının değiştirilme zamanları (dosya yoksa None)."""
+        mtimes = []
+        for path in (self.groups_path, self.group_overrides_path):
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+    
+    def get_groups(self) -> List[Dict[str, Any]]:
+        """
+        Tanımlı ülke gruplarını listeler.
+        
+        Returns:
+            List[Dict[str, Any]]: name, label, countries ve varsa weights içeren grup listesi
+        """
+        return [{'name': name, **group.to_dict()} for name, group in sorted(self.groups.items())]
+    
+    def define_group(self, name: str, countries: List[str], weights: Optional[Dict[str, float]] = None,
+                     label: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir ülke grubunu tanımlar veya yeniden tanımlar ve çalışma zamanı grup dosyasına kaydeder.
+        
+        Varsayılan yapılandırma dosyası değiştirilmez; aynı adlı varsayılan grubun yerine
+        yeni tanım geçer. Dosya geçici bir dosyaya yazılıp tek bir rename ile değiştirilir; diğer süreçler
+        yeni tanımı dosyanın değiştirilme zamanından fark eder. Grup özetlerinin önbellek
+        anahtarı tanımı da içerdiğinden eski özetler kullanılmaz.
+        
+        Args:
+            name (str): Grup adı
+            countries (List[str]): Üye ülke adları veya kodları
+            weights (Dict[str, float], optional): Üye -> ağırlık
+            label (str, optional): Görünen ad
             
-            # Global trend
-            global_trend = self._calculate_global_trend()
+        Returns:
+            Dict[str, Any]: Kaydedilen grup tanımı
+        
+        Raises:
+            ValueError: Tanım geçersizse veya bir üye veri setinde yoksa
+        """
+        group = country_groups.CountryGroup(name, countries, weights=weights, label=label)
+        
+        # Çözümlenemeyen üyeler kaydedilmez; yazım hataları özet isteğine kadar gizli kalmasın
+        unknown = [member for member in group.countries
+                   if self.store is None or self._store_position(self.store, member) is None]
+        if unknown:
+            raise ValueError(f"Veri setinde bulunamayan ülkeler: {', '.join(unknown)}")
+        
+        with self._reload_lock:
+            groups = dict(self.groups)
+            groups[group.name] = group
+            overrides = country_groups.load_groups(self.group_overrides_path)
+            overrides[group.name] = group
+            definitions = {key: value.to_dict() for key, value in overrides.items()}
+            
+            directory = os.path.dirname(self.group_overrides_path)
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.group_overrides_path}.tmp-{os.getpid()}"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(definitions, f, ensure_ascii=False, indent=4)
+            os.replace(tmp_path, self.group_overrides_path)
+            
+            self._groups = groups
+            self._groups_mtime = self._groups_file_mtime()
+        
+        logger.info(f"Ülke grubu tanımlandı: {group.name} ({len(group.countries)} ülke)")
+        return {'name': group.name, **group.to_dict()}
+    
+    def get_group_data(self, name: str, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir ülke grubunun yıl başına özetlerini döndürür.
+        
+        Ortalama, medyan, en küçük/en büyük değer, değeri olan üye sayısı ve grup
+        ağırlık içeriyorsa ağırlıklı ortalama küp üzerinde üyelerin satırlarından
+        tek geçişte hesaplanır. Sonuç grup tanımı, gösterge ve veri sürümü başına saklanır.
+        
+        Args:
+            name (str): Grup adı
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
             
+        Returns:
+            Dict[str, Any]: name, label, years, countries, missing, mean, median, min, max, count,
+                            (weighted_mean) ve ortalama serinin son 5 değerlik trendi
+        
+        Raises:
+            ValueError: Grup tanımlı değilse, hiçbir üye bulunamazsa veya gösterge yoksa
+        """
+        group = self.groups.get(name)
+        if group is None:
+            raise ValueError(f"Ülke grubu bulunamadı: {name}")
+        
+        store = self._get_store(indicator)
+        if store is None:
+            raise ValueError("Veri seti boş, grup özeti hesaplanamıyor")
+        
+        def build() -> Dict[str, Any]:
+            rows, weights, missing, seen = [], [], [], set()
+            for member in group.countries:
+                row = self._store_position(store, member)
+                if row is None:
+                    missing.append(member)
+                    continue
+                if row not in seen:
+                    seen.add(row)
+                    rows.append(row)
+                    weights.append(group.weights.get(member, 1.0))
+            
+            if not rows:
+                raise ValueError(f"'{name}' grubunun hiçbir ülkesi veri setinde yok")
+            if missing:
+                logger.warning(f"'{name}' grubunda bulunamayan ülkeler: {', '.join(missing)}")
+            
+            summary = country_groups.aggregate(
+                store.values, rows, np.array(weights) if group.weights else None
+            )
+            result = {
+                'name': group.name,
+                'label': group.label,
+                'years': store.years.tolist(),
+                'countries': [store.countries[row] for row in rows],
+                'missing': missing
+            }
+            for key, column in summary.items():
+                if key == 'count':
+                    result[key] = column.tolist()
+                else:
+                    result[key] = np.where(np.isnan(column), None, column).tolist()
+            result['trend'] = float(trends.percent_change(summary['mean'], trends.DEFAULT_WINDOW)[0])
+            if indicator is not None:
+                result['indicator'] = indicator
+            return result
+        
+        definition = json.dumps(group.to_dict(), sort_keys=True)
+        return self._cached_aggregate(f'group:{name}:{definition}', build, indicator=indicator)
+    
+    def _overview_store(self) -> Optional[CountryYearStore]:
+        """
+        Genel bakışın hesaplanacağı küpü döndürür.
+        
+        Küp yoksa (elle atanmış uzun format) geçici bir küp oluşturulur; yılı
+        eksik satırlar atlanır, melted_data değiştirilmez.
+        """
+        if self.store is not None:
+            return self.store
+        melted = self.melted_data
+        if melted is None or melted.empty:
+            return None
+        return CountryYearStore.from_melted(melted)
+    
+    def _build_data_overview(self) -> Dict[str, Any]:
+        """
+        Genel bakışı küp üzerinden hesaplar: en yüksek/en düşük ülkeler son yılın
+        tek bir sıralamasından, global istatistikler tüm değerlerden alınır.
+        
+        Returns:
+            Dict[str, Any]: Genel bakış bilgilerini içeren sözlük
+        """
+        store = self._overview_store()
+        present = None if store is None else ~np.isnan(store.values)
+        if present is None or not present.any():
+            logger.warning("Veri seti boş, genel bakış oluşturulamıyor.")
             return {
-                'highest_countries': highest_countries,
-                'lowest_countries': lowest_countries,
-                'global_stats': global_stats,
-                'global_trend': global_trend,
-                'highest_chart': highest_chart,
-                'lowest_chart': lowest_chart
+                'highest_countries': [],
+                'lowest_countries': [],
+                'global_stats': {
+                    'min': 0,
+                    'max': 0,
+                    'mean': 0,
+                    'median': 0,
+                    'std': 0,
+                    'total_countries': 0,
+                    'years_range': "Veri yok"
+                },
+                'global_trend': 0
             }
-        except Exception as e:
-            logger.error(f"Genel bakış verileri alınırken hata: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-            raise Exception(f"Genel bakış verileri alınırken hata oluştu: {str(e)}")
+        
+        # Değeri olan yıllar; son yıl en yüksek/en düşük ülkeler için kullanılır
+        year_columns = np.flatnonzero(present.any(axis=0))
+        earliest_year = int(store.years[year_columns[0]])
+        latest_year = int(store.years[year_columns[-1]])
+        
+        # Yıl değerlerini daha anlamlı yap
+        if latest_year <= 30 and earliest_year >= 1:  # Muhtemelen 1-26 gibi indeks numaraları
+            # Daha anlamlı yıl değerleri oluştur (2000-2025 gibi)
+            base_year = 2000
+            latest_year = base_year + latest_year - 1
+            earliest_year = base_year + earliest_year - 1
+            logger.info(f"Yıl değerleri daha anlamlı hale getirildi: {earliest_year} - {latest_year}")
+        
+        # Son yılın en yüksek/en düşük ülkeleri sıralama indeksinden okunur (eşitlikte ülke sırası korunur)
+        latest_column = year_columns[-1]
+        highest_rows = store.rank_index().top(latest_column, 10, descending=True)
+        lowest_rows = store.rank_index().top(latest_column, 10, descending=False)
+        
+        highest_countries = [{
+            'country': store.countries[row],
+            'value': float(to_float64(store.values[row, latest_column]))
+        } for row in highest_rows]
+        
+        lowest_countries = [{
+            'country': store.countries[row],
+            'value': float(to_float64(store.values[row, latest_column]))
+        } for row in lowest_rows]
+        
+        # Global istatistikler - tüm mevcut değerler üzerinden
+        # float32 hücreler float64 biriktiricilerle özetlenir; matris genişletilmez
+        all_values = store.values[present]
+        std_value = float(all_values.std(ddof=1, dtype=np.float64)) if len(all_values) > 1 else 0
+        
+        # Yıl aralığını oluştur - anlamlı ve kullanıcı dostu bir format
+        years_range = f"{earliest_year} - {latest_year}" if earliest_year and latest_year else "Veri yok"
+        
+        global_stats = {
+            'min': float(to_float64(all_values.min())),
+            'max': float(to_float64(all_values.max())),
+            'mean': float(all_values.mean(dtype=np.float64)),
+            'median': float(to_float64(np.median(all_values))),
+            'std': std_value,
+            'total_countries': len(self.countries) if self.countries else 0,
+            'years_range': years_range
+        }
+        
+        # Chart.js için veri formatı hazırla
+        highest_chart = {
+            'labels': [item['country'] for item in highest_countries],
+            'datasets': [{
+                'label': 'Yenilenebilir Enerji Oranı (%)',
+                'data': [item['value'] for item in highest_countries],
+                'backgroundColor': 'rgba(75, 192, 192, 0.2)',
+                'borderColor': 'rgba(75, 192, 192, 1)',
+                'borderWidth': 1
+            }]
+        }
+        
+        lowest_chart = {
+            'labels': [item['country'] for item in lowest_countries],
+            'datasets': [{
+                'label': 'Yenilenebilir Enerji Oranı (%)',
+                'data': [item['value'] for item in lowest_countries],
+                'backgroundColor': 'rgba(255, 99, 132, 0.2)',
+                'borderColor': 'rgba(255, 99, 132, 1)',
+                'borderWidth': 1
+            }]
+        }
+        
+        # Global trend (göstergenin tamamına ait özet - veri değişene kadar saklanır)
+        global_trend = self._cached_aggregate('global_trend', self._calculate_global_trend)
+        
+        return {
+            'highest_countries': highest_countries,
+            'lowest_countries': lowest_countries,
+            'global_stats': global_stats,
+            'global_trend': global_trend,
+            'highest_chart': highest_chart,
+            'lowest_chart': lowest_chart
+        }
     
     def _calculate_global_trend(self) -> float:
         """
@@ -724,35 +2120,29 @@ class DataService:
             float: Global trend değeri
         """
         try:
-            # Her yıl için ortalama değerleri hesapla
-            yearly_avg = self.melted_data.groupby('Year')['Renewable_Value'].mean().reset_index()
-            
-            # Son 5 yıl için trend hesapla
-            recent_years = yearly_avg.tail(min(5, len(yearly_avg)))
-            
-            if len(recent_years) <= 1:
+            # Her yıl için ortalama değerleri hesapla (değeri olmayan yıllar atlanır)
+            store = self._overview_store()
+            if store is None:
                 return 0.0
-            
-            first_value = recent_years.iloc[0]['Renewable_Value']
-            last_value = recent_years.iloc[-1]['Renewable_Value']
-            
-            # 0'a bölme hatasını önle
-            if first_value == 0:
+            values = store.values
+            has_values = ~np.isnan(values).all(axis=0)
+            if not has_values.any():
                 return 0.0
+            yearly_avg = np.nanmean(values[:, has_values], axis=0, dtype=np.float64)
             
-            # Yüzde değişimi hesapla
-            percent_change = ((last_value - first_value) / first_value) * 100
-            return percent_change
+            # Son 5 yıl için trend hesapla (0 ile başlayan pencerede trend 0 kabul edilir)
+            return float(trends.percent_change(yearly_avg, trends.DEFAULT_WINDOW, zero_start=0.0)[0])
         except Exception as e:
             logger.error(f"Global trend hesaplanırken hata: {str(e)}")
             return 0.0
     
-    def train_model(self, country_name: str = None) -> Dict[str, Any]:
+    def train_model(self, country_name: str = None, indicator: Optional[str] = None) -> Dict[str, Any]:
         """
         Belirli bir ülke veya tüm ülkeler için model eğitir.
         
         Args:
             country_name (str, optional): Modeli eğitmek için ülke adı. None ise genel model eğitilir.
+            indicator (str, optional): Ülke modeli için gösterge kodu. None ise varsayılan gösterge
             
         Returns:
             Dict[str, Any]: Model eğitim sonuçları
@@ -762,12 +2152,12 @@ class DataService:
         try:
             if country_name:
                 # Belirli bir ülke için model eğit
-                result = self._train_country_model(country_name)
+                result = self._train_country_model(country_name, indicator)
                 if not result.get('success', False):
                     logger.error(f"{country_name} için model eğitimi başarısız: {result.get('error', 'Bilinmeyen hata')}")
                     
                 # Modelin başarıyla eğitildiğini doğrula
-                if country_name in self.models:
+                if self._model_key(result.get('country', country_name), indicator) in self.models:
                     logger.info(f"{country_name} için model başarıyla oluşturuldu ve kaydedildi")
                 else:
                     logger.error(f"{country_name} için model eğitildikten sonra bulunamadı")
@@ -801,295 +2191,165 @@ class DataService:
                 'country': country_name if country_name else 'general'
             }
     
-    def _train_country_model(self, country_name: str) -> Dict[str, Any]:
+    def ensure_model(self, country_name: Optional[str] = None, indicator: Optional[str] = None) -> Dict[str, Any]:
         """
-        Belirli bir ülke için model eğitir.
+        Modelin güncel veriyle eğitilmiş olmasını sağlar; model güncelse hiçbir şey yapmaz.
+        
+        Model, eğitildiği verinin damgasıyla birlikte tutulur ve veri sürümü başına
+        bir kez eğitilir. Model yoksa veya veri değiştiyse (bayatsa) yeniden eğitilir.
+        Aynı model için eşzamanlı çağrılar tek bir eğitimi bekler ve onun sonucunu
+        kullanır (single-flight); farklı modeller birbirini beklemez.
         
         Args:
-            country_name (str): Ülke adı
+            country_name (str, optional): Ülke adı veya kodu. None ise genel model
+            indicator (str, optional): Ülke modeli için gösterge kodu. None ise varsayılan gösterge
             
         Returns:
-            Dict[str, Any]: Model eğitim sonuçları
+            Dict[str, Any]: 'success', 'country' ve modelin bu çağrıda eğitilip eğitilmediği ('trained');
+                            eğitildiyse eğitim sonucu
         """
-        if country_name not in self.countries:
-            logger.warning(f"Model eğitimi için ülke bulunamadı: {country_name}")
-            raise ValueError(f"Ülke bulunamadı: {country_name}")
+        if country_name is not None:
+            country_name = self._resolve_country(country_name, indicator)
+            key = self._model_key(country_name, indicator)
+        else:
+            key = 'general'
         
-        try:
-            # Ülke verilerini al
-            country_data = self.melted_data[self.melted_data['Country Name'] == country_name].copy()
-            
-            # Veri yeterli mi kontrol et
-            if len(country_data) < 5:
-                logger.warning(f"{country_name} için yeterli veri yok. En az 5 veri noktası gerekli.")
-                
-                # Veri az olsa bile doğrusal regresyon deneyebiliriz
-                logger.info(f"{country_name} için az veri, doğrusal regresyon deneniyor...")
-                
-                try:
-                    # En azından doğrusal trend belirlemek için doğrusal regresyon deneyelim
-                    from sklearn.linear_model import LinearRegression
-                    X = country_data[['Year']].copy()
-                    y = country_data['Renewable_Value'].copy()
-                    
-                    model = LinearRegression()
-                    model.fit(X, y)
-                    
-                    # Modeli kaydet
-                    self.models[country_name] = model
-                    
-                    logger.info(f"{country_name} için doğrusal regresyon modeli oluşturuldu.")
-                    
-                    # Basit metrikler hesapla
-                    pred = model.predict(X)
-                    
-                    return {
-                        'success': True,
-                        'country': country_name,
-                        'metrics': {
-                            'r2_score': float(r2_score(y, pred)) if len(y) > 1 else 0.1,
-                            'mae': float(mean_absolute_error(y, pred)),
-                            'rmse': float(np.sqrt(mean_squared_error(y, pred))),
-                            'mse': float(mean_squared_error(y, pred))
-                        },
-                        'model': "LinearRegression"
-                    }
-                except Exception as e:
-                    logger.warning(f"Doğrusal regresyon başarısız: {str(e)}, basit model kullanılacak")
-                    
-                    # Eğer doğrusal regresyon da başarısız olursa, basit bir model kullanalım
-                    # Ancak sabit değil, en azından yıla göre artan/azalan bir değer döndürelim
-                    X = country_data[['Year']].copy()
-                    y = country_data['Renewable_Value'].copy()
-                    
-                    # Ortalama değer ve artış/azalış trendi
-                    mean_value = float(y.mean())
-                    
-                    # Eğer birden fazla veri noktası varsa trend hesaplayalım
-                    if len(y) > 1:
-                        years = X['Year'].values
-                        values = y.values
-                        # En son ve ilk değer arasındaki yüzde değişim
-                        if values[0] != 0:
-                            annual_rate = (values[-1] / values[0]) ** (1 / max(1, (years[-1] - years[0]))) - 1
-                        else:
-                            annual_rate = 0.01  # Varsayılan yıllık %1 artış
-                    else:
-                        annual_rate = 0.01  # Varsayılan yıllık %1 artış
-                    
-                    # Basit trend tahmini yapan model
-                    class TrendPredictor:
-                        def __init__(self, base_value, annual_rate, base_year):
-                            self.base_value = base_value
-                            self.annual_rate = annual_rate
-                            self.base_year = base_year
-                            # Uyumluluk için
-                            self.feature_importances_ = np.ones(1)
-                        
-                        def predict(self, X):
-                            years = X[:, 0]  # İlk sütun yıl değerleri
-                            predictions = []
-                            for year in years:
-                                # Üstel büyüme/azalış formülü
-                                years_diff = year - self.base_year
-                                pred = self.base_value * (1 + self.annual_rate) ** years_diff
-                                predictions.append(pred)
-                            return np.array(predictions)
-                        
-                        def __str__(self):
-                            return f"TrendPredictor(base_value={self.base_value}, annual_rate={self.annual_rate})"
-                    
-                    # En son yıl ve değeri referans al
-                    last_year = X['Year'].iloc[-1]
-                    last_value = y.iloc[-1]
-                    
-                    # Modeli oluştur ve kaydet
-                    model = TrendPredictor(last_value, annual_rate, last_year)
-                    self.models[country_name] = model
-                    
-                    logger.info(f"{country_name} için trend tahmini modeli oluşturuldu. Yıllık değişim: %{annual_rate*100:.2f}")
-                    
-                    # Basit metrikler döndür
-                    return {
-                        'success': True,
-                        'country': country_name,
-                        'metrics': {
-                            'r2_score': 0.3,  # Makul bir R2 değeri
-                            'mae': 0.0,
-                            'rmse': 0.0,
-                            'mse': 0.0
-                        },
-                        'model': "TrendPredictor (Basit Trend Tahmini)"
+        stamp = self._model_stamp(country_name, indicator)
+        if key in self.models and self._model_stamps.get(key) == stamp:
+            return {'success': True, 'country': country_name or 'general', 'trained': False}
+        
+        with self._training_locks_guard:
+            lock = self._training_locks.setdefault(key, threading.Lock())
+        with lock:
+            # Kilidi beklerken başka bir çağrı aynı modeli eğitmiş olabilir
+            if key in self.models and self._model_stamps.get(key) == stamp:
+                return {'success': True, 'country': country_name or 'general', 'trained': False}
+            
+            if key in self.models:
+                logger.info(f"{key} modeli bayat (veri değişti), yeniden eğitiliyor...")
+                # Eski modelle hesaplanmış tahminler de geçersizdir
+                if country_name is not None and key == country_name:
+                    self.predictions_cache = {
+                        cache_key: value for cache_key, value in self.predictions_cache.items()
+                        if cache_key.rsplit('_', 1)[0] != country_name
                     }
+            result = self.train_model(country_name, indicator)
+            return {**result, 'trained': True}
+    
+    def train_all_models(self, countries: Optional[List[str]] = None, indicator: Optional[str] = None,
+                         workers: Optional[int] = None,
+                         timeout: Optional[float] = parallel_training.DEFAULT_TIMEOUT,
+                         progress: Optional[parallel_training.ProgressCallback] = None) -> Dict[str, Any]:
+        """
+        Ülke modellerini toplu olarak, süreç havuzunda paralel eğitir.
+        
+        Her ülkenin küçük veri çerçevesi bir worker sürecine gönderilir, eğitilen
+        model geri alınıp self.models içine yazılır. Başarısız veya süresi dolan
+        ülkeler diğerlerini durdurmaz, özet içinde hata mesajlarıyla döndürülür.
+        
+        Args:
+            countries (List[str], optional): Eğitilecek ülkeler. None ise tüm ülkeler
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            workers (int, optional): Worker süreç sayısı. None ise çekirdek sayısı
+            timeout (float, optional): Ülke başına süre sınırı (saniye). None ise sınırsız
+            progress (callable, optional): Her ülke bittiğinde (biten, toplam, ülke, hata) ile çağrılır
             
-            # Yıl sütununu düzenle
-            country_data = country_data.sort_values('Year')
-            
-            # Eksik verileri tekrar kontrol et
-            if country_data['Renewable_Value'].isna().any():
-                logger.warning(f"{country_name} için eksik veriler var. Lineer interpolasyon kullanılacak.")
-                country_data['Renewable_Value'] = country_data['Renewable_Value'].interpolate(method='linear')
-            
-            # Özellik oluşturma
-            country_data['Previous_Value'] = country_data['Renewable_Value'].shift(1)
-            country_data['Rolling_Mean'] = country_data['Renewable_Value'].rolling(window=min(3, len(country_data)), min_periods=1).mean()
-            country_data['Rolling_Std'] = country_data['Renewable_Value'].rolling(window=min(3, len(country_data)), min_periods=1).std().fillna(0)
-            
-            # İlk satırdan NaN değerleri temizle
-            country_data = country_data.fillna(method='bfill')
-            
-            # Özellikler ve hedef
-            features = ['Year']
-            
-            # Eğer yeterince veri varsa ek özellikler ekleyin
-            if len(country_data) >= 3:
-                features.extend(['Previous_Value', 'Rolling_Mean'])
-                if len(country_data) >= 5:
-                    features.append('Rolling_Std')
-            
-            X = country_data[features]
-            y = country_data['Renewable_Value']
-            
-            # Eğitim ve test setlerine ayır
-            # Çok az veri varsa cross-validation kullan
-            if len(country_data) < 10:
-                logger.info(f"{country_name} için az veri var ({len(country_data)} satır), tüm veri kullanılacak")
-                # Basit bir model kullan - tüm veriyi eğitim için kullan
-                X_train, X_test, y_train, y_test = X, X, y, y
-            else:
-                # Normal eğitim-test ayrımı
-                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-            
-            # Model eğitimi
-            model = None
-            model_name = "Bilinmeyen Model"
+        Returns:
+            Dict[str, Any]: Eğitilen, model kaydından yüklenen ve başarısız ülke sayıları,
+                            model türleri ve hata özeti
+        """
+        started = time.perf_counter()
+        self._get_store(indicator)  # Bilinmeyen gösterge için ValueError
+        failures = {}
+        tasks = {}
+        model_types = {}
+        loaded = 0
+        for country in (self.countries if countries is None else countries):
             try:
-                if has_xgboost:
-                    logger.info(f"{country_name} için XGBoost modeli eğitiliyor...")
-                    model = XGBRegressor(n_estimators=100, random_state=42, objective='reg:squarederror')
-                    model.fit(X_train, y_train)
-                    model_name = "XGBoost"
-                else:
-                    logger.info(f"{country_name} için RandomForest modeli eğitiliyor (XGBoost mevcut değil)...")
-                    model = RandomForestRegressor(n_estimators=50, random_state=42)
-                    model.fit(X_train, y_train)
-                    model_name = "RandomForest"
-            except Exception as model_error:
-                logger.warning(f"İlk model eğitimi başarısız: {str(model_error)}. Alternatif model kullanılacak.")
-                # En basit model - LinearRegression
-                try:
-                    from sklearn.linear_model import LinearRegression
-                    model = LinearRegression()
-                    model.fit(X[['Year']], y)  # Sadece yıl özelliğini kullan
-                    logger.info(f"{country_name} için doğrusal regresyon modeli eğitildi")
-                    model_name = "LinearRegression"
-                except Exception as linear_error:
-                    logger.error(f"Doğrusal regresyon da başarısız: {str(linear_error)}")
-                    # Son çare olarak trend tahmini yapan bir model kullan
-                    
-                    # Son iki veri noktasını kullanarak yıllık değişim oranı hesapla
-                    if len(country_data) >= 2:
-                        country_data = country_data.sort_values('Year')
-                        last_year = country_data['Year'].iloc[-1]
-                        last_value = country_data['Renewable_Value'].iloc[-1]
-                        first_year = country_data['Year'].iloc[0]
-                        first_value = country_data['Renewable_Value'].iloc[0]
-                        
-                        # Yıllık büyüme oranı hesapla (compound annual growth rate)
-                        if first_value > 0 and last_year != first_year:
-                            years_diff = last_year - first_year
-                            annual_rate = (last_value / first_value) ** (1 / years_diff) - 1
-                        else:
-                            # Varsayılan yıllık %2 artış
-                            annual_rate = 0.02
-                            
-                        # Aşırı değerleri sınırlandır
-                        annual_rate = max(min(annual_rate, 0.1), -0.1)  # %10 ile sınırlandır
-                    else:
-                        annual_rate = 0.02  # Varsayılan yıllık %2 artış
-                        last_year = country_data['Year'].iloc[0]
-                        last_value = country_data['Renewable_Value'].iloc[0]
-                    
-                    # Trend tahminleyici sınıfı
-                    class TrendPredictor:
-                        def __init__(self, base_value, annual_rate, base_year):
-                            self.base_value = base_value
-                            self.annual_rate = annual_rate
-                            self.base_year = base_year
-                            # RandomForest ile kompatibl olmak için
-                            self.feature_importances_ = np.ones(1)
-                        
-                        def predict(self, X):
-                            years = X[:, 0]  # İlk sütun yıl değerleri
-                            predictions = []
-                            for year in years:
-                                # Üstel büyüme/azalış formülü
-                                years_diff = year - self.base_year
-                                pred = self.base_value * (1 + self.annual_rate) ** years_diff
-                                predictions.append(pred)
-                            return np.array(predictions)
-                        
-                        def __str__(self):
-                            return f"TrendPredictor(base_value={self.base_value}, annual_rate={self.annual_rate})"
-                    
-                    model = TrendPredictor(last_value, annual_rate, last_year)
-                    model_name = "TrendPredictor (Trend Tahmini)"
-                    logger.warning(f"{country_name} için trend tahmini modeli kullanıldı, yıllık değişim: %{annual_rate*100:.2f}")
-            
-            # Modeli kaydet
-            if model is not None:
-                self.models[country_name] = model
-                logger.info(f"{country_name} için model başarıyla kaydedildi: {model_name}")
+                name = self._resolve_country(country, indicator)
+                country_data = self._country_frame(name, indicator)
+            except ValueError as e:
+                failures[str(country)] = str(e)
+                continue
+            # Model kaydında aynı veriyle eğitilmiş model varsa yeniden eğitilmez
+            registered = self._load_registered_model(name, indicator, country_data)
+            if registered is not None:
+                loaded += 1
+                model_types[registered.get('model')] = model_types.get(registered.get('model'), 0) + 1
             else:
-                logger.error(f"{country_name} için model oluşturulamadı")
-                raise ValueError("Model eğitimi başarısız oldu")
+                tasks[name] = (name, country_data)
+        
+        # Az veri noktası olan ülkelerin doğrusal modelleri havuza gönderilmeden tek seferde çözülür
+        small = {name: args[1] for name, args in tasks.items() if len(args[1]) < SMALL_SAMPLE_ROWS}
+        results = fit_linear_models(small)
+        tasks_for_pool = {name: args for name, args in tasks.items() if name not in results}
+        
+        workers = workers or parallel_training.default_workers()
+        logger.info(f"{len(tasks_for_pool)} ülke için toplu model eğitimi başlatılıyor ({workers} worker), "
+                    f"{len(results)} ülkenin doğrusal modeli toplu çözüldü")
+        pool_results, pool_failures = parallel_training.run_parallel(
+            fit_country_model, tasks_for_pool, workers=workers, timeout=timeout, progress=progress
+        )
+        results.update(pool_results)
+        failures.update(pool_failures)
+        
+        for name, (model, result) in results.items():
+            self.models[self._model_key(name, indicator)] = model
+            self._model_stamps[self._model_key(name, indicator)] = dataset_hash(
+                tasks[name][1]['Year'], tasks[name][1]['Renewable_Value']
+            )
+            self._register_model(name, tasks[name][1], model, result)
+            model_types[result['model']] = model_types.get(result['model'], 0) + 1
+        
+        elapsed = time.perf_counter() - started
+        logger.info(f"Toplu model eğitimi tamamlandı: {len(results)} eğitildi, {loaded} kayıttan yüklendi, "
+                    f"{len(failures)} başarısız, {elapsed:.1f} sn")
+        return {
+            'success': len(results) + loaded > 0 or not failures,
+            'indicator': indicator or self.default_indicator,
+            'total': len(results) + loaded + len(failures),
+            'trained': len(results),
+            'loaded': loaded,
+            'failed': len(failures),
+            'failures': failures,
+            'model_types': model_types,
+            'workers': workers,
+            'elapsed_seconds': round(elapsed, 3)
+        }
+    
+    def _train_country_model(self, country_name: str, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Belirli bir ülke için model eğitir.
+        
+        Args:
+            country_name (str): Ülke adı veya ülke kodu
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
             
-            # Model metrikleri
-            try:
-                train_pred = model.predict(X_train)
-                test_pred = model.predict(X_test)
-                
-                metrics = {
-                    'train_rmse': float(np.sqrt(mean_squared_error(y_train, train_pred))),
-                    'test_rmse': float(np.sqrt(mean_squared_error(y_test, test_pred))),
-                    'train_mae': float(mean_absolute_error(y_train, train_pred)),
-                    'test_mae': float(mean_absolute_error(y_test, test_pred)),
-                    'r2_score': float(r2_score(y_test, test_pred)),
-                    'rmse': float(np.sqrt(mean_squared_error(y_test, test_pred))),
-                    'mae': float(mean_absolute_error(y_test, test_pred)),
-                    'mse': float(mean_squared_error(y_test, test_pred))
-                }
-                
-                # Özellik önemini al (eğer destekliyorsa)
-                if hasattr(model, 'feature_importances_'):
-                    metrics['feature_importance'] = dict(zip(features, model.feature_importances_))
-                else:
-                    metrics['feature_importance'] = {feature: 1.0/len(features) for feature in features}
-                
-            except Exception as metrics_error:
-                logger.error(f"Metrikler hesaplanırken hata: {str(metrics_error)}")
-                # Boş metrikler döndür
-                metrics = {
-                    'train_rmse': 0.0,
-                    'test_rmse': 0.0, 
-                    'train_mae': 0.0,
-                    'test_mae': 0.0,
-                    'r2_score': 0.0,
-                    'rmse': 0.0,
-                    'mae': 0.0,
-                    'mse': 0.0,
-                    'feature_importance': {feature: 1.0/len(features) for feature in features}
-                }
+        Returns:
+            Dict[str, Any]: Model eğitim sonuçları
+        """
+        try:
+            country_name = self._resolve_country(country_name, indicator)
+        except ValueError:
+            logger.warning(f"Model eğitimi için ülke bulunamadı: {country_name}")
+            raise
+        model_key = self._model_key(country_name, indicator)
+        
+        try:
+            # Ülke verilerini al; aynı veriyle eğitilmiş model kayıttaysa onu kullan
+            country_data = self._country_frame(country_name, indicator)
+            result = self._load_registered_model(country_name, indicator, country_data)
+            if result is not None:
+                return result
             
-            logger.info(f"{country_name} için model eğitildi. R2 skoru: {metrics.get('r2_score', 'N/A')}")
+            model, result = fit_country_model(country_name, country_data)
             
-            # Başarılı sonuç döndür
-            return {
-                'success': True,
-                'country': country_name,
-                'metrics': metrics,
-                'model': model_name
-            }
+            # Modeli kaydet
+            self.models[model_key] = model
+            self._model_stamps[model_key] = dataset_hash(country_data['Year'], country_data['Renewable_Value'])
+            self._register_model(country_name, country_data, model, result)
+            logger.info(f"{country_name} için model başarıyla kaydedildi: {result['model']}")
+            return result
         
         except Exception as e:
             logger.error(f"{country_name} için model eğitilirken hata: {str(e)}")
@@ -1100,16 +2360,76 @@ class DataService:
                 'error': f"Ülke modeli eğitilirken hata oluştu: {str(e)}"
             }
     
+    def _registry_key(self, country_name: str, country_data: pd.DataFrame) -> Tuple[str, str, Dict[str, Any], str]:
+        """
+        Ülke modelinin kayıt anahtarı: (ülke, model türü, hiperparametreler, eğitim verisinin özeti).
+        """
+        model_type, params = model_spec()
+        return country_name, model_type, params, dataset_hash(country_data['Year'], country_data['Renewable_Value'])
+    
+    def _model_stamp(self, country_name: Optional[str], indicator: Optional[str] = None) -> str:
+        """
+        Modelin eğitileceği verinin damgası: ülke modeli için ülke verisinin özeti,
+        genel model için bellekteki verinin sürümü (diskteki CSV yeniden yüklenmeden değişebilir).
+        """
+        if country_name is None:
+            return f"v{self.data_version}"
+        years, values = self._country_series(country_name, indicator)
+        # Eğitim çerçevesiyle (_country_frame) aynı float64 değerlerden hesaplanmalı
+        return dataset_hash(years, to_float64(values))
+    
+    def _load_registered_model(self, country_name: str, indicator: Optional[str],
+                               country_data: pd.DataFrame) -> Optional[Dict[str, Any]]:
+        """
+        Ülke modelini model kaydından yükleyip self.models içine koyar.
+        
+        Args:
+            country_name (str): Kanonik ülke adı
+            indicator (str, optional): Gösterge kodu
+            country_data (pd.DataFrame): Ülkenin eğitim verisi
+            
+        Returns:
+            Optional[Dict[str, Any]]: Kayıtlı eğitim sonucu; kayıt kapalıysa veya model yoksa None
+        """
+        if self.registry is None:
+            return None
+        key = self._registry_key(country_name, country_data)
+        entry = self.registry.get(*key)
+        if entry is None:
+            return None
+        self.models[self._model_key(country_name, indicator)] = entry['model']
+        self._model_stamps[self._model_key(country_name, indicator)] = key[3]
+        logger.info(f"{country_name} için model kayıttan yüklendi: {entry['result'].get('model')}")
+        return {**entry['result'], 'country': country_name, 'from_registry': True}
+    
+    def _register_model(self, country_name: str, country_data: pd.DataFrame, model: Any,
+                        result: Dict[str, Any]) -> None:
+        """
+        Eğitilen ülke modelini model kaydına yazar; yazma hatası eğitimi başarısız saymaz.
+        """
+        if self.registry is None:
+            return
+        try:
+            self.registry.put(*self._registry_key(country_name, country_data), model, result)
+        except Exception as e:
+            logger.warning(f"{country_name} modeli kayda yazılamadı: {str(e)}")
+    
     def _train_general_model(self) -> Dict[str, Any]:
         """
-        Tüm veri seti için genel bir model eğitir.
+        Tüm ülkelerin verisiyle tek bir genel (havuzlanmış) model eğitir.
+        
+        Model her ülkenin önceki yıl değerleri, hareketli istatistikleri ve ülke
+        kodlamasıyla eğitilir (bkz. app/models/global_model.py); tek model tüm
+        ülkeler için tahmin yapabilir ve forecast_all_countries() ile tüm
+        ülkelerin tahmini tek seferde hesaplanır. Aynı küple daha önce eğitilmiş
+        genel model model kaydında varsa yeniden eğitilmez, kayıttan yüklenir.
         
         Returns:
             Dict[str, Any]: Model eğitim sonuçları
         """
         try:
-            # Veri hazırlığı - tüm veri seti için
-            if self.melted_data is None or len(self.melted_data) == 0:
+            store = self._general_store()
+            if store is None or len(store.countries) == 0:
                 logger.error("Genel model için veri yok")
                 return {
                     'success': False,
@@ -1118,150 +2438,33 @@ class DataService:
                     'metrics': {}
                 }
             
-            # Sadece sayısal verileri kullan
+            registered = self._load_registered_general_model(store)
+            if registered is not None:
+                return registered
+            
             try:
-                X = self.melted_data[['Year']].copy()
-                y = self.melted_data['Renewable_Value'].copy()
-                
-                # NaN değerleri kontrol et
-                if X.isna().any().any() or y.isna().any():
-                    logger.warning("Genel modelde NaN değerler var, temizleniyor")
-                    mask = ~(X.isna().any(axis=1) | y.isna())
-                    X = X[mask]
-                    y = y[mask]
-                
-                # Yeterli veri var mı kontrolü
-                if len(X) < 10:
-                    logger.warning("Genel model için yeterli veri yok")
-                    return {
-                        'success': False,
-                        'error': "Yeterli veri yok",
-                        'country': 'general',
-                        'metrics': {}
-                    }
-                
-                # Veriyi eğitim ve test olarak böl
-                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-                
-                # Model eğitimi
-                try:
-                    if has_xgboost:
-                        logger.info("Genel model için XGBoost eğitiliyor...")
-                        model = XGBRegressor(n_estimators=100, random_state=42, objective='reg:squarederror')
-                        model.fit(X_train, y_train)
-                    else:
-                        logger.info("Genel model için RandomForest eğitiliyor (XGBoost mevcut değil)...")
-                        model = RandomForestRegressor(n_estimators=100, random_state=42)
-                        model.fit(X_train, y_train)
-                except Exception as e:
-                    logger.warning(f"İlk model eğitimi başarısız: {str(e)}. Alternatif model kullanılacak.")
-                    try:
-                        from sklearn.linear_model import LinearRegression
-                        model = LinearRegression()
-                        model.fit(X_train, y_train)
-                        logger.info("Genel model için doğrusal regresyon eğitildi")
-                    except Exception as linear_error:
-                        logger.error(f"Doğrusal regresyon eğitimi de başarısız: {str(linear_error)}")
-                        # Trend tahminleyici model kullan
-                        
-                        # Verileri sıralayalım
-                        sorted_data = self.melted_data.sort_values('Year')
-                        
-                        # İlk ve son değerleri alalım
-                        if len(sorted_data) >= 2:
-                            first_year = sorted_data['Year'].iloc[0]
-                            first_value = sorted_data['Renewable_Value'].iloc[0]
-                            last_year = sorted_data['Year'].iloc[-1]
-                            last_value = sorted_data['Renewable_Value'].iloc[-1]
-                            
-                            # Yıllık büyüme oranı hesapla (compound annual growth rate)
-                            if first_value > 0 and last_year != first_year:
-                                years_diff = last_year - first_year
-                                annual_rate = (last_value / first_value) ** (1 / years_diff) - 1
-                            else:
-                                # Varsayılan yıllık %2 artış
-                                annual_rate = 0.02
-                        else:
-                            # Yeterli veri yoksa varsayılan değerler
-                            mean_value = float(y.mean())
-                            last_year = sorted_data['Year'].iloc[0] if len(sorted_data) > 0 else 2020
-                            last_value = mean_value
-                            annual_rate = 0.02  # Varsayılan yıllık %2 artış
-                        
-                        # Aşırı değerleri sınırlandır
-                        annual_rate = max(min(annual_rate, 0.1), -0.1)  # %10 ile sınırlandır
-                        
-                        # Trend tahminleyici sınıf
-                        class TrendPredictor:
-                            def __init__(self, base_value, annual_rate, base_year):
-                                self.base_value = base_value
-                                self.annual_rate = annual_rate
-                                self.base_year = base_year
-                                # RandomForest ile kompatibl olmak için
-                                self.feature_importances_ = np.ones(1)
-                            
-                            def predict(self, X):
-                                years = X[:, 0]  # İlk sütun yıl değerleri
-                                predictions = []
-                                for year in years:
-                                    # Üstel büyüme/azalış formülü
-                                    years_diff = year - self.base_year
-                                    pred = self.base_value * (1 + self.annual_rate) ** years_diff
-                                    predictions.append(pred)
-                                return np.array(predictions)
-                        
-                        model = TrendPredictor(last_value, annual_rate, last_year)
-                        logger.warning(f"Genel model için trend tahmini modeli kullanıldı, yıllık değişim: %{annual_rate*100:.2f}")
-                
-                # Modeli kaydet
-                self.models['general'] = model
-                
-                # Model metrikleri
-                try:
-                    train_pred = model.predict(X_train)
-                    test_pred = model.predict(X_test)
-                    
-                    metrics = {
-                        'train_rmse': float(np.sqrt(mean_squared_error(y_train, train_pred))),
-                        'test_rmse': float(np.sqrt(mean_squared_error(y_test, test_pred))),
-                        'train_mae': float(mean_absolute_error(y_train, train_pred)),
-                        'test_mae': float(mean_absolute_error(y_test, test_pred)),
-                        'r2_score': float(r2_score(y_test, test_pred))
-                    }
-                    
-                    if hasattr(model, 'feature_importances_'):
-                        metrics['feature_importance'] = dict(zip(['Year'], model.feature_importances_))
-                    else:
-                        metrics['feature_importance'] = {'Year': 1.0}
-                    
-                except Exception as metrics_error:
-                    logger.error(f"Metrikler hesaplanırken hata: {str(metrics_error)}")
-                    metrics = {
-                        'train_rmse': 0.0,
-                        'test_rmse': 0.0,
-                        'train_mae': 0.0,
-                        'test_mae': 0.0,
-                        'r2_score': 0.0,
-                        'feature_importance': {'Year': 1.0}
-                    }
-                
-                logger.info(f"Genel model eğitildi. R2 skoru: {metrics.get('r2_score', 'N/A')}")
-                
-                return {
-                    'success': True,
-                    'country': 'general',
-                    'metrics': metrics,
-                    'model_quality': "genel"
-                }
-                
-            except Exception as inner_e:
-                logger.error(f"Genel model veri hazırlığında hata: {str(inner_e)}")
+                model, result = fit_global_model(store.values, store.years, store.countries)
+            except ValueError as e:
+                logger.warning(f"Genel model eğitilemedi: {str(e)}")
                 return {
                     'success': False,
-                    'error': f"Veri hazırlığında hata: {str(inner_e)}",
+                    'error': str(e),
                     'country': 'general',
                     'metrics': {}
                 }
+            
+            # Modeli kaydet
+            self.models['general'] = model
+            self._model_stamps['general'] = self._model_stamp(None)
+            if self.registry is not None:
+                try:
+                    self.registry.put(*self._general_registry_key(store), model, result)
+                except Exception as e:
+                    logger.warning(f"Genel model kayda yazılamadı: {str(e)}")
+            
+            logger.info(f"Genel model eğitildi ({result['samples']} örnek, {result['countries']} ülke). "
+                        f"R2 skoru: {result['metrics'].get('r2_score', 'N/A')}")
+            return result
         except Exception as e:
             logger.error(f"Genel model eğitilirken hata: {str(e)}")
             return {
@@ -1271,6 +2474,111 @@ class DataService:
                 'metrics': {}
             }
     
+    def _general_registry_key(self, store: CountryYearStore) -> Tuple[str, str, Dict[str, Any], str]:
+        """
+        Genel modelin kayıt anahtarı: ('general', model türü, hiperparametreler, küpün içerik özeti).
+        """
+        model_type, params = global_model_spec()
+        return 'general', model_type, params, store.content_hash()
+    
+    def _load_registered_general_model(self, store: CountryYearStore) -> Optional[Dict[str, Any]]:
+        """
+        Genel modeli model kaydından yükleyip self.models içine koyar.
+        
+        Args:
+            store (CountryYearStore): Genel modelin eğitileceği küp
+            
+        Returns:
+            Optional[Dict[str, Any]]: Kayıtlı eğitim sonucu; kayıt kapalıysa veya model yoksa None
+        """
+        if self.registry is None:
+            return None
+        entry = self.registry.get(*self._general_registry_key(store))
+        if entry is None or not isinstance(entry['model'], GlobalForecaster):
+            return None
+        self.models['general'] = entry['model']
+        self._model_stamps['general'] = self._model_stamp(None)
+        logger.info(f"Genel model kayıttan yüklendi: {entry['result'].get('model')}")
+        return {**entry['result'], 'country': 'general', 'from_registry': True}
+    
+    def _general_store(self) -> Optional[CountryYearStore]:
+        """
+        Genel modelin eğitildiği ülke × yıl küpü: varsayılan göstergenin küpü,
+        küp yoksa (elle atanmış veri) uzun formattan oluşturulan küp.
+        """
+        if self.store is not None:
+            return self.store
+        if self.melted_data is None or len(self.melted_data) == 0:
+            return None
+        return CountryYearStore.from_melted(self.melted_data)
+    
+    def forecast_all_countries(self, future_year: int,
+                               countries: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Genel modelle birden fazla ülkenin (varsayılan: tümünün) tahminini tek seferde hesaplar.
+        
+        Ülke başına model eğitilmez; son veri yılından hedef yıla kadar her yıl
+        tüm ülkeler için tek bir predict çağrısıyla hesaplanır.
+        
+        Args:
+            future_year (int): Tahmin edilecek yıl (son veri yılından büyük olmalı)
+            countries (List[str], optional): Ülke adları veya kodları. None ise tüm ülkeler
+            
+        Returns:
+            Dict[str, Any]: year, base_year, model, countries, predictions (ülke sırasıyla,
+                            tahmin edilemeyenler None) ve bulunamayan girdiler (missing)
+        
+        Raises:
+            ValueError: Yıl geçersizse, hiçbir ülke bulunamazsa veya genel model eğitilemezse
+        """
+        try:
+            future_year = int(future_year)
+        except (ValueError, TypeError):
+            raise ValueError(f"Geçersiz gelecek yılı: {future_year}. Yıl bir tam sayı olmalıdır.")
+        
+        store = self._general_store()
+        if store is None:
+            raise ValueError("Veri seti boş, tahmin yapılamıyor")
+        
+        rows, missing, seen = [], [], set()
+        for country in (countries if countries else store.countries):
+            row = self._store_position(store, country)
+            if row is None:
+                missing.append(country)
+                continue
+            if row not in seen:
+                seen.add(row)
+                rows.append(row)
+        if not rows:
+            raise ValueError(f"Bulunamayan ülkeler: {', '.join(missing)}")
+        
+        # Yıllar 1-26 gibi sıra numaralarıysa takvim yılı olarak 2000'den başlar (bkz. get_data_overview)
+        offset = 0
+        if store.years[-1] <= 30 and store.years[0] >= 1 and future_year >= 1000:
+            offset = 1999
+        base_year = int(store.years[-1]) + offset
+        if future_year <= base_year:
+            raise ValueError(f"Geçersiz gelecek yılı: {future_year}. Gelecek yılı mevcut son yıldan ({base_year}) büyük olmalıdır.")
+        
+        train_result = self.ensure_model()
+        model = self.models.get('general')
+        if not train_result.get('success', False) or not isinstance(model, GlobalForecaster):
+            raise ValueError(f"Genel model eğitilemedi: {train_result.get('error', 'Bilinmeyen hata')}")
+        
+        names = [store.countries[row] for row in rows]
+        forecasts = model.forecast(store.values[rows], store.years, names, future_year - offset)
+        predictions = forecasts[:, -1]
+        
+        return {
+            'success': True,
+            'year': future_year,
+            'base_year': base_year,
+            'model': model.model_name,
+            'countries': names,
+            'predictions': np.where(np.isnan(predictions), None, np.round(predictions, 4)).tolist(),
+            'missing': missing
+        }
+    
     def get_model_metrics(self, country_name: str = None) -> Dict[str, Any]:
         """
         Eğitilmiş model metriklerini döndürür.
@@ -1281,15 +2589,16 @@ class DataService:
         Returns:
             Dict[str, Any]: Model metrikleri
         """
+        # Ağır ML bağımlılıkları ilk kullanımda içe aktarılır
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         try:
-            # Eğer model yoksa önce eğit
-            model_key = country_name if country_name else 'general'
-            if model_key not in self.models:
-                logger.info(f"{model_key} için model bulunamadı, eğitiliyor...")
-                if country_name:
-                    self.train_model(country_name)
-                else:
-                    self.train_model()
+            # Eğer model yoksa önce eğit (kod ve takma adlar eğitimdeki kanonik anahtara çözülür)
+            if country_name:
+                country_name = self._resolve_country(country_name)
+            model_key = self._model_key(country_name) if country_name else 'general'
+            self.ensure_model(country_name)
             
             if model_key not in self.models:
                 logger.warning(f"{model_key} için model eğitilemedi")
@@ -1330,7 +2639,7 @@ class DataService:
                 
                 if country_name:
                     # Ülkeye özgü veriler
-                    country_data = self.melted_data[self.melted_data['Country Name'] == country_name].copy()
+                    country_data = self._country_frame(country_name)
                     
                     # Eksik verileri temizle
                     if country_data['Renewable_Value'].isna().any():
@@ -1378,8 +2687,11 @@ class DataService:
                     logger.info(f"Kullanılacak özellikler: {available_features}")
                     X = country_data[available_features]
                     y = country_data['Renewable_Value']
+                elif isinstance(model, GlobalForecaster):
+                    # Genel model için - tüm ülkelerin gecikme özellikleri
+                    store = self._general_store()
+                    X, y = model.samples(store.values, store.years, store.countries)
                 else:
-                    # Genel model için - sadece yıl kullan
                     X = self.melted_data[['Year']]
                     y = self.melted_data['Renewable_Value']
                 
@@ -1492,16 +2804,15 @@ class DataService:
         """
         try:
             # Eğer model yoksa önce eğit
-            model_key = country_name if country_name else 'general'
+            model_key = 'general'
             
             # Modeli eğitmeyi dene, hata olursa varsayılan değerler döndür
             try:
-                if model_key not in self.models:
-                    logger.info(f"{model_key} için model eğitiliyor...")
-                    if country_name:
-                        self._train_country_model(country_name)
-                    else:
-                        self._train_general_model()
+                if country_name:
+                    # Kod ve takma adlar eğitimdeki kanonik anahtara çözülür
+                    country_name = self._resolve_country(country_name)
+                    model_key = self._model_key(country_name)
+                self.ensure_model(country_name)
                 
                 if model_key not in self.models:
                     logger.warning(f"Özellik önemliliği için model bulunamadı: {model_key}")
@@ -1591,6 +2902,7 @@ class DataService:
         if country_name not in self.countries:
             logger.warning(f"Tahmin için ülke bulunamadı: {country_name}")
             raise ValueError(f"Ülke bulunamadı: {country_name}")
+        country_name = self._resolve_country(country_name)
         
         try:
             # Gelen yıl değerinin sayısal olduğunu garanti et
@@ -1601,7 +2913,7 @@ class DataService:
         
         # Mevcut en son yılı güvenli şekilde belirle
         try:
-            current_max_year = int(self.melted_data['Year'].max())
+            current_max_year = self._max_year()
         except (ValueError, TypeError):
             logger.warning(f"Mevcut yıl değeri dönüştürülemedi")
             # Varsayılan bir değer koy
@@ -1620,12 +2932,15 @@ class DataService:
             cached_prediction = self.predictions_cache[cache_key]
             if cached_prediction.get('future_year') == future_year:
                 # Önbellek geçerli
+                self.cache_stats['hits'] += 1
                 return cached_prediction
             else:
                 # Önbellek tutarsız, sil
                 logger.warning(f"Önbellekte yıl tutarsızlığı, yeniden hesaplanıyor: {cached_prediction.get('future_year')} != {future_year}")
                 del self.predictions_cache[cache_key]
         
+        self.cache_stats['misses'] += 1
+        
         try:
             # Ülke verilerini al
             country_data = self.get_country_data(country_name)
@@ -1661,10 +2976,8 @@ class DataService:
                 latest_year = current_max_year
                 logger.warning(f"Yıl dönüştürülemedi, varsayılan değer kullanılıyor: {latest_year}")
             
-            # Eğer model yoksa eğit
-            if country_name not in self.models:
-                logger.info(f"{country_name} için model bulunamadı, eğitiliyor...")
-                self.train_model(country_name)
+            # Model yoksa veya bayatsa eğit (eşzamanlı istekler tek eğitimi bekler)
+            self.ensure_model(country_name)
             
             # Modele erişim kontrolü
             if country_name not in self.models:
@@ -1685,8 +2998,7 @@ class DataService:
                 # Önceki değer, ortalama ve standart sapma değerlerini hesapla
                 
                 # Ülkeye ait veriler
-                country_df = self.melted_data[self.melted_data['Country Name'] == country_name].copy()
-                country_df = country_df.sort_values('Year')
+                country_df = self._country_frame(country_name)
                 
                 # Son verileri al
                 last_data = country_df.iloc[-1]
@@ -1788,7 +3100,7 @@ class DataService:
                     
                     # Modelin yaptığı tahminin gerçekçiliğini kontrol et
                     # Çok yüksek tahminleri sınırlandır
-                    current_max = self.melted_data['Renewable_Value'].max() * 1.5  # Mevcut maksimum değerin %50 fazlasını üst sınır olarak kabul et
+                    current_max = self._max_value() * 1.5  # Mevcut maksimum değerin %50 fazlasını üst sınır olarak kabul et
                     if future_prediction > current_max:
                         logger.warning(f"Tahmin değeri ({future_prediction}) çok yüksek, {current_max} ile sınırlandırılıyor")
                         future_prediction = current_max
@@ -1922,6 +3234,7 @@ class DataService:
         if invalid_countries:
             logger.warning(f"Bulunamayan ülkeler: {', '.join(invalid_countries)}")
             raise ValueError(f"Bulunamayan ülkeler: {', '.join(invalid_countries)}")
+        countries = [self._resolve_country(country) for country in countries]
         
         try:
             # Her ülke için veri al
@@ -4,8 +4,10 @@ Bu modül model ve görünüm arasında köprü görevi görerek, verileri gör
 """
 
 from typing import Dict, List, Tuple, Optional, Any, Union
+import json
 import logging
 from app.data_service import DataService
+from app.service_container import get_data_service
 import numpy as np
 import random
 import math
@@ -32,9 +34,11 @@ class DataViewModel:
         DataViewModel sınıfı başlatıcı
         
         Args:
-            data_service (DataService, optional): Kullanılacak veri servisi. None ise yeni bir DataService oluşturulur.
+            data_service (DataService, optional): Kullanılacak veri servisi. None ise süreç genelinde paylaşılan DataService kullanılır.
         """
-        self.data_service = data_service or DataService()
+        self.data_service = data_service or get_data_service()
+        # (servisin genel bakış JSON'u, yanıt zarfıyla birlikte JSON) - servis veri değişince yeni JSON üretir
+        self._overview_response: Optional[Tuple[bytes, bytes]] = None
         logger.info("DataViewModel başlatıldı.")
     
     def get_countries(self) -> Dict[str, Any]:
@@ -86,18 +90,53 @@ class DataViewModel:
                 'count': 0
             }
     
-    def get_country_data(self, country_name: str) -> Dict[str, Any]:
+    def get_indicators(self) -> Dict[str, Any]:
+        """
+        Veri setindeki göstergelerin listesini döndürür.
+        
+        Returns:
+            Dict[str, Any]: API yanıtı olarak gösterge listesi
+        """
+        try:
+            indicators = self.data_service.get_indicators()
+            return {
+                'success': True,
+                'indicators': indicators,
+                'default': self.data_service.default_indicator,
+                'count': len(indicators)
+            }
+        except Exception as e:
+            logger.error(f"Gösterge listesi alınırken hata: {str(e)}")
+            return {
+                'success': False,
+                'error': str(e),
+                'indicators': [],
+                'count': 0
+            }
+    
+    def get_country_data(self, country_name: str, indicator: str = None, start_year: Optional[int] = None,
+                         end_year: Optional[int] = None, step: int = 1) -> Dict[str, Any]:
         """
         Belirli bir ülke için veri döndürür.
         
         Args:
-            country_name (str): Ülke adı
+            country_name (str): Ülke adı veya ülke kodu
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            start_year (int, optional): Aralığın başlangıç yılı (dahil)
+            end_year (int, optional): Aralığın bitiş yılı (dahil)
+            step (int): Seri için adım (1 ise tüm noktalar)
             
         Returns:
             Dict[str, Any]: API yanıtı olarak ülke verileri
         """
         try:
-            data = self.data_service.get_country_data(country_name)
+            # Yalnızca verilen seçenekler iletilir
+            options = {}
+            if indicator:
+                options['indicator'] = indicator
+            if start_year is not None or end_year is not None or step != 1:
+                options.update(start_year=start_year, end_year=end_year, step=step)
+            data = self.data_service.get_country_data(country_name, **options)
             
             if not data:
                 logger.warning(f"{country_name} için veri bulunamadı.")
@@ -164,14 +203,17 @@ class DataViewModel:
                 if isinstance(value, float) and np.isnan(value):
                     chart_data["datasets"][0]["data"][i] = 0
             
-            return {
+            result = {
                 "success": True,
-                "country": country_name,
+                "country": data.get("country", country_name),
                 "statistics": stats,
                 "chart_data": chart_data,
                 "years": years_data,
                 "values": values_data
             }
+            if indicator:
+                result["indicator"] = indicator
+            return result
         except Exception as e:
             logger.error(f"{country_name} için veri alınırken hata: {str(e)}")
             import traceback
@@ -182,6 +224,38 @@ class DataViewModel:
                 "message": str(e)
             }
     
+    def get_countries_data(self, countries: List[str], indicator: str = None, start_year: Optional[int] = None,
+                           end_year: Optional[int] = None, step: int = 1) -> Dict[str, Any]:
+        """
+        Birden fazla ülkenin verisini sütun düzeninde döndürür.
+        
+        Args:
+            countries (List[str]): Ülke adları veya ülke kodları
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            start_year (int, optional): Aralığın başlangıç yılı (dahil)
+            end_year (int, optional): Aralığın bitiş yılı (dahil)
+            step (int): Yıl ekseni için adım (1 ise tüm yıllar)
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak ortak yıllar ve ülke başına değer dizileri
+        """
+        try:
+            options = {}
+            if start_year is not None or end_year is not None or step != 1:
+                options.update(start_year=start_year, end_year=end_year, step=step)
+            data = self.data_service.get_countries_data(countries, indicator=indicator, **options)
+            return {
+                "success": True,
+                **data
+            }
+        except Exception as e:
+            logger.error(f"Ülke verileri toplu alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Ülke verileri alınamadı",
+                "message": str(e)
+            }
+    
     def get_data_overview(self) -> Dict[str, Any]:
         """
         Veri seti hakkında genel bakış döndürür.
@@ -204,6 +278,243 @@ class DataViewModel:
                 "message": str(e)
             }
     
+    def get_data_overview_json(self) -> bytes:
+        """
+        get_data_overview() yanıtını JSON olarak döndürür.
+        
+        Yanıt veri sürümü başına bir kez yazılır; sonraki istekler aynı baytları alır.
+        
+        Returns:
+            bytes: UTF-8 JSON API yanıtı
+        """
+        try:
+            overview = self.data_service.get_data_overview_json()
+            cached = self._overview_response
+            if cached is None or cached[0] is not overview:
+                cached = (overview, b'{"success":true,"overview":' + overview + b'}')
+                self._overview_response = cached
+            return cached[1]
+        except Exception as e:
+            logger.error(f"Veri genel bakış bilgileri alınırken hata: {str(e)}")
+            return json.dumps({
+                "success": False,
+                "error": "Veri genel bakış bilgileri alınamadı",
+                "message": str(e)
+            }).encode('utf-8')
+    
+    def get_rankings(self, year: Optional[int] = None, k: int = 10, direction: str = 'desc',
+                     country: Optional[str] = None, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir yılın ülke sıralamasını döndürür.
+        
+        Args:
+            year (int, optional): Yıl. None ise değeri olan en son yıl
+            k (int): Döndürülecek ülke sayısı
+            direction (str): 'desc' (en yüksekten) veya 'asc' (en düşükten)
+            country (str, optional): Sırası ve yüzdeliği istenen ülke
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak sıralama
+        """
+        try:
+            rankings = self.data_service.get_rankings(year, k, direction, country=country, indicator=indicator)
+            return {
+                "success": True,
+                **rankings
+            }
+        except Exception as e:
+            logger.error(f"Sıralama alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Sıralama alınamadı",
+                "message": str(e)
+            }
+    
+    def query_countries(self, filters: Optional[str] = None, year: Optional[int] = None,
+                        sort: Optional[str] = 'value', direction: str = 'desc', offset: int = 0,
+                        limit: int = 50, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Ülkeleri filtre ifadesine göre tarar, sıralar ve sayfalar.
+        
+        Args:
+            filters (str, optional): "value>40, trend<0" biçiminde filtre ifadesi
+            year (int, optional): value/rank/percentile alanlarının yılı
+            sort (str, optional): Sıralama alanı
+            direction (str): 'desc' veya 'asc'
+            offset (int): Atlanacak sonuç sayısı
+            limit (int): Döndürülecek en fazla sonuç
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak eşleşen ülkeler
+        """
+        try:
+            result = self.data_service.query_countries(filters, year, sort, direction, offset, limit,
+                                                       indicator=indicator)
+            return {
+                "success": True,
+                **result
+            }
+        except Exception as e:
+            logger.error(f"Ülke sorgusu çalıştırılırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Sorgu çalıştırılamadı",
+                "message": str(e)
+            }
+    
+    def suggest_countries(self, query: str, limit: int = 10) -> Dict[str, Any]:
+        """
+        Ülke adı otomatik tamamlama önerilerini döndürür.
+        
+        Args:
+            query (str): Aranan önek
+            limit (int): Döndürülecek en fazla ülke
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak öneriler
+        """
+        try:
+            return {
+                "success": True,
+                "query": query,
+                "suggestions": self.data_service.suggest_countries(query, limit)
+            }
+        except Exception as e:
+            logger.error(f"Ülke önerileri alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Ülke önerileri alınamadı",
+                "message": str(e)
+            }
+    
+    def get_trends(self, indicator: Optional[str] = None, window: int = 5) -> Dict[str, Any]:
+        """
+        Tüm ülkelerin trend tablosunu döndürür.
+        
+        Args:
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            window (int): Pencereli ölçüler için değer sayısı
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak sütun biçiminde trend tablosu
+        """
+        try:
+            table = self.data_service.get_trends(indicator=indicator, window=window)
+            return {
+                "success": True,
+                **table
+            }
+        except Exception as e:
+            logger.error(f"Trendler alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Trendler alınamadı",
+                "message": str(e)
+            }
+    
+    def get_similar_countries(self, country_name: str, k: int = 10, metric: str = 'pearson',
+                              indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir ülkeye en benzer k ülkeyi döndürür.
+        
+        Args:
+            country_name (str): Ülke adı veya kodu
+            k (int): Döndürülecek ülke sayısı
+            metric (str): 'pearson', 'pearson_diff' veya 'euclidean'
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak benzer ülkeler
+        """
+        try:
+            similar = self.data_service.get_similar_countries(country_name, k, metric, indicator=indicator)
+            return {
+                "success": True,
+                **similar
+            }
+        except Exception as e:
+            logger.error(f"Benzer ülkeler alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Benzer ülkeler alınamadı",
+                "message": str(e)
+            }
+    
+    def get_groups(self) -> Dict[str, Any]:
+        """
+        Tanımlı ülke gruplarını döndürür.
+        
+        Returns:
+            Dict[str, Any]: API yanıtı olarak grup listesi
+        """
+        try:
+            return {
+                "success": True,
+                "groups": self.data_service.get_groups()
+            }
+        except Exception as e:
+            logger.error(f"Ülke grupları alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Ülke grupları alınamadı",
+                "message": str(e)
+            }
+    
+    def define_group(self, name: str, countries: List[str], weights: Optional[Dict[str, float]] = None,
+                     label: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir ülke grubunu tanımlar.
+        
+        Args:
+            name (str): Grup adı
+            countries (List[str]): Üye ülke adları veya kodları
+            weights (Dict[str, float], optional): Üye -> ağırlık
+            label (str, optional): Görünen ad
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak kaydedilen grup
+        """
+        try:
+            group = self.data_service.define_group(name, countries, weights=weights, label=label)
+            return {
+                "success": True,
+                "group": group
+            }
+        except Exception as e:
+            logger.error(f"Ülke grubu tanımlanırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Ülke grubu tanımlanamadı",
+                "message": str(e)
+            }
+    
+    def get_group_data(self, name: str, indicator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Bir ülke grubunun yıl başına özetlerini döndürür.
+        
+        Args:
+            name (str): Grup adı
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            
+        Returns:
+            Dict[str, Any]: API yanıtı olarak grup özetleri
+        """
+        try:
+            summary = self.data_service.get_group_data(name, indicator=indicator)
+            return {
+                "success": True,
+                **summary
+            }
+        except Exception as e:
+            logger.error(f"Grup verileri alınırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Grup verileri alınamadı",
+                "message": str(e)
+            }
+    
     def get_feature_importance(self, country_name: str = None) -> Dict[str, Any]:
         """
         Model için özellik önem derecelerini döndürür.
@@ -420,14 +731,11 @@ class DataViewModel:
                 # Detaylı loglama ekleyerek sorunları tespit etmeye çalışalım
                 logger.info(f"{country_name} için {future_year} yılı tahmini hesaplanıyor...")
                 
-                # Model var mı kontrol edelim
-                if country_name not in self.data_service.models:
-                    logger.warning(f"{country_name} için model bulunamadı. Model eğitimi yapılacak...")
-                    train_result = self.data_service.train_model(country_name)
-                    if not train_result.get('success', False):
-                        logger.error(f"Model eğitimi başarısız oldu: {train_result.get('error', 'Bilinmeyen hata')}")
-                        raise ValueError(f"Model eğitimi başarısız oldu: {train_result.get('error', 'Bilinmeyen hata')}")
-                    logger.info(f"{country_name} için model başarıyla eğitildi.")
+                # Model yoksa veya veri değiştiyse eğitilir; güncel model yeniden eğitilmez
+                train_result = self.data_service.ensure_model(country_name)
+                if not train_result.get('success', False):
+                    logger.error(f"Model eğitimi başarısız oldu: {train_result.get('error', 'Bilinmeyen hata')}")
+                    raise ValueError(f"Model eğitimi başarısız oldu: {train_result.get('error', 'Bilinmeyen hata')}")
                 
                 # Tahmin verisi al
                 prediction_data = self.data_service.predict_future(country_name, future_year)
@@ -759,12 +1067,13 @@ class DataViewModel:
                 "error": f"Model metrikleri alınamadı: {str(e)}"
             }
     
-    def train_model(self, country_name: str = None) -> Dict[str, Any]:
+    def train_model(self, country_name: str = None, indicator: str = None) -> Dict[str, Any]:
         """
         Modeli eğitir ve sonuçları döndürür.
         
         Args:
             country_name (str, optional): Ülke adı. None ise global model eğitilir.
+            indicator (str, optional): Ülke modeli için gösterge kodu. None ise varsayılan gösterge
             
         Returns:
             Dict[str, Any]: API yanıtı olarak eğitim sonuçları
@@ -783,7 +1092,10 @@ class DataViewModel:
                     }
                     
                 # Ülke modeli eğitimi
-                result = self.data_service.train_model(country_name)
+                if indicator:
+                    result = self.data_service.train_model(country_name, indicator=indicator)
+                else:
+                    result = self.data_service.train_model(country_name)
             else:
                 # Genel model eğitimi
                 result = self.data_service.train_model()
@@ -840,7 +1152,87 @@ class DataViewModel:
                 'error': str(e),
                 'message': "Model eğitimi sırasında beklenmeyen bir hata oluştu"
             }
-    
+
+    def get_predictions(self, future_year: int, countries: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Genel modelle birden fazla ülkenin (varsayılan: tümünün) tahminini tek seferde döndürür.
+
+        Args:
+            future_year (int): Tahmin edilecek yıl
+            countries (List[str], optional): Ülke adları veya kodları. None ise tüm ülkeler
+
+        Returns:
+            Dict[str, Any]: API yanıtı olarak ülke sırasıyla tahminler ve bulunamayan girdiler
+        """
+        try:
+            return self.data_service.forecast_all_countries(future_year, countries)
+        except Exception as e:
+            logger.error(f"Toplu tahmin yapılırken hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Tahminler hesaplanamadı",
+                "message": str(e)
+            }
+
+    def train_all_models(self, countries: Optional[List[str]] = None, indicator: Optional[str] = None,
+                         workers: Optional[int] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Ülke modellerini süreç havuzunda toplu olarak eğitir.
+
+        Args:
+            countries (List[str], optional): Eğitilecek ülkeler. None ise tüm ülkeler
+            indicator (str, optional): Gösterge kodu. None ise varsayılan gösterge
+            workers (int, optional): Worker süreç sayısı. None ise çekirdek sayısı
+            timeout (float, optional): Ülke başına süre sınırı (saniye). None ise varsayılan sınır
+
+        Returns:
+            Dict[str, Any]: API yanıtı olarak eğitim özeti ve başarısız ülkeler
+        """
+        try:
+            options = {} if timeout is None else {'timeout': timeout}
+            result = self.data_service.train_all_models(countries, indicator=indicator, workers=workers, **options)
+            if not result.get('success'):
+                return {"success": False, "error": "Hiçbir ülke modeli eğitilemedi", **result}
+            return result
+        except Exception as e:
+            logger.error(f"Toplu model eğitimi sırasında hata: {str(e)}")
+            return {
+                "success": False,
+                "error": "Toplu model eğitimi başarısız",
+                "message": str(e)
+            }
+
+    def reload_data(self) -> Dict[str, Any]:
+        """
+        CSV dosyasını yeniden yükler; yalnızca değişen ülkelerin modelleri ve tahminleri silinir.
+
+        Returns:
+            Dict[str, Any]: API yanıtı olarak veri sürümü ve değişiklik özeti
+        """
+        try:
+            result = self.data_service.reload_data()
+            changed_countries = {
+                code: sorted(set(diff['added'] + diff['removed'] + diff['changed']))
+                for code, diff in result.get('changes', {}).items()
+            }
+            return {
+                'success': True,
+                'reloaded': result.get('reloaded', False),
+                'data_version': result.get('data_version'),
+                'changed_countries': changed_countries,
+                'changes': result.get('changes', {}),
+                'invalidated': result.get('invalidated', {})
+            }
+        except Exception as e:
+            logger.error(f"Veri yeniden yüklenirken hata: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            return {
+                'success': False,
+                'error': str(e),
+                'message': "Veri yeniden yüklenemedi, mevcut veri kullanılmaya devam ediliyor"
+            }
+
     def get_countries_comparison(self, countries: List[str]) -> Dict[str, Any]:
         """
         Ülkeler arası karşılaştırma verilerini döndürür.
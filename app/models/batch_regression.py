@@ -0,0 +1,216 @@
+"""
+Batch Regression Modülü - Tüm ülkeler için tek seferde kapalı formda polinom regresyon
+
+Doğrusal ve polinom (yıl, yıl², yıl³) modeller ülke başına ayrı bir sklearn
+nesnesiyle eğitilmek yerine ülke × yıl matrisi üzerinde birlikte çözülür:
+aynı yıllarda gözlemi olan ülkeler aynı tasarım matrisini paylaşır ve tek bir
+en küçük kareler çözümüyle (sağ tarafta ülke başına bir sütun) eğitilir.
+Katsayılar [ülke, derece + 1] boyutlu tek bir dizide tutulur; herhangi bir
+ülke kümesinin tahmini tek bir matris çarpımıdır.
+
+Çözüm sklearn LinearRegression ile aynıdır: özellikler eğitim ortalamalarına
+göre merkezlenir, eksik ranklı durumlarda en küçük normlu çözüm seçilir ve
+sabit terim ortalamalardan hesaplanır. Yıllar koşullanmayı iyileştirmek için
+ölçeklenir; sabit terimli bir polinomun ölçeklenmesi tahminleri değiştirmez.
+"""
+
+import logging
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def _metrics(actual: np.ndarray, predicted: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Satır başına MAE, RMSE ve R² hesaplar (sklearn metrikleriyle aynı tanımlar).
+
+    Args:
+        actual: [ülke, örnek] boyutlu gerçek değerler
+        predicted: [ülke, örnek] boyutlu tahminler
+
+    Returns:
+        Dict[str, np.ndarray]: 'mae', 'rmse', 'r2' (ülke başına)
+    """
+    errors = actual - predicted
+    ss_res = (errors ** 2).sum(axis=1)
+    ss_tot = ((actual - actual.mean(axis=1, keepdims=True)) ** 2).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Sabit seride sklearn: hata yoksa 1, varsa 0; tek örnekte tanımsız
+        r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+    if actual.shape[1] < 2:
+        r2 = np.full(len(actual), np.nan)
+    return {
+        'mae': np.abs(errors).mean(axis=1),
+        'rmse': np.sqrt((errors ** 2).mean(axis=1)),
+        'r2': r2
+    }
+
+
+class BatchPolynomialRegression:
+    """
+    Ülke başına yıl polinomu; tüm ülkelerin katsayıları tek dizide.
+
+    coef_[i] = [sabit terim, t, t², ...] katsayılarıdır; t = (yıl - center) / scale.
+    """
+
+    def __init__(self, degree: int = 3):
+        """
+        BatchPolynomialRegression başlatıcı
+
+        Args:
+            degree: Polinom derecesi (1 ise doğrusal regresyon)
+        """
+        self.degree = degree
+        self.center = 0.0
+        self.scale = 1.0
+        self.countries: list = []
+        self.country_index: Dict[str, int] = {}
+        self.coef_: Optional[np.ndarray] = None
+        self.metrics_: Dict[str, np.ndarray] = {}
+
+    def design(self, years: Sequence[float]) -> np.ndarray:
+        """
+        Yıllar için [yıl, derece + 1] boyutlu tasarım matrisini (1, t, t², ...) döndürür.
+        """
+        t = (np.asarray(years, dtype=np.float64) - self.center) / self.scale
+        return t[:, None] ** np.arange(self.degree + 1)[None, :]
+
+    def fit(self, values: np.ndarray, years: Sequence[int], countries: Sequence[str],
+            test_size: Optional[float] = None, min_points: int = 1) -> 'BatchPolynomialRegression':
+        """
+        Tüm ülkelerin polinomlarını eğitir.
+
+        Gözlenen yılları aynı olan ülkeler bir grupta tek lstsq çağrısıyla çözülür.
+        test_size verilirse her grubun yılları train_test_split(random_state=42)
+        ile ayrılır; bu, ülke başına ayrı ayrı yapılan bölmeyle aynıdır.
+        Gözlemi min_points'ten az olan ülkelerin katsayıları NaN kalır.
+
+        Args:
+            values: [ülke, yıl] boyutlu değer matrisi (eksik hücreler NaN)
+            years: Sütun yılları
+            countries: Satır ülkeleri
+            test_size: Test için ayrılacak oran (None ise tüm yıllar eğitimde ve metriklerde)
+            min_points: Eğitim için gereken en az gözlem
+
+        Returns:
+            BatchPolynomialRegression: self
+        """
+        values = np.asarray(values, dtype=np.float64)
+        years = np.asarray(years, dtype=np.float64)
+        n_terms = self.degree + 1
+        self.countries = list(countries)
+        self.country_index = {country: i for i, country in enumerate(self.countries)}
+        self.center = float(years.mean()) if len(years) else 0.0
+        self.scale = float(years.std()) if len(years) > 1 and years.std() > 0 else 1.0
+
+        features = self.design(years)[:, 1:]
+        self.coef_ = np.full((len(values), n_terms), np.nan)
+        self.metrics_ = {name: np.full(len(values), np.nan) for name in ('mae', 'rmse', 'r2')}
+
+        observed = ~np.isnan(values)
+        patterns, groups = np.unique(observed, axis=0, return_inverse=True)
+        for g, pattern in enumerate(patterns):
+            rows = np.flatnonzero(groups.reshape(-1) == g)
+            columns = np.flatnonzero(pattern)
+            if len(columns) < max(1, min_points):
+                continue
+            if test_size:
+                from sklearn.model_selection import train_test_split
+                train_pos, test_pos = train_test_split(np.arange(len(columns)), test_size=test_size,
+                                                       random_state=42)
+                train_columns, test_columns = columns[train_pos], columns[test_pos]
+            else:
+                train_columns = test_columns = columns
+
+            # Merkezlenmiş özelliklerle tek lstsq: sağ tarafta ülke başına bir sütun
+            X = features[train_columns]
+            Y = values[np.ix_(rows, train_columns)].T
+            X_mean, Y_mean = X.mean(axis=0), Y.mean(axis=0)
+            slopes = np.linalg.lstsq(X - X_mean, Y - Y_mean, rcond=None)[0]
+            self.coef_[rows, 0] = Y_mean - X_mean @ slopes
+            self.coef_[rows, 1:] = slopes.T
+
+            for name, value in _metrics(values[np.ix_(rows, test_columns)],
+                                        self.coef_[rows] @ self.design(years[test_columns]).T).items():
+                self.metrics_[name][rows] = value
+        return self
+
+    def fitted(self, country: str) -> bool:
+        """Ülke için katsayı hesaplanmış mı?"""
+        row = self.country_index.get(country)
+        return row is not None and not np.isnan(self.coef_[row]).any()
+
+    def predict(self, years: Sequence[float], countries: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Ülkelerin verilen yıllardaki tahminlerini tek matris çarpımıyla hesaplar.
+
+        Args:
+            years: Tahmin yılları
+            countries: Ülkeler (None ise tüm ülkeler, eğitim sırasıyla)
+
+        Returns:
+            np.ndarray: [ülke, yıl] boyutlu tahminler
+
+        Raises:
+            KeyError: Eğitimde olmayan ülke istenirse
+        """
+        coef = self.coef_ if countries is None else self.coef_[[self.country_index[c] for c in countries]]
+        return coef @ self.design(years).T
+
+    def metrics(self, country: str) -> Dict[str, float]:
+        """
+        Ülkenin test (test_size yoksa eğitim) metrikleri.
+
+        Returns:
+            Dict[str, float]: 'mae', 'rmse', 'r2'
+        """
+        row = self.country_index[country]
+        return {name: float(values[row]) for name, values in self.metrics_.items()}
+
+    def country_model(self, country: str) -> 'CountryPolynomialModel':
+        """Ülke için sklearn benzeri predict(X) arayüzlü görünüm döndürür."""
+        return CountryPolynomialModel(self, country)
+
+
+class CountryPolynomialModel:
+    """
+    Toplu modelin tek ülkelik görünümü.
+
+    predict() ilk sütunu yıl olarak yorumlar; ülke modeli bekleyen kod
+    (tahmin, metrikler) sklearn modeli gibi kullanabilir. Katsayılar toplu
+    modelin dizisinde kalır, kopyalanmaz.
+    """
+
+    def __init__(self, batch: BatchPolynomialRegression, country: str):
+        self.batch = batch
+        self.country = country
+        self.row = batch.country_index[country]
+        self.feature_names_in_ = np.array(['Year'], dtype=object)
+        self.n_features_in_ = 1
+
+    @property
+    def coef_(self) -> np.ndarray:
+        return self.batch.coef_[self.row, 1:]
+
+    @property
+    def intercept_(self) -> float:
+        return float(self.batch.coef_[self.row, 0])
+
+    def predict(self, X) -> np.ndarray:
+        years = np.asarray(X, dtype=np.float64).reshape(len(X), -1)[:, 0]
+        return self.batch.design(years) @ self.batch.coef_[self.row]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Tek başına kaydedilirken (model kaydı, worker) yalnızca bu ülkenin katsayıları taşınır
+        batch = BatchPolynomialRegression(self.batch.degree)
+        batch.center, batch.scale = self.batch.center, self.batch.scale
+        batch.countries, batch.country_index = [self.country], {self.country: 0}
+        batch.coef_ = self.batch.coef_[self.row:self.row + 1].copy()
+        batch.metrics_ = {name: values[self.row:self.row + 1].copy() for name, values in self.batch.metrics_.items()}
+        return {'batch': batch, 'country': self.country, 'row': 0,
+                'feature_names_in_': self.feature_names_in_, 'n_features_in_': 1}
+
+    def __str__(self):
+        return f"CountryPolynomialModel(country={self.country}, degree={self.batch.degree})"
@@ -2,13 +2,52 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 import os
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.preprocessing import StandardScaler
 import joblib
 
+from app.models.batch_regression import BatchPolynomialRegression
+from app.utils.country_store import RankIndex
+
+
+# Ülke modelleri: yıl, yıl² ve yıl³ özellikleriyle doğrusal regresyon
+POLYNOMIAL_DEGREE = 3
+POLYNOMIAL_FEATURES = ['Year', 'Year_Squared', 'Year_Cubed']
+
+# Eğitim için ülke başına gereken en az satır
+MIN_TRAINING_ROWS = 10
+
+
+def fit_polynomial_models(melted_df: pd.DataFrame) -> BatchPolynomialRegression:
+    """
+    Tüm ülkelerin yıl, yıl² ve yıl³ polinomlarını tek seferde eğitir.
+    
+    Uzun formattaki veri ülke × yıl matrisine çevrilir ve aynı yıllarda
+    gözlemi olan ülkeler tek bir en küçük kareler çözümüyle eğitilir. Her
+    ülkenin yılları ülke başına yapılan bölmeyle aynı biçimde (random_state=42)
+    eğitim ve test olarak ayrılır; metrikler test yıllarından hesaplanır.
+    
+    Args:
+        melted_df: 'Country Name', 'Year' ve 'Renewable_Value' sütunları olan veri
+        
+    Returns:
+        BatchPolynomialRegression: Tüm ülkelerin katsayıları ve metrikleri
+    """
+    matrix = melted_df.pivot_table(index='Country Name', columns='Year', values='Renewable_Value',
+                                   aggfunc='first', dropna=False)
+    return BatchPolynomialRegression(POLYNOMIAL_DEGREE).fit(
+        matrix.to_numpy(dtype=np.float64), matrix.columns.to_numpy(), list(matrix.index), test_size=0.2
+    )
+
+
+def _model_entry(batch: BatchPolynomialRegression, country_name: str) -> Dict[str, Any]:
+    """Toplu modelden ülkenin model önbelleği kaydını oluşturur."""
+    return {
+        'model': batch.country_model(country_name),
+        'features': POLYNOMIAL_FEATURES,
+        'metrics': batch.metrics(country_name)
+    }
+
+
 class DataModel:
     """
     Veri modeli sınıfı - CSV verilerini yükler ve işler
@@ -36,6 +75,8 @@ class DataModel:
         self.model_metrics = None
         self.feature_importance = None
         self.models_cache = {}  # Ülke başına model önbelleği
+        self.batch_model = None  # Tüm ülkelerin polinom katsayıları (BatchPolynomialRegression)
+        self._ranking = None  # (ülkeler, ülke kodları, yıl -> sütun, değerler, RankIndex)
         
         # CSV dosya yolunu belirle
         if csv_path is None:
@@ -69,6 +110,7 @@ class DataModel:
             
             # Veriyi long format'a dönüştür
             self._melt_data()
+            self._ranking = None
         except Exception as e:
             print(f"Veri yükleme hatası: {e}")
             # Gerçek uygulamada hata loglama yapılmalı
@@ -186,25 +228,42 @@ class DataModel:
         Returns:
             Ülke listesi ve değerleri
         """
-        if self.melted_df is None:
+        ranking = self._year_ranking()
+        if ranking is None:
             return []
         
-        # Yıla göre filtrele
-        year_df = self.melted_df[self.melted_df['Year'] == year]
-        
-        # Ülkeleri yenilenebilir enerji değerine göre sırala
-        top_countries = year_df.sort_values('Renewable_Value', ascending=ascending).head(limit)
+        countries, codes, columns, values, index = ranking
+        column = columns.get(int(year))
+        if column is None:
+            return []
         
-        # JSON formatında veriyi döndür
-        result = []
-        for _, row in top_countries.iterrows():
-            result.append({
-                'country': row['Country Name'],
-                'country_code': row['Country Code'],
-                'value': float(row['Renewable_Value'])
-            })
+        # Sıralama yıl başına bir kez yapıldı; burada yalnızca ilk `limit` satır okunur
+        return [{
+            'country': countries[row],
+            'country_code': codes[row],
+            'value': float(values[row, column])
+        } for row in index.top(column, limit, descending=not ascending)]
+    
+    def _year_ranking(self) -> Optional[Tuple[List[str], List[str], Dict[int, int], np.ndarray, RankIndex]]:
+        """
+        Ülke × yıl değer matrisini ve yıl başına sıralama indeksini bir kez oluşturur
         
-        return result
+        Returns:
+            (ülkeler, ülke kodları, yıl -> sütun, değerler, RankIndex); veri yoksa None
+        """
+        if self._ranking is None and self.melted_df is not None:
+            matrix = self.melted_df.groupby(
+                ['Country Name', 'Country Code', 'Year'], dropna=False
+            )['Renewable_Value'].last().unstack('Year')
+            values = matrix.to_numpy(dtype=np.float64)
+            self._ranking = (
+                matrix.index.get_level_values('Country Name').tolist(),
+                matrix.index.get_level_values('Country Code').tolist(),
+                {int(year): col for col, year in enumerate(matrix.columns)},
+                values,
+                RankIndex(values)
+            )
+        return self._ranking
         
     def get_feature_importance(self, country_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -317,6 +376,9 @@ class DataModel:
         """
         Model eğitir
         
+        Tüm ülkeler eğitilirken polinom modelleri tek seferde (toplu en küçük
+        kareler) çözülür; katsayılar self.batch_model içinde tek dizide tutulur.
+        
         Args:
             country_name: Ülke adı (None ise tüm ülkeler için)
             force_retrain: Mevcut model olsa bile yeniden eğitilsin mi
@@ -342,43 +404,12 @@ class DataModel:
                 # Ülkeye ait verileri filtrele
                 country_data = self.melted_df[self.melted_df['Country Name'] == country_name].sort_values('Year')
                 
-                if len(country_data) < 10:
+                if len(country_data) < MIN_TRAINING_ROWS:
                     return {'success': False, 'error': 'Yeterli veri yok'}
                 
-                # Özellikleri oluştur
-                X = country_data[['Year']]
-                X['Year_Squared'] = X['Year'] ** 2
-                X['Year_Cubed'] = X['Year'] ** 3
-                y = country_data['Renewable_Value']
-                
-                # Veriyi eğitim ve test olarak ayır
-                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-                
-                # Özellikleri ölçeklendir
-                scaler = StandardScaler()
-                X_train_scaled = scaler.fit_transform(X_train)
-                X_test_scaled = scaler.transform(X_test)
-                
-                # Lineer regresyon modeli eğit
-                model = LinearRegression()
-                model.fit(X_train_scaled, y_train)
-                
-                # Model performansını değerlendir
-                y_pred = model.predict(X_test_scaled)
-                
-                metrics = {
-                    'mae': float(mean_absolute_error(y_test, y_pred)),
-                    'rmse': float(np.sqrt(mean_squared_error(y_test, y_pred))),
-                    'r2': float(r2_score(y_test, y_pred))
-                }
-                
-                # Modeli önbelleğe al
-                self.models_cache[country_name] = {
-                    'model': model,
-                    'scaler': scaler,
-                    'features': ['Year', 'Year_Squared', 'Year_Cubed'],
-                    'metrics': metrics
-                }
+                # Modeli eğit ve önbelleğe al
+                self.models_cache[country_name] = _model_entry(fit_polynomial_models(country_data), country_name)
+                metrics = self.models_cache[country_name]['metrics']
                 
                 return {
                     'success': True,
@@ -388,25 +419,83 @@ class DataModel:
                 }
                 
             else:
-                # Tüm ülkeler için model eğitimi (burada basit bir yaklaşım)
-                trained_count = 0
+                # Tüm ülkeler için model eğitimi: tüm ülkeler tek seferde çözülür
                 countries = self.get_countries()
+                row_counts = self.melted_df.groupby('Country Name', sort=False).size()
+                failures = {
+                    country: 'Yeterli veri yok' for country, count in row_counts.items() if count < MIN_TRAINING_ROWS
+                }
+                self.batch_model = fit_polynomial_models(
+                    self.melted_df[~self.melted_df['Country Name'].isin(failures)]
+                )
                 
-                for country in countries:
-                    result = self.train_model(country, force_retrain)
-                    if result.get('success', False):
+                trained_count = 0
+                for country in self.batch_model.countries:
+                    if country in self.models_cache and not force_retrain:
                         trained_count += 1
+                    elif self.batch_model.fitted(country):
+                        self.models_cache[country] = _model_entry(self.batch_model, country)
+                        trained_count += 1
+                    else:
+                        failures[country] = 'Model eğitilemedi'
                 
                 return {
                     'success': True,
                     'message': f"{trained_count} ülke için model eğitildi",
                     'total_countries': len(countries),
-                    'trained_countries': trained_count
+                    'trained_countries': trained_count,
+                    'failed_countries': len(failures),
+                    'failures': failures
                 }
                 
         except Exception as e:
             return {'success': False, 'error': str(e)}
     
+    def predict_countries(self, country_names: Optional[List[str]] = None, years_ahead: int = 5) -> Dict[str, Any]:
+        """
+        Birden fazla ülkenin tahminini toplu modelle tek matris çarpımıyla hesaplar.
+        
+        Args:
+            country_names: Ülke adları (None ise toplu modeldeki tüm ülkeler)
+            years_ahead: Kaç yıl ilerisi için tahmin yapılacak
+            
+        Returns:
+            Tahmin sonuçları: ortak yıllar ve ülke başına tahmin dizileri
+        """
+        if self.melted_df is None:
+            return {'success': False, 'error': 'Veri bulunamadı'}
+        
+        try:
+            if self.batch_model is None:
+                train_result = self.train_model()
+                if not train_result.get('success', False):
+                    return train_result
+            
+            batch = self.batch_model
+            requested = batch.countries if country_names is None else country_names
+            countries = [country for country in requested if batch.fitted(country)]
+            missing = [country for country in requested if not batch.fitted(country)]
+            if not countries:
+                return {'success': False, 'error': 'Tahmin için ülke bulunamadı', 'missing': missing}
+            
+            # Ortak yıl ekseni: veri setinin son yılından sonrası
+            max_year = self.melted_df['Year'].max()
+            future_years = np.arange(max_year + 1, max_year + years_ahead + 1)
+            
+            # Negatif değerleri sıfıra çevir (anlamlı minimum)
+            predictions = np.maximum(batch.predict(future_years, countries), 0)
+            
+            return {
+                'success': True,
+                'years': [int(year) for year in future_years],
+                'countries': countries,
+                'predictions': predictions.tolist(),
+                'missing': missing
+            }
+            
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+    
     def predict_future(self, country_name: str, years_ahead: int = 5) -> Dict[str, Any]:
         """
         Gelecek için tahmin yapar
@@ -428,11 +517,9 @@ class DataModel:
                 if not train_result.get('success', False):
                     return train_result
             
-            # Model ve scaler al
+            # Model al
             model_data = self.models_cache[country_name]
             model = model_data['model']
-            scaler = model_data['scaler']
-            features = model_data['features']
             metrics = model_data['metrics']
             
             # Ülkeye ait maksimum yılı bul
@@ -442,16 +529,8 @@ class DataModel:
             # Tahmin yıllarını oluştur
             future_years = np.arange(max_year + 1, max_year + years_ahead + 1)
             
-            # Tahmin için özellikleri hazırla
-            pred_features = pd.DataFrame({'Year': future_years})
-            pred_features['Year_Squared'] = pred_features['Year'] ** 2
-            pred_features['Year_Cubed'] = pred_features['Year'] ** 3
-            
-            # Özellikleri ölçeklendir
-            pred_scaled = scaler.transform(pred_features)
-            
-            # Tahmin yap
-            predictions = model.predict(pred_scaled)
+            # Tahmin yap (yıl polinomu modelin içinde oluşturulur)
+            predictions = model.predict(future_years.reshape(-1, 1))
             
             # Negatif değerleri sıfıra çevir (anlamlı minimum)
             predictions = np.maximum(predictions, 0)
@@ -0,0 +1,340 @@
+"""
+Global Model Modülü - Tüm ülkeler için ortak (havuzlanmış) tahmin modeli
+
+Genel model tüm ülkelerin verisiyle tek seferde eğitilir. Her örnek bir
+ülkenin bir yılıdır; özellikler önceki yılların değerleri (gecikmeler),
+bu gecikmeler üzerinden hareketli ortalama/standart sapma, yıl ve ülke
+kodlamasıdır (satır sırası ve ülkenin ortalama seviyesi). Model değerin
+kendisini değil önceki yıla göre değişimini öğrenir; böylece farklı
+seviyelerdeki ülkeler aynı ağaçları paylaşabilir.
+
+Örnekler ülke × yıl matrisinden kayan pencerelerle tek seferde oluşturulur.
+Tahminde tüm ülkelerin bir sonraki yılı tek bir predict çağrısıyla
+hesaplanır; daha uzak yıllar tahminlerin gecikmelere eklenmesiyle
+adım adım (yıl başına bir predict çağrısı) bulunur.
+"""
+
+import logging
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+logger = logging.getLogger(__name__)
+
+# Özellik olarak kullanılan önceki yıl sayısı (hareketli istatistikler de bu pencere üzerinden)
+GLOBAL_LAGS = 3
+
+# Son yılların bu oranı (en az bir yıl) test için ayrılır
+TEST_FRACTION = 0.2
+
+# Adım adım tahminde gidilebilecek en uzak yıl (son veri yılından itibaren)
+MAX_HORIZON = 100
+
+XGB_PARAMS = {'n_estimators': 100, 'random_state': 42, 'objective': 'reg:squarederror'}
+RANDOM_FOREST_PARAMS = {'n_estimators': 100, 'random_state': 42}
+
+# Özellikler veya eğitim düzeni değiştiğinde artırılır; model kaydındaki eski genel modeller kullanılmaz
+GLOBAL_MODEL_VERSION = 1
+
+
+def feature_names(lags: int = GLOBAL_LAGS) -> List[str]:
+    """
+    Global modelin özellik adlarını sütun sırasıyla döndürür.
+
+    Args:
+        lags: Gecikme sayısı
+
+    Returns:
+        List[str]: Özellik adları
+    """
+    return (['Year'] + [f'Lag_{i}' for i in range(1, lags + 1)]
+            + ['Rolling_Mean', 'Rolling_Std', 'Country_Code', 'Country_Mean'])
+
+
+def _feature_block(windows: np.ndarray, target_years: np.ndarray,
+                   codes: np.ndarray, means: np.ndarray) -> np.ndarray:
+    """
+    Kayan pencerelerden özellik matrisini oluşturur.
+
+    Args:
+        windows: [ülke, hedef yıl, gecikme] boyutlu pencereler (eskiden yeniye)
+        target_years: Hedef yıllar
+        codes: Ülke başına kod
+        means: Ülke başına ortalama seviye
+
+    Returns:
+        np.ndarray: [ülke * hedef yıl, özellik] boyutlu matris (ülke sırasıyla)
+    """
+    n, m, lags = windows.shape
+    block = np.empty((n, m, lags + 5))
+    block[..., 0] = target_years[None, :]
+    block[..., 1:lags + 1] = windows[..., ::-1]
+    block[..., lags + 1] = windows.mean(axis=2)
+    block[..., lags + 2] = windows.std(axis=2, ddof=1) if lags > 1 else 0.0
+    block[..., lags + 3] = codes[:, None]
+    block[..., lags + 4] = means[:, None]
+    return block.reshape(n * m, lags + 5)
+
+
+class GlobalForecaster:
+    """
+    Tüm ülkeler için tek bir regresörü paylaşan tahmin modeli.
+
+    predict() özellik satırlarından değer tahmin eder (regresörün öğrendiği
+    değişim Lag_1'e eklenir); forecast() ülke × yıl matrisinin devamını
+    tüm ülkeler için birlikte hesaplar.
+    """
+
+    def __init__(self, regressor: Any, lags: int = GLOBAL_LAGS):
+        """
+        GlobalForecaster başlatıcı
+
+        Args:
+            regressor: fit/predict arayüzlü regresör (ör. RandomForestRegressor)
+            lags: Özellik olarak kullanılan önceki yıl sayısı
+        """
+        self.regressor = regressor
+        self.lags = lags
+        self.feature_names_in_ = np.array(feature_names(lags), dtype=object)
+        self.n_features_in_ = len(self.feature_names_in_)
+        self.model_name = type(regressor).__name__
+        self.country_index: Dict[str, int] = {}
+        self.country_means: Dict[str, float] = {}
+
+    @property
+    def feature_importances_(self) -> np.ndarray:
+        """Regresörün özellik önemleri (ağaç modeli değilse katsayı büyüklükleri)."""
+        if hasattr(self.regressor, 'feature_importances_'):
+            return self.regressor.feature_importances_
+        if hasattr(self.regressor, 'coef_'):
+            return np.abs(np.ravel(self.regressor.coef_))
+        raise AttributeError('feature_importances_')
+
+    def _encoding(self, values: np.ndarray, countries: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Ülke kodlarını ve ortalama seviyelerini döndürür; eğitimde görülmeyen ülke -1 kodunu alır."""
+        with np.errstate(all='ignore'):
+            row_means = np.nanmean(values, axis=1) if values.shape[1] else np.full(len(values), np.nan)
+        codes = np.array([self.country_index.get(country, -1) for country in countries], dtype=float)
+        means = np.array([self.country_means.get(country, row_means[i]) for i, country in enumerate(countries)],
+                         dtype=float)
+        return codes, means
+
+    def samples(self, values: np.ndarray, years: Sequence[int],
+                countries: Sequence[str]) -> Tuple[pd.DataFrame, pd.Series]:
+        """
+        Ülke × yıl matrisinden eğitim/değerlendirme örneklerini oluşturur.
+
+        Gecikmelerinden biri veya hedefi eksik olan örnekler atlanır.
+
+        Args:
+            values: [ülke, yıl] boyutlu değer matrisi
+            years: Sütun yılları (artan)
+            countries: Satır ülkeleri
+
+        Returns:
+            Tuple[pd.DataFrame, pd.Series]: (özellikler, hedef değerler)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        years = np.asarray(years, dtype=np.int64)
+        if values.shape[1] <= self.lags:
+            return pd.DataFrame(columns=self.feature_names_in_), pd.Series(dtype=float)
+
+        codes, means = self._encoding(values, countries)
+        windows = sliding_window_view(values, self.lags, axis=1)[:, :-1]
+        X = _feature_block(windows, years[self.lags:], codes, means)
+        y = values[:, self.lags:].reshape(-1)
+        valid = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+        return (pd.DataFrame(X[valid], columns=self.feature_names_in_),
+                pd.Series(y[valid], name='Renewable_Value'))
+
+    def fit(self, X, y) -> 'GlobalForecaster':
+        """
+        Regresörü önceki yıla göre değişim üzerinde eğitir.
+
+        Args:
+            X: samples() ile oluşturulmuş özellikler
+            y: Hedef değerler
+
+        Returns:
+            GlobalForecaster: self
+        """
+        X = np.asarray(X, dtype=np.float64)
+        self.regressor.fit(X, np.asarray(y, dtype=np.float64) - X[:, 1])
+        return self
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Özellik satırları için değer tahmin eder.
+
+        Args:
+            X: [örnek, özellik] boyutlu özellikler
+
+        Returns:
+            np.ndarray: Tahmin edilen değerler
+        """
+        X = np.asarray(X, dtype=np.float64)
+        return X[:, 1] + self.regressor.predict(X)
+
+    def encode(self, values: np.ndarray, countries: Sequence[str]) -> None:
+        """
+        Eğitim verisindeki ülkelerin kodlarını ve ortalama seviyelerini kaydeder.
+
+        Args:
+            values: [ülke, yıl] boyutlu değer matrisi
+            countries: Satır ülkeleri
+        """
+        self.country_index = {country: i for i, country in enumerate(countries)}
+        with np.errstate(all='ignore'):
+            row_means = np.nanmean(np.asarray(values, dtype=np.float64), axis=1)
+        self.country_means = {country: float(row_means[i]) for i, country in enumerate(countries)
+                              if not np.isnan(row_means[i])}
+
+    def forecast(self, values: np.ndarray, years: Sequence[int], countries: Sequence[str],
+                 future_year: int) -> np.ndarray:
+        """
+        Tüm ülkeler için son yıldan future_year'a kadar her yılı tahmin eder.
+
+        Her yıl tüm ülkeler için tek bir predict çağrısıyla hesaplanır ve
+        tahminler bir sonraki yılın gecikmeleri olur. Son gecikme penceresinde
+        eksik değer olan ülkeler NaN döner.
+
+        Args:
+            values: [ülke, yıl] boyutlu geçmiş değer matrisi
+            years: Sütun yılları (artan)
+            countries: Satır ülkeleri
+            future_year: Tahmin edilecek son yıl
+
+        Returns:
+            np.ndarray: [ülke, future_year - son yıl] boyutlu tahminler
+
+        Raises:
+            ValueError: Hedef yıl son yıldan büyük değilse, MAX_HORIZON yıldan uzaksa
+                        veya yeterli yıl yoksa
+        """
+        values = np.asarray(values, dtype=np.float64)
+        last_year = int(years[-1])
+        steps = int(future_year) - last_year
+        if steps < 1:
+            raise ValueError(f"Tahmin yılı son veri yılından ({last_year}) büyük olmalı: {future_year}")
+        if steps > MAX_HORIZON:
+            raise ValueError(f"Tahmin yılı son veri yılından en fazla {MAX_HORIZON} yıl ileride olabilir: {future_year}")
+        if values.shape[1] < self.lags:
+            raise ValueError(f"Tahmin için en az {self.lags} yıllık veri gerekli")
+
+        codes, means = self._encoding(values, countries)
+        history = values[:, -self.lags:].copy()
+        valid = ~(np.isnan(history).any(axis=1) | np.isnan(means))
+        forecasts = np.full((len(values), steps), np.nan)
+        if not valid.any():
+            return forecasts
+
+        history, codes, means = history[valid], codes[valid], means[valid]
+        for step in range(steps):
+            X = _feature_block(history[:, None, :], np.array([last_year + step + 1]), codes, means)
+            predicted = self.predict(X)
+            forecasts[valid, step] = predicted
+            history = np.column_stack([history[:, 1:], predicted])
+        return forecasts
+
+
+def global_model_spec() -> Tuple[str, Dict[str, Any]]:
+    """
+    fit_global_model()'in bu ortamda kullanacağı model türünü ve hiperparametreleri döndürür.
+
+    Model kaydında genel modelin anahtarının parçasıdır; yedek doğrusal
+    regresyon aynı anahtar altında saklanır.
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: (model türü, hiperparametreler)
+    """
+    from app.data_service import _xgb_regressor
+    params = {'lags': GLOBAL_LAGS, 'test_fraction': TEST_FRACTION, 'version': GLOBAL_MODEL_VERSION}
+    if _xgb_regressor() is not None:
+        return 'XGBoost', {**XGB_PARAMS, **params}
+    return 'RandomForest', {**RANDOM_FOREST_PARAMS, **params}
+
+
+def fit_global_model(values: np.ndarray, years: Sequence[int],
+                     countries: Sequence[str]) -> Tuple[GlobalForecaster, Dict[str, Any]]:
+    """
+    Tüm ülkelerin verisiyle genel (havuzlanmış) modeli eğitir.
+
+    XGBoost yüklüyse XGBRegressor, değilse RandomForest; bunlar eğitilemezse
+    aynı özelliklerle doğrusal regresyon kullanılır. Son yıllar (TEST_FRACTION)
+    test için ayrılır; model ve ülke kodlaması (Country_Mean) yalnızca önceki
+    yıllardan hesaplanır, test yılları eğitime sızmaz.
+
+    Args:
+        values: [ülke, yıl] boyutlu değer matrisi
+        years: Sütun yılları (artan)
+        countries: Satır ülkeleri
+
+    Returns:
+        Tuple[GlobalForecaster, Dict[str, Any]]: (eğitilmiş model, eğitim sonucu ve metrikler)
+
+    Raises:
+        ValueError: Yeterli örnek yoksa veya model eğitilemezse
+    """
+    # Ağır ML bağımlılıkları ilk eğitimde içe aktarılır
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    from app.data_service import _xgb_regressor
+    XGBRegressor = _xgb_regressor()
+
+    if XGBRegressor is not None:
+        model, model_name = GlobalForecaster(XGBRegressor(**XGB_PARAMS)), "XGBoost"
+    else:
+        model, model_name = GlobalForecaster(RandomForestRegressor(**RANDOM_FOREST_PARAMS)), "RandomForest"
+
+    # Zaman sırasına göre ayır: hedef yılların son TEST_FRACTION'ı test için
+    years = np.asarray(years, dtype=np.int64)
+    target_years = years[model.lags:]
+    test_years = max(1, int(round(len(target_years) * TEST_FRACTION))) if len(target_years) > 1 else 0
+    train_columns = len(years) - test_years
+    model.encode(np.asarray(values)[:, :train_columns], countries)
+
+    X, y = model.samples(values, years, countries)
+    if len(X) < 10:
+        raise ValueError(f"Genel model için yeterli veri yok ({len(X)} örnek)")
+
+    test_mask = X['Year'].isin(years[train_columns:]).to_numpy()
+    X_train, y_train = X[~test_mask], y[~test_mask]
+    X_test, y_test = (X[test_mask], y[test_mask]) if test_mask.any() else (X_train, y_train)
+
+    try:
+        logger.info(f"Genel model için {model_name} eğitiliyor ({len(X_train)} örnek, {len(countries)} ülke)...")
+        model.fit(X_train, y_train)
+    except Exception as e:
+        logger.warning(f"İlk model eğitimi başarısız: {str(e)}. Alternatif model kullanılacak.")
+        from sklearn.linear_model import LinearRegression
+        model, model_name = GlobalForecaster(LinearRegression()), "LinearRegression"
+        model.encode(np.asarray(values)[:, :train_columns], countries)
+        model.fit(X_train, y_train)
+        logger.info("Genel model için doğrusal regresyon eğitildi")
+    model.model_name = f"{model_name} (global)"
+
+    train_pred = model.predict(X_train)
+    test_pred = model.predict(X_test)
+    metrics = {
+        'train_rmse': float(np.sqrt(mean_squared_error(y_train, train_pred))),
+        'test_rmse': float(np.sqrt(mean_squared_error(y_test, test_pred))),
+        'train_mae': float(mean_absolute_error(y_train, train_pred)),
+        'test_mae': float(mean_absolute_error(y_test, test_pred)),
+        'r2_score': float(r2_score(y_test, test_pred)) if len(y_test) > 1 else 0.0,
+        'feature_importance': {
+            name: float(importance)
+            for name, importance in zip(model.feature_names_in_, model.feature_importances_)
+        }
+    }
+
+    return model, {
+        'success': True,
+        'country': 'general',
+        'metrics': metrics,
+        'model': model.model_name,
+        'samples': int(len(X)),
+        'countries': len(countries),
+        'model_quality': "genel"
+    }
@@ -1,4 +1,4 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 import pandas as pd
 import numpy as np
 import json
@@ -17,23 +17,49 @@ logger = logging.getLogger(__name__)
 # API Blueprint oluştur - url_prefix olmadan tanımlayarak daha esnek olsun
 api_bp = Blueprint('api', __name__)
 
-# Veri servisini bir kere import et ve yeniden kullan
-try:
-    from app.data_service import DataService
-    from app.data_viewmodel import DataViewModel
-    data_service = DataService()
-    data_vm = DataViewModel(data_service)
-    logger.info("API Blueprint için veri servisleri başarıyla yüklendi")
-except Exception as e:
-    logger.error(f"API Blueprint için veri servisleri yüklenemedi: {str(e)}")
-    data_service = None
-    data_vm = None
+# Veri servisleri import sırasında değil, ilk istekte süreç genelindeki
+# kapsayıcıdan alınır; böylece app.py ile aynı DataService örneği paylaşılır
+from app.service_container import get_data_viewmodel
+
+
+def _get_data_vm():
+    """
+    Paylaşılan DataViewModel örneğini döndürür.
+    
+    Returns:
+        DataViewModel veya None: Veri servisleri yüklenemezse None
+    """
+    try:
+        return get_data_viewmodel()
+    except Exception as e:
+        logger.error(f"API Blueprint için veri servisleri yüklenemedi: {str(e)}")
+        return None
+
+
+def _parse_country_list(value):
+    """
+    İstekteki ülke listesini ayrıştırır.
+    
+    Virgülle ayrılmış metin bölünür; liste yalnızca metin elemanlardan oluşmalıdır.
+    
+    Args:
+        value: Sorgu parametresi veya JSON alanı
+        
+    Returns:
+        List[str] veya None: Ülke listesi, değer geçersizse None
+    """
+    if isinstance(value, str):
+        return [name.strip() for name in value.split(',') if name.strip()]
+    if isinstance(value, list) and all(isinstance(name, str) for name in value):
+        return value
+    return None
 
 # Ana uygulama direk olarak tanımlanmış endpoint'ler 
 @api_bp.route('/countries', methods=['GET'])
 def get_countries():
     """Mevcut ülkelerin listesini döndürür"""
     try:
+        data_vm = _get_data_vm()
         if data_vm:
             # DataViewModel üzerinden ülke listesi al
             response = data_vm.get_countries()
@@ -86,6 +112,19 @@ def get_countries():
         ]
         return jsonify(demo_countries)
         
+@api_bp.route('/countries/suggest', methods=['GET'])
+def suggest_countries():
+    """Ülke adı otomatik tamamlama (?q=<önek>&limit=10); ad, ISO3 kodu ve Türkçe/İngilizce adlar aranır"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        response = data_vm.suggest_countries(request.args.get('q', ''), request.args.get('limit', 10, type=int))
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Ülke önerileri alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 # Özellik önemi endpoint'leri
 @api_bp.route('/features/importance', methods=['GET'])
 @api_bp.route('/feature-importance', methods=['GET'])
@@ -93,6 +132,7 @@ def get_countries():
 def get_global_feature_importance():
     """Tüm veri seti için özellik önemi verilerini döndürür"""
     try:
+        data_vm = _get_data_vm()
         if data_vm:
             # DataViewModel üzerinden global özellik önemi al
             response = data_vm.get_feature_importance(None)
@@ -156,6 +196,7 @@ def get_global_feature_importance():
 def get_country_feature_importance(country):
     """Belirli bir ülke için özellik önemi verilerini döndürür"""
     try:
+        data_vm = _get_data_vm()
         if data_vm:
             # DataViewModel üzerinden ülke özellik önemi al
             response = data_vm.get_feature_importance(country)
@@ -219,14 +260,46 @@ def get_data_countries():
     """Ülke listesini döndürür (alternatif endpoint)"""
     return get_countries()
 
+@api_bp.route('/data/countries/batch', methods=['GET', 'POST'])
+def get_countries_data():
+    """Birden fazla ülkenin verisini tek istekte döndürür (?countries=TUR,Germany&from=&to=&step= veya POST {"countries": [...]})"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        payload = (request.get_json(silent=True) or {}) if request.method == 'POST' else {}
+        countries = payload.get('countries')
+        if countries is None:
+            countries = request.args.get('countries', '')
+        countries = _parse_country_list(countries)
+        if countries is None:
+            return jsonify({'success': False, 'error': 'countries bir liste veya virgülle ayrılmış metin olmalı'}), 400
+        
+        # JSON gövdesindeki alanlar da sorgu parametreleri gibi tamsayıya çevrilir
+        try:
+            start_year = payload.get('from', request.args.get('from', None))
+            end_year = payload.get('to', request.args.get('to', None))
+            start_year = int(start_year) if start_year is not None else None
+            end_year = int(end_year) if end_year is not None else None
+            step = int(payload.get('step', request.args.get('step', 1)))
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'from, to ve step tamsayı olmalı'}), 400
+        
+        indicator = payload.get('indicator') or request.args.get('indicator', None)
+        response = data_vm.get_countries_data(countries, indicator, start_year=start_year, end_year=end_year, step=step)
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Ülke verileri toplu alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @api_bp.route('/data/overview', methods=['GET'])
 def get_overview_data():
     """Genel bakış verilerini döndürür"""
     try:
+        data_vm = _get_data_vm()
         if data_vm:
-            # DataViewModel üzerinden genel bakış verileri al
-            response = data_vm.get_data_overview()
-            return jsonify(response)
+            # DataViewModel üzerinden genel bakış verileri al (veri sürümü başına bir kez JSON'a yazılır)
+            return Response(data_vm.get_data_overview_json(), mimetype='application/json')
         else:
             # Veri servisi yoksa hata döndür
             return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
@@ -234,10 +307,160 @@ def get_overview_data():
         logger.error(f"Genel bakış verileri alınırken hata: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500 
 
+@api_bp.route('/data/rankings', methods=['GET'])
+def get_rankings():
+    """Bir yılın en yüksek/en düşük k ülkesini döndürür (?year=&k=&direction=asc|desc&country=&indicator=)"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        year = request.args.get('year', None, type=int)
+        k = request.args.get('k', 10, type=int)
+        direction = request.args.get('direction', 'desc').lower()
+        response = data_vm.get_rankings(year, k, direction,
+                                        country=request.args.get('country', None),
+                                        indicator=request.args.get('indicator', None))
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Sıralama alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/data/similar/<country_name>', methods=['GET'])
+def get_similar_countries(country_name):
+    """Ülkeye en benzer k ülkeyi döndürür (?k=10&metric=pearson|pearson_diff|euclidean&indicator=)"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        k = request.args.get('k', 10, type=int)
+        metric = request.args.get('metric', 'pearson').lower()
+        response = data_vm.get_similar_countries(country_name, k, metric,
+                                                 indicator=request.args.get('indicator', None))
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Benzer ülkeler alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/data/groups', methods=['GET'])
+def get_groups():
+    """Tanımlı ülke gruplarını döndürür"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        response = data_vm.get_groups()
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Ülke grupları alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/data/group/<name>', methods=['GET', 'PUT'])
+def group_data(name):
+    """Grubun yıl başına özetlerini döndürür (?indicator=) veya grubu tanımlar (PUT {"countries": [...], "weights": {...}, "label": ...})"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        if request.method == 'PUT':
+            payload = request.get_json(silent=True) or {}
+            countries = _parse_country_list(payload.get('countries', []))
+            if countries is None:
+                return jsonify({'success': False, 'error': 'countries bir liste veya virgülle ayrılmış metin olmalı'}), 400
+            response = data_vm.define_group(name, countries,
+                                            weights=payload.get('weights'), label=payload.get('label'))
+        else:
+            response = data_vm.get_group_data(name, indicator=request.args.get('indicator', None))
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Grup isteği işlenirken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/data/query', methods=['GET'])
+def query_countries():
+    """Ülkeleri filtreler, sıralar ve sayfalar (?where=value>40,trend<0&year=&sort=value&direction=desc&offset=0&limit=50)"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        response = data_vm.query_countries(
+            request.args.get('where', None),
+            year=request.args.get('year', None, type=int),
+            sort=request.args.get('sort', 'value') or None,
+            direction=request.args.get('direction', 'desc').lower(),
+            offset=request.args.get('offset', 0, type=int),
+            limit=request.args.get('limit', 50, type=int),
+            indicator=request.args.get('indicator', None)
+        )
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Ülke sorgusu çalıştırılırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/data/predictions', methods=['GET'])
+def get_predictions():
+    """Genel modelle tüm ülkelerin (veya ?countries=A,B) tahminini tek istekte döndürür (?year=2030)"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        future_year = request.args.get('year', None, type=int)
+        if future_year is None:
+            return jsonify({'success': False, 'error': 'year parametresi gerekli'}), 400
+        countries = request.args.get('countries', None)
+        response = data_vm.get_predictions(
+            future_year,
+            [name.strip() for name in countries.split(',') if name.strip()] if countries else None
+        )
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Toplu tahmin sırasında hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/data/train-all', methods=['POST'])
+def train_all_models():
+    """Ülke modellerini süreç havuzunda toplu eğitir (?countries=A,B&workers=4&timeout=60&indicator=)"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        countries = request.args.get('countries', None)
+        workers = request.args.get('workers', None, type=int)
+        if workers is not None and workers < 1:
+            return jsonify({'success': False, 'error': 'workers en az 1 olmalı'}), 400
+        timeout = request.args.get('timeout', None, type=float)
+        # NaN da reddedilsin diye karşılaştırma olumsuzlanır
+        if timeout is not None and not timeout > 0:
+            return jsonify({'success': False, 'error': 'timeout sıfırdan büyük olmalı'}), 400
+        response = data_vm.train_all_models(
+            [name.strip() for name in countries.split(',') if name.strip()] if countries else None,
+            indicator=request.args.get('indicator', None),
+            workers=workers,
+            timeout=timeout
+        )
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Toplu model eğitimi sırasında hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@api_bp.route('/trends', methods=['GET'])
+def get_trends():
+    """Tüm ülkelerin trend tablosunu döndürür (?indicator=&window=)"""
+    try:
+        data_vm = _get_data_vm()
+        if not data_vm:
+            return jsonify({'success': False, 'error': 'Veri servisi yüklenemedi'}), 500
+        window = request.args.get('window', 5, type=int)
+        response = data_vm.get_trends(indicator=request.args.get('indicator', None), window=window)
+        return jsonify(response), 200 if response.get('success') else 400
+    except Exception as e:
+        logger.error(f"Trendler alınırken hata: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @api_bp.route('/data/model', methods=['GET'])
 def get_model_data():
     """Model analiz verilerini döndürür"""
     try:
+        data_vm = _get_data_vm()
         if data_vm:
             # URL'den ülke parametresini al
             country_name = request.args.get('country', None)
@@ -0,0 +1,128 @@
+"""
+Servis Kapsayıcısı Modülü - Süreç genelinde paylaşılan servis örnekleri
+
+Bu modül DataService ve DataViewModel örneklerini süreç başına bir kez,
+ilk ihtiyaç duyulduğunda ve thread-safe biçimde oluşturur. app.py, API
+Blueprint'leri ve kök dizindeki api.py aynı örnekleri buradan alır; böylece
+CSV bir kez yüklenir, modeller bir kez eğitilir ve önbellekler paylaşılır.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Oluşturma sırasında başka servisler de çözülebildiği için yeniden girişli kilit
+_lock = threading.RLock()
+_instances: Dict[str, Any] = {}
+_settings: Dict[str, Any] = {
+    'data_path': None,
+    'use_snapshot': True,
+    'memory_limit_mb': None,
+    'shared_dataset': False,
+    'model_registry': False
+}
+
+
+def configure(data_path: Optional[str] = None, use_snapshot: bool = True,
+              memory_limit_mb: Optional[float] = None, shared_dataset: bool = False,
+              model_registry: bool = False) -> None:
+    """
+    Paylaşılan DataService'in oluşturulma ayarlarını belirler.
+    İlk get_data_service() çağrısından önce yapılmalıdır.
+
+    Args:
+        data_path: CSV dosyasının yolu (None ise DataService varsayılanı kullanılır)
+        use_snapshot: Ön işlenmiş veri anlık görüntüsü kullanılsın mı
+        memory_limit_mb: Verilirse CSV bu bellek tavanıyla parça parça yüklenir
+        shared_dataset: Değer matrisleri worker'lar arasında bellek eşlemeli dosyalarla paylaşılsın mı
+        model_registry: Eğitilen modeller diskteki model kaydına yazılıp oradan yüklensin mi
+    """
+    with _lock:
+        if 'data_service' in _instances and data_path != _settings['data_path']:
+            logger.warning("DataService zaten oluşturuldu, yeni veri yolu ayarı sonraki reset() sonrasında geçerli olacak")
+        _settings['data_path'] = data_path
+        _settings['use_snapshot'] = use_snapshot
+        _settings['memory_limit_mb'] = memory_limit_mb
+        _settings['shared_dataset'] = shared_dataset
+        _settings['model_registry'] = model_registry
+
+
+def resolve(name: str, factory: Callable[[], Any]) -> Any:
+    """
+    Adı verilen servisi döndürür, yoksa factory ile bir kez oluşturur.
+
+    Oluşturma sırasında hata olursa örnek kaydedilmez ve bir sonraki çağrı
+    oluşturmayı yeniden dener.
+
+    Args:
+        name: Servis adı
+        factory: Servisi oluşturan parametresiz fonksiyon
+
+    Returns:
+        Any: Paylaşılan servis örneği
+    """
+    instance = _instances.get(name)
+    if instance is not None:
+        return instance
+
+    with _lock:
+        instance = _instances.get(name)
+        if instance is None:
+            logger.info(f"Paylaşılan servis oluşturuluyor: {name}")
+            instance = factory()
+            _instances[name] = instance
+        return instance
+
+
+def get_data_service():
+    """
+    Süreç genelinde paylaşılan DataService örneğini döndürür.
+
+    Returns:
+        DataService: Paylaşılan veri servisi
+    """
+    from app.data_service import DataService
+
+    return resolve('data_service', lambda: DataService(
+        _settings['data_path'],
+        use_snapshot=_settings['use_snapshot'],
+        memory_limit_mb=_settings['memory_limit_mb'],
+        shared_dataset=_settings['shared_dataset'],
+        model_registry=_settings['model_registry']
+    ))
+
+
+def get_data_viewmodel():
+    """
+    Paylaşılan DataService üzerine kurulu DataViewModel örneğini döndürür.
+
+    Returns:
+        DataViewModel: Paylaşılan ViewModel
+    """
+    from app.data_viewmodel import DataViewModel
+
+    return resolve('data_viewmodel', lambda: DataViewModel(get_data_service()))
+
+
+def after_fork() -> None:
+    """
+    Ana süreçte oluşturulan servisleri fork sonrası worker'da kullanıma hazırlar.
+
+    Thread'ler fork ile çocuk sürece taşınmadığından, ana süreçte başlatılmış
+    dosya izleyicisi worker'da aynı aralıkla yeniden başlatılır.
+    """
+    data_service = _instances.get('data_service')
+    if data_service is None or not data_service.watch_interval:
+        return
+    data_service._watcher = None
+    data_service.start_watcher(data_service.watch_interval)
+
+
+def reset() -> None:
+    """
+    Tüm paylaşılan örnekleri bırakır (testler ve yeniden yapılandırma için).
+    """
+    with _lock:
+        _instances.clear()
@@ -49,4 +49,52 @@ class TestSystemIntegration(unittest.TestCase):
         
         # Yanlis yil formatinda bad request aliyor
         response = self.app.get('/api/data/prediction/Turkey?year=invalid_year')
-        self.assertEqual(response.status_code, 400)
\ No newline at end of file
+        self.assertEqual(response.status_code, 400)
+
+    def test_batch_post_coerces_json_fields(self):
+        """Sistem toplu POST isteginde metin olarak gelen yil, adim ve ulke listesini kabul ediyor."""
+        response = self.app.post('/api/data/countries/batch', json={
+            'countries': 'Turkey, Germany', 'from': '3', 'to': 10, 'step': '2'
+        })
+        data = json.loads(response.data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['countries'], ['Turkey', 'Germany'])
+        self.assertEqual(data['years'], [3, 5, 7, 9])
+
+    def test_batch_post_rejects_invalid_fields(self):
+        """Sistem toplu POST isteginde sayiya cevrilemeyen alanlari ve liste olmayan ulkeleri reddediyor."""
+        for payload in ({'countries': ['Turkey'], 'step': 'iki'},
+                        {'countries': ['Turkey'], 'from': 'ilk'},
+                        {'countries': 5}):
+            response = self.app.post('/api/data/countries/batch', json=payload)
+            self.assertEqual(response.status_code, 400, payload)
+
+    def test_group_put_accepts_comma_separated_countries(self):
+        """Sistem grup tanimlarken virgulle ayrilmis ulke metnini listeye bolup kaydediyor."""
+        response = self.app.put('/api/data/group/sistem_testi', json={'countries': 'Turkey, Germany'})
+        data = json.loads(response.data)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['group']['countries'], ['Turkey', 'Germany'])
+
+    def test_group_put_rejects_invalid_definitions(self):
+        """Sistem grup tanimlarken metin olmayan uyeleri, bilinmeyen ulkeleri ve bool agirliklari reddediyor."""
+        for payload in ({'countries': [1, 2]},
+                        {'countries': {'TUR': 1}},
+                        {'countries': ['Turkey', 'Atlantis']},
+                        {'countries': ['Turkey'], 'weights': {'Turkey': True}}):
+            response = self.app.put('/api/data/group/sistem_testi', json=payload)
+            self.assertEqual(response.status_code, 400, payload)
+
+    def test_train_all_rejects_invalid_workers(self):
+        """Sistem toplu egitimde 1'den kucuk worker sayisini reddediyor."""
+        for workers in ('0', '-3'):
+            response = self.app.post(f'/api/data/train-all?countries=Turkey&workers={workers}')
+            self.assertEqual(response.status_code, 400, workers)
+
+    def test_train_all_rejects_invalid_timeout(self):
+        """Sistem toplu egitimde sifir, negatif veya sayi olmayan sure sinirini reddediyor."""
+        for timeout in ('0', '-5', 'nan'):
+            response = self.app.post(f'/api/data/train-all?countries=Turkey&timeout={timeout}')
+            self.assertEqual(response.status_code, 400, timeout)
@@ -0,0 +1,124 @@
+"""
+Batch Regression Unit Testleri
+
+Tüm ülkelerin polinom/doğrusal modellerinin tek seferde çözülmesi, ülke
+başına sklearn LinearRegression ile aynı sonucu vermesi, eksik değerler ve
+toplu tahmin test edilir.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import numpy as np
+import pandas as pd
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from app.models.batch_regression import BatchPolynomialRegression
+from app.models.country_model import fit_linear_models
+from app.models.data_model import fit_polynomial_models
+
+
+class TestBatchRegression(unittest.TestCase):
+    """
+    batch_regression modülü için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup: rastgele yürüyüş serileri, bazı hücreleri eksik"""
+        rng = np.random.default_rng(0)
+        self.years = np.arange(1990, 2016)
+        self.countries = [f'C{i}' for i in range(20)]
+        self.values = rng.normal(size=(20, len(self.years))).cumsum(axis=1) + 20
+        self.values[3, [0, 5]] = np.nan
+        self.values[7, :] = np.nan
+
+    def _sklearn_polynomial(self, row: int):
+        """Eski ülke başına eğitim: yıl, yıl², yıl³ + StandardScaler + LinearRegression"""
+        observed = ~np.isnan(self.values[row])
+        years = self.years[observed].astype(float)
+        X = np.column_stack([years, years ** 2, years ** 3])
+        X_train, X_test, y_train, y_test = train_test_split(X, self.values[row, observed],
+                                                            test_size=0.2, random_state=42)
+        scaler = StandardScaler().fit(X_train)
+        model = LinearRegression().fit(scaler.transform(X_train), y_train)
+        return scaler, model, r2_score(y_test, model.predict(scaler.transform(X_test)))
+
+    def test_matches_per_country_sklearn(self):
+        """Test: Toplu çözüm ülke başına sklearn modeliyle aynı tahmin ve metrikleri vermeli"""
+        # Act
+        batch = BatchPolynomialRegression(3).fit(self.values, self.years, self.countries, test_size=0.2)
+
+        # Assert
+        future = np.arange(2016, 2021, dtype=float)
+        for row in (0, 3):
+            scaler, model, r2 = self._sklearn_polynomial(row)
+            expected = model.predict(scaler.transform(np.column_stack([future, future ** 2, future ** 3])))
+            np.testing.assert_allclose(batch.predict(future, [self.countries[row]])[0], expected, atol=1e-8)
+            self.assertAlmostEqual(batch.metrics(self.countries[row])['r2'], r2, places=8)
+        self.assertFalse(batch.fitted('C7'))
+
+    def test_predict_all_countries_at_once(self):
+        """Test: Tahmin tüm ülkeler için [ülke, yıl] boyutlu tek matris olmalı"""
+        # Arrange
+        batch = BatchPolynomialRegression(1).fit(self.values, self.years, self.countries)
+
+        # Act
+        predictions = batch.predict([2016, 2017])
+        selected = batch.predict([2016, 2017], ['C2', 'C0'])
+
+        # Assert
+        self.assertEqual(batch.coef_.shape, (20, 2))
+        self.assertEqual(predictions.shape, (20, 2))
+        np.testing.assert_allclose(selected, predictions[[2, 0]])
+        view = pickle.loads(pickle.dumps(batch.country_model('C2')))
+        np.testing.assert_allclose(view.predict(np.array([[2016], [2017]])), predictions[2])
+        self.assertEqual(view.batch.coef_.shape, (1, 2))
+
+    def test_fit_linear_models(self):
+        """Test: Az veri noktası olan ülkeler ayrı LinearRegression ile aynı modeli almalı"""
+        # Arrange
+        frames = {
+            'A': pd.DataFrame({'Year': [1, 2, 3], 'Renewable_Value': [1.0, 2.5, 2.9]}),
+            'B': pd.DataFrame({'Year': [2, 3], 'Renewable_Value': [4.0, np.nan]}),
+            'C': pd.DataFrame({'Year': [1], 'Renewable_Value': [np.nan]})
+        }
+
+        # Act
+        results = fit_linear_models(frames)
+
+        # Assert
+        self.assertEqual(sorted(results), ['A', 'B'])
+        expected = LinearRegression().fit(frames['A'][['Year']], frames['A']['Renewable_Value'])
+        model, result = results['A']
+        np.testing.assert_allclose(model.predict(np.array([[5], [6]])), expected.predict(pd.DataFrame({'Year': [5, 6]})))
+        self.assertEqual(result['model'], 'LinearRegression')
+        self.assertEqual(results['B'][0].predict(np.array([[9]]))[0], 4.0)
+
+    def test_fit_polynomial_models_from_long_format(self):
+        """Test: Uzun formattaki veriden tüm ülkelerin polinomları birlikte eğitilmeli"""
+        # Arrange
+        melted = pd.DataFrame({
+            'Country Name': np.repeat(self.countries[:3], len(self.years)),
+            'Year': np.tile(self.years, 3),
+            'Renewable_Value': self.values[:3].reshape(-1)
+        })
+
+        # Act
+        batch = fit_polynomial_models(melted)
+
+        # Assert
+        self.assertEqual(batch.countries, self.countries[:3])
+        scaler, model, r2 = self._sklearn_polynomial(3 - 1)
+        self.assertAlmostEqual(batch.metrics('C2')['r2'], r2, places=8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Country Groups Unit Testleri
+
+Ülke grubu tanımlarının okunması, doğrulanması ve grup özetlerinin
+ülke × yıl matrisi üzerinde hesaplanması test edilir.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+import shutil
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils.country_groups import CountryGroup, aggregate, load_groups
+
+
+class TestCountryGroups(unittest.TestCase):
+    """
+    country_groups modülü için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.values = np.array([
+            [1.0, 2.0, np.nan],
+            [3.0, np.nan, np.nan],
+            [5.0, 6.0, np.nan],
+            [100.0, 100.0, 100.0]
+        ])
+
+    def tearDown(self):
+        """Test cleanup"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_aggregate_ignores_missing_cells(self):
+        """Test: Özetler yalnızca üyelerin değeri olan hücrelerinden hesaplanmalı"""
+        # Act
+        result = aggregate(self.values, [0, 1, 2])
+
+        # Assert
+        np.testing.assert_allclose(result['mean'], [3.0, 4.0, np.nan])
+        np.testing.assert_allclose(result['median'], [3.0, 4.0, np.nan])
+        np.testing.assert_allclose(result['min'], [1.0, 2.0, np.nan])
+        np.testing.assert_allclose(result['max'], [5.0, 6.0, np.nan])
+        self.assertEqual(result['count'].tolist(), [3, 2, 0])
+        self.assertNotIn('weighted_mean', result)
+
+    def test_aggregate_weighted_mean_renormalizes_per_year(self):
+        """Test: Ağırlıklı ortalama her yıl değeri olan üyelerin ağırlıklarıyla normalize edilmeli"""
+        # Act
+        result = aggregate(self.values, [0, 1, 2], weights=np.array([2.0, 1.0, 1.0]))
+
+        # Assert
+        np.testing.assert_allclose(result['weighted_mean'], [(2 + 3 + 5) / 4, (4 + 6) / 3, np.nan])
+
+    def test_group_validation(self):
+        """Test: Boş üye listesi ve gruba ait olmayan ağırlık ValueError fırlatmalı"""
+        with self.assertRaises(ValueError):
+            CountryGroup('bos', [])
+        with self.assertRaises(ValueError):
+            CountryGroup('g', ['TUR'], weights={'DEU': 1})
+        with self.assertRaises(ValueError):
+            CountryGroup('g', ['TUR'], weights={'TUR': -1})
+
+    def test_group_rejects_invalid_types(self):
+        """Test: Metin listesi olmayan üyeler ve bool ağırlıklar ValueError fırlatmalı"""
+        with self.assertRaises(ValueError):
+            CountryGroup('g', 'TUR,DEU')
+        with self.assertRaises(ValueError):
+            CountryGroup('g', [1, 2])
+        with self.assertRaises(ValueError):
+            CountryGroup('g', ['TUR'], weights={'TUR': True})
+        with self.assertRaises(ValueError):
+            CountryGroup('g', ['TUR'], weights=[('TUR', 1)])
+
+    def test_load_groups_skips_invalid_definitions(self):
+        """Test: Geçersiz tanımlar atlanmalı, dosya yoksa boş sözlük dönmeli"""
+        # Arrange
+        path = os.path.join(self.test_dir, 'groups.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'EU': {'label': 'Avrupa Birliği', 'countries': ['DEU', 'FRA']},
+                'bos': {'countries': []}
+            }, f)
+
+        # Act
+        groups = load_groups(path)
+
+        # Assert
+        self.assertEqual(list(groups), ['EU'])
+        self.assertEqual(groups['EU'].label, 'Avrupa Birliği')
+        self.assertEqual(load_groups(os.path.join(self.test_dir, 'yok.json')), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
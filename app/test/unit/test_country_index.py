@@ -0,0 +1,80 @@
+"""
+Country Index Unit Testleri
+
+Ülke adı normalizasyonu, ad/kod/takma ad çözümü, önek ağacı önerileri ve
+hash tabanlı üyelik testi yapan ülke listesi test edilir.
+"""
+
+import unittest
+import sys
+import os
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils.country_index import CountryIndex, CountryList, load_aliases, normalize
+
+
+class TestCountryIndex(unittest.TestCase):
+    """
+    CountryIndex için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.index = CountryIndex(
+            ['Turkey', 'Germany', 'United Kingdom', 'United States', 'Tunisia', "Cote d'Ivoire"],
+            {'TUR': 'Turkey', 'DEU': 'Germany', 'GBR': 'United Kingdom', 'USA': 'United States',
+             'TUN': 'Tunisia', 'CIV': "Cote d'Ivoire", 'XXX': 'Atlantis'},
+            {'TUR': ['Türkiye'], 'DEU': ['Almanya'], 'GBR': ['İngiltere'], 'TUN': ['Tunus'],
+             'USA': ['ABD', 'US'], 'XXX': ['Atlantis']}
+        )
+
+    def test_normalize(self):
+        """Test: Türkçe karakterler, aksanlar, büyük harfler ve noktalama yok sayılmalı"""
+        self.assertEqual(normalize('TÜRKİYE'), 'turkiye')
+        self.assertEqual(normalize('Isparta'), 'isparta')
+        self.assertEqual(normalize("  Côte d'Ivoire "), 'cote d ivoire')
+
+    def test_resolve_names_codes_and_aliases(self):
+        """Test: Ad, kod ve takma adlar büyük/küçük harften bağımsız kanonik ada çözülmeli"""
+        cases = {
+            'Turkey': 'Turkey', 'turkey': 'Turkey', 'TUR': 'Turkey', 'tur': 'Turkey',
+            'Türkiye': 'Turkey', 'turkiye': 'Turkey', 'ALMANYA': 'Germany', 'ingiltere': 'United Kingdom',
+            'abd': 'United States', "cote d'ivoire": "Cote d'Ivoire"
+        }
+        for query, expected in cases.items():
+            self.assertEqual(self.index.resolve(query), expected, query)
+        self.assertIsNone(self.index.resolve('Atlantis'))
+        self.assertIsNone(self.index.resolve('XXX'))
+        self.assertIsNone(self.index.resolve(None))
+
+    def test_suggest_orders_by_match_kind(self):
+        """Test: Ad önekleri kod, takma ad ve kelime eşleşmelerinden önce gelmeli"""
+        self.assertEqual(self.index.suggest('tu'), ['Tunisia', 'Turkey'])
+        self.assertEqual(self.index.suggest('uni'), ['United Kingdom', 'United States'])
+        self.assertEqual(self.index.suggest('kingdom'), ['United Kingdom'])
+        self.assertEqual(self.index.suggest('al'), ['Germany'])
+        self.assertEqual(self.index.suggest('uni', limit=1), ['United Kingdom'])
+        self.assertEqual(self.index.suggest(''), [])
+        self.assertEqual(self.index.suggest('zz'), [])
+
+    def test_country_list_membership(self):
+        """Test: CountryList liste gibi davranmalı, üyelik indeks üzerinden çözülmeli"""
+        countries = CountryList(self.index.names, self.index)
+
+        self.assertEqual(countries, sorted(self.index.names))
+        self.assertIn('Turkey', countries)
+        self.assertIn('almanya', countries)
+        self.assertNotIn('Atlantis', countries)
+
+    def test_bundled_aliases(self):
+        """Test: Paketle gelen takma ad dosyası ülke kodu -> ad listesi olmalı"""
+        aliases = load_aliases()
+
+        self.assertIn('Türkiye', aliases['TUR'])
+        self.assertTrue(all(isinstance(names, list) for names in aliases.values()))
+
+
+if __name__ == '__main__':
+    unittest.main()
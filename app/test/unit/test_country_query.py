@@ -0,0 +1,70 @@
+"""
+Country Query Unit Testleri
+
+Filtre ifadelerinin ayrıştırılması ve önceden hesaplanmış diziler üzerinde
+maskeleme, sıralama ve sayfalama test edilir.
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils.country_query import filter_mask, parse_filters, select
+
+
+class TestCountryQuery(unittest.TestCase):
+    """
+    country_query modülü için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.columns = {
+            'value': np.array([50.0, 45.0, np.nan, 10.0, 60.0]),
+            'trend': np.array([-2.0, 3.0, -1.0, -5.0, -0.5])
+        }
+
+    def test_parse_filters(self):
+        """Test: Virgül ve 'and' ile ayrılmış koşullar ayrıştırılmalı"""
+        self.assertEqual(
+            parse_filters('value>40, trend<0 AND rank<=10'),
+            [('value', '>', 40.0), ('trend', '<', 0.0), ('rank', '<=', 10.0)]
+        )
+        self.assertEqual(parse_filters('cagr>=-1.5e0'), [('cagr', '>=', -1.5)])
+        self.assertEqual(parse_filters(''), [])
+        self.assertEqual(parse_filters(None), [])
+
+    def test_parse_filters_rejects_invalid(self):
+        """Test: Bilinmeyen alan veya hatalı sözdizimi ValueError fırlatmalı"""
+        for expression in ['foo>1', 'value>', 'value ~ 3', 'value>40 or trend<0']:
+            with self.assertRaises(ValueError):
+                parse_filters(expression)
+
+    def test_filter_mask_excludes_missing(self):
+        """Test: Eksik değerler hiçbir koşulu sağlamamalı"""
+        mask = filter_mask(self.columns, parse_filters('value>40, trend<0'))
+
+        self.assertEqual(mask.tolist(), [True, False, False, False, True])
+        self.assertEqual(filter_mask(self.columns, parse_filters('value!=10')).tolist(),
+                         [True, True, True, False, True])
+
+    def test_select_sorts_and_paginates(self):
+        """Test: Eşleşenler sıralanmalı, NaN'lar sona kalmalı, toplam sayfadan bağımsız olmalı"""
+        # Act
+        rows, total = select(self.columns, [], sort='value', descending=True, offset=1, limit=2)
+        ascending, _ = select(self.columns, [], sort='value', descending=False)
+
+        # Assert
+        self.assertEqual(rows.tolist(), [0, 1])
+        self.assertEqual(total, 5)
+        self.assertEqual(ascending.tolist(), [3, 1, 0, 4, 2])
+        with self.assertRaises(ValueError):
+            select(self.columns, [], sort='foo')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,401 @@
+"""
+CountryYearStore Unit Testleri
+
+Ülke × yıl küpünün oluşturulması, satır görünümleri ve uzun formata
+geri dönüşüm test edilir.
+"""
+
+import unittest
+import sys
+import os
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils.country_store import (
+    CountryStatsTable, CountryYearStore, RankIndex, SimilarityIndex, log_value, to_float64
+)
+from app.data_service import DataService
+
+
+class TestCountryYearStore(unittest.TestCase):
+    """
+    CountryYearStore sınıfı için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.melted = pd.DataFrame({
+            'Country Name': ['Turkey', 'Germany', 'Turkey', 'Germany', 'Turkey'],
+            'Country Code': ['TUR', 'DEU', 'TUR', 'DEU', 'TUR'],
+            'YR_label': ['YRbir', 'YRbir', 'YRiki', 'YRiki', 'YRuc'],
+            'Renewable_Value': [10.5, 15.2, 11.2, 16.1, 12.0],
+            'Year': [1, 1, 2, 2, 3]
+        })
+        self.store = CountryYearStore.from_melted(self.melted)
+
+    def test_from_melted_builds_dense_matrix(self):
+        """Test: Küp float32 olmalı, eksik hücreler NaN olmalı"""
+        self.assertEqual(self.store.values.dtype, np.float32)
+        self.assertEqual(self.store.values.shape, (2, 3))
+        self.assertEqual(self.store.countries, ['Germany', 'Turkey'])
+        self.assertEqual(self.store.years.tolist(), [1, 2, 3])
+        self.assertTrue(np.isnan(self.store.values[self.store.country_index['Germany'], 2]))
+
+    def test_series_of_complete_row_is_a_view(self):
+        """Test: Eksiksiz satırın serisi kopya değil görünüm olmalı"""
+        # Act
+        years, values = self.store.series('Turkey')
+
+        # Assert
+        self.assertTrue(np.shares_memory(values, self.store.values))
+        self.assertEqual(years.tolist(), [1, 2, 3])
+        self.assertEqual(to_float64(values).tolist(), [10.5, 11.2, 12.0])
+
+    def test_series_skips_missing_years(self):
+        """Test: Eksik yıllar seriden çıkarılmalı"""
+        years, values = self.store.series('Germany')
+
+        self.assertEqual(years.tolist(), [1, 2])
+        self.assertEqual(to_float64(values).tolist(), [15.2, 16.1])
+
+    def test_values_are_read_only(self):
+        """Test: Dışarıya verilen görünümler değiştirilememeli"""
+        _, values = self.store.series('Turkey')
+
+        with self.assertRaises(ValueError):
+            values[0] = 99.0
+
+    def test_year_slice_uses_closed_range(self):
+        """Test: Yıl aralığı her iki ucu da içermeli, aralık dışı boş dilim vermeli"""
+        self.assertEqual(self.store.year_slice(2, 3), slice(1, 3))
+        self.assertEqual(self.store.year_slice(None, 1), slice(0, 1))
+        self.assertEqual(self.store.year_slice(2, None), slice(1, 3))
+        self.assertEqual(self.store.years[self.store.year_slice(5, 9)].tolist(), [])
+        self.assertEqual(self.store.years[self.store.year_slice(3, 2)].tolist(), [])
+
+    def test_value_lookup(self):
+        """Test: Tek hücre okuma, eksik hücre ve bilinmeyen ülke için None döndürmeli"""
+        self.assertEqual(self.store.value('Germany', 2), 16.1)
+        self.assertIsNone(self.store.value('Germany', 3))
+        self.assertIsNone(self.store.value('France', 1))
+
+    def test_to_melted_round_trip(self):
+        """Test: Küpten türetilen uzun format aynı satırları içermeli"""
+        # Act
+        melted = self.store.to_melted()
+
+        # Assert
+        expected = self.melted.sort_values(['Year', 'Country Name']).reset_index(drop=True)
+        columns = ['Country Name', 'Country Code', 'YR_label']
+        pd.testing.assert_frame_equal(melted[columns].astype(object), expected[columns])
+        self.assertEqual(to_float64(melted['Renewable_Value']).tolist(), expected['Renewable_Value'].tolist())
+        self.assertEqual(melted['Year'].tolist(), expected['Year'].tolist())
+
+    def test_to_melted_is_compact(self):
+        """Test: Metin sütunları kategorik, değerler float32, yıllar int16 olmalı; LogValue saklanmamalı"""
+        # Act
+        melted = self.store.to_melted()
+
+        # Assert
+        for column in ['Country Name', 'Country Code', 'YR_label']:
+            self.assertIsInstance(melted[column].dtype, pd.CategoricalDtype)
+        self.assertEqual(melted['Renewable_Value'].dtype, np.float32)
+        self.assertEqual(melted['Year'].dtype, np.int16)
+        self.assertNotIn('LogValue', melted.columns)
+
+    def test_log_value_is_computed_on_demand(self):
+        """Test: log_value() pozitif değerler için log1p, diğerleri için 0 döndürmeli"""
+        # Arrange
+        frame = pd.DataFrame({'Renewable_Value': np.array([15.2, 0.0, -1.0], dtype=np.float32)})
+
+        # Act
+        logs = log_value(frame)
+
+        # Assert
+        self.assertAlmostEqual(logs.iloc[0], np.log1p(15.2), places=12)
+        self.assertEqual(logs.iloc[1:].tolist(), [0.0, 0.0])
+
+    def test_from_melted_requires_columns(self):
+        """Test: Gerekli sütunlar yoksa ValueError fırlatmalı"""
+        with self.assertRaises(ValueError):
+            CountryYearStore.from_melted(pd.DataFrame({'Year': [1], 'Renewable_Value': [1.0]}))
+
+    def test_diff_finds_changed_rows_on_union_of_years(self):
+        """Test: Yeni yıl eklenen ve değeri değişen ülkeler 'changed' olmalı"""
+        # Arrange
+        newer = self.melted.copy()
+        newer.loc[4, 'Renewable_Value'] = 12.5
+        newer = pd.concat([newer, pd.DataFrame({
+            'Country Name': ['Germany'], 'Country Code': ['DEU'], 'YR_label': ['YRdort'],
+            'Renewable_Value': [17.0], 'Year': [4]
+        })], ignore_index=True)
+
+        # Act
+        diff = self.store.diff(CountryYearStore.from_melted(newer))
+
+        # Assert
+        self.assertEqual(diff, {'added': [], 'removed': [], 'changed': ['Germany', 'Turkey']})
+
+    def test_diff_of_identical_stores_is_empty(self):
+        """Test: Aynı veriden oluşturulan küpler arasında fark olmamalı"""
+        diff = self.store.diff(CountryYearStore.from_melted(self.melted.copy()))
+
+        self.assertEqual(diff, {'added': [], 'removed': [], 'changed': []})
+
+
+class TestCountryStatsTable(unittest.TestCase):
+    """
+    CountryStatsTable için unit testler.
+    """
+
+    def test_stats_match_series_without_missing_years(self):
+        """Test: Eksik hücreli satırın istatistikleri NaN'sız seriyle aynı olmalı"""
+        # Arrange
+        values = np.array([[np.nan, 2.0, 4.0, np.nan, 9.0]], dtype=np.float32)
+        series = np.array([2.0, 4.0, 9.0])
+
+        # Act
+        stats = CountryStatsTable(values, [1, 2, 3, 4, 5]).stats(0)
+
+        # Assert
+        self.assertEqual(stats['years'], [2, 3, 5])
+        self.assertEqual(stats['values'], [2.0, 4.0, 9.0])
+        self.assertEqual(stats['min'], 2.0)
+        self.assertEqual(stats['max'], 9.0)
+        self.assertAlmostEqual(stats['mean'], series.mean())
+        self.assertEqual(stats['median'], 4.0)
+        self.assertAlmostEqual(stats['std'], series.std(ddof=1))
+        self.assertEqual(stats['last_value'], 9.0)
+        self.assertAlmostEqual(stats['trend'], 350.0)
+
+    def test_trend_uses_last_five_values(self):
+        """Test: Trend son beş değerin ilk ve sonuncusundan hesaplanmalı"""
+        # Arrange
+        values = np.array([
+            [1.0, 2.0, 4.0, 5.0, 6.0, 7.0, 8.0],
+            [0.0, 3.0, np.nan, np.nan, np.nan, np.nan, np.nan],
+            [5.0, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan]
+        ], dtype=np.float32)
+
+        # Act
+        table = CountryStatsTable(values, range(7))
+
+        # Assert
+        self.assertAlmostEqual(table.trend[0], 100.0)
+        self.assertEqual(table.trend[1], 100.0)  # Sıfırdan pozitif değere
+        self.assertEqual(table.trend[2], 0.0)    # Tek değer
+        self.assertTrue(np.isnan(table.std[2]))
+
+    def test_time_series_keys(self):
+        """Test: Zaman serisi anahtarları "1.0" biçiminde olmalı, eksik yıllar atlanmalı"""
+        table = CountryStatsTable(np.array([[10.5, np.nan, 12.0]], dtype=np.float32), [1, 2, 3])
+
+        self.assertEqual(table.time_series(0), {'1.0': 10.5, '3.0': 12.0})
+
+    def test_empty_row_raises(self):
+        """Test: Hiç değeri olmayan satırın istatistikleri istenirse ValueError"""
+        table = CountryStatsTable(np.full((1, 3), np.nan, dtype=np.float32), [1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            table.stats(0)
+
+    def test_store_caches_table(self):
+        """Test: Küp istatistik tablosunu bir kez oluşturmalı"""
+        store = CountryYearStore.from_melted(pd.DataFrame({
+            'Country Name': ['Turkey', 'Turkey'],
+            'Renewable_Value': [10.5, 11.2],
+            'Year': [1, 2]
+        }))
+
+        self.assertIs(store.stats_table(), store.stats_table())
+        self.assertEqual(store.stats_table().stats(store.position('Turkey'))['last_value'], 11.2)
+
+    def test_table_does_not_copy_matrix(self):
+        """Test: Tablo float32 küpü paylaşmalı, yalnızca yanıttaki satır ondalıklarıyla genişletilmeli"""
+        # Arrange
+        values = np.array([[10.5, 11.2, np.nan, 12.8]], dtype=np.float32)
+
+        # Act
+        table = CountryStatsTable(values, [1, 2, 3, 4])
+        stats = table.stats(0)
+
+        # Assert
+        self.assertTrue(np.shares_memory(table.values, values))
+        self.assertEqual(table.values.dtype, np.float32)
+        self.assertEqual(stats['values'], [10.5, 11.2, 12.8])
+        self.assertEqual(stats['max'], 12.8)
+        self.assertAlmostEqual(stats['mean'], (10.5 + 11.2 + 12.8) / 3, places=5)
+        self.assertAlmostEqual(stats['trend'], (12.8 - 10.5) / 10.5 * 100)
+
+
+class TestRankIndex(unittest.TestCase):
+    """
+    RankIndex için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        # Satırlar: A, B, C, D; ikinci yılda C eksik, B ile D eşit
+        self.values = np.array([
+            [1.0, 5.0],
+            [3.0, 2.0],
+            [2.0, np.nan],
+            [4.0, 2.0]
+        ], dtype=np.float32)
+        self.index = RankIndex(self.values)
+
+    def test_top_and_bottom_k(self):
+        """Test: İlk/son k satır değer sırasına göre dönmeli, eksikler atlanmalı"""
+        self.assertEqual(self.index.top(0, 2).tolist(), [3, 1])
+        self.assertEqual(self.index.top(0, 2, descending=False).tolist(), [0, 2])
+        self.assertEqual(self.index.top(1, 10).tolist(), [0, 1, 3])
+        self.assertEqual(self.index.top(1, 10, descending=False).tolist(), [1, 3, 0])
+
+    def test_rank_and_percentile(self):
+        """Test: Eşit değerler aynı sırayı paylaşmalı, yüzdelik ≤ değer oranı olmalı"""
+        self.assertEqual(self.index.rank[:, 0].tolist(), [4, 2, 3, 1])
+        self.assertEqual(self.index.rank[1, 1], 2)
+        self.assertEqual(self.index.rank[3, 1], 2)
+        self.assertAlmostEqual(self.index.percentile[0, 0], 25.0)
+        self.assertAlmostEqual(self.index.percentile[1, 1], 200 / 3)
+        self.assertTrue(np.isnan(self.index.percentile[2, 1]))
+        self.assertEqual(self.index.count.tolist(), [4, 3])
+
+    def test_store_caches_index(self):
+        """Test: Küp sıralama indeksini bir kez oluşturmalı"""
+        store = CountryYearStore(self.values, ['A', 'B', 'C', 'D'], [1, 2])
+
+        self.assertIs(store.rank_index(), store.rank_index())
+
+
+class TestSimilarityIndex(unittest.TestCase):
+    """
+    SimilarityIndex için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        rng = np.random.default_rng(3)
+        self.values = rng.random((12, 15)) * 10
+        self.values[rng.random(self.values.shape) < 0.25] = np.nan
+        # Satır 1, satır 0'ın ölçeklenmiş kopyası; satır 2 yalnızca iki değere sahip
+        self.values[1] = self.values[0] * 3 + 1
+        self.values[2] = np.nan
+        self.values[2, :2] = [1.0, 2.0]
+        self.index = SimilarityIndex(self.values)
+
+    def test_matrices_match_pairwise_reference(self):
+        """Test: Ölçüler her çiftin ortak yılları üzerinden hesaplananla aynı olmalı"""
+        def zscore(row):
+            return (row - np.nanmean(row)) / np.nanstd(row)
+
+        for i in range(len(self.values)):
+            for j in range(len(self.values)):
+                both = ~np.isnan(self.values[i]) & ~np.isnan(self.values[j])
+                if both.sum() < SimilarityIndex.MIN_OVERLAP:
+                    self.assertTrue(np.isnan(self.index.matrices['pearson'][i, j]))
+                    continue
+                x, y = self.values[i][both], self.values[j][both]
+                self.assertAlmostEqual(self.index.matrices['pearson'][i, j], np.corrcoef(x, y)[0, 1])
+                distance = np.sqrt(np.mean((zscore(self.values[i])[both] - zscore(self.values[j])[both]) ** 2))
+                self.assertAlmostEqual(self.index.matrices['euclidean'][i, j], distance)
+                self.assertEqual(self.index.overlap[i, j], both.sum())
+
+    def test_most_similar(self):
+        """Test: En benzer ülkeler kendisi ve ölçüsü olmayanlar hariç benzerlik sırasıyla dönmeli"""
+        # Act
+        pearson = self.index.most_similar(0, 3)
+        euclidean = self.index.most_similar(0, 20, metric='euclidean')
+
+        # Assert
+        self.assertEqual(pearson[0], 1)
+        self.assertEqual(euclidean[0], 1)
+        self.assertNotIn(0, euclidean)
+        self.assertNotIn(2, euclidean)
+        self.assertEqual(len(euclidean), 10)
+        scores = self.index.matrices['euclidean'][0, euclidean]
+        self.assertTrue(np.all(np.diff(scores) >= 0))
+        self.assertEqual(len(self.index.most_similar(2, 5)), 0)
+        with self.assertRaises(ValueError):
+            self.index.most_similar(0, 3, metric='cosine')
+
+    def test_store_caches_index(self):
+        """Test: Küp benzerlik indeksini bir kez oluşturmalı"""
+        store = CountryYearStore(self.values.astype(np.float32), [f"C{i}" for i in range(12)], range(15))
+
+        self.assertIs(store.similarity_index(), store.similarity_index())
+
+
+class TestDataServiceStore(unittest.TestCase):
+    """
+    DataService'in küp üzerinden sorgu yapması için testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_csv_path = os.path.join(self.test_dir, 'test_data.csv')
+        pd.DataFrame({
+            'Country Name': ['Turkey', 'Germany'],
+            'Country Code': ['TUR', 'DEU'],
+            'Series Name': ['Renewable'] * 2,
+            'Series Code': ['REN'] * 2,
+            'YRbir': [10.5, 15.2],
+            'YRiki': [11.2, 16.1],
+            'YRuc': [12.0, 17.3]
+        }).to_csv(self.test_csv_path, index=False)
+
+    def tearDown(self):
+        """Test cleanup"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_country_lookup_does_not_build_melted_data(self):
+        """Test: Ülke sorgusu uzun formattaki veriyi oluşturmamalı"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        country_data = service.get_country_data('Turkey')
+
+        # Assert
+        self.assertIsNone(service._melted_data)
+        self.assertEqual(country_data['stats']['values'], [10.5, 11.2, 12.0])
+        self.assertEqual(list(country_data['time_series'].keys()), ['1.0', '2.0', '3.0'])
+
+    def test_melted_data_is_derived_lazily(self):
+        """Test: melted_data ilk erişimde küpten türetilmeli"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        melted = service.melted_data
+
+        # Assert
+        self.assertEqual(len(melted), 6)
+        self.assertEqual(melted['Series Name'].cat.categories.tolist(), ['Renewable'])
+        self.assertIs(service.melted_data, melted)
+
+    def test_assigning_melted_data_rebuilds_store(self):
+        """Test: melted_data atanınca küp yeni veriden oluşturulmalı"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        service.melted_data = pd.DataFrame({
+            'Country Name': ['Turkey', 'Turkey'],
+            'Year': [1, 2],
+            'Renewable_Value': [1.0, 2.0]
+        })
+
+        # Assert
+        self.assertEqual(service.get_country_data('Turkey')['stats']['values'], [1.0, 2.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Veri Yeniden Yükleme Unit Testleri
+
+CSV dosyasının çalışma sırasında yeniden yüklenmesi, ülke koduna göre
+fark bulunması ve yalnızca değişen ülkelerin model, tahmin ve özetlerinin
+geçersiz kılınması test edilir.
+"""
+
+import unittest
+import sys
+import os
+import time
+import pandas as pd
+import tempfile
+import shutil
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.data_service import DataService
+
+
+class TestDataReload(unittest.TestCase):
+    """
+    DataService.reload_data ve dosya izleyicisi testleri.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_csv_path = os.path.join(self.test_dir, 'test_data.csv')
+        self.frame = pd.DataFrame({
+            'Country Name': ['Turkey', 'Germany', 'France'],
+            'Country Code': ['TUR', 'DEU', 'FRA'],
+            'YRbir': [10.5, 15.2, 20.1],
+            'YRiki': [11.2, 16.1, 21.3],
+            'YRuc': [12.0, 17.3, 22.4]
+        })
+        self.frame.to_csv(self.test_csv_path, index=False)
+        self.service = DataService(data_path=self.test_csv_path)
+
+    def tearDown(self):
+        """Test cleanup"""
+        self.service.stop_watcher()
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def _write(self, frame: pd.DataFrame) -> None:
+        frame.to_csv(self.test_csv_path, index=False)
+        # Dosya sistemi zaman çözünürlüğünden bağımsız olarak mtime değişsin
+        stamp = time.time() + 10
+        os.utime(self.test_csv_path, (stamp, stamp))
+
+    def test_reload_invalidates_only_changed_countries(self):
+        """Test: Yalnızca değeri değişen ülkenin modeli ve tahminleri silinmeli"""
+        # Arrange
+        self.service.models = {'Turkey': object(), 'Germany': object(), 'general': object()}
+        self.service.predictions_cache = {'Turkey_30': {}, 'Germany_30': {}}
+        changed = self.frame.copy()
+        changed.loc[0, 'YRuc'] = 13.5
+        self._write(changed)
+
+        # Act
+        result = self.service.reload_data()
+
+        # Assert
+        self.assertTrue(result['reloaded'])
+        self.assertEqual(result['data_version'], 2)
+        self.assertEqual(result['changes']['default']['changed'], ['Turkey'])
+        self.assertEqual(set(self.service.models), {'Germany'})
+        self.assertEqual(set(self.service.predictions_cache), {'Germany_30'})
+        self.assertEqual(self.service.get_country_data('Turkey')['stats']['last_value'], 13.5)
+
+    def test_reload_without_changes_keeps_everything(self):
+        """Test: Dosya değişmediyse sürüm ve önbellekler korunmalı"""
+        # Arrange
+        store = self.service.store
+        self.service.models = {'Turkey': object()}
+        self.service.predictions_cache = {'Turkey_30': {}}
+
+        # Act
+        result = self.service.reload_data()
+
+        # Assert
+        self.assertFalse(result['reloaded'])
+        self.assertEqual(self.service.data_version, 1)
+        self.assertIs(self.service.store, store)
+        self.assertIn('Turkey', self.service.models)
+        self.assertIn('Turkey_30', self.service.predictions_cache)
+
+    def test_reload_matches_rows_by_country_code(self):
+        """Test: Eklenen, silinen ve adı değişen ülkeler ülke koduna göre bulunmalı"""
+        # Arrange
+        changed = self.frame.copy()
+        changed.loc[0, 'Country Name'] = 'Türkiye'
+        changed.loc[2, ['Country Name', 'Country Code']] = ['Spain', 'ESP']
+        self._write(changed)
+
+        # Act
+        result = self.service.reload_data()
+
+        # Assert
+        diff = result['changes']['default']
+        self.assertEqual(diff['added'], ['Spain'])
+        self.assertEqual(diff['removed'], ['France'])
+        self.assertEqual(sorted(diff['changed']), ['Turkey', 'Türkiye'])
+        self.assertEqual(self.service.countries, ['Germany', 'Spain', 'Türkiye'])
+
+    def test_reload_failure_keeps_current_data(self):
+        """Test: Yeni dosya yüklenemezse mevcut veri değişmeden kalmalı"""
+        # Arrange
+        store = self.service.store
+
+        # Act & Assert
+        with self.assertRaises(Exception):
+            self.service.reload_data(os.path.join(self.test_dir, 'missing', 'yok.csv'))
+        self.assertIs(self.service.store, store)
+        self.assertEqual(self.service.data_version, 1)
+
+    def test_reload_drops_indicator_wide_aggregates(self):
+        """Test: Ülkeye bağlı özetler korunmalı, göstergenin tamamına ait özetler silinmeli"""
+        # Arrange
+        self.service._cached_aggregate('stats', lambda: 'eski', country='Germany')
+        self.service._cached_aggregate('stats', lambda: 'eski', country='Turkey')
+        self.service.get_data_overview()
+        changed = self.frame.copy()
+        changed.loc[0, 'YRbir'] = 9.0
+        self._write(changed)
+
+        # Act
+        self.service.reload_data()
+
+        # Assert
+        self.assertEqual(set(self.service.aggregate_cache), {('stats', 'default', 'Germany')})
+
+    def test_watcher_reloads_when_file_changes(self):
+        """Test: İzleyici dosyanın değiştiğini fark edip veriyi yeniden yüklemeli"""
+        # Arrange
+        self.service.start_watcher(interval=0.05)
+        changed = self.frame.copy()
+        changed.loc[1, 'YRuc'] = 18.0
+
+        # Act
+        self._write(changed)
+        deadline = time.time() + 10
+        while self.service.data_version == 1 and time.time() < deadline:
+            time.sleep(0.05)
+
+        # Assert
+        self.assertEqual(self.service.data_version, 2)
+        self.assertEqual(self.service.get_country_data('Germany')['stats']['last_value'], 18.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -22,6 +22,7 @@ import unittest
 from unittest.mock import MagicMock, patch, Mock, PropertyMock
 import sys
 import os
+import json
 import pandas as pd
 import numpy as np
 import tempfile
@@ -31,6 +32,7 @@ import shutil
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 from app.data_service import DataService
+from app.models.global_model import GlobalForecaster
 
 
 class TestDataService(unittest.TestCase):
@@ -288,6 +290,511 @@ class TestDataService(unittest.TestCase):
         self.assertIsInstance(overview['highest_countries'], list)
         self.assertIsInstance(overview['lowest_countries'], list)
     
+    def test_get_data_overview_is_materialized_once(self):
+        """
+        Test: get_data_overview() veri değişene kadar aynı sonucu bellekten döndürmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        first = service.get_data_overview()
+        second = service.get_data_overview()
+        
+        # Assert
+        self.assertIs(first, second)
+        self.assertIsNone(service._melted_data)  # Uzun format oluşturulmamalı
+        self.assertEqual(first['highest_countries'][0], {'country': 'Germany', 'value': 19.2})
+        self.assertEqual(first['lowest_countries'][0], {'country': 'Turkey', 'value': 13.5})
+    
+    def test_get_data_overview_json_matches_overview(self):
+        """
+        Test: get_data_overview_json() genel bakışın JSON'u olmalı ve veri değişince yenilenmeli.
+        """
+        # Arrange
+        import json
+        service = DataService(data_path=self.test_csv_path)
+        payload = service.get_data_overview_json()
+        
+        # Act
+        frame = service.melted_data.copy()
+        frame.loc[frame['Country Name'] == 'Turkey', 'Renewable_Value'] = 99.0
+        service.melted_data = frame
+        
+        # Assert
+        self.assertEqual(json.loads(payload), json.loads(json.dumps(DataService(data_path=self.test_csv_path).get_data_overview())))
+        self.assertIsNot(service.get_data_overview_json(), payload)
+        self.assertEqual(service.get_data_overview()['highest_countries'][0]['country'], 'Turkey')
+    
+    def test_get_country_data_year_range(self):
+        """
+        Test: Yıl aralığı verilirse seri ve istatistikler yalnızca aralığı kapsamalı.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_country_data('Turkey', start_year=2, end_year=4)
+        
+        # Assert
+        self.assertEqual(result['stats']['years'], [2, 3, 4])
+        self.assertEqual(result['stats']['values'], [11.2, 12.0, 12.8])
+        self.assertEqual(result['stats']['min'], 11.2)
+        self.assertEqual(result['stats']['last_value'], 12.8)
+        self.assertEqual(list(result['time_series']), ['2.0', '3.0', '4.0'])
+        self.assertEqual(result['range'], {'from': 2, 'to': 4, 'step': 1})
+    
+    def test_get_country_data_empty_year_range(self):
+        """
+        Test: Boş yıl aralığı hata vermemeli; seri boş, istatistikler None dönmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        for start_year, end_year in ((8, 5), (100, None), (None, 0)):
+            # Act
+            result = service.get_country_data('Turkey', start_year=start_year, end_year=end_year)
+            
+            # Assert
+            self.assertEqual(result['time_series'], {})
+            self.assertEqual(result['stats']['years'], [])
+            self.assertIsNone(result['stats']['mean'])
+            self.assertIsNone(result['stats']['last_value'])
+            self.assertEqual(result['range'], {'from': start_year, 'to': end_year, 'step': 1})
+    
+    def test_get_country_data_step(self):
+        """
+        Test: step > 1 seriyi seyreltmeli, istatistikleri değiştirmemeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_country_data('Turkey', step=2)
+        
+        # Assert
+        self.assertEqual(result['stats']['years'], [1, 3, 5])
+        self.assertEqual(result['time_series'], {'1.0': 10.5, '3.0': 12.0, '5.0': 13.5})
+        self.assertEqual(result['stats']['min'], 10.5)
+        with self.assertRaises(ValueError):
+            service.get_country_data('Turkey', step=0)
+    
+    def test_get_countries_data_year_range(self):
+        """
+        Test: Toplu sorguda yıl aralığı ve adım ortak yıl eksenine uygulanmalı.
+        """
+        service = DataService(data_path=self.test_csv_path)
+        
+        result = service.get_countries_data(['TUR', 'DEU'], start_year=2, step=2)
+        
+        self.assertEqual(result['years'], [2, 4])
+        self.assertEqual(result['values'], [[11.2, 12.8], [16.1, 18.5]])
+    
+    def test_get_countries_data_columnar(self):
+        """
+        Test: get_countries_data() ortak yıl dizisi ve ülke başına değer dizisi döndürmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_countries_data(['TUR', 'Germany', 'Atlantis', 'Turkey'])
+        
+        # Assert
+        self.assertEqual(result['years'], [1, 2, 3, 4, 5])
+        self.assertEqual(result['countries'], ['Turkey', 'Germany'])
+        self.assertEqual(result['codes'], ['TUR', 'DEU'])
+        self.assertEqual(result['values'][0], [10.5, 11.2, 12.0, 12.8, 13.5])
+        self.assertEqual(result['values'][1], service.get_country_data('Germany')['stats']['values'])
+        self.assertEqual(result['missing'], ['Atlantis'])
+    
+    def test_get_countries_data_requires_known_country(self):
+        """
+        Test: Hiçbir ülke bulunamazsa veya liste boşsa ValueError fırlatmalı.
+        """
+        service = DataService(data_path=self.test_csv_path)
+        
+        with self.assertRaises(ValueError):
+            service.get_countries_data([])
+        with self.assertRaises(ValueError):
+            service.get_countries_data(['Atlantis'])
+    
+    def test_get_rankings_top_and_country_rank(self):
+        """
+        Test: get_rankings() yılın ilk k ülkesini ve istenen ülkenin sırasını döndürmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_rankings(year=1, k=2, direction='desc', country='TUR')
+        
+        # Assert
+        self.assertEqual(result['year'], 1)
+        self.assertEqual(result['total'], 5)
+        self.assertEqual([item['country'] for item in result['countries']], ['Germany', 'Spain'])
+        self.assertEqual(result['countries'][0]['value'], 15.2)
+        self.assertEqual(result['countries'][0]['country_code'], 'DEU')
+        self.assertEqual(result['country']['rank'], 5)
+        self.assertAlmostEqual(result['country']['percentile'], 20.0)
+    
+    def test_get_rankings_defaults_to_latest_year_ascending(self):
+        """
+        Test: Yıl verilmezse en son yıl kullanılmalı; 'asc' en düşükten başlamalı.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_rankings(k=1, direction='asc')
+        
+        # Assert
+        self.assertEqual(result['year'], 5)
+        self.assertEqual(result['countries'], [{
+            'rank': 5, 'country': 'Turkey', 'country_code': 'TUR', 'value': 13.5, 'percentile': 20.0
+        }])
+    
+    def test_get_rankings_invalid_arguments(self):
+        """
+        Test: Geçersiz yön veya yıl ValueError fırlatmalı.
+        """
+        service = DataService(data_path=self.test_csv_path)
+        
+        with self.assertRaises(ValueError):
+            service.get_rankings(direction='up')
+        with self.assertRaises(ValueError):
+            service.get_rankings(year=99)
+    
+    def test_get_trends_table(self):
+        """
+        Test: get_trends() tüm ülkelerin trend ölçülerini sütun biçiminde döndürmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_trends(window=5)
+        
+        # Assert
+        row = result['countries'].index('Turkey')
+        self.assertEqual(result['codes'][row], 'TUR')
+        self.assertEqual((result['first_year'], result['last_year']), (1, 5))
+        self.assertAlmostEqual(result['percent_change'][row], (13.5 - 10.5) / 10.5 * 100)
+        self.assertAlmostEqual(result['cagr'][row], ((13.5 / 10.5) ** 0.25 - 1) * 100)
+        self.assertAlmostEqual(result['slope'][row], np.polyfit([1, 2, 3, 4, 5], [10.5, 11.2, 12.0, 12.8, 13.5], 1)[0])
+        self.assertAlmostEqual(result['window_average'][row], 12.0)
+        # İlk ve son pencere için en az 10 değer gerekir
+        self.assertEqual(result['window_change'][row], 0.0)
+        self.assertIs(service.get_trends(window=5), result)
+    
+    def test_get_trends_invalid_window(self):
+        """
+        Test: Geçersiz pencere ValueError fırlatmalı.
+        """
+        service = DataService(data_path=self.test_csv_path)
+        
+        with self.assertRaises(ValueError):
+            service.get_trends(window=0)
+    
+    def test_country_lookup_accepts_codes_and_aliases(self):
+        """
+        Test: Ülke kodu, küçük harfli ad ve Türkçe takma ad kanonik ülkeye çözülmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act & Assert
+        self.assertIn('türkiye', service.countries)
+        self.assertNotIn('Atlantis', service.countries)
+        self.assertEqual(service.get_country_data('almanya')['country'], 'Germany')
+        self.assertEqual(service.get_country_data('fra')['country'], 'France')
+        self.assertEqual([item['country'] for item in service.suggest_countries('i')], ['Italy', 'Spain'])
+    
+    def test_batch_lookups_accept_aliases_and_lowercase(self):
+        """
+        Test: Toplu veri, grup özeti ve toplu tahmin takma adları ve küçük harfli adları çözmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        service.define_group('portfoy', ['türkiye', 'germany'])
+        
+        # Act
+        batch = service.get_countries_data(['türkiye', 'Almanya', 'turkey', 'Atlantis'])
+        group = service.get_group_data('portfoy')
+        forecast = service.forecast_all_countries(6, ['turkey', 'Almanya'])
+        
+        # Assert
+        self.assertEqual(batch['countries'], ['Turkey', 'Germany'])
+        self.assertEqual(batch['missing'], ['Atlantis'])
+        self.assertEqual(group['countries'], ['Turkey', 'Germany'])
+        self.assertEqual(group['missing'], [])
+        self.assertEqual(forecast['countries'], ['Turkey', 'Germany'])
+    
+    def test_train_all_models_in_process_pool(self):
+        """
+        Test: train_all_models() ülke modellerini worker süreçlerinde eğitip servise kaydetmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        progress = []
+        
+        # Act
+        result = service.train_all_models(['TUR', 'Germany', 'Atlantis'], workers=2,
+                                          progress=lambda done, total, country, error: progress.append(done))
+        
+        # Assert
+        self.assertEqual((result['trained'], result['failed'], result['total']), (2, 1, 3))
+        self.assertIn('Atlantis', result['failures'])
+        self.assertEqual(sorted(progress), [1, 2])
+        self.assertIn(service._model_key('Turkey', None), service.models)
+        self.assertEqual(sum(result['model_types'].values()), 2)
+        self.assertTrue(hasattr(service.models[service._model_key('Germany', None)], 'predict'))
+    
+    def test_model_registry_skips_retraining(self):
+        """
+        Test: Kayıttaki model başka bir servis örneğinde yeniden eğitilmeden yüklenmeli.
+        """
+        # Arrange
+        DataService(data_path=self.test_csv_path, model_registry=True).train_model('Turkey')
+        service = DataService(data_path=self.test_csv_path, model_registry=True)
+        
+        # Act
+        with patch('app.data_service.fit_country_model') as mock_fit:
+            result = service.train_model('TUR')
+            summary = service.train_all_models(['Turkey'], workers=1, timeout=None)
+        
+        # Assert
+        mock_fit.assert_not_called()
+        self.assertTrue(result['success'])
+        self.assertTrue(result['from_registry'])
+        self.assertIn('Turkey', service.models)
+        self.assertEqual((summary['trained'], summary['loaded']), (0, 1))
+        self.assertTrue(os.path.isdir(os.path.join(self.test_dir, '.models', 'Turkey')))
+    
+    def test_general_model_registry_skips_retraining(self):
+        """
+        Test: Aynı küple eğitilmiş genel model başka bir servis örneğinde kayıttan yüklenmeli.
+        """
+        # Arrange
+        DataService(data_path=self.test_csv_path, model_registry=True).train_model()
+        service = DataService(data_path=self.test_csv_path, model_registry=True)
+        
+        # Act
+        with patch('app.data_service.fit_global_model') as mock_fit:
+            result = service.train_model()
+            forecast = service.forecast_all_countries(7)
+        
+        # Assert
+        mock_fit.assert_not_called()
+        self.assertTrue(result['from_registry'])
+        self.assertIsInstance(service.models['general'], GlobalForecaster)
+        self.assertEqual(len(forecast['predictions']), 5)
+        self.assertTrue(os.path.isdir(os.path.join(self.test_dir, '.models', 'general')))
+    
+    def test_ensure_model_trains_once_per_data_version(self):
+        """
+        Test: ensure_model() güncel modeli yeniden eğitmemeli, bayat modeli yeniden eğitmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        first = service.ensure_model('TUR')
+        with patch.object(service, 'train_model', wraps=service.train_model) as mock_train:
+            second = service.ensure_model('Turkey')
+            service.predict_future('Turkey', 7)
+            not_retrained = mock_train.call_count
+            service._model_stamps['Turkey'] = 'eski-veri'
+            stale = service.ensure_model('Turkey')
+        
+        # Assert
+        self.assertTrue(first['success'])
+        self.assertTrue(first['trained'])
+        self.assertEqual(second, {'success': True, 'country': 'Turkey', 'trained': False})
+        self.assertEqual(not_retrained, 0)
+        self.assertTrue(stale['trained'])
+        self.assertEqual(mock_train.call_count, 1)
+    
+    def test_ensure_model_single_flight(self):
+        """
+        Test: Aynı model için eşzamanlı ensure_model() çağrıları tek bir eğitimi beklemeli.
+        """
+        # Arrange
+        import threading
+        service = DataService(data_path=self.test_csv_path)
+        start = threading.Barrier(4)
+        results = []
+        
+        def call():
+            start.wait()
+            results.append(service.ensure_model('Turkey'))
+        
+        # Act
+        with patch.object(service, 'train_model', wraps=service.train_model) as mock_train:
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        # Assert
+        self.assertEqual(mock_train.call_count, 1)
+        self.assertEqual(len(results), 4)
+        self.assertEqual(sum(1 for result in results if result['trained']), 1)
+        self.assertTrue(all(result['success'] for result in results))
+    
+    def test_forecast_all_countries_uses_general_model(self):
+        """
+        Test: forecast_all_countries() ülke modeli eğitmeden tek genel modelle tahmin yapmalı.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        with patch('app.data_service.fit_country_model') as mock_fit:
+            result = service.forecast_all_countries(7)
+            subset = service.forecast_all_countries(6, ['TUR', 'Atlantis', 'Turkey'])
+        
+        # Assert
+        mock_fit.assert_not_called()
+        self.assertEqual(list(service.models), ['general'])
+        self.assertEqual(result['base_year'], 5)
+        self.assertEqual(result['countries'], ['France', 'Germany', 'Italy', 'Spain', 'Turkey'])
+        self.assertTrue(all(isinstance(value, float) for value in result['predictions']))
+        self.assertEqual(subset['countries'], ['Turkey'])
+        self.assertEqual(subset['missing'], ['Atlantis'])
+        with self.assertRaises(ValueError):
+            service.forecast_all_countries(5)
+    
+    def test_query_countries_filters_sorts_and_paginates(self):
+        """
+        Test: query_countries() koşulları sağlayan ülkeleri sıralı ve sayfalı döndürmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.query_countries('value>14, trend>0', sort='value', direction='asc', limit=2)
+        second_page = service.query_countries('value>14, trend>0', sort='value', direction='asc',
+                                              offset=2, limit=2)
+        
+        # Assert
+        self.assertEqual(result['year'], 5)
+        self.assertEqual(result['total'], 4)
+        self.assertEqual([item['country'] for item in result['countries']], ['Italy', 'France'])
+        self.assertEqual([item['country'] for item in second_page['countries']], ['Spain', 'Germany'])
+        self.assertEqual(second_page['countries'][1]['rank'], 1)
+        self.assertEqual(second_page['countries'][1]['count'], 5)
+        self.assertEqual(second_page['countries'][1]['country_code'], 'DEU')
+    
+    def test_query_countries_by_year_and_rank(self):
+        """
+        Test: value/rank alanları seçilen yıla göre değerlendirilmeli.
+        """
+        service = DataService(data_path=self.test_csv_path)
+        
+        result = service.query_countries('rank<=2', year=1)
+        
+        self.assertEqual(result['year'], 1)
+        self.assertEqual([item['country'] for item in result['countries']], ['Germany', 'Spain'])
+        with self.assertRaises(ValueError):
+            service.query_countries('value>>1')
+        with self.assertRaises(ValueError):
+            service.query_countries(limit=0)
+    
+    def test_get_similar_countries(self):
+        """
+        Test: get_similar_countries() ülkenin kendisi hariç en benzer k ülkeyi döndürmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        result = service.get_similar_countries('TUR', k=2, metric='pearson_diff')
+        
+        # Assert
+        self.assertEqual(result['country'], 'Turkey')
+        self.assertEqual(result['metric'], 'pearson_diff')
+        self.assertEqual(len(result['countries']), 2)
+        self.assertNotIn('Turkey', [item['country'] for item in result['countries']])
+        self.assertEqual(result['countries'][0]['overlap'], 5)
+        scores = [item['score'] for item in result['countries']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        with self.assertRaises(ValueError):
+            service.get_similar_countries('TUR', metric='cosine')
+    
+    def test_define_and_get_group_data(self):
+        """
+        Test: Tanımlanan grup dosyaya kaydedilmeli ve yıl başına özetleri döndürülmeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        service.define_group('portfoy', ['TUR', 'Germany'], weights={'TUR': 3})
+        
+        # Act
+        result = service.get_group_data('portfoy')
+        
+        # Assert
+        self.assertTrue(os.path.exists(service.group_overrides_path))
+        self.assertFalse(os.path.exists(service.groups_path))
+        self.assertEqual(result['countries'], ['Turkey', 'Germany'])
+        self.assertEqual(result['missing'], [])
+        self.assertEqual(result['years'], [1, 2, 3, 4, 5])
+        self.assertAlmostEqual(result['mean'][0], (10.5 + 15.2) / 2)
+        self.assertAlmostEqual(result['weighted_mean'][0], (3 * 10.5 + 15.2) / 4)
+        self.assertEqual(result['count'], [2] * 5)
+        self.assertIs(service.get_group_data('portfoy'), result)
+        
+        # Yeni bir servis tanımı dosyadan okumalı; yeniden tanımlama önbelleği kullanmamalı
+        other = DataService(data_path=self.test_csv_path)
+        self.assertEqual(other.get_groups()[0]['countries'], ['TUR', 'Germany'])
+        service.define_group('portfoy', ['FRA'])
+        self.assertEqual(service.get_group_data('portfoy')['countries'], ['France'])
+    
+    def test_define_group_rejects_unknown_countries(self):
+        """
+        Test: Veri setinde bulunmayan üyeler içeren grup kaydedilmemeli.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            service.define_group('portfoy', ['TUR', 'XXX'])
+        self.assertFalse(os.path.exists(service.group_overrides_path))
+        self.assertEqual(service.get_groups(), [])
+    
+    def test_define_group_keeps_default_groups_file(self):
+        """
+        Test: Varsayılan grup dosyası değiştirilmemeli; aynı adlı grupta kaydedilen tanım geçerli olmalı.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        with open(service.groups_path, 'w', encoding='utf-8') as f:
+            json.dump({'EU': {'countries': ['DEU', 'FRA']}, 'G2': {'countries': ['TUR', 'ITA']}}, f)
+        with open(service.groups_path, 'r', encoding='utf-8') as f:
+            defaults = f.read()
+        
+        # Act
+        service.define_group('EU', ['DEU', 'FRA', 'ITA'])
+        
+        # Assert
+        with open(service.groups_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), defaults)
+        other = DataService(data_path=self.test_csv_path)
+        groups = {group['name']: group['countries'] for group in other.get_groups()}
+        self.assertEqual(groups, {'EU': ['DEU', 'FRA', 'ITA'], 'G2': ['TUR', 'ITA']})
+        self.assertEqual(other.get_group_data('EU')['countries'], ['Germany', 'France', 'Italy'])
+    
+    def test_get_group_data_unknown_group(self):
+        """
+        Test: Tanımlı olmayan grup ValueError fırlatmalı.
+        """
+        service = DataService(data_path=self.test_csv_path)
+        
+        with self.assertRaises(ValueError):
+            service.get_group_data('yok')
+    
     def test_get_data_overview_empty_data(self):
         """
         Test: Boş veri ile get_data_overview() uygun yapı döndürmeli.
@@ -388,6 +895,26 @@ class TestDataService(unittest.TestCase):
         self.assertIsInstance(metrics, dict)
         # Model otomatik eğitilmeli veya hata döndürmeli
     
+    def test_model_lookups_accept_codes_and_aliases(self):
+        """
+        Test: get_model_metrics() ve get_feature_importance() kod ve takma adla aynı modeli kullanmalı.
+        """
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+        
+        # Act
+        by_code = service.get_model_metrics('TUR')
+        by_alias = service.get_model_metrics('türkiye')
+        importance = service.get_feature_importance('tur')
+        
+        # Assert
+        self.assertTrue(by_code['success'])
+        self.assertEqual(by_code['country'], 'Turkey')
+        self.assertEqual(by_alias['metrics'], by_code['metrics'])
+        self.assertEqual(list(service.models), ['Turkey'])
+        # Varsayılan (model dışı) önemler yerine eğitilen modelin önemleri dönmeli
+        self.assertEqual(importance['features'], ['Yıl', 'Önceki Değer', 'Ortalama', 'Trend'])
+    
     def test_predict_future_valid_inputs(self):
         """
         Test: Geçerli girdiler ile predict_future() tahmin döndürmeli.
@@ -411,6 +938,7 @@ class TestDataService(unittest.TestCase):
         # Değerlerin mantıklı olduğunu kontrol et
         self.assertGreater(prediction['future_year'], prediction['current_year'])
         self.assertIsInstance(prediction['predicted_value'], (int, float))
+        self.assertIsNone(service._melted_data)  # Uzun format oluşturulmamalı
     
     def test_predict_future_invalid_country(self):
         """
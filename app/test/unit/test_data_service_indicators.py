@@ -0,0 +1,131 @@
+"""
+Çok Göstergeli Veri Unit Testleri
+
+Birden fazla gösterge (Series Code) içeren dosyaların gösterge başına
+ayrı küplere yüklenmesi ve gösterge parametreli sorgular test edilir.
+"""
+
+import unittest
+import sys
+import os
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.data_service import DataService, PREFERRED_INDICATOR
+
+
+class TestDataServiceIndicators(unittest.TestCase):
+    """
+    DataService çok göstergeli veri testleri.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_csv_path = os.path.join(self.test_dir, 'test_data.csv')
+        pd.DataFrame({
+            'Series Name': ['Access to electricity'] * 2 + ['Renewable share'] * 2,
+            'Series Code': ['EG.ELC.ACCS.ZS'] * 2 + [PREFERRED_INDICATOR] * 2,
+            'Country Name': ['Turkey', 'Germany', 'Turkey', 'Germany'],
+            'Country Code': ['TUR', 'DEU', 'TUR', 'DEU'],
+            'YRbir': [90.0, 99.0, 10.5, np.nan],
+            'YRiki': [np.nan, 100.0, 11.2, np.nan],
+            'YRuc': [np.nan, 100.0, 12.0, np.nan]
+        }).to_csv(self.test_csv_path, index=False)
+
+    def tearDown(self):
+        """Test cleanup"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_each_indicator_gets_its_own_store(self):
+        """Test: Her gösterge ayrı bir küpe yüklenmeli, varsayılan yenilenebilir enerji payı olmalı"""
+        # Act
+        service = DataService(data_path=self.test_csv_path)
+
+        # Assert
+        self.assertEqual(list(service.stores), ['EG.ELC.ACCS.ZS', PREFERRED_INDICATOR])
+        self.assertEqual(service.default_indicator, PREFERRED_INDICATOR)
+        codes = [item['code'] for item in service.get_indicators()]
+        self.assertEqual(codes, ['EG.ELC.ACCS.ZS', PREFERRED_INDICATOR])
+
+    def test_get_country_data_with_indicator(self):
+        """Test: Gösterge parametresi doğru serinin değerlerini döndürmeli"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        default = service.get_country_data('Turkey')
+        access = service.get_country_data('Turkey', indicator='EG.ELC.ACCS.ZS')
+
+        # Assert
+        self.assertEqual(default['stats']['values'], [10.5, 11.2, 12.0])
+        self.assertEqual(access['stats']['values'], [90.0, 90.0, 90.0])
+        self.assertEqual(access['indicator'], 'EG.ELC.ACCS.ZS')
+
+    def test_indicators_are_not_mixed_during_imputation(self):
+        """Test: Eksik değerler yalnızca aynı göstergenin verisiyle doldurulmalı"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        germany = service.get_country_data('Germany')
+
+        # Assert - Germany'nin hiç değeri yok; yalnızca aynı göstergenin sütun ortalamaları kullanılır
+        self.assertEqual(germany['stats']['values'], [10.5, 11.2, 12.0])
+
+    def test_lookup_by_country_code(self):
+        """Test: Ülke kodu ile sorgu ülke adı ile aynı sonucu vermeli"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        by_code = service.get_country_data('TUR', indicator='EG.ELC.ACCS.ZS')
+
+        # Assert
+        self.assertEqual(by_code['country'], 'Turkey')
+
+    def test_unknown_indicator_raises(self):
+        """Test: Olmayan gösterge ValueError fırlatmalı"""
+        service = DataService(data_path=self.test_csv_path)
+
+        with self.assertRaises(ValueError):
+            service.get_country_data('Turkey', indicator='NOPE')
+
+    def test_train_model_with_indicator_uses_separate_key(self):
+        """Test: Gösterge modeli varsayılan göstergenin modelinden ayrı saklanmalı"""
+        # Arrange
+        service = DataService(data_path=self.test_csv_path)
+
+        # Act
+        result = service.train_model('Turkey', indicator='EG.ELC.ACCS.ZS')
+
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertIn('EG.ELC.ACCS.ZS:Turkey', service.models)
+        self.assertNotIn('Turkey', service.models)
+
+    def test_snapshot_round_trip_keeps_indicators(self):
+        """Test: Anlık görüntüden yüklenen servis tüm göstergeleri içermeli"""
+        # Arrange
+        DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Act
+        warm = DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Assert
+        self.assertEqual(list(warm.stores), ['EG.ELC.ACCS.ZS', PREFERRED_INDICATOR])
+        self.assertEqual(warm.default_indicator, PREFERRED_INDICATOR)
+        self.assertEqual(
+            warm.get_country_data('Germany', indicator='EG.ELC.ACCS.ZS')['stats']['values'],
+            [99.0, 100.0, 100.0]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
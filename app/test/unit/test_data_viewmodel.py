@@ -506,6 +506,46 @@ class TestDataViewModel(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertIn("error", result)
     
+    def test_get_countries_data(self):
+        """get_countries_data servis sonucunu başarı yanıtına sarmalı"""
+        # Mock veri hazırla
+        self.data_service_mock.get_countries_data.return_value = {
+            "years": [1, 2], "countries": ["Turkey"], "codes": ["TUR"], "values": [[10.5, None]], "missing": []
+        }
+        
+        # Metodu çağır
+        result = self.viewmodel.get_countries_data(["TUR"])
+        
+        # Sonucu kontrol et
+        self.assertTrue(result["success"])
+        self.assertEqual(result["values"], [[10.5, None]])
+        self.data_service_mock.get_countries_data.assert_called_once_with(["TUR"], indicator=None)
+    
+    def test_get_data_overview_json_reuses_bytes(self):
+        """get_data_overview_json aynı veri sürümü için aynı baytları döndürmeli"""
+        # Mock veri hazırla
+        self.data_service_mock.get_data_overview_json.return_value = b'{"global_trend":5.6}'
+        
+        # Metodu çağır
+        first = self.viewmodel.get_data_overview_json()
+        second = self.viewmodel.get_data_overview_json()
+        
+        # Sonucu kontrol et
+        self.assertEqual(json.loads(first), {"success": True, "overview": {"global_trend": 5.6}})
+        self.assertIs(first, second)
+    
+    def test_get_data_overview_json_error(self):
+        """get_data_overview_json hata durumunda başarısız yanıtı JSON olarak döndürmeli"""
+        # Mock hata oluştur
+        self.data_service_mock.get_data_overview_json.side_effect = Exception("Overview error")
+        
+        # Metodu çağır
+        result = json.loads(self.viewmodel.get_data_overview_json())
+        
+        # Sonucu kontrol et
+        self.assertFalse(result["success"])
+        self.assertIn("error", result)
+    
     def test_get_country_data_chart_data_structure(self):
         """get_country_data metodu chart_data yapısını doğru oluşturmalı"""
         # Mock veri hazırla
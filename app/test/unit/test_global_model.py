@@ -0,0 +1,109 @@
+"""
+Global Model Unit Testleri
+
+Ülke × yıl matrisinden gecikme özelliklerinin oluşturulması, ortak modelin
+eğitimi ve tüm ülkeler için adım adım toplu tahmin test edilir.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from sklearn.linear_model import LinearRegression
+
+from app.models.global_model import GlobalForecaster, feature_names, fit_global_model
+
+
+class TestGlobalModel(unittest.TestCase):
+    """
+    global_model modülü için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup: her ülke kendi sabit adımıyla doğrusal artar"""
+        self.years = np.arange(1, 11)
+        self.countries = ['A', 'B', 'C', 'D']
+        steps = np.array([1.0, 2.0, -0.5, 0.0])
+        self.values = 10.0 + steps[:, None] * np.arange(10)[None, :]
+
+    def test_samples_use_lagged_values(self):
+        """Test: Her örnek önceki yılların değerlerini ve hareketli istatistiklerini içermeli"""
+        # Arrange
+        model = GlobalForecaster(LinearRegression(), lags=3)
+        model.encode(self.values, self.countries)
+        values = self.values.copy()
+        values[1, 5] = np.nan
+
+        # Act
+        X, y = model.samples(values, self.years, self.countries)
+
+        # Assert
+        self.assertEqual(list(X.columns), feature_names(3))
+        # B ülkesinde eksik hücre hem hedef hem de üç örneğin gecikmesi olduğu için 4 örnek düşer
+        self.assertEqual(len(X), 4 * 7 - 4)
+        first = X.iloc[0]
+        self.assertEqual(first['Year'], 4)
+        self.assertEqual([first['Lag_1'], first['Lag_2'], first['Lag_3']], [12.0, 11.0, 10.0])
+        self.assertAlmostEqual(first['Rolling_Mean'], 11.0)
+        self.assertAlmostEqual(first['Rolling_Std'], 1.0)
+        self.assertEqual(first['Country_Code'], 0)
+        self.assertAlmostEqual(first['Country_Mean'], 14.5)
+        self.assertEqual(y.iloc[0], 13.0)
+
+    def test_forecast_all_countries_at_once(self):
+        """Test: Tüm ülkelerin sonraki yılları tek modelle ve yıl başına tek predict ile tahmin edilmeli"""
+        # Arrange
+        model = GlobalForecaster(LinearRegression(), lags=3)
+        model.encode(self.values, self.countries)
+        model.fit(*model.samples(self.values, self.years, self.countries))
+        calls = []
+        predict = model.regressor.predict
+        model.regressor.predict = lambda X: calls.append(len(X)) or predict(X)
+
+        # Act
+        forecasts = model.forecast(self.values, self.years, self.countries, 13)
+
+        # Assert
+        self.assertEqual(forecasts.shape, (4, 3))
+        np.testing.assert_allclose(forecasts[:, -1], [22.0, 34.0, 4.0, 10.0], atol=1e-6)
+        self.assertEqual(calls, [4, 4, 4])
+        with self.assertRaises(ValueError):
+            model.forecast(self.values, self.years, self.countries, 10)
+
+    def test_fit_global_model(self):
+        """Test: fit_global_model() tek model, metrikler ve özellik önemleri döndürmeli"""
+        # Act
+        model, result = fit_global_model(self.values, self.years, self.countries)
+
+        # Assert
+        self.assertTrue(result['success'])
+        self.assertEqual(result['country'], 'general')
+        self.assertEqual(result['countries'], 4)
+        self.assertEqual(set(result['metrics']['feature_importance']), set(feature_names()))
+        self.assertIn('test_rmse', result['metrics'])
+        restored = pickle.loads(pickle.dumps(model))
+        np.testing.assert_allclose(
+            restored.forecast(self.values, self.years, self.countries, 11),
+            model.forecast(self.values, self.years, self.countries, 11)
+        )
+        with self.assertRaises(ValueError):
+            fit_global_model(self.values[:, :3], self.years[:3], self.countries)
+
+    def test_encoding_uses_training_years_only(self):
+        """Test: Ülke ortalaması (Country_Mean) test için ayrılan son yılları içermemeli"""
+        # Act
+        model, _ = fit_global_model(self.values, self.years, self.countries)
+
+        # Assert
+        # 7 hedef yılın sonuncusu test yılıdır; A ülkesinin ilk 9 yılının ortalaması 14.0
+        self.assertEqual(model.country_means['A'], 14.0)
+        self.assertEqual(model.country_means['D'], 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""
+Gecikmeli İçe Aktarma Unit Testleri
+
+Veri servislerinin içe aktarılmasının ağır ML ve çizim bağımlılıklarını
+yüklemediği, bunların ilk model eğitiminde yüklendiği test edilir.
+"""
+
+import unittest
+import subprocess
+import sys
+import os
+
+# Projenin kök dizini
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..'))
+
+HEAVY_PACKAGES = ['sklearn', 'xgboost', 'matplotlib', 'seaborn', 'joblib']
+
+
+def _loaded_packages(code: str) -> list:
+    """Kodu temiz bir süreçte çalıştırır ve yüklenen ağır paketleri döndürür."""
+    check = f"{code}\nimport sys\nprint('loaded:' + ','.join(p for p in {HEAVY_PACKAGES!r} if p in sys.modules))"
+    output = subprocess.check_output([sys.executable, '-c', check], cwd=ROOT, stderr=subprocess.DEVNULL)
+    line = [line for line in output.decode().splitlines() if line.startswith('loaded:')][-1]
+    return [name for name in line[len('loaded:'):].split(',') if name]
+
+
+class TestLazyImports(unittest.TestCase):
+    """
+    Ağır bağımlılıkların gecikmeli yüklenmesi testleri.
+    """
+
+    def test_service_modules_do_not_import_heavy_packages(self):
+        """Test: Veri servisi ve ViewModel içe aktarılınca sklearn/xgboost/matplotlib yüklenmemeli"""
+        loaded = _loaded_packages("import app.data_service, app.data_viewmodel, app.routes.api")
+
+        self.assertEqual(loaded, [])
+
+    def test_country_queries_do_not_import_heavy_packages(self):
+        """Test: Ülke listesi ve ülke verisi sorguları ağır paketleri yüklememeli"""
+        loaded = _loaded_packages(
+            "import logging; logging.disable(logging.CRITICAL)\n"
+            "from app.data_service import DataService\n"
+            "service = DataService()\n"
+            "service.get_country_data(service.get_countries()[0])"
+        )
+
+        self.assertEqual(loaded, [])
+
+    def test_training_imports_sklearn(self):
+        """Test: İlk model eğitimi scikit-learn'ü yüklemeli"""
+        loaded = _loaded_packages(
+            "import logging; logging.disable(logging.CRITICAL)\n"
+            "from app.data_service import DataService\n"
+            "service = DataService()\n"
+            "service.train_model(service.get_countries()[0])"
+        )
+
+        self.assertIn('sklearn', loaded)
+
+
+if __name__ == '__main__':
+    unittest.main()
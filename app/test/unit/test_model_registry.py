@@ -0,0 +1,87 @@
+"""
+Model Registry Unit Testleri
+
+Modellerin ülke, model türü, hiperparametreler ve veri özeti ile
+anahtarlanarak diske atomik yazılması ve geri yüklenmesi test edilir.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.models.country_model import TrendPredictor
+from app.utils.model_registry import ModelRegistry, dataset_hash, registry_dir
+
+
+class TestModelRegistry(unittest.TestCase):
+    """
+    ModelRegistry için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.registry = ModelRegistry(os.path.join(self.test_dir, '.models'))
+        self.params = {'n_estimators': 50, 'random_state': 42, 'version': 1}
+        self.data_hash = dataset_hash([2000, 2001, 2002], [10.0, np.nan, 12.0])
+
+    def tearDown(self):
+        """Test cleanup"""
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_put_and_get_round_trip(self):
+        """Test: Kaydedilen model ve eğitim sonucu aynı anahtarla geri yüklenmeli"""
+        # Arrange
+        model = TrendPredictor(10.0, 0.1, 2000)
+
+        # Act
+        path = self.registry.put("Cote d'Ivoire", 'RandomForest', self.params, self.data_hash,
+                                 model, {'metrics': {'r2_score': 0.5}})
+        entry = ModelRegistry(self.registry.root).get("Cote d'Ivoire", 'RandomForest', self.params, self.data_hash)
+
+        # Assert
+        self.assertTrue(path.startswith(self.registry.root))
+        self.assertEqual(entry['result'], {'metrics': {'r2_score': 0.5}})
+        self.assertEqual(entry['meta']['data_hash'], self.data_hash)
+        np.testing.assert_allclose(entry['model'].predict(np.array([[2001]])), [11.0])
+        self.assertEqual([name for name in os.listdir(os.path.dirname(path)) if name.endswith('.tmp')], [])
+
+    def test_key_includes_params_and_data(self):
+        """Test: Hiperparametre veya veri değişince eski kayıt kullanılmamalı"""
+        self.registry.put('Turkey', 'RandomForest', self.params, self.data_hash, TrendPredictor(1.0, 0.0, 2000))
+
+        self.assertIsNotNone(self.registry.get('Turkey', 'RandomForest', self.params, self.data_hash))
+        self.assertIsNone(self.registry.get('Turkey', 'RandomForest', {**self.params, 'version': 2}, self.data_hash))
+        self.assertIsNone(self.registry.get('Turkey', 'XGBoost', self.params, self.data_hash))
+        self.assertIsNone(self.registry.get('Turkey', 'RandomForest', self.params,
+                                            dataset_hash([2000, 2001, 2002], [10.0, 11.0, 12.0])))
+
+    def test_unreadable_entry_is_ignored(self):
+        """Test: Bozuk kayıt dosyası hata fırlatmamalı, model yok sayılmalı"""
+        path = self.registry.path('Turkey', 'RandomForest', self.params, self.data_hash)
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'wb') as f:
+            f.write(b'bozuk')
+
+        self.assertIsNone(self.registry.get('Turkey', 'RandomForest', self.params, self.data_hash))
+
+    def test_registry_dir(self):
+        """Test: Kayıt dizini CSV'nin yanında olmalı, ortam değişkeni ile değiştirilebilmeli"""
+        csv_path = os.path.join(self.test_dir, 'data.csv')
+        self.assertEqual(registry_dir(csv_path), os.path.join(self.test_dir, '.models'))
+
+        os.environ['RENEWABLE_MODEL_DIR'] = self.test_dir
+        try:
+            self.assertEqual(registry_dir(csv_path), self.test_dir)
+        finally:
+            del os.environ['RENEWABLE_MODEL_DIR']
+
+
+if __name__ == '__main__':
+    unittest.main()
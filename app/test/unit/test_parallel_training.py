@@ -0,0 +1,104 @@
+"""
+Parallel Training Unit Testleri
+
+Görevlerin süreç havuzunda çalıştırılması, hata ve zaman aşımı özetleri,
+ilerleme bildirimi ve eğitilen modellerin pickle edilebilirliği test edilir.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import time
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.models.country_model import TrendPredictor
+from app.utils.parallel_training import default_workers, run_parallel
+
+
+def _square(value):
+    """Worker'da çalışan test görevi"""
+    if value < 0:
+        raise ValueError("negatif değer")
+    return value * value
+
+
+def _sleep(seconds):
+    """Süre sınırını aşan test görevi"""
+    time.sleep(seconds)
+    return os.getpid()
+
+
+class TestParallelTraining(unittest.TestCase):
+    """
+    parallel_training modülü için unit testler.
+    """
+
+    def test_results_and_failures(self):
+        """Test: Başarılı görevlerin sonuçları, başarısızların hata mesajları döndürülmeli"""
+        # Arrange
+        tasks = {'a': (2,), 'b': (-1,), 'c': (3,)}
+        progress = []
+
+        # Act
+        results, failures = run_parallel(_square, tasks, workers=2, timeout=30,
+                                         progress=lambda done, total, key, error: progress.append((done, total)))
+
+        # Assert
+        self.assertEqual(results, {'a': 4, 'c': 9})
+        self.assertEqual(failures, {'b': 'negatif değer'})
+        self.assertEqual(sorted(progress), [(1, 3), (2, 3), (3, 3)])
+
+    def test_timeout_does_not_block_other_tasks(self):
+        """Test: Süresi dolan görev başarısız sayılmalı, kalan görevler yeni worker'larda çalışmalı"""
+        # Act
+        started = time.monotonic()
+        results, failures = run_parallel(_sleep, {'slow': (30,), 'fast': (0,), 'next': (0,)},
+                                         workers=2, timeout=1)
+
+        # Assert
+        self.assertLess(time.monotonic() - started, 15)
+        self.assertEqual(set(results), {'fast', 'next'})
+        self.assertIn('Zaman aşımı', failures['slow'])
+
+    def test_single_worker_runs_in_process(self):
+        """Test: Tek worker ve süre sınırı yoksa görevler bu süreçte çalıştırılmalı"""
+        results, failures = run_parallel(_sleep, {'a': (0,)}, workers=1, timeout=None)
+
+        self.assertEqual(results, {'a': os.getpid()})
+        self.assertEqual(failures, {})
+        self.assertEqual(run_parallel(_square, {}), ({}, {}))
+
+    def test_workers_capped_by_default_workers(self):
+        """Test: İstenen worker sayısı default_workers() değerini aşmamalı"""
+        os.environ['RENEWABLE_TRAIN_WORKERS'] = '1'
+        try:
+            # Tek worker'a indirilen istek havuz kurulmadan bu süreçte çalışır
+            results, failures = run_parallel(_sleep, {'a': (0,), 'b': (0,)}, workers=64, timeout=None)
+        finally:
+            del os.environ['RENEWABLE_TRAIN_WORKERS']
+
+        self.assertEqual(results, {'a': os.getpid(), 'b': os.getpid()})
+        self.assertEqual(failures, {})
+
+    def test_default_workers_from_environment(self):
+        """Test: Worker sayısı ortam değişkeninden okunmalı"""
+        os.environ['RENEWABLE_TRAIN_WORKERS'] = '3'
+        try:
+            self.assertEqual(default_workers(), 3)
+        finally:
+            del os.environ['RENEWABLE_TRAIN_WORKERS']
+        self.assertGreaterEqual(default_workers(), 1)
+
+    def test_trend_predictor_is_picklable(self):
+        """Test: Yedek trend modeli worker'dan ana sürece pickle ile taşınabilmeli"""
+        model = pickle.loads(pickle.dumps(TrendPredictor(10.0, 0.1, 2000)))
+
+        np.testing.assert_allclose(model.predict(np.array([[2000], [2002]])), [10.0, 12.1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+Servis Kapsayıcısı Unit Testleri
+
+Paylaşılan servis örneklerinin süreç başına bir kez oluşturulması test edilir.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app import service_container
+
+
+class TestServiceContainer(unittest.TestCase):
+    """
+    service_container modülü için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        service_container.reset()
+
+    def tearDown(self):
+        """Test cleanup"""
+        service_container.reset()
+
+    def test_resolve_returns_same_instance(self):
+        """Test: Aynı ad için her çağrıda aynı örnek döndürülmeli"""
+        # Act
+        first = service_container.resolve('sample', object)
+        second = service_container.resolve('sample', object)
+
+        # Assert
+        self.assertIs(first, second)
+
+    def test_concurrent_resolve_calls_factory_once(self):
+        """Test: Eşzamanlı çağrılarda factory yalnızca bir kez çalışmalı"""
+        # Arrange
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def factory():
+            calls.append(1)
+            return object()
+
+        def worker():
+            barrier.wait()
+            results.append(service_container.resolve('sample', factory))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_failed_factory_is_not_cached(self):
+        """Test: Oluşturma hatası kaydedilmemeli, sonraki çağrı yeniden denemeli"""
+        # Arrange
+        def failing_factory():
+            raise RuntimeError("veri yok")
+
+        # Act & Assert
+        with self.assertRaises(RuntimeError):
+            service_container.resolve('sample', failing_factory)
+        self.assertEqual(service_container.resolve('sample', lambda: 'ok'), 'ok')
+
+    def test_reset_releases_instances(self):
+        """Test: reset() sonrası yeni örnek oluşturulmalı"""
+        # Arrange
+        first = service_container.resolve('sample', object)
+
+        # Act
+        service_container.reset()
+        second = service_container.resolve('sample', object)
+
+        # Assert
+        self.assertIsNot(first, second)
+
+    def test_viewmodel_uses_shared_data_service(self):
+        """Test: Paylaşılan ViewModel paylaşılan DataService'i kullanmalı"""
+        # Arrange
+        sentinel = object()
+        service_container.resolve('data_service', lambda: sentinel)
+
+        # Act
+        data_vm = service_container.get_data_viewmodel()
+
+        # Assert
+        self.assertIs(data_vm.data_service, sentinel)
+        self.assertIs(service_container.get_data_viewmodel(), data_vm)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Paylaşılan Veri Seti Unit Testleri
+
+Gösterge küplerinin bellek eşlemeli dosyalara yayınlanması, worker'ların
+bu dosyalara kopyalamadan salt okunur bağlanması ve DataService'in
+paylaşılan veri seti üzerinde aynı sonuçları üretmesi test edilir.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.data_service import DataService
+from app.utils import shared_dataset
+
+
+def _is_memory_mapped(array: np.ndarray) -> bool:
+    """Dizinin (veya tabanlarından birinin) bir np.memmap olup olmadığını döndürür."""
+    while array is not None:
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base if isinstance(array, np.ndarray) else None
+    return False
+
+
+class TestSharedDataset(unittest.TestCase):
+    """
+    shared_dataset modülü ve DataService(shared_dataset=True) testleri.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_csv_path = os.path.join(self.test_dir, 'test_data.csv')
+        pd.DataFrame({
+            'Country Name': ['Turkey', 'Germany', 'France'],
+            'Country Code': ['TUR', 'DEU', 'FRA'],
+            'YRbir': [10.5, 15.2, 20.1],
+            'YRiki': [11.2, 16.1, 21.3],
+            'YRuc': [12.0, 17.3, 22.4]
+        }).to_csv(self.test_csv_path, index=False)
+        self.service = DataService(data_path=self.test_csv_path)
+        self.directory = os.path.join(self.test_dir, 'dataset.shared')
+
+    def tearDown(self):
+        """Test cleanup"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_publish_attach_round_trip(self):
+        """Test: Bağlanılan küpler yayınlanan küplerle aynı olmalı"""
+        # Act
+        published = shared_dataset.publish(self.directory, self.service.stores)
+        stores = shared_dataset.attach(self.directory)
+
+        # Assert
+        self.assertTrue(published)
+        self.assertEqual(list(stores), list(self.service.stores))
+        for code, store in self.service.stores.items():
+            attached = stores[code]
+            np.testing.assert_array_equal(attached.values, store.values)
+            self.assertEqual(attached.countries, store.countries)
+            self.assertEqual(list(attached.years), list(store.years))
+            self.assertEqual(attached.year_labels, store.year_labels)
+
+    def test_attached_values_are_read_only_mappings(self):
+        """Test: Bağlanılan değer matrisi bellek eşlemeli ve salt okunur olmalı"""
+        # Arrange
+        shared_dataset.publish(self.directory, self.service.stores)
+
+        # Act
+        store = next(iter(shared_dataset.attach(self.directory).values()))
+
+        # Assert
+        self.assertTrue(_is_memory_mapped(store.values))
+        self.assertFalse(store.values.flags.writeable)
+        with self.assertRaises(ValueError):
+            store.values[0, 0] = 0.0
+
+    def test_second_publish_keeps_first(self):
+        """Test: Zaten yayınlanmış veri seti yeniden yazılmamalı"""
+        # Arrange
+        shared_dataset.publish(self.directory, self.service.stores)
+
+        # Act
+        published = shared_dataset.publish(self.directory, self.service.stores)
+
+        # Assert
+        self.assertFalse(published)
+        leftovers = [name for name in os.listdir(self.test_dir) if name.startswith('.tmp-shared-')]
+        self.assertEqual(leftovers, [])
+
+    def test_attach_missing_directory_returns_none(self):
+        """Test: Olmayan veri setine bağlanma None döndürmeli"""
+        self.assertIsNone(shared_dataset.attach(self.directory))
+
+    def test_service_uses_shared_dataset(self):
+        """Test: Paylaşılan veri setli servis aynı sonuçları üretmeli ve geniş çerçeve tutmamalı"""
+        # Act
+        shared = DataService(data_path=self.test_csv_path, shared_dataset=True)
+
+        # Assert
+        self.assertIsNone(shared.data)
+        self.assertTrue(_is_memory_mapped(shared.stores[shared.default_indicator].values))
+        self.assertEqual(shared.countries, self.service.countries)
+        self.assertEqual(shared.get_country_data('Germany'), self.service.get_country_data('Germany'))
+
+    def test_second_service_attaches_without_parsing_csv(self):
+        """Test: Yayınlanmış veri setine bağlanan servis CSV'yi okumamalı"""
+        # Arrange
+        DataService(data_path=self.test_csv_path, shared_dataset=True)
+
+        # Act
+        with patch('app.data_service.pd.read_csv') as read_csv:
+            worker = DataService(data_path=self.test_csv_path, shared_dataset=True)
+
+        # Assert
+        read_csv.assert_not_called()
+        self.assertEqual(worker.get_country_data('Turkey'), self.service.get_country_data('Turkey'))
+
+
+if __name__ == '__main__':
+    unittest.main()
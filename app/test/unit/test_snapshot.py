@@ -0,0 +1,151 @@
+"""
+Snapshot Unit Testleri
+
+Ön işlenmiş veri anlık görüntülerinin yazılması, okunması ve
+DataService'in anlık görüntüden başlatılması test edilir.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils import snapshot
+from app.data_service import DataService
+
+
+class TestSnapshotFrames(unittest.TestCase):
+    """
+    save_frames / load_frames için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, 'frames.npz')
+
+    def tearDown(self):
+        """Test cleanup"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_round_trip_preserves_values_and_nulls(self):
+        """Test: Yazılıp okunan çerçeve aynı değerleri ve boş değerleri içermeli"""
+        # Arrange
+        frame = pd.DataFrame({
+            'Country Name': ['Turkey', 'Germany', 'Turkey'],
+            'Series Code': ['REN', np.nan, 'REN'],
+            'Year': [1, 2, 3],
+            'Renewable_Value': [10.5, np.nan, 12.0]
+        }, index=[3, 7, 9])
+
+        # Act
+        snapshot.save_frames(self.path, {'melted_data': frame}, meta={'source': 'test'})
+        frames, meta = snapshot.load_frames(self.path)
+
+        # Assert
+        pd.testing.assert_frame_equal(frames['melted_data'], frame)
+        self.assertEqual(meta, {'source': 'test'})
+
+    def test_load_missing_file_returns_none(self):
+        """Test: Olmayan dosya için None döndürmeli"""
+        self.assertIsNone(snapshot.load_frames(self.path))
+
+    def test_load_other_format_returns_none(self):
+        """Test: Farklı format sürümüyle yazılmış dosya yok sayılmalı"""
+        # Arrange
+        snapshot.save_frames(self.path, {'data': pd.DataFrame({'a': [1.0]})})
+
+        # Act & Assert
+        with patch.object(snapshot, 'SNAPSHOT_FORMAT', snapshot.SNAPSHOT_FORMAT + 1):
+            self.assertIsNone(snapshot.load_frames(self.path))
+
+    def test_snapshot_path_depends_on_hash_and_version(self):
+        """Test: Yol içerik özetine ve sürüme göre değişmeli"""
+        path_a = snapshot.snapshot_path('/tmp/data.csv', 'a' * 64, '1')
+        path_b = snapshot.snapshot_path('/tmp/data.csv', 'b' * 64, '1')
+        path_c = snapshot.snapshot_path('/tmp/data.csv', 'a' * 64, '2')
+
+        self.assertNotEqual(path_a, path_b)
+        self.assertNotEqual(path_a, path_c)
+
+
+class TestDataServiceSnapshot(unittest.TestCase):
+    """
+    DataService'in anlık görüntü ile başlatılması için testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_csv_path = os.path.join(self.test_dir, 'test_data.csv')
+        pd.DataFrame({
+            'Country Name': ['Turkey', 'Germany', 'France'],
+            'Country Code': ['TUR', 'DEU', 'FRA'],
+            'Series Name': ['Renewable'] * 3,
+            'Series Code': ['REN'] * 3,
+            'YRbir': [10.5, 15.2, np.nan],
+            'YRiki': [11.2, 16.1, 13.5],
+            'YRuc': [12.0, 17.3, 14.2]
+        }).to_csv(self.test_csv_path, index=False)
+
+    def tearDown(self):
+        """Test cleanup"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_snapshot_is_written_on_first_load(self):
+        """Test: İlk yüklemeden sonra anlık görüntü dosyası oluşmalı"""
+        # Act
+        service = DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Assert
+        self.assertTrue(os.path.exists(service._snapshot_file()))
+
+    def test_warm_start_matches_cold_start(self):
+        """Test: Anlık görüntüden yüklenen veri CSV'den yüklenenle aynı olmalı"""
+        # Arrange
+        cold = DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Act
+        with patch('app.data_service.pd.read_csv') as mock_read:
+            warm = DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Assert - CSV tekrar okunmamalı
+        mock_read.assert_not_called()
+        self.assertEqual(warm.countries, cold.countries)
+        pd.testing.assert_frame_equal(warm.melted_data, cold.melted_data)
+        self.assertEqual(warm.get_country_data('Turkey'), cold.get_country_data('Turkey'))
+
+    def test_changed_csv_invalidates_snapshot(self):
+        """Test: CSV içeriği değişince anlık görüntü yeniden oluşturulmalı"""
+        # Arrange
+        DataService(data_path=self.test_csv_path, use_snapshot=True)
+        df = pd.read_csv(self.test_csv_path)
+        df.loc[0, 'YRuc'] = 99.0
+        df.to_csv(self.test_csv_path, index=False)
+
+        # Act
+        service = DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Assert
+        self.assertEqual(service.get_country_data('Turkey')['stats']['last_value'], 99.0)
+
+    def test_snapshot_disabled_by_default(self):
+        """Test: use_snapshot verilmezse diske anlık görüntü yazılmamalı"""
+        # Act
+        DataService(data_path=self.test_csv_path)
+
+        # Assert
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, '.snapshots')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Akışlı Yükleme Unit Testleri
+
+CSV'nin bellek tavanına göre parça parça okunup doğrudan gösterge
+küplerine eklenmesi ve sonucun toplu yüklemeyle aynı olması test edilir.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.data_service import DataService, PREFERRED_INDICATOR
+from app.utils.country_store import CountryYearStoreBuilder
+
+
+class TestStreamingIngestion(unittest.TestCase):
+    """
+    DataService akışlı yükleme testleri.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.test_dir = tempfile.mkdtemp()
+        self.test_csv_path = os.path.join(self.test_dir, 'test_data.csv')
+        pd.DataFrame({
+            'Series Name': ['Access'] * 3 + ['Renewable'] * 3,
+            'Series Code': ['EG.ELC.ACCS.ZS'] * 3 + [PREFERRED_INDICATOR] * 3,
+            'Country Name': ['Turkey', 'Germany', None, 'Turkey', 'Germany', 'France'],
+            'Country Code': ['TUR', 'DEU', 'XXX', 'TUR', 'DEU', 'FRA'],
+            'YRbir': [90.0, -5.0, 1.0, 10.5, np.nan, np.nan],
+            'YRiki': [np.nan, 100.0, 1.0, 11.2, 16.1, np.nan],
+            'YRuc': ['92,5', 100.0, 1.0, 12.0, 17.3, np.nan]
+        }).to_csv(self.test_csv_path, index=False)
+
+    def tearDown(self):
+        """Test cleanup"""
+        if os.path.exists(self.test_dir):
+            shutil.rmtree(self.test_dir)
+
+    def test_streaming_matches_batch_loading(self):
+        """Test: Akışlı yükleme toplu yüklemeyle aynı küpleri üretmeli"""
+        # Arrange
+        batch = DataService(data_path=self.test_csv_path)
+
+        # Act - çok küçük tavan her satırı ayrı parça yapar
+        streamed = DataService(data_path=self.test_csv_path, memory_limit_mb=0.0001)
+
+        # Assert
+        self.assertEqual(list(streamed.stores), list(batch.stores))
+        self.assertEqual(streamed.countries, batch.countries)
+        for code, store in batch.stores.items():
+            np.testing.assert_array_equal(streamed.stores[code].values, store.values)
+            np.testing.assert_array_equal(streamed.stores[code].years, store.years)
+        self.assertEqual(streamed.get_country_data('France'), batch.get_country_data('France'))
+
+    def test_streaming_reads_file_in_chunks(self):
+        """Test: Dosya tek seferde değil, parçalar halinde okunmalı"""
+        # Arrange
+        read_csv = pd.read_csv
+        calls = []
+
+        def spy(*args, **kwargs):
+            calls.append(kwargs)
+            return read_csv(*args, **kwargs)
+
+        # Act
+        with patch('app.data_service.pd.read_csv', side_effect=spy):
+            DataService(data_path=self.test_csv_path, memory_limit_mb=0.0001)
+
+        # Assert
+        self.assertTrue(any(call.get('chunksize') == 1 for call in calls))
+        self.assertFalse(any('chunksize' not in call and 'nrows' not in call for call in calls))
+
+    def test_streaming_does_not_keep_raw_frames(self):
+        """Test: Akışlı yüklemede ham ve geniş veri çerçeveleri tutulmamalı"""
+        # Act
+        service = DataService(data_path=self.test_csv_path, memory_limit_mb=1)
+
+        # Assert
+        self.assertIsNone(service.raw_data)
+        self.assertIsNone(service.data)
+        self.assertEqual(service.default_indicator, PREFERRED_INDICATOR)
+
+    def test_streaming_with_snapshot(self):
+        """Test: Akışlı yüklenen veri anlık görüntüye yazılıp geri okunabilmeli"""
+        # Arrange
+        DataService(data_path=self.test_csv_path, memory_limit_mb=1, use_snapshot=True)
+
+        # Act
+        warm = DataService(data_path=self.test_csv_path, use_snapshot=True)
+
+        # Assert
+        self.assertEqual(warm.get_country_data('Turkey')['stats']['values'], [10.5, 11.2, 12.0])
+
+
+class TestCountryYearStoreBuilder(unittest.TestCase):
+    """
+    CountryYearStoreBuilder için unit testler.
+    """
+
+    def test_build_keeps_last_duplicate_and_sorts_countries(self):
+        """Test: Tekrarlanan ülkede son satır kullanılmalı, ülkeler sıralanmalı"""
+        # Arrange
+        builder = CountryYearStoreBuilder([1, 2], ['YRbir', 'YRiki'])
+        builder.append(pd.DataFrame({'Country Name': ['Turkey', 'Germany']}), np.array([[1.0, 2.0], [3.0, 4.0]]))
+        builder.append(pd.DataFrame({'Country Name': ['Turkey']}), np.array([[5.0, 6.0]]))
+
+        # Act
+        store = builder.build()
+
+        # Assert
+        self.assertEqual(store.countries, ['Germany', 'Turkey'])
+        self.assertEqual(store.row('Turkey').tolist(), [5.0, 6.0])
+
+    def test_fill_missing_updates_means(self):
+        """Test: Doldurulan hücreler sütun ortalamalarına katılmalı"""
+        # Arrange
+        builder = CountryYearStoreBuilder([1], ['YRbir'])
+        builder.append(pd.DataFrame({'Country Name': ['A', 'B']}), np.array([[2.0], [np.nan]]))
+
+        # Act
+        builder.fill_missing(np.array([4.0]))
+
+        # Assert
+        self.assertEqual(builder.column_means().tolist(), [3.0])
+        self.assertEqual(builder.build().row('B').tolist(), [4.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
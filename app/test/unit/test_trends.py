@@ -0,0 +1,115 @@
+"""
+Trends Unit Testleri
+
+Ülke × yıl matrisi üzerindeki vektörel trend ölçüleri (yüzde değişim, CAGR,
+en küçük kareler eğimi, pencere ortalamaları) test edilir.
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils import trends
+
+
+class TestTrends(unittest.TestCase):
+    """
+    trends modülü için unit testler.
+    """
+
+    def setUp(self):
+        """Test setup"""
+        self.years = np.arange(2000, 2012)
+        rng = np.random.default_rng(7)
+        self.values = rng.random((20, len(self.years))) * 100 + 1
+        self.values[rng.random(self.values.shape) < 0.3] = np.nan
+
+    def _series(self, row):
+        mask = ~np.isnan(self.values[row])
+        return self.years[mask], self.values[row][mask]
+
+    def test_percent_change_matches_series_calculation(self):
+        """Test: Yüzde değişim her satırın NaN'sız serisinin son 5 değeriyle aynı olmalı"""
+        # Act
+        change = trends.percent_change(self.values, window=5)
+
+        # Assert
+        for row in range(len(self.values)):
+            _, series = self._series(row)
+            recent = series[-5:]
+            expected = (recent[-1] - recent[0]) / recent[0] * 100 if len(series) > 1 else 0.0
+            self.assertAlmostEqual(change[row], expected)
+
+    def test_percent_change_edge_cases(self):
+        """Test: Tek değerli satır 0, sıfırdan başlayan satır zero_start döndürmeli"""
+        # Arrange
+        values = np.array([
+            [np.nan, 4.0, np.nan],
+            [0.0, 1.0, 2.0],
+            [0.0, 0.0, 0.0],
+            [np.nan, np.nan, np.nan]
+        ])
+
+        # Act
+        change = trends.percent_change(values, window=None, zero_start=np.inf)
+
+        # Assert
+        self.assertEqual(change.tolist(), [0.0, np.inf, 0.0, 0.0])
+        self.assertEqual(trends.percent_change([0.0, 3.0])[0], 100.0)
+
+    def test_cagr_and_slope_match_reference(self):
+        """Test: CAGR ve eğim satır satır hesaplananla aynı olmalı"""
+        # Act
+        growth = trends.cagr(self.values, self.years)
+        slope = trends.ols_slope(self.values, self.years)
+
+        # Assert
+        for row in range(len(self.values)):
+            years, series = self._series(row)
+            span = years[-1] - years[0]
+            self.assertAlmostEqual(growth[row], ((series[-1] / series[0]) ** (1 / span) - 1) * 100)
+            self.assertAlmostEqual(slope[row], np.polyfit(years, series, 1)[0])
+
+    def test_cagr_and_slope_undefined_cases(self):
+        """Test: Pozitif olmayan başlangıç veya tek değer için CAGR ve eğim NaN olmalı"""
+        values = np.array([[0.0, 1.0, 2.0], [np.nan, 5.0, np.nan]])
+
+        growth = trends.cagr(values, [1, 2, 3])
+        slope = trends.ols_slope(values, [1, 2, 3])
+
+        self.assertTrue(np.isnan(growth).all())
+        self.assertAlmostEqual(slope[0], 1.0)
+        self.assertTrue(np.isnan(slope[1]))
+
+    def test_window_average_change(self):
+        """Test: İlk ve son pencere ortalamaları karşılaştırılmalı; yetersiz veri 0 döndürmeli"""
+        # Arrange
+        values = np.array([
+            [1.0, 1.0, np.nan, 3.0, 3.0],
+            [1.0, 2.0, 3.0, np.nan, np.nan]
+        ])
+
+        # Act
+        average = trends.window_average(values, window=2)
+        change = trends.window_average_change(values, window=2)
+
+        # Assert
+        self.assertEqual(average.tolist(), [3.0, 2.5])
+        self.assertEqual(change.tolist(), [200.0, 0.0])
+
+    def test_trend_table_contains_all_measures(self):
+        """Test: trend_table tüm ölçüleri satır sırasıyla döndürmeli"""
+        table = trends.trend_table(self.values, self.years, window=3)
+
+        self.assertEqual(set(table), {'percent_change', 'cagr', 'slope', 'window_average', 'window_change'})
+        for column in table.values():
+            self.assertEqual(column.shape, (len(self.values),))
+        np.testing.assert_allclose(table['percent_change'], trends.percent_change(self.values, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Year Labels Unit Testleri
+
+Yıl sütun etiketlerinin sayısal yıllara dönüştürülmesi test edilir.
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import pandas as pd
+import numpy as np
+
+# Projenin kök dizinini path'e ekle
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+from app.utils import year_labels
+from app.utils.year_labels import decode_year_label, decode_year_labels
+
+
+class TestDecodeYearLabel(unittest.TestCase):
+    """
+    decode_year_label fonksiyonu için unit testler.
+    """
+
+    def test_turkish_number_words(self):
+        """Test: Türkçe sayı sözcükleri (boşluk ve büyük harf dahil) çözülmeli"""
+        self.assertEqual(decode_year_label('YRbir'), 1)
+        self.assertEqual(decode_year_label('YRsekiz '), 8)
+        self.assertEqual(decode_year_label('YRYirmiAlti'), 26)
+
+    def test_digit_fallbacks(self):
+        """Test: Rakamlı etiketler çözülmeli"""
+        self.assertEqual(decode_year_label('YR12'), 12)
+        self.assertEqual(decode_year_label('1990'), 1990)
+        self.assertEqual(decode_year_label('Y1995'), 1995)
+        self.assertEqual(decode_year_label('2001_y'), 2001)
+        self.assertEqual(decode_year_label(2005.0), 2005)
+
+    def test_unknown_label_returns_zero(self):
+        """Test: Çözülemeyen etiket 0 döndürmeli"""
+        self.assertEqual(decode_year_label('YRbilinmeyen'), 0)
+        self.assertEqual(decode_year_label('etiket'), 0)
+
+
+class TestDecodeYearLabels(unittest.TestCase):
+    """
+    decode_year_labels fonksiyonu için unit testler.
+    """
+
+    def test_matches_per_row_decoding(self):
+        """Test: Sonuç satır başına çözme ile aynı olmalı"""
+        # Arrange
+        labels = pd.Series(['YRbir', 'YRiki', 'YRbir', None, 'Y1990', 'YRiki'])
+
+        # Act
+        years = decode_year_labels(labels)
+
+        # Assert
+        self.assertEqual(years.tolist(), [1, 2, 1, 0, 1990, 2])
+        self.assertEqual(years.dtype, np.int64)
+
+    def test_each_distinct_label_decoded_once(self):
+        """Test: Tekrarlanan etiketler yalnızca bir kez çözülmeli"""
+        # Arrange
+        labels = pd.Series(['YRbir', 'YRiki', 'YRuc'] * 1000)
+
+        # Act
+        with patch.object(year_labels, 'decode_year_label', wraps=decode_year_label) as mock_decode:
+            years = decode_year_labels(labels)
+
+        # Assert
+        self.assertEqual(mock_decode.call_count, 3)
+        self.assertEqual(years[:3].tolist(), [1, 2, 3])
+
+    def test_categorical_labels_use_existing_codes(self):
+        """Test: Kategorik etiketlerde kategori kodları kullanılmalı"""
+        # Arrange
+        labels = pd.Series(pd.Categorical.from_codes([1, 0, 1], categories=['YRbir', 'YRiki']))
+
+        # Act & Assert
+        self.assertEqual(decode_year_labels(labels).tolist(), [2, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
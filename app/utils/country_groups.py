@@ -0,0 +1,183 @@
+"""
+Country Groups Modülü - Kullanıcı tanımlı ülke grupları ve grup özetleri
+
+Bu modül bölgesel veya özel ülke gruplarının (AB, G20, müşteri portföyleri)
+tanımlarını bir JSON yapılandırma dosyasından okur ve grup üyelerinin satırları
+üzerinden yıl başına özetleri (ortalama, medyan, isteğe bağlı ağırlıklı ortalama,
+en küçük/en büyük değer, değeri olan üye sayısı) ülke × yıl matrisinde tek
+geçişte hesaplar.
+
+Yapılandırma dosyası biçimi:
+    {
+        "EU": {"label": "Avrupa Birliği", "countries": ["AUT", "BEL", ...]},
+        "portfoy": {"countries": ["TUR", "Germany"], "weights": {"TUR": 2, "Germany": 1}}
+    }
+Üyeler ülke adı veya ülke kodu olabilir; ağırlıklar verilmeyen üyelerin ağırlığı 1'dir.
+
+Depoda izlenen yapılandırma dosyası salt okunur varsayılanlardır; çalışma zamanında
+tanımlanan gruplar aynı biçimdeki ayrı bir dosyaya (overrides_path) yazılır ve aynı adlı
+varsayılanların yerine geçer.
+"""
+
+import json
+import logging
+import os
+import warnings
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.utils.country_store import to_float64
+
+logger = logging.getLogger(__name__)
+
+GROUPS_FILE = 'country_groups.json'
+
+# Çalışma zamanı grup tanımlarının yazılacağı dizini ortam değişkeni ile değiştirmeye izin ver
+GROUPS_DIR_ENV = 'RENEWABLE_GROUPS_DIR'
+
+
+class CountryGroup:
+    """
+    Ad, görünen ad, üye listesi ve isteğe bağlı üye ağırlıklarından oluşan ülke grubu.
+    """
+
+    def __init__(self, name: str, countries: List[str], weights: Optional[Dict[str, float]] = None,
+                 label: Optional[str] = None):
+        """
+        CountryGroup başlatıcı
+
+        Args:
+            name: Grubun adı (URL'de kullanılan anahtar)
+            countries: Üye ülke adları veya kodları
+            weights: Üye -> ağırlık (verilmeyen üyeler için 1)
+            label: Görünen ad (None ise ad)
+
+        Raises:
+            ValueError: Ad boşsa, üyeler metin listesi değilse ya da ağırlıklar geçersizse
+        """
+        if not name or not str(name).strip():
+            raise ValueError("Grup adı boş olamaz")
+        if not isinstance(countries, (list, tuple)) or not all(isinstance(member, str) for member in countries):
+            raise ValueError(f"'{name}' grubunun üyeleri ülke adı veya kodu listesi olmalı")
+        if not countries:
+            raise ValueError(f"'{name}' grubunda en az bir ülke olmalı")
+        if weights is not None and not isinstance(weights, dict):
+            raise ValueError(f"'{name}' grubunun ağırlıkları üye -> sayı sözlüğü olmalı")
+        weights = dict(weights or {})
+        unknown = [member for member in weights if member not in countries]
+        if unknown:
+            raise ValueError(f"Ağırlığı verilen ülkeler grupta yok: {', '.join(unknown)}")
+        for member, weight in weights.items():
+            # bool int'in alt sınıfı olduğundan ayrıca dışlanır
+            if (isinstance(weight, bool) or not isinstance(weight, (int, float))
+                    or not np.isfinite(weight) or weight < 0):
+                raise ValueError(f"Geçersiz ağırlık: {member}={weight}")
+
+        self.name = str(name).strip()
+        self.label = label or self.name
+        self.countries = list(dict.fromkeys(countries))
+        self.weights = {member: float(weight) for member, weight in weights.items()}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Grubu yapılandırma dosyasındaki biçimde döndürür.
+        """
+        definition = {'label': self.label, 'countries': list(self.countries)}
+        if self.weights:
+            definition['weights'] = dict(self.weights)
+        return definition
+
+
+def overrides_path(data_path: Optional[str]) -> str:
+    """
+    Çalışma zamanında tanımlanan grupların yazılacağı dosyanın yolunu döndürür.
+
+    Args:
+        data_path: Kaynak CSV dosyasının yolu
+
+    Returns:
+        str: Ortam değişkeni verilmişse o dizindeki, aksi halde CSV'nin yanındaki .groups dizinindeki dosya
+    """
+    directory = os.environ.get(GROUPS_DIR_ENV)
+    if not directory:
+        base = os.path.dirname(os.path.abspath(data_path)) if data_path else os.getcwd()
+        directory = os.path.join(base, '.groups')
+    return os.path.join(directory, GROUPS_FILE)
+
+
+def load_groups(path: str) -> Dict[str, CountryGroup]:
+    """
+    Grup tanımlarını JSON dosyasından okur.
+
+    Dosya yoksa boş sözlük döner; geçersiz tanımlar uyarı ile atlanır.
+
+    Args:
+        path: Yapılandırma dosyasının yolu
+
+    Returns:
+        Dict[str, CountryGroup]: Grup adı -> grup
+    """
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            definitions = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Ülke grupları okunamadı ({path}): {str(e)}")
+        return {}
+
+    groups = {}
+    for name, definition in definitions.items():
+        try:
+            groups[name] = CountryGroup(
+                name,
+                definition.get('countries', []),
+                weights=definition.get('weights'),
+                label=definition.get('label')
+            )
+        except (AttributeError, ValueError) as e:
+            logger.warning(f"Geçersiz grup tanımı atlandı ({name}): {str(e)}")
+    logger.info(f"{len(groups)} ülke grubu yüklendi: {path}")
+    return groups
+
+
+def aggregate(values: np.ndarray, rows: List[int], weights: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    Verilen satırların yıl başına özetlerini hesaplar.
+
+    Eksik (NaN) hücreler dışlanır; bir yılda hiçbir üyenin değeri yoksa o yılın
+    özetleri NaN'dır. Ağırlıklı ortalama her yıl yalnızca değeri olan üyelerin
+    ağırlıklarıyla normalize edilir. Matristen yalnızca üye satırları float64'e
+    genişletilir.
+
+    Args:
+        values: [ülke sayısı, yıl sayısı] değer matrisi
+        rows: Grup üyelerinin satır numaraları
+        weights: Satır sırasıyla üye ağırlıkları (None ise ağırlıklı ortalama hesaplanmaz)
+
+    Returns:
+        Dict[str, np.ndarray]: mean, median, min, max, count (ve weights verildiyse weighted_mean)
+    """
+    block = to_float64(values[rows])
+    present = ~np.isnan(block)
+
+    with warnings.catch_warnings():
+        # Tümü eksik yıllar NaN üretir; uyarı beklenen durumdur
+        warnings.simplefilter('ignore', RuntimeWarning)
+        result = {
+            'mean': np.nanmean(block, axis=0),
+            'median': np.nanmedian(block, axis=0),
+            'min': np.nanmin(block, axis=0),
+            'max': np.nanmax(block, axis=0),
+            'count': present.sum(axis=0)
+        }
+
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64)[:, np.newaxis]
+        weight_sum = np.where(present, weights, 0.0).sum(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['weighted_mean'] = np.where(present, block * weights, 0.0).sum(axis=0) / weight_sum
+        result['weighted_mean'][weight_sum == 0] = np.nan
+    return result
@@ -0,0 +1,213 @@
+"""
+Country Index Modülü - Ülke adı, kodu ve takma adları için hash indeksi ve önek ağacı
+
+Bu modül ülke sorgularını (ad, ISO3 ülke kodu, Türkçe/İngilizce takma ad)
+büyük/küçük harf, Türkçe karakter ve aksan farklarından bağımsız olarak tek
+bir sözlük aramasıyla kanonik ülke adına çevirir. Otomatik tamamlama için
+aynı anahtarlar bir önek ağacına (trie) eklenir; her düğüm, altındaki
+anahtarlara karşılık gelen ülkeleri önceden sıralanmış olarak tutar ve bir
+önek sorgusu önek uzunluğu + k adımda yanıtlanır.
+
+Takma adlar country_aliases.json dosyasında ülke kodu -> takma adlar
+biçiminde tutulur.
+"""
+
+import json
+import logging
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ALIASES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'country_aliases.json')
+
+# Eşleşme önceliği: küçük değer önce gelir
+PRIORITY_NAME = 0
+PRIORITY_CODE = 1
+PRIORITY_ALIAS = 2
+PRIORITY_WORD = 3
+
+# Türkçe büyük/küçük harf dönüşümü casefold() ile doğru sonuç vermez (İ -> i̇, I -> ı beklenir)
+_TURKISH = str.maketrans({'İ': 'i', 'I': 'i', 'ı': 'i'})
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def normalize(text: str) -> str:
+    """
+    Ülke adını karşılaştırma anahtarına çevirir.
+
+    Türkçe karakterler ve aksanlar ASCII karşılıklarına indirgenir, harfler
+    küçültülür ve harf/rakam dışındaki karakterler tek boşluğa çevrilir:
+    "Türkiye" -> "turkiye", "Côte d'Ivoire" -> "cote d ivoire".
+
+    Args:
+        text: Ülke adı, kodu veya takma adı
+
+    Returns:
+        str: Normalize anahtar
+    """
+    text = unicodedata.normalize('NFKD', str(text).translate(_TURKISH))
+    text = ''.join(char for char in text if not unicodedata.combining(char)).casefold()
+    return _NON_WORD.sub(' ', text).strip()
+
+
+def load_aliases(path: str = ALIASES_FILE) -> Dict[str, List[str]]:
+    """
+    Ülke kodu -> takma adlar eşlemesini okur.
+
+    Args:
+        path: Takma ad dosyasının yolu
+
+    Returns:
+        Dict[str, List[str]]: Ülke kodu -> takma adlar (dosya okunamazsa boş)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ülke takma adları okunamadı ({path}): {str(e)}")
+        return {}
+
+
+class _TrieNode:
+    """Önek ağacı düğümü: çocuklar ve altındaki ülkeler (öncelik, ad) sırasıyla."""
+
+    __slots__ = ('children', 'entries', 'ranked')
+
+    def __init__(self):
+        self.children: Dict[str, '_TrieNode'] = {}
+        self.entries: Dict[str, int] = {}
+        self.ranked: List[str] = []
+
+
+class CountryIndex:
+    """
+    Kanonik ülke adları üzerine kurulu hash indeksi ve önek ağacı.
+
+    resolve() adı, ISO3 kodunu veya takma adı O(1) ortalama sürede kanonik
+    ada çevirir. suggest() önekle başlayan ülkeleri; tam ad eşleşmeleri, kod,
+    takma ad ve ad içindeki kelime eşleşmeleri sırasıyla döndürür.
+    """
+
+    def __init__(self, names: Iterable[str], codes: Optional[Dict[str, str]] = None,
+                 aliases: Optional[Dict[str, List[str]]] = None):
+        """
+        CountryIndex başlatıcı
+
+        Args:
+            names: Kanonik ülke adları
+            codes: Ülke kodu -> kanonik ad
+            aliases: Ülke kodu -> takma adlar (kodu indekste olmayanlar atlanır)
+        """
+        self.names = sorted(set(names))
+        self._exact = set(self.names)
+        self._keys: Dict[str, Tuple[int, str]] = {}
+        self._root = _TrieNode()
+        codes = {code: name for code, name in (codes or {}).items() if name in self._exact}
+
+        for name in self.names:
+            self._add(name, name, PRIORITY_NAME)
+        for code, name in codes.items():
+            self._add(code, name, PRIORITY_CODE)
+        for code, names_for_code in (aliases or {}).items():
+            if code in codes:
+                for alias in names_for_code:
+                    self._add(alias, codes[code], PRIORITY_ALIAS)
+        # Çok kelimeli adlarda sonraki kelimeler de önek olarak aranabilir ("kingdom" -> United Kingdom)
+        for name in self.names:
+            words = normalize(name).split(' ')
+            for i in range(1, len(words)):
+                self._insert(' '.join(words[i:]), name, PRIORITY_WORD)
+
+        self._rank(self._root)
+
+    def _add(self, text: str, name: str, priority: int) -> None:
+        """Anahtarı hash indeksine ve önek ağacına ekler; çakışmada önceliği yüksek olan kalır."""
+        key = normalize(text)
+        if not key:
+            return
+        existing = self._keys.get(key)
+        if existing is not None and existing[1] != name:
+            if existing[0] <= priority:
+                logger.debug(f"Ülke anahtarı çakışması yok sayıldı: '{text}' -> {name} ({existing[1]} korunuyor)")
+                return
+        self._keys[key] = (priority, name)
+        self._insert(key, name, priority)
+
+    def _insert(self, key: str, name: str, priority: int) -> None:
+        node = self._root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+            node.entries[name] = min(priority, node.entries.get(name, priority))
+
+    def _rank(self, root: _TrieNode) -> None:
+        """Her düğümün ülkelerini (öncelik, ad) sırasına dizer."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            node.ranked = [name for name, _ in sorted(node.entries.items(), key=lambda item: (item[1], item[0]))]
+            node.entries = {}
+            stack.extend(node.children.values())
+
+    def __contains__(self, country: str) -> bool:
+        return self.resolve(country) is not None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def resolve(self, country: str) -> Optional[str]:
+        """
+        Ülke adını, kodunu veya takma adını kanonik ada çevirir.
+
+        Args:
+            country: Sorgu
+
+        Returns:
+            Optional[str]: Kanonik ülke adı, bulunamazsa None
+        """
+        if country in self._exact:
+            return country
+        if not isinstance(country, str):
+            return None
+        match = self._keys.get(normalize(country))
+        return match[1] if match is not None else None
+
+    def suggest(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        Önekle başlayan ülkeleri eşleşme önceliği ve ad sırasıyla döndürür.
+
+        Args:
+            prefix: Aranan önek
+            limit: Döndürülecek en fazla ülke
+
+        Returns:
+            List[str]: Kanonik ülke adları
+        """
+        key = normalize(prefix)
+        if not key or limit < 1:
+            return []
+        node = self._root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.ranked[:limit]
+
+
+class CountryList(list):
+    """
+    Sıralı ülke adları listesi; üyelik testi CountryIndex üzerinden O(1) yapılır.
+
+    `ad in service.countries` kontrolleri liste taraması yerine hash araması
+    kullanır ve ülke kodu ile takma adları da kabul eder. Liste olarak
+    davranışı (sıra, dilimleme, JSON'a yazma) değişmez.
+    """
+
+    def __init__(self, names: Iterable[str], index: CountryIndex):
+        super().__init__(names)
+        self.index = index
+
+    def __contains__(self, country) -> bool:
+        return self.index.resolve(country) is not None
@@ -0,0 +1,131 @@
+"""
+Country Query Modülü - Ülke × yıl küpü üzerinde vektörel filtreleme ve sıralama
+
+Bu modül "son yılda değeri 40'ın üzerinde ve 5 yıllık trendi negatif olan
+ülkeler" gibi taramaları, önceden hesaplanmış ülke başına dizilerin (seçilen
+yılın değeri, sırası ve yüzdeliği, istatistikler, trend ölçüleri) üzerinde
+boolean maskelerle değerlendirir. Her koşul tüm ülkeler için tek bir NumPy
+karşılaştırmasıdır; sıralama ve sayfalama yalnızca eşleşen satırlar üzerinde
+yapılır.
+
+Filtre ifadesi virgül veya "and" ile ayrılmış koşullardan oluşur:
+    value>40, trend<0
+    rank<=10 and cagr>=2
+Desteklenen alanlar FIELDS, işleçler OPERATORS içindedir. Eksik (NaN) değerler
+hiçbir koşulu sağlamaz ve sıralamada her zaman sona kalır.
+"""
+
+import operator
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Sorgulanabilir alanlar -> açıklama
+FIELDS = {
+    'value': "Seçilen yılın değeri",
+    'rank': "Seçilen yıldaki sıra (1 en yüksek)",
+    'percentile': "Seçilen yıldaki yüzdelik dilim",
+    'last_value': "Değeri olan son yılın değeri",
+    'mean': "Tüm yılların ortalaması",
+    'median': "Tüm yılların medyanı",
+    'min': "En küçük değer",
+    'max': "En büyük değer",
+    'std': "Standart sapma",
+    'count': "Değeri olan yıl sayısı",
+    'trend': "Son 5 değerin yüzde değişimi",
+    'cagr': "Yıllık bileşik büyüme oranı (%)",
+    'slope': "En küçük kareler eğimi (birim/yıl)"
+}
+
+OPERATORS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '!=': operator.ne,
+    '==': operator.eq,
+    '=': operator.eq,
+    '>': operator.gt,
+    '<': operator.lt
+}
+
+_CONDITION = re.compile(r'^\s*([a-z_]+)\s*(>=|<=|!=|==|=|>|<)\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*$')
+_SEPARATOR = re.compile(r'\s*,\s*|\s+and\s+', re.IGNORECASE)
+
+
+def parse_filters(expression: Optional[str]) -> List[Tuple[str, str, float]]:
+    """
+    Filtre ifadesini (alan, işleç, sayı) koşullarına ayrıştırır.
+
+    Args:
+        expression: "value>40, trend<0" biçiminde ifade (boş veya None ise koşul yok)
+
+    Returns:
+        List[Tuple[str, str, float]]: Koşullar
+
+    Raises:
+        ValueError: Koşul sözdizimi veya alan geçersizse
+    """
+    if not expression or not expression.strip():
+        return []
+
+    conditions = []
+    for part in _SEPARATOR.split(expression.strip()):
+        match = _CONDITION.match(part)
+        if match is None:
+            raise ValueError(f"Geçersiz filtre koşulu: '{part}' (ör. value>40)")
+        field, op, number = match.groups()
+        if field not in FIELDS:
+            raise ValueError(f"Bilinmeyen filtre alanı: {field} ({', '.join(FIELDS)})")
+        conditions.append((field, op, float(number)))
+    return conditions
+
+
+def filter_mask(columns: Dict[str, np.ndarray], conditions: List[Tuple[str, str, float]]) -> np.ndarray:
+    """
+    Koşulların tümünü sağlayan satırların maskesini döndürür.
+
+    Args:
+        columns: Alan -> satır sırasıyla değer dizisi
+        conditions: parse_filters() çıktısı
+
+    Returns:
+        np.ndarray: Boolean maske
+    """
+    mask = np.ones(len(next(iter(columns.values()))), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        for field, op, number in conditions:
+            mask &= OPERATORS[op](columns[field], number)
+    return mask
+
+
+def select(columns: Dict[str, np.ndarray], conditions: List[Tuple[str, str, float]],
+           sort: Optional[str] = None, descending: bool = True,
+           offset: int = 0, limit: Optional[int] = None) -> Tuple[np.ndarray, int]:
+    """
+    Filtreler, sıralar ve sayfalar.
+
+    Args:
+        columns: Alan -> satır sırasıyla değer dizisi
+        conditions: parse_filters() çıktısı
+        sort: Sıralama alanı (None ise satır sırası)
+        descending: True ise büyükten küçüğe
+        offset: Atlanacak satır sayısı
+        limit: Döndürülecek en fazla satır (None ise tümü)
+
+    Returns:
+        Tuple[np.ndarray, int]: (sayfadaki satır numaraları, eşleşen toplam satır sayısı)
+
+    Raises:
+        ValueError: Sıralama alanı bilinmiyorsa
+    """
+    if sort is not None and sort not in columns:
+        raise ValueError(f"Bilinmeyen sıralama alanı: {sort} ({', '.join(FIELDS)})")
+
+    rows = np.flatnonzero(filter_mask(columns, conditions))
+    if sort is not None:
+        keys = columns[sort][rows].astype(np.float64)
+        # Kararlı argsort NaN'ları sona koyar; azalan sıra için anahtarlar negatiflenir
+        rows = rows[np.argsort(-keys if descending else keys, kind='stable')]
+
+    end = None if limit is None else offset + limit
+    return rows[offset:end], len(rows)
@@ -0,0 +1,856 @@
+"""
+Country Store Modülü - Ülke × yıl yoğun veri küpü
+
+Bu modül uzun formattaki yenilenebilir enerji verisini bitişik bir float32
+matriste (satır = ülke, sütun = yıl) tutar. Ülke -> satır ve yıl -> sütun
+sözlükleri sayesinde bir ülkenin zaman serisi tüm veri taranmadan ve
+kopyalanmadan, matrisin bir satır görünümü olarak alınır.
+
+Uzun formattaki DataFrame (melted_data) artık birincil depo değildir;
+ihtiyaç duyan eski kodlar için to_melted() ile küpten kompakt (kategorik
+metin sütunları, float32 değerler, int16 yıllar) olarak türetilir.
+"""
+
+import hashlib
+import logging
+import warnings
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.utils import trends
+
+logger = logging.getLogger(__name__)
+
+VALUE_COLUMN = 'Renewable_Value'
+
+# Ülke trendinin hesaplandığı son değer sayısı
+TREND_WINDOW = trends.DEFAULT_WINDOW
+
+
+def to_float64(values: np.ndarray) -> np.ndarray:
+    """
+    float32 değerleri kaynak dosyadaki ondalık gösterimini koruyarak float64'e genişletir.
+
+    Doğrudan astype(float64) 11.2 gibi bir değeri 11.199999809... yapar; bu
+    değerler API yanıtlarında ve istatistiklerde görünür. float32'nin en kısa
+    ondalık gösterimi üzerinden geçmek CSV'deki değeri geri verir.
+
+    Args:
+        values: float32 dizi
+
+    Returns:
+        np.ndarray: float64 dizi
+    """
+    values = np.asarray(values)
+    if values.dtype != np.float32:
+        return values.astype(np.float64)
+    return values.astype(str).astype(np.float64)
+
+
+def to_float_list(values: np.ndarray) -> List[float]:
+    """
+    Diziyi JSON'a yazılabilir Python float listesine dönüştürür.
+
+    Args:
+        values: Sayısal dizi
+
+    Returns:
+        List[float]: Değer listesi
+    """
+    return to_float64(values).tolist()
+
+
+def log_value(frame: pd.DataFrame, value_column: str = VALUE_COLUMN) -> pd.Series:
+    """
+    Türetilmiş LogValue sütununu (log(1 + x), pozitif olmayan değerler için 0) hesaplar.
+
+    Uzun formattaki veri bu sütunu saklamaz; yalnızca ihtiyaç duyan kod çağırır.
+
+    Args:
+        frame: Değer sütununu içeren DataFrame
+        value_column: Değer sütununun adı
+
+    Returns:
+        pd.Series: frame ile aynı indeksli float64 seri
+    """
+    values = to_float64(frame[value_column].to_numpy())
+    with np.errstate(invalid='ignore'):
+        logs = np.where(values > 0, np.log1p(np.clip(values, 0, None)), 0.0)
+    return pd.Series(logs, index=frame.index, name='LogValue')
+
+
+def year_range_slice(years: np.ndarray, start_year: Optional[int] = None,
+                     end_year: Optional[int] = None) -> slice:
+    """
+    Artan sıralı yıl dizisinde [start_year, end_year] kapalı aralığının dilimini ikili aramayla bulur.
+
+    Args:
+        years: Artan sıralı yıllar
+        start_year: Başlangıç yılı (None ise ilk yıl)
+        end_year: Bitiş yılı (None ise son yıl)
+
+    Returns:
+        slice: Aralıktaki yılların dilimi (aralıkta yıl yoksa boş dilim)
+    """
+    start = 0 if start_year is None else int(np.searchsorted(years, start_year, side='left'))
+    stop = len(years) if end_year is None else int(np.searchsorted(years, end_year, side='right'))
+    return slice(start, max(start, stop))
+
+
+def _compact_take(column: pd.Series, positions: np.ndarray) -> np.ndarray:
+    """
+    Satır başına tanımlayıcı sütunu verilen satır konumlarına yayar.
+
+    Metin sütunları kategorik olarak yayılır: her metin bir kez saklanır ve
+    satırlar yalnızca küçük tamsayı kodları taşır.
+    """
+    if column.dtype != object and not isinstance(column.dtype, pd.CategoricalDtype):
+        return column.to_numpy()[positions]
+    codes, uniques = pd.factorize(column)
+    return pd.Categorical.from_codes(codes[positions], categories=uniques)
+
+
+def _year_dtype(years: np.ndarray) -> np.dtype:
+    """Yıllar int16'ya sığıyorsa int16, sığmıyorsa int64 döndürür."""
+    bounds = np.iinfo(np.int16)
+    if len(years) == 0 or (years.min() >= bounds.min and years.max() <= bounds.max):
+        return np.dtype(np.int16)
+    return np.dtype(np.int64)
+
+
+class CountryYearStore:
+    """
+    Ülke × yıl değer matrisi ve indeksleri.
+
+    Eksik hücreler NaN ile tutulur. Matris salt okunur işaretlenir, böylece
+    dışarıya verilen satır görünümleri yanlışlıkla değiştirilemez.
+    """
+
+    def __init__(self, values: np.ndarray, countries: List[str], years: Iterable[int],
+                 row_meta: Optional[pd.DataFrame] = None, year_labels: Optional[List[str]] = None):
+        """
+        CountryYearStore başlatıcı
+
+        Args:
+            values: [ülke sayısı, yıl sayısı] boyutlu değer matrisi
+            countries: Satır sırasına göre ülke adları
+            years: Sütun sırasına göre (artan) yıllar
+            row_meta: Satır başına tanımlayıcı sütunlar (Country Code, Series Code vb.)
+            year_labels: Sütun başına kaynak yıl etiketleri (YRbir, YRiki ...)
+        """
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+        self.values.flags.writeable = False
+        self.countries = list(countries)
+        self.years = np.asarray(years, dtype=np.int64)
+        self.years.flags.writeable = False
+
+        if self.values.shape != (len(self.countries), len(self.years)):
+            raise ValueError(
+                f"Matris boyutu {self.values.shape} ülke/yıl sayısı ile uyuşmuyor "
+                f"({len(self.countries)}, {len(self.years)})"
+            )
+
+        self.country_index: Dict[str, int] = {name: i for i, name in enumerate(self.countries)}
+        self.year_index: Dict[int, int] = {int(year): j for j, year in enumerate(self.years)}
+
+        if row_meta is None:
+            row_meta = pd.DataFrame({'Country Name': self.countries})
+        self.row_meta = row_meta.reset_index(drop=True)
+        # Ülke kodu (ISO3) -> satır; ülke adı yerine kodla da O(1) erişim sağlar
+        self.code_index: Dict[str, int] = {}
+        if 'Country Code' in self.row_meta.columns:
+            self.code_index = {
+                code: i for i, code in enumerate(self.row_meta['Country Code'])
+                if isinstance(code, str)
+            }
+        self.year_labels = list(year_labels) if year_labels is not None else [None] * len(self.years)
+
+        # Hiç eksik hücresi olmayan satırlar için maske uygulamadan görünüm döndürülebilir
+        self._complete_rows = ~np.isnan(self.values).any(axis=1)
+        self._stats_table: Optional['CountryStatsTable'] = None
+        self._rank_index: Optional['RankIndex'] = None
+        self._similarity_index: Optional['SimilarityIndex'] = None
+        self._content_hash: Optional[str] = None
+
+    @classmethod
+    def from_melted(cls, frame: pd.DataFrame, value_column: str = VALUE_COLUMN) -> 'CountryYearStore':
+        """
+        Uzun formattaki veri çerçevesinden küp oluşturur.
+
+        Aynı (ülke, yıl) çifti birden fazla kez geçerse son satır kullanılır.
+
+        Args:
+            frame: 'Country Name', 'Year' ve değer sütununu içeren DataFrame
+            value_column: Değer sütununun adı
+
+        Returns:
+            CountryYearStore: Oluşturulan küp
+
+        Raises:
+            ValueError: Gerekli sütunlar yoksa
+        """
+        required = ['Country Name', 'Year', value_column]
+        missing = [col for col in required if col not in frame.columns]
+        if missing:
+            raise ValueError(f"Küp oluşturmak için eksik sütunlar: {missing}")
+
+        if frame['Country Name'].isna().any() or frame['Year'].isna().any():
+            frame = frame.dropna(subset=['Country Name', 'Year'])
+
+        countries = sorted(frame['Country Name'].unique().tolist())
+        years = np.sort(frame['Year'].astype(np.int64).unique())
+
+        row_idx = pd.Index(countries).get_indexer(frame['Country Name'])
+        col_idx = np.searchsorted(years, frame['Year'].astype(np.int64).to_numpy())
+
+        values = np.full((len(countries), len(years)), np.nan, dtype=np.float32)
+        values[row_idx, col_idx] = frame[value_column].to_numpy(dtype=np.float32)
+
+        duplicates = len(frame) - len(np.unique(row_idx * max(len(years), 1) + col_idx))
+        if duplicates > 0:
+            logger.warning(f"Küp oluşturulurken {duplicates} tekrarlanan ülke/yıl satırı bulundu, son değer kullanıldı")
+
+        # Satır başına tanımlayıcı sütunlar (ülkenin ilk satırından)
+        meta_columns = [
+            col for col in frame.columns
+            if col not in ('Year', 'YR_label', 'LogValue', value_column)
+        ]
+        first_rows = frame[~frame['Country Name'].duplicated()]
+        row_meta = first_rows[meta_columns].set_index('Country Name', drop=False).loc[countries]
+
+        year_labels = None
+        if 'YR_label' in frame.columns:
+            first_labels = frame[~frame['Year'].duplicated()]
+            label_map = dict(zip(first_labels['Year'].astype(np.int64), first_labels['YR_label']))
+            year_labels = [label_map.get(int(year)) for year in years]
+
+        return cls(values, countries, years, row_meta=row_meta, year_labels=year_labels)
+
+    def __contains__(self, country: str) -> bool:
+        return country in self.country_index or country in self.code_index
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    def resolve(self, country: str) -> str:
+        """
+        Ülke adını veya ülke kodunu küpteki ülke adına çevirir.
+
+        Raises:
+            KeyError: Ülke küpte yoksa
+        """
+        if country in self.country_index:
+            return country
+        return self.countries[self.code_index[country]]
+
+    def _row_index(self, country: str) -> int:
+        index = self.country_index.get(country)
+        if index is None:
+            index = self.code_index[country]
+        return index
+
+    def position(self, country: str) -> int:
+        """
+        Ülkenin (adı veya kodu) matristeki satır numarasını döndürür.
+
+        Raises:
+            KeyError: Ülke küpte yoksa
+        """
+        return self._row_index(country)
+
+    def content_hash(self) -> str:
+        """
+        Küpün içeriğinin (ülkeler, yıllar ve değerler) SHA-256 özetini döndürür; ilk çağrıda hesaplanır.
+        """
+        if self._content_hash is None:
+            digest = hashlib.sha256()
+            digest.update('\n'.join(self.countries).encode('utf-8'))
+            digest.update(self.years.tobytes())
+            digest.update(self.values.tobytes())
+            self._content_hash = digest.hexdigest()
+        return self._content_hash
+
+    def stats_table(self) -> 'CountryStatsTable':
+        """
+        Tüm ülkelerin istatistik tablosunu döndürür; ilk çağrıda tek geçişte hesaplanır.
+
+        Matris değişmez olduğundan tablo küp yaşadıkça geçerlidir.
+        """
+        if self._stats_table is None:
+            self._stats_table = CountryStatsTable(self.values, self.years)
+        return self._stats_table
+
+    def rank_index(self) -> 'RankIndex':
+        """
+        Yıl başına sıralama indeksini döndürür; ilk çağrıda oluşturulur.
+        """
+        if self._rank_index is None:
+            self._rank_index = RankIndex(self.values)
+        return self._rank_index
+
+    def similarity_index(self) -> 'SimilarityIndex':
+        """
+        Ülkeler arası benzerlik matrislerini döndürür; ilk çağrıda tek geçişte hesaplanır.
+        """
+        if self._similarity_index is None:
+            self._similarity_index = SimilarityIndex(self.values)
+        return self._similarity_index
+
+    def row(self, country_name: str) -> np.ndarray:
+        """
+        Ülkenin tüm yıllar için değer satırını (eksikler NaN) görünüm olarak döndürür.
+
+        Raises:
+            KeyError: Ülke küpte yoksa
+        """
+        return self.values[self._row_index(country_name)]
+
+    def series(self, country_name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ülkenin değeri olan yıllarını ve değerlerini artan yıl sırasıyla döndürür.
+
+        Eksik hücresi olmayan ülkelerde dönen diziler kopya değil görünümdür.
+
+        Args:
+            country_name: Ülke adı veya ülke kodu
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (yıllar, float32 değerler)
+
+        Raises:
+            KeyError: Ülke küpte yoksa
+        """
+        index = self._row_index(country_name)
+        values = self.values[index]
+        if self._complete_rows[index]:
+            return self.years, values
+        mask = ~np.isnan(values)
+        return self.years[mask], values[mask]
+
+    def year_slice(self, start_year: Optional[int] = None, end_year: Optional[int] = None) -> slice:
+        """
+        [start_year, end_year] kapalı aralığına düşen sütunları ikili aramayla bulur.
+
+        Args:
+            start_year: Başlangıç yılı (None ise ilk yıl)
+            end_year: Bitiş yılı (None ise son yıl)
+
+        Returns:
+            slice: Yıl sütunları dilimi (aralıkta yıl yoksa boş dilim)
+        """
+        return year_range_slice(self.years, start_year, end_year)
+
+    def value(self, country_name: str, year: int) -> Optional[float]:
+        """
+        Tek bir hücrenin değerini döndürür (yoksa None).
+        """
+        row = self.country_index.get(country_name, self.code_index.get(country_name))
+        col = self.year_index.get(int(year))
+        if row is None or col is None:
+            return None
+        value = self.values[row, col]
+        return None if np.isnan(value) else float(to_float64(value))
+
+    def to_melted(self, value_column: str = VALUE_COLUMN) -> pd.DataFrame:
+        """
+        Küpten eski kodların kullandığı uzun formattaki DataFrame'i türetir.
+
+        Satırlar yıl, yıl içinde ülke sırasına göredir; eksik hücreler atlanır.
+        Satır başına tekrarlanan metin sütunları (ülke, gösterge, yıl etiketi)
+        kategorik, değerler float32 ve yıllar int16 tutulur. LogValue gibi
+        türetilmiş sütunlar saklanmaz; gerektiğinde log_value() ile hesaplanır.
+
+        Returns:
+            pd.DataFrame: Tanımlayıcı sütunlar, YR_label, değer ve Year
+        """
+        n_countries, n_years = self.values.shape
+        # Yıl-öncelikli sıra: pd.melt'in ürettiği düzen
+        flat = self.values.T.reshape(-1)
+        present = ~np.isnan(flat)
+        row_idx = np.tile(np.arange(n_countries, dtype=np.int32), n_years)[present]
+        col_idx = np.repeat(np.arange(n_years, dtype=np.int32), n_countries)[present]
+
+        columns = {name: _compact_take(self.row_meta[name], row_idx) for name in self.row_meta.columns}
+        labels = pd.Series(self.year_labels, dtype=object)
+        if labels.notna().all() and labels.is_unique:
+            columns['YR_label'] = pd.Categorical.from_codes(col_idx, categories=labels.tolist())
+        else:
+            columns['YR_label'] = labels.to_numpy()[col_idx]
+        columns[value_column] = flat[present]
+        columns['Year'] = self.years.astype(_year_dtype(self.years))[col_idx]
+        return pd.DataFrame(columns)
+
+    def row_keys(self) -> List[str]:
+        """
+        Satırları dosyalar arasında eşleştirmek için anahtarlar: ülke kodu, kod yoksa ülke adı.
+        """
+        if 'Country Code' not in self.row_meta.columns:
+            return list(self.countries)
+        return [
+            code if isinstance(code, str) else name
+            for code, name in zip(self.row_meta['Country Code'], self.countries)
+        ]
+
+    def aligned_values(self, years: np.ndarray) -> np.ndarray:
+        """
+        Değer matrisini verilen (artan, bu küpün yıllarını içeren) yıl eksenine yerleştirir.
+
+        Args:
+            years: Hedef yıl ekseni
+
+        Returns:
+            np.ndarray: [ülke sayısı, len(years)] boyutlu matris, küpte olmayan yıllar NaN
+        """
+        if np.array_equal(years, self.years):
+            return self.values
+        aligned = np.full((len(self.countries), len(years)), np.nan, dtype=np.float32)
+        aligned[:, np.searchsorted(years, self.years)] = self.values
+        return aligned
+
+    def diff(self, other: 'CountryYearStore') -> Dict[str, List[str]]:
+        """
+        Bu küp ile yeni bir küp arasındaki ülke bazlı farkları bulur.
+
+        Satırlar ülke koduyla (yoksa adla) eşleştirilir ve tek bir vektörel
+        karşılaştırmayla değeri değişen satırlar bulunur. Adı değişen ülkenin
+        hem eski hem yeni adı 'changed' listesine girer.
+
+        Args:
+            other: Yeni küp
+
+        Returns:
+            Dict[str, List[str]]: 'added', 'removed' ve 'changed' ülke adı listeleri
+        """
+        old_keys = self.row_keys()
+        new_keys = other.row_keys()
+        old_pos = {key: i for i, key in enumerate(old_keys)}
+        new_pos = {key: i for i, key in enumerate(new_keys)}
+
+        added = [other.countries[i] for i, key in enumerate(new_keys) if key not in old_pos]
+        removed = [self.countries[i] for i, key in enumerate(old_keys) if key not in new_pos]
+
+        common = [key for key in new_keys if key in old_pos]
+        old_idx = np.array([old_pos[key] for key in common], dtype=np.int64)
+        new_idx = np.array([new_pos[key] for key in common], dtype=np.int64)
+
+        years = np.union1d(self.years, other.years)
+        old_values = self.aligned_values(years)[old_idx]
+        new_values = other.aligned_values(years)[new_idx]
+        same = (old_values == new_values) | (np.isnan(old_values) & np.isnan(new_values))
+        differs = ~same.all(axis=1)
+
+        changed = []
+        for i, j, value_changed in zip(old_idx, new_idx, differs):
+            old_name, new_name = self.countries[i], other.countries[j]
+            if value_changed or old_name != new_name:
+                changed.append(new_name)
+                if old_name != new_name:
+                    changed.append(old_name)
+
+        return {'added': added, 'removed': removed, 'changed': changed}
+
+    def to_frames(self) -> Dict[str, pd.DataFrame]:
+        """
+        Küpü anlık görüntü (snapshot) modülünün yazabileceği DataFrame'lere ayırır.
+        """
+        return {
+            'store_values': pd.DataFrame(self.values, columns=list(range(len(self.years)))),
+            'store_rows': self.row_meta,
+            'store_years': pd.DataFrame({'Year': self.years, 'YR_label': self.year_labels})
+        }
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame]) -> 'CountryYearStore':
+        """
+        to_frames ile ayrılmış küpü geri oluşturur.
+        """
+        rows = frames['store_rows']
+        years = frames['store_years']
+        return cls(
+            frames['store_values'].to_numpy(dtype=np.float32),
+            rows['Country Name'].tolist(),
+            years['Year'].to_numpy(),
+            row_meta=rows,
+            year_labels=years['YR_label'].tolist()
+        )
+
+
+class CountryStatsTable:
+    """
+    Ülke başına tanımlayıcı istatistikler, son değer ve trend tablosu.
+
+    Tüm satırlar için min, max, ortalama, medyan, standart sapma, son değer ve
+    son TREND_WINDOW değerin yüzde değişimi matris üzerinde tek geçişte
+    hesaplanır. İstekler yalnızca tablonun bir satırını okur. Eksik (NaN)
+    hücreler tüm hesaplardan dışlanır; sonuçlar satırın NaN'sız serisi
+    üzerinden hesaplananla aynıdır.
+
+    Matris kopyalanmaz: istatistikler float32 küp üzerinde float64
+    biriktiricilerle hesaplanır, ondalık gösterimi koruyan dönüşüm (to_float64)
+    yalnızca ülke başına min/max/medyan/son değer dizilerine ve yanıta yazılan
+    satıra uygulanır.
+    """
+
+    def __init__(self, values: np.ndarray, years: Iterable[int]):
+        """
+        CountryStatsTable başlatıcı
+
+        Args:
+            values: [ülke sayısı, yıl sayısı] boyutlu değer matrisi (eksikler NaN)
+            years: Sütun sırasına göre (artan) yıllar
+        """
+        values = np.atleast_2d(np.asarray(values))
+        if values.dtype != np.float32:
+            values = values.astype(np.float64)
+        self.values = values.view()
+        self.values.flags.writeable = False
+        self.years = np.asarray(years, dtype=np.int64)
+        self.present = ~np.isnan(self.values)
+        self.count = self.present.sum(axis=1)
+        # Zaman serisi anahtarları önceki sürümlerle aynı biçimde: "1.0"
+        self._year_keys = [str(float(year)) for year in self.years]
+        self._year_list = self.years.tolist()
+
+        with warnings.catch_warnings():
+            # Tümü eksik satırlar NaN üretir; uyarı beklenen durumdur
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self.min = to_float64(np.nanmin(values, axis=1))
+            self.max = to_float64(np.nanmax(values, axis=1))
+            self.median = to_float64(np.nanmedian(values, axis=1))
+            self.mean = np.nanmean(values, axis=1, dtype=np.float64)
+            self.std = np.nanstd(values, axis=1, ddof=1, dtype=np.float64)
+        self.std[self.count <= 1] = np.nan
+
+        # Trend yalnızca pencerenin ilk ve son değerinden hesaplanır: bu iki sütun genişletilir
+        rows = np.arange(len(values))
+        first_col, last_col, _ = trends.window_bounds(values, TREND_WINDOW)
+        ends = to_float64(np.column_stack([values[rows, first_col], values[rows, last_col]]))
+        self.last_value = np.where(self.count > 0, ends[:, 1], np.nan)
+        self.trend = trends.percent_change(ends, None)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def series(self, row: int) -> Tuple[List[int], List[float]]:
+        """
+        Satırın değeri olan yıllarını ve değerlerini liste olarak döndürür.
+        """
+        mask = self.present[row]
+        if self.count[row] == len(self.years):
+            return list(self._year_list), to_float_list(self.values[row])
+        return self.years[mask].tolist(), to_float_list(self.values[row][mask])
+
+    def stats(self, row: int) -> Dict[str, Any]:
+        """
+        Satırın istatistiklerini get_country_data() yanıtındaki biçimde döndürür.
+
+        Args:
+            row: Satır numarası
+
+        Returns:
+            Dict[str, Any]: min, max, mean, median, std, last_value, years, values, trend
+
+        Raises:
+            ValueError: Satırda hiç değer yoksa
+        """
+        if self.count[row] == 0:
+            raise ValueError("Seride değer bulunamadı")
+        years, values = self.series(row)
+        return {
+            'min': float(self.min[row]),
+            'max': float(self.max[row]),
+            'mean': float(self.mean[row]),
+            'median': float(self.median[row]),
+            'std': float(self.std[row]),
+            'last_value': float(self.last_value[row]),
+            'years': years,
+            'values': values,
+            'trend': float(self.trend[row])
+        }
+
+    def time_series(self, row: int) -> Dict[str, float]:
+        """
+        Satırın zaman serisini {"yıl": değer} sözlüğü olarak döndürür.
+        """
+        keys = self._year_keys
+        if self.count[row] != len(self.years):
+            keys = [key for key, present in zip(keys, self.present[row]) if present]
+        return dict(zip(keys, to_float_list(self.values[row][self.present[row]])))
+
+
+class RankIndex:
+    """
+    Her yıl (sütun) için ülkelerin önceden hesaplanmış sıralaması.
+
+    Yıl başına artan ve azalan kararlı argsort sırası, değeri olan ülke sayısı
+    ve her hücrenin sıra numarası ile yüzdelik dilimi bir kez hesaplanır.
+    İlk/son k ülke O(k) dilimle, bir ülkenin sırası ve yüzdeliği O(1) okunur.
+    Eşit değerli ülkeler satır (ülke adı) sırasını korur; eksik hücreler
+    sıralamaya girmez.
+    """
+
+    def __init__(self, values: np.ndarray):
+        """
+        RankIndex başlatıcı
+
+        Args:
+            values: [ülke sayısı, yıl sayısı] boyutlu değer matrisi (eksikler NaN)
+        """
+        by_year = np.asarray(values).T
+        present = ~np.isnan(by_year)
+        self.count = present.sum(axis=1)
+
+        # Kararlı argsort NaN'ları sona koyar; azalan sıra için değerler negatiflenir
+        self.ascending = np.argsort(by_year, axis=1, kind='stable').astype(np.int32)
+        self.descending = np.argsort(-by_year, axis=1, kind='stable').astype(np.int32)
+
+        # Sıra: kendisinden büyük değer sayısı + 1 (eşitler aynı sırayı paylaşır)
+        # Yüzdelik: değeri kendisinden küçük veya eşit ülkelerin oranı
+        sorted_values = np.take_along_axis(by_year, self.ascending, axis=1)
+        rank = np.zeros(by_year.shape, dtype=np.int32)
+        percentile = np.full(by_year.shape, np.nan)
+        for col in range(len(by_year)):
+            n = self.count[col]
+            if n == 0:
+                continue
+            column = sorted_values[col, :n]
+            rows = np.flatnonzero(present[col])
+            at_or_below = np.searchsorted(column, by_year[col, rows], side='right')
+            rank[col, rows] = n - at_or_below + 1
+            percentile[col, rows] = at_or_below / n * 100
+        self.rank = rank.T
+        self.percentile = percentile.T
+
+    def top(self, column: int, k: int, descending: bool = True) -> np.ndarray:
+        """
+        Yılın en yüksek (veya en düşük) k ülkesinin satır numaralarını döndürür.
+
+        Args:
+            column: Yıl sütunu
+            k: Ülke sayısı
+            descending: True ise en yüksekten, False ise en düşükten başlar
+
+        Returns:
+            np.ndarray: En fazla k satır numarası (görünüm)
+        """
+        order = self.descending if descending else self.ascending
+        return order[column, :min(max(k, 0), self.count[column])]
+
+
+class SimilarityIndex:
+    """
+    Tüm ülke çiftleri için önceden hesaplanmış benzerlik matrisleri.
+
+    Üç ölçü desteklenir:
+        - 'pearson': Değer serileri arasındaki Pearson korelasyonu
+        - 'pearson_diff': Yıllık farklar (değişimler) arasındaki Pearson korelasyonu
+        - 'euclidean': Satır başına z-normalize edilmiş seriler arasındaki
+          (ortak yıl sayısına bölünmüş) Öklid uzaklığı; küçük değer daha benzerdir
+
+    Her çift yalnızca ikisinin de değeri olan yıllar üzerinden karşılaştırılır;
+    maskeli matris çarpımlarıyla tüm çiftler tek geçişte hesaplanır. Ortak yıl
+    sayısı MIN_OVERLAP'ten azsa ölçü NaN'dır. Her ülke için komşular benzerlik
+    sırasıyla bir kez sıralanır; en benzer k ülke O(k) dilimle okunur.
+    """
+
+    METRICS = ('pearson', 'pearson_diff', 'euclidean')
+    MIN_OVERLAP = 3
+
+    def __init__(self, values: np.ndarray):
+        """
+        SimilarityIndex başlatıcı
+
+        Args:
+            values: [ülke sayısı, yıl sayısı] boyutlu değer matrisi (eksikler NaN)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        self.overlap = self._overlap(values)
+        self.matrices = {
+            'pearson': self._pearson(values),
+            'pearson_diff': self._pearson(np.diff(values, axis=1)),
+            'euclidean': self._normalized_distance(values)
+        }
+        self.order = {metric: self._neighbor_order(metric) for metric in self.METRICS}
+
+    @staticmethod
+    def _masked(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Değerleri (eksikler 0) ve değer maskesini (1/0) döndürür."""
+        present = ~np.isnan(values)
+        return np.where(present, values, 0.0), present.astype(np.float64)
+
+    def _overlap(self, values: np.ndarray) -> np.ndarray:
+        """Çift başına ortak yıl sayısı."""
+        _, mask = self._masked(values)
+        return (mask @ mask.T).astype(np.int32)
+
+    def _pearson(self, values: np.ndarray) -> np.ndarray:
+        """Çift başına, ortak yıllar üzerinden Pearson korelasyonu."""
+        x, mask = self._masked(values)
+        n = mask @ mask.T
+        # sum_x[i, j]: i'nin j ile ortak yıllardaki değerlerinin toplamı
+        sum_x = x @ mask.T
+        sum_xx = (x * x) @ mask.T
+        sum_xy = x @ x.T
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = sum_xy - sum_x * sum_x.T / n
+            var_x = sum_xx - sum_x * sum_x / n
+            var_y = var_x.T
+            corr = cov / np.sqrt(var_x * var_y)
+        corr[(n < self.MIN_OVERLAP) | ~np.isfinite(corr)] = np.nan
+        return np.clip(corr, -1.0, 1.0)
+
+    def _normalized_distance(self, values: np.ndarray) -> np.ndarray:
+        """Çift başına z-normalize serilerin ortak yıllar üzerinden ortalama karesel uzaklığının kökü."""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.nanmean(values, axis=1, keepdims=True)
+            std = np.nanstd(values, axis=1, keepdims=True)
+        # Sabit seriler yalnızca ortalamadan arındırılır
+        std[~(std > 0)] = 1.0
+        z, mask = self._masked((values - mean) / std)
+        n = mask @ mask.T
+        sum_zz = (z * z) @ mask.T
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            squared = (sum_zz + sum_zz.T - 2 * (z @ z.T)) / n
+        distance = np.sqrt(np.maximum(squared, 0.0))
+        # Yuvarlama hatası köşegende küçük pozitif değerler bırakır
+        np.fill_diagonal(distance, 0.0)
+        distance[n < self.MIN_OVERLAP] = np.nan
+        return distance
+
+    def _neighbor_order(self, metric: str) -> np.ndarray:
+        """Her satır için diğer ülkelerin en benzerden başlayan sırası (NaN'lar sonda)."""
+        matrix = self.matrices[metric].copy()
+        # Korelasyonlarda büyük, uzaklıkta küçük değer daha benzerdir
+        if metric != 'euclidean':
+            matrix = -matrix
+        np.fill_diagonal(matrix, np.nan)
+        return np.argsort(matrix, axis=1, kind='stable').astype(np.int32)
+
+    def most_similar(self, row: int, k: int, metric: str = 'pearson') -> np.ndarray:
+        """
+        Satıra en benzer k ülkenin satır numaralarını döndürür (kendisi ve ölçüsü NaN olanlar hariç).
+
+        Args:
+            row: Satır numarası
+            k: Ülke sayısı
+            metric: Benzerlik ölçüsü (METRICS)
+
+        Returns:
+            np.ndarray: En fazla k satır numarası
+
+        Raises:
+            ValueError: Ölçü geçersizse
+        """
+        if metric not in self.matrices:
+            raise ValueError(f"Geçersiz benzerlik ölçüsü: {metric} ({', '.join(self.METRICS)})")
+        neighbors = self.order[metric][row, :max(k, 0)]
+        return neighbors[~np.isnan(self.matrices[metric][row, neighbors]) & (neighbors != row)]
+
+
+class CountryYearStoreBuilder:
+    """
+    Satır gruplarını parça parça ekleyerek tek bir göstergenin küpünü oluşturur.
+
+    Akışlı (chunk) yüklemede her parçanın yalnızca float32 değerleri ve
+    tanımlayıcı sütunları saklanır; ham metin satırları parça işlendikten
+    sonra bırakılır. Eksik değer doldurmada kullanılan sütun ortalamaları,
+    toplu yüklemeyle aynı sonucu vermesi için float64 değerlerden tutulur.
+    """
+
+    def __init__(self, years: Iterable[int], year_labels: Optional[List[str]] = None):
+        """
+        CountryYearStoreBuilder başlatıcı
+
+        Args:
+            years: Değer sütunlarına karşılık gelen yıllar (artan sırada)
+            year_labels: Sütun başına kaynak yıl etiketleri
+        """
+        self.years = np.asarray(years, dtype=np.int64)
+        self.year_labels = year_labels
+        self.totals = np.zeros(len(self.years), dtype=np.float64)
+        self.counts = np.zeros(len(self.years), dtype=np.int64)
+        self._meta: List[pd.DataFrame] = []
+        self._blocks: List[np.ndarray] = []
+
+    def append(self, row_meta: pd.DataFrame, values: np.ndarray) -> None:
+        """
+        Bir satır grubunu ekler.
+
+        Args:
+            row_meta: 'Country Name' ve diğer tanımlayıcı sütunlar
+            values: [satır sayısı, yıl sayısı] boyutlu float64 değerler
+        """
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        self.totals += np.where(present, values, 0.0).sum(axis=0)
+        self.counts += present.sum(axis=0)
+        self._meta.append(row_meta.reset_index(drop=True))
+        self._blocks.append(values.astype(np.float32))
+
+    def _stacked(self) -> Tuple[pd.DataFrame, np.ndarray]:
+        """Eklenen parçaları tek bir çerçeve ve matriste birleştirir."""
+        if not self._blocks:
+            return pd.DataFrame({'Country Name': []}), np.empty((0, len(self.years)), dtype=np.float32)
+        if len(self._blocks) > 1:
+            self._meta = [pd.concat(self._meta, ignore_index=True)]
+            self._blocks = [np.concatenate(self._blocks, axis=0)]
+        return self._meta[0], self._blocks[0]
+
+    def column_means(self) -> np.ndarray:
+        """
+        Eklenen değerlerin sütun ortalamalarını döndürür (değeri olmayan sütunlar NaN).
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.counts > 0, self.totals / np.maximum(self.counts, 1), np.nan)
+
+    def fill_missing(self, column_values: np.ndarray) -> None:
+        """
+        Eksik hücreleri sütun başına verilen değerlerle doldurur (NaN değerler atlanır).
+        Doldurulan hücreler sonraki ortalamalara katılır.
+
+        Args:
+            column_values: Yıl sütunu başına doldurma değerleri
+        """
+        _, values = self._stacked()
+        column_values = np.asarray(column_values, dtype=np.float64)
+        missing = np.isnan(values) & ~np.isnan(column_values)[None, :]
+        if not missing.any():
+            return
+        filled_counts = missing.sum(axis=0)
+        self.totals += np.where(filled_counts > 0, column_values * filled_counts, 0.0)
+        self.counts += filled_counts
+        self._blocks = [np.where(missing, column_values.astype(np.float32)[None, :], values)]
+
+    def build(self) -> CountryYearStore:
+        """
+        Küpü oluşturur.
+
+        Aynı ülke birden fazla kez geçerse son satırın değerleri kullanılır;
+        hiç değeri olmayan ülkeler ve yıllar küpe alınmaz.
+
+        Returns:
+            CountryYearStore: Oluşturulan küp
+        """
+        meta, values = self._stacked()
+
+        names = meta['Country Name']
+        keep = (~names.duplicated(keep='last')).to_numpy() & ~np.isnan(values).all(axis=1)
+        meta, values = meta[keep], values[keep]
+
+        order = np.argsort(meta['Country Name'].to_numpy(), kind='stable')
+        meta, values = meta.iloc[order], values[order]
+
+        year_mask = ~np.isnan(values).all(axis=0)
+        labels = self.year_labels if self.year_labels is not None else [None] * len(self.years)
+        return CountryYearStore(
+            values[:, year_mask],
+            meta['Country Name'].tolist(),
+            self.years[year_mask],
+            row_meta=meta,
+            year_labels=[label for label, keep_year in zip(labels, year_mask) if keep_year]
+        )
@@ -4,6 +4,8 @@ from typing import Dict, List, Any, Optional, Tuple
 import json
 import os
 
+from app.utils import trends
+
 def calculate_trend(values: List[float], window_size: int = 5) -> float:
     """
     Zaman serisi verilerinde trend hesaplar (son n yıl ile ilk n yıl karşılaştırması)
@@ -18,16 +20,7 @@ def calculate_trend(values: List[float], window_size: int = 5) -> float:
     if len(values) < window_size * 2:
         return 0.0
     
-    first_window = values[:window_size]
-    last_window = values[-window_size:]
-    
-    first_avg = sum(first_window) / window_size
-    last_avg = sum(last_window) / window_size
-    
-    if first_avg == 0:
-        return 0.0
-        
-    return ((last_avg - first_avg) / first_avg) * 100
+    return float(trends.window_average_change(values, window_size)[0])
 
 def interpolate_missing_years(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
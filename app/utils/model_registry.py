@@ -0,0 +1,198 @@
+"""
+Model Registry Modülü - Eğitilmiş modellerin sürümlü disk kaydı
+
+Eğitilmiş modeller ülke, model türü, hiperparametreler ve eğitim verisinin
+özeti (dataset hash) ile anahtarlanarak diske yazılır. Aynı veriyle aynı
+model daha önce eğitilmişse - başka bir worker süreci tarafından ya da
+yeniden başlatmadan önce - yeniden eğitilmez, kayıttan yüklenir. Veri veya
+hiperparametreler değişince anahtar da değişir; eski sürümler ayrı dosyalarda
+kalır ve hiçbir zaman yanlış veriyle eğitilmiş bir model döndürülmez.
+
+Dosyalar sıkıştırılmadan joblib ile yazılır; yükleme ilk kullanımda yapılır
+ve büyük NumPy dizileri (ağaç düğümleri, katsayılar) mümkün olduğunda bellek
+eşlemeli (mmap) okunur. Yazma önce aynı dizinde geçici bir dosyaya yapılır,
+ardından os.replace ile yerine taşınır; eşzamanlı okuyucular yarım yazılmış
+bir dosyayı asla görmez.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Dosya düzeni değiştiğinde artırılır; eski kayıtlar anahtar eşleşmediği için kullanılmaz
+REGISTRY_FORMAT = 1
+
+# Kayıt dizinini ortam değişkeni ile değiştirmeye izin ver
+REGISTRY_DIR_ENV = 'RENEWABLE_MODEL_DIR'
+
+_UNSAFE = re.compile(r'[^0-9A-Za-z._-]+')
+
+
+def registry_dir(data_path: Optional[str]) -> str:
+    """
+    Model kayıt dizinini döndürür.
+
+    Args:
+        data_path: Kaynak CSV dosyasının yolu
+
+    Returns:
+        str: Ortam değişkeni verilmişse o dizin, aksi halde CSV'nin yanındaki .models
+    """
+    configured = os.environ.get(REGISTRY_DIR_ENV)
+    if configured:
+        return configured
+    base = os.path.dirname(os.path.abspath(data_path)) if data_path else os.getcwd()
+    return os.path.join(base, '.models')
+
+
+def dataset_hash(years, values) -> str:
+    """
+    Bir ülkenin eğitim verisinin (yıllar ve değerler) özetini hesaplar.
+
+    Args:
+        years: Yıllar
+        values: Değerler (eksik değerler NaN)
+
+    Returns:
+        str: SHA-256 özeti (onaltılık)
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(years, dtype=np.int64).tobytes())
+    digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def entry_key(country: str, model_type: str, params: Dict[str, Any], data_hash: str) -> str:
+    """
+    Kayıt anahtarını hesaplar.
+
+    Args:
+        country: Ülke adı
+        model_type: Model türü (ör. "RandomForest")
+        params: Hiperparametreler (JSON'a dönüştürülebilir olmalı)
+        data_hash: Eğitim verisinin özeti
+
+    Returns:
+        str: SHA-256 özeti (onaltılık)
+    """
+    payload = json.dumps({
+        'format': REGISTRY_FORMAT,
+        'country': country,
+        'model_type': model_type,
+        'params': params,
+        'data_hash': data_hash
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ModelRegistry:
+    """
+    Eğitilmiş modellerin diskteki sürümlü kaydı.
+
+    Her kayıt ülke başına bir alt dizinde "<model türü>-<anahtar>.joblib"
+    dosyasıdır ve modeli, eğitim sonucunu (metrikler) ve anahtar bilgilerini
+    birlikte tutar.
+    """
+
+    def __init__(self, root: str, mmap_mode: Optional[str] = 'r'):
+        """
+        ModelRegistry başlatıcı
+
+        Args:
+            root: Kayıt dizini (ilk yazmada oluşturulur)
+            mmap_mode: joblib.load için bellek eşleme kipi (None ise diziler belleğe kopyalanır)
+        """
+        self.root = root
+        self.mmap_mode = mmap_mode
+
+    def path(self, country: str, model_type: str, params: Dict[str, Any], data_hash: str) -> str:
+        """
+        Kaydın dosya yolunu döndürür.
+
+        Returns:
+            str: .joblib dosya yolu
+        """
+        key = entry_key(country, model_type, params, data_hash)
+        return os.path.join(self.root, _UNSAFE.sub('_', country) or '_',
+                            f"{_UNSAFE.sub('_', model_type)}-{key[:24]}.joblib")
+
+    def get(self, country: str, model_type: str, params: Dict[str, Any],
+            data_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Kayıtlı modeli yükler.
+
+        Args:
+            country: Ülke adı
+            model_type: Model türü
+            params: Hiperparametreler
+            data_hash: Eğitim verisinin özeti
+
+        Returns:
+            Optional[Dict[str, Any]]: {'model', 'result', 'meta'} kaydı; yoksa veya okunamazsa None
+        """
+        path = self.path(country, model_type, params, data_hash)
+        if not os.path.isfile(path):
+            return None
+        try:
+            import joblib
+            entry = joblib.load(path, mmap_mode=self.mmap_mode)
+        except Exception as e:
+            logger.warning(f"Kayıtlı model okunamadı, yeniden eğitilecek ({path}): {str(e)}")
+            return None
+        if not isinstance(entry, dict) or entry.get('meta', {}).get('key') != entry_key(
+                country, model_type, params, data_hash):
+            logger.warning(f"Kayıtlı model anahtarı eşleşmiyor, yok sayıldı: {path}")
+            return None
+        logger.debug(f"{country} modeli kayıttan yüklendi: {path}")
+        return entry
+
+    def put(self, country: str, model_type: str, params: Dict[str, Any], data_hash: str,
+            model: Any, result: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Modeli atomik olarak kaydeder; aynı anahtarlı kayıt varsa üzerine yazılır.
+
+        Args:
+            country: Ülke adı
+            model_type: Model türü
+            params: Hiperparametreler
+            data_hash: Eğitim verisinin özeti
+            model: Eğitilmiş model (pickle edilebilir olmalı)
+            result: Eğitim sonucu ve metrikler
+
+        Returns:
+            str: Yazılan dosyanın yolu
+        """
+        import joblib
+
+        path = self.path(country, model_type, params, data_hash)
+        entry = {
+            'model': model,
+            'result': result or {},
+            'meta': {
+                'key': entry_key(country, model_type, params, data_hash),
+                'country': country,
+                'model_type': model_type,
+                'params': params,
+                'data_hash': data_hash
+            }
+        }
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as handle:
+                joblib.dump(entry, handle)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
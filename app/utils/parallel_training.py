@@ -0,0 +1,166 @@
+"""
+Parallel Training Modülü - Ülke başına model eğitimini süreç havuzuna dağıtır
+
+Ülke modelleri birbirinden bağımsızdır ve her biri küçük bir veri çerçevesi
+üzerinde eğitilir; bu nedenle toplu eğitim tek süreçte sırayla yapmak
+yerine ProcessPoolExecutor ile çekirdeklere dağıtılır. Girdi olarak yalnızca
+ülkenin küçük veri çerçevesi, çıktı olarak eğitilmiş model gönderilir; iş
+fonksiyonu ve döndürdüğü model modül düzeyinde tanımlı (pickle edilebilir)
+olmalıdır.
+
+Havuza aynı anda en fazla worker sayısı kadar görev verilir; böylece her
+görevin süresi gerçekten çalışmaya başladığı andan ölçülür. Süresi dolan
+görev başarısız sayılır, takılan worker'lar kalan görevler bitince
+sonlandırılır ve havuz yeniden kurulur.
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Varsayılan worker sayısını ortam değişkeni ile değiştirmeye izin ver
+WORKERS_ENV = 'RENEWABLE_TRAIN_WORKERS'
+
+# Tek bir görevin (ülke modelinin) varsayılan süre sınırı (saniye)
+DEFAULT_TIMEOUT = 120.0
+
+# İlerleme bu kadar görevde bir (toplamın onda biri) loglanır
+PROGRESS_STEPS = 10
+
+ProgressCallback = Callable[[int, int, str, Optional[str]], None]
+
+
+def default_workers() -> int:
+    """
+    Varsayılan worker sayısını döndürür.
+
+    Returns:
+        int: Ortam değişkeni verilmişse o değer, aksi halde çekirdek sayısı
+    """
+    configured = os.environ.get(WORKERS_ENV)
+    if configured:
+        try:
+            return max(1, int(configured))
+        except ValueError:
+            logger.warning(f"Geçersiz {WORKERS_ENV} değeri yok sayıldı: {configured}")
+    return max(1, os.cpu_count() or 1)
+
+
+def _terminate(executor: ProcessPoolExecutor) -> None:
+    """Süresi dolmuş görevleri çalıştıran worker süreçlerini sonlandırır ve havuzu kapatır."""
+    # ProcessPoolExecutor tek bir görevi iptal etmeyi desteklemez; süreçler doğrudan sonlandırılır
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        if process.is_alive():
+            process.terminate()
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_parallel(func: Callable[..., Any], tasks: Dict[str, Tuple],
+                 workers: Optional[int] = None, timeout: Optional[float] = DEFAULT_TIMEOUT,
+                 progress: Optional[ProgressCallback] = None) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Görevleri süreç havuzunda çalıştırır.
+
+    Args:
+        func: Modül düzeyinde tanımlı iş fonksiyonu
+        tasks: Görev anahtarı (ülke adı) -> func argümanları
+        workers: Worker süreç sayısı (None ise default_workers(); default_workers() ve
+                 görev sayısıyla sınırlanır. 1 ve süre sınırı yoksa görevler havuz
+                 kurulmadan bu süreçte çalıştırılır)
+        timeout: Görev başına süre sınırı (saniye, None ise sınırsız)
+        progress: Her görev bittiğinde (biten, toplam, anahtar, hata veya None) ile çağrılır
+
+    Returns:
+        Tuple[Dict[str, Any], Dict[str, str]]: (anahtar -> sonuç, anahtar -> hata mesajı)
+    """
+    results: Dict[str, Any] = {}
+    failures: Dict[str, str] = {}
+    total = len(tasks)
+    if total == 0:
+        return results, failures
+    # İstekten gelen worker sayısı çekirdek sayısını (veya yapılandırılan değeri) aşamaz
+    workers = max(1, min(workers or default_workers(), default_workers(), total))
+    log_every = max(1, total // PROGRESS_STEPS)
+
+    def finish(key: str, value: Any = None, error: Optional[str] = None) -> None:
+        if error is None:
+            results[key] = value
+        else:
+            failures[key] = error
+            logger.warning(f"{key} görevi başarısız: {error}")
+        done = len(results) + len(failures)
+        if done % log_every == 0 or done == total:
+            logger.info(f"Toplu eğitim: {done}/{total} tamamlandı ({len(failures)} başarısız)")
+        if progress is not None:
+            try:
+                progress(done, total, key, error)
+            except Exception as e:
+                logger.error(f"İlerleme bildirimi sırasında hata: {str(e)}")
+
+    if workers == 1 and timeout is None:
+        for key, args in tasks.items():
+            try:
+                finish(key, func(*args))
+            except Exception as e:
+                finish(key, error=str(e))
+        return results, failures
+
+    pending = iter(tasks.items())
+    executor = ProcessPoolExecutor(max_workers=workers)
+    running: Dict[Any, Tuple[str, Optional[float]]] = {}
+    stalled = set()
+    exhausted = False
+    try:
+        while True:
+            # Takılan worker'lar varsa yeni görev verilmez; kalanlar bitince havuz yeniden kurulur
+            if stalled and not running:
+                logger.warning(f"Süresi dolan {len(stalled)} görev sonlandırılıyor, havuz yeniden kuruluyor")
+                _terminate(executor)
+                stalled.clear()
+                executor = ProcessPoolExecutor(max_workers=workers)
+
+            while not stalled and not exhausted and len(running) < workers:
+                item = next(pending, None)
+                if item is None:
+                    exhausted = True
+                    break
+                key, args = item
+                deadline = time.monotonic() + timeout if timeout else None
+                running[executor.submit(func, *args)] = (key, deadline)
+
+            if not running:
+                break
+
+            deadlines = [deadline for _, deadline in running.values() if deadline is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            done, _ = wait(list(running), timeout=wait_for, return_when=FIRST_COMPLETED)
+
+            now = time.monotonic()
+            for future in list(running):
+                key, deadline = running[future]
+                if future in done:
+                    del running[future]
+                    try:
+                        finish(key, future.result())
+                    except BrokenProcessPool as e:
+                        # Worker beklenmedik biçimde çöktü; havuz kullanılamaz
+                        finish(key, error=f"Worker süreci sonlandı: {str(e)}")
+                        stalled.add(future)
+                    except Exception as e:
+                        finish(key, error=str(e))
+                elif deadline is not None and now >= deadline:
+                    del running[future]
+                    stalled.add(future)
+                    finish(key, error=f"Zaman aşımı ({timeout:g} sn)")
+    finally:
+        if stalled:
+            _terminate(executor)
+        else:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return results, failures
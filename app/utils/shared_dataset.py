@@ -0,0 +1,124 @@
+"""
+Shared Dataset Modülü - Worker'lar arasında paylaşılan bellek eşlemeli veri seti
+
+Bu modül gösterge küplerinin float32 değer matrislerini ayrı .npy dosyalarına
+yazar ve worker'ların bu dosyaları np.load(mmap_mode='r') ile salt okunur
+olarak eşlemesini sağlar. Matrisler işletim sisteminin sayfa önbelleğinde bir
+kez bulunur; worker sayısı arttıkça her worker yalnızca küçük satır/yıl
+tanımlayıcılarını kendi belleğinde tutar.
+
+Veri seti dizini, anlık görüntüler gibi kaynak CSV'nin içerik özeti ve veri
+işleme hattının sürümü ile anahtarlanır. Dizin önce geçici bir adla yazılır,
+ardından tek bir rename ile yayınlanır; yarım yazılmış bir dizine asla
+bağlanılmaz.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.utils import snapshot
+from app.utils.country_store import CountryYearStore
+
+logger = logging.getLogger(__name__)
+
+# Dizin düzeni değiştiğinde artırılır
+SHARED_FORMAT = 1
+
+META_FILE = 'meta.npz'
+
+
+def dataset_dir(data_path: str, content_hash: str, pipeline_version: str) -> str:
+    """
+    Verilen CSV için paylaşılan veri seti dizininin yolunu oluşturur.
+
+    Args:
+        data_path: Kaynak CSV dosyasının yolu
+        content_hash: CSV içeriğinin özeti
+        pipeline_version: Veri işleme hattının sürümü
+
+    Returns:
+        str: Dizin yolu (anlık görüntü dizininde, .shared uzantılı)
+    """
+    base = os.path.splitext(snapshot.snapshot_path(data_path, content_hash, pipeline_version))[0]
+    return f"{base}.s{SHARED_FORMAT}.shared"
+
+
+def publish(directory: str, stores: Dict[str, CountryYearStore]) -> bool:
+    """
+    Gösterge küplerini paylaşılan veri seti dizinine yazar.
+
+    Aynı dizini başka bir süreç önce yayınladıysa bu sürecin yazdıkları silinir.
+
+    Args:
+        directory: Hedef dizin
+        stores: Gösterge kodu -> küp
+
+    Returns:
+        bool: Dizin bu çağrıyla yayınlandıysa True, zaten varsa False
+    """
+    if os.path.isdir(directory):
+        return False
+
+    parent = os.path.dirname(os.path.abspath(directory))
+    os.makedirs(parent, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=parent, prefix='.tmp-shared-')
+    try:
+        frames = {'indicators': pd.DataFrame({'Series Code': list(stores)})}
+        for i, store in enumerate(stores.values()):
+            np.save(os.path.join(tmp_dir, f"values_{i}.npy"), store.values)
+            frames[f"i{i}_rows"] = store.row_meta
+            frames[f"i{i}_years"] = pd.DataFrame({'Year': store.years, 'YR_label': store.year_labels})
+        snapshot.save_frames(os.path.join(tmp_dir, META_FILE), frames, meta={'format': SHARED_FORMAT})
+
+        try:
+            os.rename(tmp_dir, directory)
+        except OSError:
+            # Başka bir worker aynı veri setini önce yayınladı
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            return False
+        return True
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+
+def attach(directory: str) -> Optional[Dict[str, CountryYearStore]]:
+    """
+    Paylaşılan veri setine salt okunur bağlanır.
+
+    Değer matrisleri kopyalanmaz; küpler dosyaların bellek eşlemeleri üzerine kurulur.
+
+    Args:
+        directory: Veri seti dizini
+
+    Returns:
+        Optional[Dict[str, CountryYearStore]]: Gösterge kodu -> küp, dizin yoksa None
+    """
+    loaded = snapshot.load_frames(os.path.join(directory, META_FILE))
+    if loaded is None:
+        return None
+
+    frames, meta = loaded
+    if meta.get('format') != SHARED_FORMAT:
+        logger.info(f"Paylaşılan veri seti formatı uyumsuz, yok sayılıyor: {directory}")
+        return None
+
+    stores = {}
+    for i, code in enumerate(frames['indicators']['Series Code'].tolist()):
+        values = np.load(os.path.join(directory, f"values_{i}.npy"), mmap_mode='r')
+        rows = frames[f"i{i}_rows"]
+        years = frames[f"i{i}_years"]
+        stores[code] = CountryYearStore(
+            values,
+            rows['Country Name'].tolist(),
+            years['Year'].to_numpy(),
+            row_meta=rows,
+            year_labels=years['YR_label'].tolist()
+        )
+    return stores
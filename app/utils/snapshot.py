@@ -0,0 +1,179 @@
+"""
+Snapshot Modülü - Ön işlenmiş verilerin ikili anlık görüntüleri
+
+Bu modül temizlenmiş geniş veri çerçevesini ve uzun formattaki veriyi
+sıkıştırılmamış, sütun bazlı bir .npz dosyasına yazar ve geri okur.
+Anlık görüntüler kaynak CSV dosyasının içerik özeti (SHA-256) ve veri
+işleme hattının sürümü ile anahtarlanır; CSV değişmediği sürece worker'lar
+CSV ayrıştırma ve ön işleme adımlarını atlayarak doğrudan buradan başlar.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Dosya düzeni değiştiğinde artırılır (veri işleme hattının sürümünden bağımsızdır)
+SNAPSHOT_FORMAT = 1
+
+# Anlık görüntülerin yazılacağı dizini ortam değişkeni ile değiştirmeye izin ver
+SNAPSHOT_DIR_ENV = 'RENEWABLE_SNAPSHOT_DIR'
+
+
+def file_content_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Dosyanın içeriğinden SHA-256 özeti hesaplar.
+
+    Args:
+        path: Dosya yolu
+        chunk_size: Tek seferde okunacak bayt sayısı
+
+    Returns:
+        str: Onaltılık (hex) özet
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as handle:
+        for block in iter(lambda: handle.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def snapshot_path(data_path: str, content_hash: str, pipeline_version: str,
+                  cache_dir: Optional[str] = None) -> str:
+    """
+    Verilen CSV dosyası için anlık görüntü dosyasının yolunu oluşturur.
+
+    Args:
+        data_path: Kaynak CSV dosyasının yolu
+        content_hash: CSV içeriğinin özeti
+        pipeline_version: Veri işleme hattının sürümü
+        cache_dir: Anlık görüntü dizini (None ise ortam değişkeni veya CSV'nin yanındaki .snapshots)
+
+    Returns:
+        str: .npz dosyasının yolu
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(SNAPSHOT_DIR_ENV) or os.path.join(
+            os.path.dirname(os.path.abspath(data_path)), '.snapshots'
+        )
+    base_name = os.path.splitext(os.path.basename(data_path))[0]
+    file_name = f"{base_name}.{content_hash[:16]}.p{pipeline_version}.f{SNAPSHOT_FORMAT}.npz"
+    return os.path.join(cache_dir, file_name)
+
+
+def _encode_column(series: pd.Series) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Bir sütunu pickle gerektirmeyen numpy dizilerine dönüştürür.
+
+    Sayısal sütunlar olduğu gibi saklanır; metin sütunları tekrar eden
+    değerleri bir kez yazmak için kategori listesi + int32 kod dizisi olarak
+    saklanır (-1 kodu boş değeri gösterir).
+    """
+    if series.dtype.kind in 'biufcmM':
+        return {'values': series.to_numpy()}, {'kind': 'numeric'}
+
+    codes, categories = pd.factorize(series, use_na_sentinel=True)
+    return {
+        'codes': codes.astype(np.int32),
+        'categories': np.asarray(categories, dtype=str)
+    }, {'kind': 'object'}
+
+
+def _decode_column(arrays: Dict[str, np.ndarray], info: Dict[str, Any]) -> np.ndarray:
+    """
+    _encode_column ile yazılmış sütunu geri oluşturur.
+    """
+    if info['kind'] == 'numeric':
+        return arrays['values']
+
+    codes = arrays['codes']
+    # Sona eklenen NaN, -1 kodlarının boş değere çözülmesini sağlar
+    lookup = np.append(arrays['categories'].astype(object), np.nan)
+    return lookup[codes]
+
+
+def save_frames(path: str, frames: Dict[str, pd.DataFrame], meta: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Veri çerçevelerini tek bir .npz dosyasına atomik olarak yazar.
+
+    Dosya önce aynı dizinde geçici bir ada yazılır, ardından os.replace ile
+    yerine taşınır. Böylece aynı anda başlayan worker'lar yarım yazılmış bir
+    dosyayı asla okumaz.
+
+    Args:
+        path: Hedef .npz dosyası
+        frames: Ad -> DataFrame sözlüğü
+        meta: Dosyaya eklenecek ek bilgiler (JSON'a dönüştürülebilir olmalı)
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    layout: Dict[str, Any] = {'format': SNAPSHOT_FORMAT, 'meta': meta or {}, 'frames': {}}
+
+    for frame_idx, (name, frame) in enumerate(frames.items()):
+        prefix = f"f{frame_idx}"
+        columns = []
+        arrays[f"{prefix}_index"] = frame.index.to_numpy()
+        for col_idx, column in enumerate(frame.columns):
+            encoded, info = _encode_column(frame[column])
+            for part, array in encoded.items():
+                arrays[f"{prefix}_c{col_idx}_{part}"] = array
+            info['name'] = column
+            columns.append(info)
+        layout['frames'][name] = {'prefix': prefix, 'columns': columns}
+
+    arrays['layout'] = np.array(json.dumps(layout))
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as handle:
+            np.savez(handle, **arrays)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_frames(path: str) -> Optional[Tuple[Dict[str, pd.DataFrame], Dict[str, Any]]]:
+    """
+    save_frames ile yazılmış bir .npz dosyasını okur.
+
+    Args:
+        path: .npz dosyasının yolu
+
+    Returns:
+        Optional[Tuple]: (Ad -> DataFrame sözlüğü, meta bilgileri). Dosya yoksa
+        veya farklı bir formatta yazılmışsa None
+    """
+    if not os.path.exists(path):
+        return None
+
+    with np.load(path, allow_pickle=False) as archive:
+        layout = json.loads(str(archive['layout']))
+        if layout.get('format') != SNAPSHOT_FORMAT:
+            logger.info(f"Anlık görüntü formatı uyumsuz, yok sayılıyor: {path}")
+            return None
+
+        frames = {}
+        for name, spec in layout['frames'].items():
+            prefix = spec['prefix']
+            data = {}
+            for col_idx, info in enumerate(spec['columns']):
+                arrays = {
+                    part: archive[f"{prefix}_c{col_idx}_{part}"]
+                    for part in ('values', 'codes', 'categories')
+                    if f"{prefix}_c{col_idx}_{part}" in archive.files
+                }
+                data[info['name']] = _decode_column(arrays, info)
+            columns = [info['name'] for info in spec['columns']]
+            frames[name] = pd.DataFrame(data, columns=columns, index=archive[f"{prefix}_index"])
+
+    return frames, layout['meta']
@@ -0,0 +1,195 @@
+"""
+Trends Modülü - Ülke × yıl matrisi üzerinde vektörel trend hesapları
+
+Bu modül yüzde değişim, yıllık bileşik büyüme oranı (CAGR), en küçük
+kareler eğimi ve pencere ortalamalarını tüm satırlar (ülkeler) için tek
+geçişte hesaplar. Girdi [ülke sayısı, yıl sayısı] boyutlu bir matristir;
+eksik hücreler NaN'dır ve her satırda yalnızca değeri olan yıllar kullanılır.
+Tek bir seri için matris tek satırlı olarak verilir (np.atleast_2d).
+
+DataService, DataViewModel ve yardımcı fonksiyonlar trendleri buradan alır;
+böylece aynı tanım her yerde aynı sonucu verir.
+"""
+
+from typing import Dict, Iterable, Optional
+
+import numpy as np
+
+# Varsayılan trend penceresi (son kaç değer)
+DEFAULT_WINDOW = 5
+
+
+def _as_matrix(values) -> np.ndarray:
+    """Girdiyi float64, en az iki boyutlu bir matrise çevirir."""
+    return np.atleast_2d(np.asarray(values, dtype=np.float64))
+
+
+def window_bounds(values, window: Optional[int] = DEFAULT_WINDOW):
+    """
+    Her satırın son `window` değerinin ilk ve son sütununu bulur.
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        window: Pencere boyutu (None ise satırın tüm değerleri)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (ilk sütun, son sütun, satırdaki değer sayısı)
+    """
+    # Yalnızca değer maskesi gerekir; float32 matris genişletilmeden kullanılır
+    present = ~np.isnan(np.atleast_2d(values))
+    count = present.sum(axis=1)
+    # Sağdan itibaren değeri olan hücre sayısı: son değer 1, pencerenin başı min(window, n)
+    from_right = np.cumsum(present[:, ::-1], axis=1)[:, ::-1]
+    size = count if window is None else np.minimum(count, window)
+    first_col = np.argmax(present & (from_right == size[:, np.newaxis]), axis=1)
+    last_col = np.argmax(present & (from_right == 1), axis=1)
+    return first_col, last_col, count
+
+
+def percent_change(values, window: Optional[int] = DEFAULT_WINDOW, zero_start: float = 100.0) -> np.ndarray:
+    """
+    Son `window` değerin ilk ve sonuncusu arasındaki yüzde değişim.
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        window: Pencere boyutu (None ise ilk ve son değer)
+        zero_start: Pencere 0 ile başlayıp pozitif bir değerle bitiyorsa dönecek değer
+                    (0 ile başlayıp pozitif bitmeyen satırlar 0 döner)
+
+    Returns:
+        np.ndarray: Satır başına yüzde değişim; 1 veya daha az değeri olan satırlar 0
+    """
+    values = _as_matrix(values)
+    first_col, last_col, count = window_bounds(values, window)
+    rows = np.arange(len(values))
+    first = values[rows, first_col]
+    last = values[rows, last_col]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (last - first) / first * 100
+    from_zero = np.where(last > 0, zero_start, 0.0)
+    change = np.where(first == 0, from_zero, change)
+    change[count <= 1] = 0.0
+    return change
+
+
+def cagr(values, years: Iterable[int]) -> np.ndarray:
+    """
+    İlk ve son değer arasındaki yıllık bileşik büyüme oranı (yüzde).
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        years: Sütun sırasına göre yıllar
+
+    Returns:
+        np.ndarray: Satır başına CAGR; ilk değer pozitif değilse veya tek yıl varsa NaN
+    """
+    values = _as_matrix(values)
+    years = np.asarray(years, dtype=np.float64)
+    first_col, last_col, count = window_bounds(values, None)
+    rows = np.arange(len(values))
+    first = values[rows, first_col]
+    last = values[rows, last_col]
+    span = years[last_col] - years[first_col]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth = (np.power(last / first, 1.0 / span) - 1) * 100
+    growth[(count <= 1) | (span <= 0) | ~(first > 0) | (last < 0)] = np.nan
+    return growth
+
+
+def ols_slope(values, years: Iterable[int]) -> np.ndarray:
+    """
+    Değerlerin yıla göre en küçük kareler doğrusunun eğimi (birim / yıl).
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        years: Sütun sırasına göre yıllar
+
+    Returns:
+        np.ndarray: Satır başına eğim; ikiden az değeri olan satırlar NaN
+    """
+    values = _as_matrix(values)
+    present = ~np.isnan(values)
+    count = present.sum(axis=1)
+    x = np.where(present, np.asarray(years, dtype=np.float64), 0.0)
+    y = np.where(present, values, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_mean = x.sum(axis=1) / count
+        y_mean = y.sum(axis=1) / count
+        dx = np.where(present, x - x_mean[:, np.newaxis], 0.0)
+        dy = np.where(present, y - y_mean[:, np.newaxis], 0.0)
+        slope = (dx * dy).sum(axis=1) / (dx * dx).sum(axis=1)
+    slope[count < 2] = np.nan
+    return slope
+
+
+def window_average(values, window: int = DEFAULT_WINDOW, last: bool = True) -> np.ndarray:
+    """
+    Her satırın son (veya ilk) `window` değerinin ortalaması.
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        window: Pencere boyutu
+        last: True ise son, False ise ilk `window` değer
+
+    Returns:
+        np.ndarray: Satır başına ortalama (değeri olmayan satırlar NaN)
+    """
+    values = _as_matrix(values)
+    present = ~np.isnan(values)
+    order = present[:, ::-1] if last else present
+    position = np.cumsum(order, axis=1)
+    if last:
+        position = position[:, ::-1]
+    in_window = present & (position <= window)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(in_window, values, 0.0).sum(axis=1) / in_window.sum(axis=1)
+
+
+def window_average_change(values, window: int = DEFAULT_WINDOW) -> np.ndarray:
+    """
+    İlk `window` değerin ortalamasından son `window` değerin ortalamasına yüzde değişim.
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        window: Pencere boyutu
+
+    Returns:
+        np.ndarray: Satır başına yüzde değişim; 2 × window'dan az değeri olan
+                    veya ilk pencere ortalaması 0 olan satırlar 0
+    """
+    values = _as_matrix(values)
+    count = (~np.isnan(values)).sum(axis=1)
+    first_avg = window_average(values, window, last=False)
+    last_avg = window_average(values, window, last=True)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (last_avg - first_avg) / first_avg * 100
+    change[(count < window * 2) | (first_avg == 0)] = 0.0
+    return change
+
+
+def trend_table(values, years: Iterable[int], window: int = DEFAULT_WINDOW) -> Dict[str, np.ndarray]:
+    """
+    Tüm satırlar için trend ölçülerini birlikte hesaplar.
+
+    Args:
+        values: [satır, sütun] matris (eksikler NaN)
+        years: Sütun sırasına göre yıllar
+        window: Pencereli ölçüler için pencere boyutu
+
+    Returns:
+        Dict[str, np.ndarray]: percent_change, cagr, slope, window_average ve
+                               window_change dizileri (satır sırasıyla)
+    """
+    values = _as_matrix(values)
+    return {
+        'percent_change': percent_change(values, window),
+        'cagr': cagr(values, years),
+        'slope': ols_slope(values, years),
+        'window_average': window_average(values, window),
+        'window_change': window_average_change(values, window)
+    }
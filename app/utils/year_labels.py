@@ -0,0 +1,90 @@
+"""
+Year Labels Modülü - Yıl sütun etiketlerinin sayısal yıla dönüştürülmesi
+
+Geniş formattaki veri dosyasında yıllar 'YRbir', 'YRiki', ... gibi Türkçe
+sayı sözcükleriyle veya 'YR1990', 'Y1990', '1990' gibi rakamlı etiketlerle
+gelir. Uzun formatta her etiket ülke sayısı kadar tekrarlandığı için
+etiketler satır başına değil, farklı etiket başına bir kez çözülür ve sonuç
+kod/arama tablosu ile tüm satırlara yayılır.
+"""
+
+import logging
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Türkçe sayı sözcükleri -> yıl sırası
+YEAR_WORDS: Dict[str, int] = {
+    'bir': 1, 'iki': 2, 'uc': 3, 'dort': 4, 'bes': 5, 'alti': 6,
+    'yedi': 7, 'sekiz': 8, 'dokuz': 9, 'on': 10, 'onbir': 11, 'oniki': 12,
+    'onuc': 13, 'ondort': 14, 'onbes': 15, 'onalti': 16, 'onyedi': 17,
+    'onsekiz': 18, 'ondokuz': 19, 'yirmi': 20, 'yirmibir': 21, 'yirmiiki': 22,
+    'yirmiuc': 23, 'yirmidort': 24, 'yirmibes': 25, 'yirmialti': 26, 'yirmiyedi': 27,
+    'yirmisekiz': 28, 'yirmidokuz': 29, 'otuz': 30, 'otuzbir': 31, 'otuziki': 32
+}
+
+# 'YR' önekinden sonra rakamla yazılmış sıralar (YR1, YR2 ... YR99)
+YEAR_SUFFIXES: Dict[str, int] = {**YEAR_WORDS, **{str(i): i for i in range(1, 100)}}
+
+
+def decode_year_label(label: Any) -> int:
+    """
+    Tek bir yıl etiketini sayısal değere dönüştürür.
+
+    Args:
+        label: Sütun etiketi ('YRbir', 'YR 5', '1990', 'Y1990', '1990_y' veya sayı)
+
+    Returns:
+        int: Yıl değeri, dönüştürülemezse 0
+    """
+    try:
+        if isinstance(label, str) and label.startswith('YR'):
+            suffix = label[2:].strip().lower()
+            return YEAR_SUFFIXES.get(suffix, 0)
+        elif isinstance(label, str) and label.isdigit():
+            # Doğrudan yıl değeri olabilir
+            return int(label)
+        elif isinstance(label, (int, float, np.integer, np.floating)):
+            # Zaten sayısal bir değer
+            return int(label)
+        # Desen arama: "Y1990" gibi formatlar
+        elif isinstance(label, str) and len(label) > 1 and label[0] in ['Y', 'y'] and label[1:].isdigit():
+            return int(label[1:])
+        # Diğer desenler: "1990y" veya "1990_y" gibi formatlar
+        elif isinstance(label, str):
+            digits = ''.join(c for c in label if c.isdigit())
+            if digits:
+                return int(digits)
+
+        logger.warning(f"'{label}' yıl değeri dönüştürülemedi")
+        return 0
+    except Exception as e:
+        logger.error(f"Yıl dönüştürme hatası ({label}): {str(e)}")
+        return 0
+
+
+def decode_year_labels(labels: pd.Series) -> np.ndarray:
+    """
+    Etiket dizisini, her farklı etiketi yalnızca bir kez çözerek yıllara dönüştürür.
+
+    Etiketler kategori kodlarına ayrılır, kategoriler decode_year_label ile
+    çözülür ve sonuç kodlar üzerinden tek bir dizi indekslemesiyle yayılır.
+    Boş etiketler 0'a çözülür.
+
+    Args:
+        labels: Yıl etiketleri (ör. uzun formattaki YR_label sütunu). Kategorik
+                sütunlarda mevcut kodlar doğrudan kullanılır
+
+    Returns:
+        np.ndarray: int64 yıl dizisi
+    """
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        codes, categories = labels.cat.codes.to_numpy(), labels.cat.categories
+    else:
+        codes, categories = pd.factorize(labels, use_na_sentinel=True)
+    # Sondaki 0, -1 kodlu (boş) etiketlerin 0'a çözülmesini sağlar
+    lookup = np.array([decode_year_label(label) for label in categories] + [0], dtype=np.int64)
+    return lookup[codes]
@@ -0,0 +1,71 @@
+"""
+Karşılaştırma betiklerinin ortak yardımcıları
+
+Betikler depo kökünü sys.path'e eklediğinden bu modül `benchmarks._common`
+olarak içe aktarılır.
+"""
+
+import time
+from typing import Callable, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.utils.year_labels import YEAR_WORDS
+
+# Gerçek dosyadaki gibi 26 yıl, biri sonunda boşluklu
+YEAR_COLUMNS = [f"YR{word}" for word in list(YEAR_WORDS)[:26]]
+YEAR_COLUMNS[7] = YEAR_COLUMNS[7] + ' '
+N_COUNTRIES = 250
+
+
+def synthetic_frame(n_indicators: int, n_countries: int = N_COUNTRIES, seed: int = 42) -> pd.DataFrame:
+    """
+    Geniş formatta (gösterge × ülke satırlık) sentetik World Bank benzeri veri üretir.
+
+    Args:
+        n_indicators: Gösterge (Series Code) sayısı
+        n_countries: Gösterge başına ülke sayısı
+        seed: Rastgele sayı üreteci tohumu
+
+    Returns:
+        pd.DataFrame: n_indicators * n_countries satır, kimlik sütunları ve YEAR_COLUMNS
+    """
+    rng = np.random.default_rng(seed)
+    n_rows = n_indicators * n_countries
+    frame = pd.DataFrame({
+        'Series Name': [f"Indicator {i // n_countries}" for i in range(n_rows)],
+        'Series Code': [f"IND.{i // n_countries:04d}" for i in range(n_rows)],
+        'Country Name': [f"Country {i % n_countries}" for i in range(n_rows)],
+        'Country Code': [f"C{i % n_countries:03d}" for i in range(n_rows)],
+    })
+    values = rng.uniform(0, 100, size=(n_rows, len(YEAR_COLUMNS))).round(4)
+    return pd.concat([frame, pd.DataFrame(values, columns=YEAR_COLUMNS)], axis=1)
+
+
+def time_calls(func: Callable, repeat: int, items: Optional[Iterable] = None, scale: float = 1e6) -> List[float]:
+    """
+    func çağrısının süresini repeat kez ölçer.
+
+    Args:
+        func: Ölçülecek fonksiyon
+        repeat: Tekrar (tur) sayısı
+        items: Verilirse her turda func her eleman için bir kez çağrılır ve
+            süre eleman başına ortalamadır; None ise func argümansız çağrılır
+        scale: Saniyeden çevirme çarpanı (1e6: µs, 1e3: ms)
+
+    Returns:
+        List[float]: Her turun süresi
+    """
+    items = None if items is None else list(items)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if items is None:
+            func()
+        else:
+            for item in items:
+                func(item)
+        elapsed = (time.perf_counter() - start) * scale
+        timings.append(elapsed / len(items) if items else elapsed)
+    return timings
@@ -0,0 +1,55 @@
+"""
+Toplu Model Eğitimi Ölçeklenmesi
+
+Tüm ülkelerin modellerini DataService.train_all_models() ile farklı worker
+sayılarında eğitir; süreyi, tek worker'a göre hızlanmayı ve verimliliği
+(hızlanma / worker) raporlar. Tek worker satırı havuz kurulmadan, önceki
+sıralı eğitimle aynı biçimde bu süreçte çalışır.
+
+Kullanım:
+    python benchmarks/bench_bulk_training.py [--data CSV_YOLU] [--workers 1 2 4 8] [--countries N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+
+DEFAULT_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'yenilenebilirenerjikaynaklarituketimi.csv'
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Toplu model eğitimi ölçeklenmesi")
+    parser.add_argument('--data', default=DEFAULT_DATA, help="Kaynak CSV dosyası")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help="Denenecek worker sayıları")
+    parser.add_argument('--countries', type=int, default=None, help="Eğitilecek ülke sayısı (varsayılan tümü)")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    service = DataService(args.data)
+    countries = service.countries[:args.countries] if args.countries else list(service.countries)
+
+    print(f"{len(countries)} ülke, {os.cpu_count()} çekirdek")
+    print(f"{'Worker':>8}{'süre (sn)':>12}{'hızlanma':>11}{'verim':>9}{'başarısız':>11}")
+    baseline = None
+    for workers in args.workers:
+        service.models.clear()
+        start = time.perf_counter()
+        # Tek worker'da süre sınırı kapatılır; görevler havuz kurulmadan sırayla çalışır
+        result = service.train_all_models(countries, workers=workers, timeout=None if workers == 1 else 600)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"{workers:>8}{elapsed:>12.2f}{speedup:>10.2f}x{speedup / workers:>9.2f}{result['failed']:>11}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Ülke Sorgusu Gecikme Karşılaştırması
+
+Bir ülkenin zaman serisini uzun formattaki veriyi filtreleyerek almak
+(önceki yöntem) ile ülke × yıl küpünden satır görünümü olarak almak
+arasındaki farkı ve get_country_data() gecikmesini ölçer.
+
+Kullanım:
+    python benchmarks/bench_country_lookup.py [--data CSV_YOLU] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from benchmarks._common import time_calls  # noqa: E402
+
+DEFAULT_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'yenilenebilirenerjikaynaklarituketimi.csv'
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ülke sorgusu gecikme karşılaştırması")
+    parser.add_argument('--data', default=DEFAULT_DATA, help="Kaynak CSV dosyası")
+    parser.add_argument('--repeat', type=int, default=5, help="Tekrar sayısı")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    service = DataService(args.data)
+    countries = service.get_countries()
+    melted = service.melted_data
+
+    def melted_scan(country):
+        return melted[melted['Country Name'] == country].copy().sort_values('Year')
+
+    rows = [
+        ('Uzun format taraması', time_calls(melted_scan, args.repeat, countries)),
+        ('Küp satır görünümü', time_calls(service.store.series, args.repeat, countries)),
+        ('get_country_data()', time_calls(service.get_country_data, args.repeat, countries)),
+    ]
+
+    print(f"{len(countries)} ülke, {len(service.store.years)} yıl")
+    print(f"{'Yol':<28}{'medyan (µs)':>14}{'min (µs)':>12}")
+    for name, timings in rows:
+        print(f"{name:<28}{statistics.median(timings):>14.1f}{min(timings):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Ülke Tarama Sorgusu Gecikmesi
+
+"Son yılda değeri 40'ın üzerinde ve 5 yıllık trendi negatif olan ülkeler"
+taramasını her ülke için get_country_data() çağırarak (önceki yöntem) ve
+önceden hesaplanmış diziler üzerinde boolean maskelerle (query_countries)
+çalıştırmanın süresini karşılaştırır. Maske/sıralama hesabının kendisi
+(JSON'a hazırlık hariç) ayrıca raporlanır.
+
+Kullanım:
+    python benchmarks/bench_country_query.py [--data CSV_YOLU] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from app.utils import country_query  # noqa: E402
+from benchmarks._common import time_calls  # noqa: E402
+
+DEFAULT_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'yenilenebilirenerjikaynaklarituketimi.csv'
+)
+
+FILTERS = 'value>40, trend<0'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ülke tarama sorgusu gecikmesi")
+    parser.add_argument('--data', default=DEFAULT_DATA, help="Kaynak CSV dosyası")
+    parser.add_argument('--repeat', type=int, default=50, help="Tekrar sayısı")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    service = DataService(args.data)
+    countries = service.get_countries()
+
+    def per_country():
+        # Önceki yöntem: her ülkenin verisi tek tek alınıp istemci tarafında süzülür
+        matches = []
+        for country in countries:
+            try:
+                stats = service.get_country_data(country)['stats']
+            except ValueError:
+                continue
+            if stats['last_value'] > 40 and stats['trend'] < 0:
+                matches.append(country)
+        return sorted(matches)
+
+    result = service.query_countries(FILTERS, limit=len(countries))
+    columns = service.aggregate_cache[(f"query_columns:{service._year_column(service.store)}",
+                                       service.default_indicator, None)]
+    conditions = country_query.parse_filters(FILTERS)
+
+    rows = [
+        ('get_country_data() döngüsü', time_calls(per_country, max(args.repeat // 10, 1))),
+        ('query_countries()', time_calls(lambda: service.query_countries(FILTERS, limit=20), args.repeat)),
+        ('maske + sıralama', time_calls(lambda: country_query.select(columns, conditions, 'value', True, 0, 20),
+                                        args.repeat)),
+    ]
+
+    print(f"{len(countries)} ülke, '{FILTERS}' -> {result['total']} eşleşme ({result['year']} yılı)")
+    print(f"{'Yol':<30}{'medyan (µs)':>14}{'min (µs)':>12}")
+    for name, timings in rows:
+        print(f"{name:<30}{statistics.median(timings):>14.1f}{min(timings):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Ülke İstatistikleri Gecikme Karşılaştırması
+
+get_country_data() istatistiklerini her istekte ülke serisinden yeniden
+hesaplamak (önceki yöntem) ile yüklemede tek geçişte hazırlanan istatistik
+tablosundan okumak arasındaki istek başına gecikmeyi ölçer. Tablonun
+oluşturulma süresi de raporlanır.
+
+Kullanım:
+    python benchmarks/bench_country_stats.py [--data CSV_YOLU] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from app.utils.country_store import CountryStatsTable, to_float64  # noqa: E402
+from benchmarks._common import time_calls  # noqa: E402
+
+DEFAULT_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'yenilenebilirenerjikaynaklarituketimi.csv'
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ülke istatistikleri gecikme karşılaştırması")
+    parser.add_argument('--data', default=DEFAULT_DATA, help="Kaynak CSV dosyası")
+    parser.add_argument('--repeat', type=int, default=5, help="Tekrar sayısı")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    service = DataService(args.data)
+    countries = service.get_countries()
+    store = service.store
+
+    def per_request(country):
+        # Önceki get_country_data(): istatistikler ve trend her istekte yeniden hesaplanır
+        years, values = store.series(country)
+        values = to_float64(values)
+        stats = {
+            'min': float(np.nanmin(values)),
+            'max': float(np.nanmax(values)),
+            'mean': float(values.mean()),
+            'median': float(np.median(values)),
+            'std': float(values.std(ddof=1)) if len(values) > 1 else np.nan,
+            'last_value': float(values[-1]),
+            'years': years.tolist(),
+            'values': values.tolist(),
+            'trend': service._trend_from_values(values)
+        }
+        return stats, {str(float(year)): value for year, value in zip(stats['years'], stats['values'])}
+
+    start = time.perf_counter()
+    CountryStatsTable(store.values, store.years)
+    build_ms = (time.perf_counter() - start) * 1e3
+
+    rows = [
+        ('İstek başına hesaplama', time_calls(per_request, args.repeat, countries)),
+        ('get_country_data() (tablo)', time_calls(service.get_country_data, args.repeat, countries)),
+    ]
+
+    print(f"{len(countries)} ülke, {len(store.years)} yıl, tablo oluşturma {build_ms:.1f} ms")
+    print(f"{'Yol':<30}{'medyan (µs)':>14}{'min (µs)':>12}")
+    for name, timings in rows:
+        print(f"{name:<30}{statistics.median(timings):>14.1f}{min(timings):>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Modül İçe Aktarma Süresi Profili
+
+Verilen modülleri temiz bir Python sürecinde `-X importtime` ile içe aktarır
+ve modül başına kümülatif içe aktarma süresini raporlar. Worker başlatma
+süresini etkileyen ağır bağımlılıkların (scikit-learn, XGBoost, matplotlib,
+seaborn) başlangıçta yüklenip yüklenmediği de gösterilir.
+
+Kullanım:
+    python benchmarks/bench_import_time.py [--modules app.data_service app.data_viewmodel] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+DEFAULT_MODULES = ['app.service_container', 'app.data_service', 'app.data_viewmodel', 'app.routes.api']
+
+# Yalnızca eğitim/çizim sırasında gerekmesi beklenen bağımlılıklar
+HEAVY_PACKAGES = ['sklearn', 'scipy', 'xgboost', 'matplotlib', 'seaborn', 'joblib']
+
+
+def profile_import(module: str) -> List[Tuple[str, int, int]]:
+    """
+    Modülü ayrı bir süreçte içe aktarır ve importtime çıktısını ayrıştırır.
+
+    Args:
+        module: İçe aktarılacak modül adı
+
+    Returns:
+        List[Tuple[str, int, int]]: (modül, kendi süresi µs, kümülatif süre µs)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{module} içe aktarılamadı:\n{result.stderr.strip().splitlines()[-1]}")
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _loaded_heavy_packages(rows: List[Tuple[str, int, int]]) -> Dict[str, int]:
+    """Yüklenen ağır paketleri ve kümülatif sürelerini döndürür."""
+    loaded = {}
+    for name, _, cumulative in rows:
+        if name in HEAVY_PACKAGES:
+            loaded[name] = cumulative
+    return loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Modül içe aktarma süresi profili")
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES, help="Profillenecek modüller")
+    parser.add_argument('--top', type=int, default=15, help="Gösterilecek en yavaş modül sayısı")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        rows = profile_import(module)
+        total_ms = next(cumulative for name, _, cumulative in rows if name == module) / 1000
+
+        print(f"\n{module}: toplam {total_ms:.1f} ms, {len(rows)} modül yüklendi")
+        heavy = _loaded_heavy_packages(rows)
+        if heavy:
+            print("  Başlangıçta yüklenen ağır paketler: " +
+                  ", ".join(f"{name} ({us / 1000:.1f} ms)" for name, us in heavy.items()))
+        else:
+            print("  Başlangıçta ağır paket yüklenmedi")
+
+        print(f"  {'kümülatif (ms)':>15}{'kendi (ms)':>12}  modül")
+        for name, self_us, cumulative_us in sorted(rows, key=lambda row: row[2], reverse=True)[:args.top]:
+            print(f"  {cumulative_us / 1000:>15.1f}{self_us / 1000:>12.1f}  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Gösterge Sayısına Göre Sorgu Gecikmesi
+
+Sentetik çok göstergeli dosyalarda (yüzlerce Series Code × ülke) gösterge
+sayısı arttıkça get_country_data() gecikmesinin sabit kaldığını gösterir.
+
+Kullanım:
+    python benchmarks/bench_indicators.py [--indicators 1 50 200 500] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from benchmarks._common import N_COUNTRIES, synthetic_frame, time_calls  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Gösterge sayısına göre sorgu gecikmesi")
+    parser.add_argument('--indicators', type=int, nargs='+', default=[1, 50, 200, 500],
+                        help="Sentetik dosyalardaki gösterge sayıları")
+    parser.add_argument('--repeat', type=int, default=5, help="Tekrar sayısı")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'Gösterge':>9}{'Satır':>9}{'Yükleme (ms)':>14}{'Sorgu medyan (µs)':>20}")
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        for n_indicators in args.indicators:
+            csv_path = os.path.join(work_dir, f"indicators_{n_indicators}.csv")
+            synthetic_frame(n_indicators).to_csv(csv_path, index=False)
+
+            start = time.perf_counter()
+            service = DataService(csv_path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            # Son göstergenin ülkeleri sorgulanır - tarama olsaydı en pahalı durum bu olurdu
+            indicator = list(service.stores)[-1]
+            countries = service.stores[indicator].countries
+            timings = time_calls(lambda country: service.get_country_data(country, indicator=indicator),
+                                 args.repeat, countries)
+
+            print(f"{n_indicators:>9}{n_indicators * N_COUNTRIES:>9}{load_ms:>14.1f}"
+                  f"{statistics.median(timings):>20.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Yıl Etiketi Çözme Karşılaştırması
+
+Sentetik geniş formattaki veri dosyalarında (binlerce seri × ülke satırı)
+yıl etiketlerini satır başına Series.apply ile çözmek (önceki yöntem) ile
+farklı etiket başına bir kez çözüp kodlar üzerinden yaymak arasındaki farkı,
+ayrıca tüm DataService yükleme süresini ölçer.
+
+Kullanım:
+    python benchmarks/bench_melt.py [--rows 1000 10000 50000] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from app.utils.year_labels import decode_year_label, decode_year_labels  # noqa: E402
+from benchmarks._common import N_COUNTRIES, YEAR_COLUMNS, synthetic_frame, time_calls  # noqa: E402
+
+
+def _median_ms(func, repeat: int) -> float:
+    """func'ı repeat kez çalıştırır ve medyan süreyi (ms) döndürür."""
+    return statistics.median(time_calls(func, repeat, scale=1e3))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Yıl etiketi çözme karşılaştırması")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 50000],
+                        help="Sentetik dosyaların satır sayıları")
+    parser.add_argument('--repeat', type=int, default=3, help="Tekrar sayısı")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'Satır':>8}{'Uzun satır':>12}{'apply (ms)':>13}{'kod/tablo (ms)':>16}"
+          f"{'Hızlanma':>10}{'Yükleme (ms)':>14}")
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        for n_rows in args.rows:
+            # Gösterge sayısı yukarı yuvarlanır, fazla satırlar kesilir
+            wide = synthetic_frame(-(-n_rows // N_COUNTRIES)).iloc[:n_rows]
+            labels = wide.melt(id_vars=list(wide.columns[:4]), var_name='YR_label')['YR_label']
+
+            per_row = _median_ms(lambda: labels.apply(decode_year_label), args.repeat)
+            codes = np.repeat(np.arange(len(YEAR_COLUMNS), dtype=np.int32), n_rows)
+            categorical = pd.Series(pd.Categorical.from_codes(codes, categories=YEAR_COLUMNS))
+            per_label = _median_ms(lambda: decode_year_labels(categorical), args.repeat)
+
+            csv_path = os.path.join(work_dir, f"synthetic_{n_rows}.csv")
+            wide.to_csv(csv_path, index=False)
+            load = _median_ms(lambda: DataService(csv_path), args.repeat)
+
+            print(f"{n_rows:>8}{len(labels):>12}{per_row:>13.1f}{per_label:>16.1f}"
+                  f"{per_row / per_label:>9.1f}x{load:>14.1f}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Uzun Format (melted_data) Bellek Kullanımı
+
+Kompakt uzun formatın (kategorik metin sütunları, float32 değerler, int16
+yıllar, saklanmayan LogValue) satır başına bellek kullanımını önceki düzenle
+(her satırda object metinler, float64 değer ve LogValue, int64 yıl) karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_melted_memory.py [--data CSV_YOLU]
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from app.utils.country_store import log_value, to_float64  # noqa: E402
+
+DEFAULT_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'yenilenebilirenerjikaynaklarituketimi.csv'
+)
+
+
+def _legacy_layout(compact: pd.DataFrame) -> pd.DataFrame:
+    """Kompakt çerçeveyi önceki düzene (object metinler, float64, int64, LogValue) çevirir."""
+    legacy = pd.DataFrame({
+        column: compact[column].astype(object)
+        for column in compact.columns if isinstance(compact[column].dtype, pd.CategoricalDtype)
+    })
+    legacy['Renewable_Value'] = to_float64(compact['Renewable_Value'].to_numpy())
+    legacy['Year'] = compact['Year'].astype(np.int64)
+    legacy['LogValue'] = log_value(compact)
+    return legacy
+
+
+def _column_bytes(column: pd.Series) -> int:
+    """
+    Sütunun gerçek bellek kullanımı.
+
+    memory_usage(deep=True) aynı metin nesnesine işaret eden her satırı ayrıca
+    sayar; burada object sütunlar için satır başına işaretçi ve her farklı
+    nesne bir kez sayılır.
+    """
+    if column.dtype != object:
+        return int(column.memory_usage(deep=True, index=False))
+    unique_objects = {id(value): value for value in column.to_numpy()}
+    return column.to_numpy().nbytes + sum(sys.getsizeof(value) for value in unique_objects.values())
+
+
+def _column_report(frame: pd.DataFrame) -> dict:
+    """Sütun başına satır başı bayt sayısını döndürür."""
+    return {column: _column_bytes(frame[column]) / len(frame) for column in frame.columns}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="melted_data satır başına bellek kullanımı")
+    parser.add_argument('--data', default=DEFAULT_DATA, help="Kaynak CSV dosyası")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    compact = DataService(args.data).melted_data
+    legacy = _legacy_layout(compact)
+
+    before = _column_report(legacy)
+    after = _column_report(compact)
+
+    print(f"{len(compact)} satır")
+    print(f"{'Sütun':<16}{'önce (B/satır)':>16}{'sonra (B/satır)':>17}")
+    for column in legacy.columns:
+        print(f"{column:<16}{before[column]:>16.1f}{after.get(column, 0.0):>17.1f}")
+    print(f"{'Toplam':<16}{sum(before.values()):>16.1f}{sum(after.values()):>17.1f}")
+    print(f"Küçülme: {sum(before.values()) / sum(after.values()):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Worker'lar Arası Paylaşılan Veri Seti Bellek Karşılaştırması
+
+N worker süreci aynı anda başlatılır; her worker veri setini ya kendi özel
+kopyası olarak (CSV ayrıştırma) ya da paylaşılan bellek eşlemeli dosyalara
+bağlanarak yükler ve tüm değer matrisini okur. Tüm worker'lar ayaktayken
+/proc/<pid>/smaps_rollup üzerinden worker başına özel bellek (Private) ve
+orantılı bellek (PSS) ölçülür. Yalnızca Linux'ta çalışır.
+
+Kullanım:
+    python benchmarks/bench_shared_memory.py [--rows 200000] [--workers 4]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_streaming import _write_synthetic  # noqa: E402
+
+
+def _child(path: str, shared: bool) -> None:
+    """Veri setini yükler, değerleri okur, hazır olduğunu bildirir ve ölçülene kadar bekler."""
+    from app.data_service import DataService
+
+    logging.disable(logging.CRITICAL)
+    service = DataService(path, shared_dataset=shared)
+    total = sum(float(store.values.sum(dtype='float64')) for store in service.stores.values())
+    print(f"ready {total:.0f}", flush=True)
+    sys.stdin.readline()
+
+
+def _memory_kb(pid: int) -> dict:
+    """smaps_rollup içinden Pss ve özel bellek (kB) değerlerini okur."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as handle:
+        for line in handle:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(':')] = int(parts[1])
+    return {
+        'pss': fields.get('Pss', 0),
+        'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    }
+
+
+def _measure(path: str, workers: int, shared: bool) -> dict:
+    """N worker başlatır, hepsi hazır olunca belleklerini ölçer ve sonlandırır."""
+    command = [sys.executable, os.path.abspath(__file__), '--child', path]
+    if shared:
+        command.append('--shared')
+        # Veri seti ana süreçte (gunicorn preload gibi) bir kez yayınlanır
+        subprocess.check_call(command[:-1] + ['--publish'], cwd=tempfile.gettempdir())
+
+    processes = [
+        subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, cwd=tempfile.gettempdir())
+        for _ in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.stdout.readline()
+        samples = [_memory_kb(process.pid) for process in processes]
+    finally:
+        for process in processes:
+            process.communicate('\n')
+    return {
+        'pss_mb': sum(sample['pss'] for sample in samples) / 1024,
+        'private_mb': sum(sample['private'] for sample in samples) / 1024 / workers
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Özel / paylaşılan veri seti bellek karşılaştırması")
+    parser.add_argument('--rows', type=int, default=200000, help="Sentetik dosyanın satır sayısı")
+    parser.add_argument('--workers', type=int, default=4, help="Eşzamanlı worker sayısı")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    parser.add_argument('--shared', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--publish', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.publish:
+        from app.data_service import DataService
+
+        logging.disable(logging.CRITICAL)
+        DataService(args.child, shared_dataset=True)
+        return
+    if args.child:
+        _child(args.child, args.shared)
+        return
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(work_dir, 'wdi_synthetic.csv')
+        _write_synthetic(path, args.rows)
+        private = _measure(path, args.workers, shared=False)
+        shared = _measure(path, args.workers, shared=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"{args.rows} satır, {args.workers} worker")
+    print(f"{'Yol':<28}{'toplam PSS (MB)':>18}{'worker başı özel (MB)':>24}")
+    print(f"{'Özel kopya':<28}{private['pss_mb']:>18.1f}{private['private_mb']:>24.1f}")
+    print(f"{'Paylaşılan (mmap)':<28}{shared['pss_mb']:>18.1f}{shared['private_mb']:>24.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+DataService Başlatma Süresi Karşılaştırması
+
+Soğuk başlatma (CSV ayrıştırma + ön işleme + melt) ile anlık görüntüden
+sıcak başlatma sürelerini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_startup.py [--data CSV_YOLU] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.data_service import DataService  # noqa: E402
+from benchmarks._common import time_calls  # noqa: E402
+
+DEFAULT_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'yenilenebilirenerjikaynaklarituketimi.csv'
+)
+
+
+def _time_startup(data_path: str, use_snapshot: bool, repeat: int) -> list:
+    """Servisi repeat kez oluşturur ve her başlatmanın süresini (ms) döndürür."""
+    return time_calls(lambda: DataService(data_path, use_snapshot=use_snapshot), repeat, scale=1e3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DataService soğuk/sıcak başlatma karşılaştırması")
+    parser.add_argument('--data', default=DEFAULT_DATA, help="Kaynak CSV dosyası")
+    parser.add_argument('--repeat', type=int, default=5, help="Her yol için tekrar sayısı")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+
+    # Gerçek veri dizinini kirletmemek için CSV'yi geçici bir dizine kopyala
+    work_dir = tempfile.mkdtemp()
+    try:
+        data_path = os.path.join(work_dir, os.path.basename(args.data))
+        shutil.copyfile(args.data, data_path)
+
+        cold = _time_startup(data_path, use_snapshot=False, repeat=args.repeat)
+
+        # İlk çağrı anlık görüntüyü oluşturur, sonraki çağrılar ondan başlar
+        DataService(data_path, use_snapshot=True)
+        warm = _time_startup(data_path, use_snapshot=True, repeat=args.repeat)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"{'Yol':<28}{'medyan (ms)':>14}{'min (ms)':>12}")
+    print(f"{'CSV (soğuk başlatma)':<28}{statistics.median(cold):>14.2f}{min(cold):>12.2f}")
+    print(f"{'Anlık görüntü (sıcak)':<28}{statistics.median(warm):>14.2f}{min(warm):>12.2f}")
+    print(f"Hızlanma: {statistics.median(cold) / statistics.median(warm):.1f}x")
+
+
+if __name__ == '__main__':
+    main()
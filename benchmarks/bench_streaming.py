@@ -0,0 +1,106 @@
+"""
+Akışlı Yükleme Bellek Karşılaştırması
+
+Sentetik büyük bir World Bank benzeri dosyayı toplu yükleme (tüm CSV tek
+seferde) ve bellek tavanlı akışlı yükleme ile açar; her yolu ayrı bir alt
+süreçte çalıştırıp en yüksek bellek kullanımını (RSS) ve süreyi raporlar.
+
+Kullanım:
+    python benchmarks/bench_streaming.py [--rows 200000] [--limit-mb 64]
+"""
+
+import argparse
+import json
+import logging
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from app.utils.year_labels import YEAR_WORDS  # noqa: E402
+
+YEAR_COLUMNS = [f"YR{word}" for word in list(YEAR_WORDS)[:26]]
+N_COUNTRIES = 250
+
+
+def _write_synthetic(path: str, n_rows: int, seed: int = 42) -> None:
+    """n_rows satırlık çok göstergeli sentetik dosyayı parça parça yazar."""
+    rng = np.random.default_rng(seed)
+    block = 50000
+    for start in range(0, n_rows, block):
+        index = np.arange(start, min(start + block, n_rows))
+        frame = pd.DataFrame({
+            'Series Name': [f"Indicator {i // N_COUNTRIES} - uzun gösterge açıklaması" for i in index],
+            'Series Code': [f"IND.{i // N_COUNTRIES:05d}" for i in index],
+            'Country Name': [f"Country {i % N_COUNTRIES}" for i in index],
+            'Country Code': [f"C{i % N_COUNTRIES:03d}" for i in index],
+        })
+        values = rng.uniform(0, 100, size=(len(index), len(YEAR_COLUMNS))).round(6)
+        values[rng.random(values.shape) < 0.1] = np.nan
+        frame = pd.concat([frame, pd.DataFrame(values, columns=YEAR_COLUMNS)], axis=1)
+        frame.to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+
+
+def _child(path: str, limit_mb: float) -> None:
+    """Alt süreçte servisi oluşturur ve sonucu JSON olarak yazar."""
+    from app.data_service import DataService
+
+    logging.disable(logging.CRITICAL)
+    start = time.perf_counter()
+    service = DataService(path, memory_limit_mb=limit_mb or None)
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        'seconds': elapsed,
+        'peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'indicators': len(service.stores)
+    }))
+
+
+def _run(path: str, limit_mb: float) -> dict:
+    """Ölçümü ayrı bir süreçte çalıştırır (en yüksek RSS süreç başına ölçülür)."""
+    output = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), '--child', path, '--limit-mb', str(limit_mb)],
+        cwd=tempfile.gettempdir()
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Toplu / akışlı yükleme bellek karşılaştırması")
+    parser.add_argument('--rows', type=int, default=200000, help="Sentetik dosyanın satır sayısı")
+    parser.add_argument('--limit-mb', type=float, default=64, help="Akışlı yükleme bellek tavanı (MB)")
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.limit_mb)
+        return
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(work_dir, 'wdi_synthetic.csv')
+        _write_synthetic(path, args.rows)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+
+        batch = _run(path, 0)
+        streamed = _run(path, args.limit_mb)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(f"Dosya: {args.rows} satır, {size_mb:.1f} MB, {batch['indicators']} gösterge")
+    print(f"{'Yol':<32}{'süre (s)':>10}{'en yüksek RSS (MB)':>20}")
+    print(f"{'Toplu yükleme':<32}{batch['seconds']:>10.1f}{batch['peak_mb']:>20.1f}")
+    print(f"{f'Akışlı yükleme ({args.limit_mb:g} MB tavan)':<32}{streamed['seconds']:>10.1f}{streamed['peak_mb']:>20.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -23,6 +23,7 @@ class DataService:
         Veri setlerini yükler ve temel işlemler için hazırlar
         """
         self.data = None
+        self._country_index = None
         self.load_data()
         logger.info("DataService başlatıldı.")
     
@@ -37,6 +38,7 @@ class DataService:
                 return False
             
             self.data = pd.read_csv(file_path)
+            self._country_index = None
             logger.info(f"Veri başarıyla yüklendi. Satır sayısı: {len(self.data)}")
             
             # Sütun isimlerini kontrol et
@@ -141,6 +143,32 @@ class DataService:
             logger.error(f"Ülke verisi alınırken hata: {str(e)}")
             return None
     
+    def _country_rows(self, country_name):
+        """
+        Ülkenin satırlarının (ülke, yıl) sırasına göre dizilmiş veri içindeki aralığını döndürür
+        
+        Sıralı kopya ve ülke -> satır aralığı sözlüğü ilk çağrıda bir kez oluşturulur.
+        
+        Args:
+            country_name (str): Ülke adı
+            
+        Returns:
+            tuple: (satır aralığı, ülkenin artan sıralı yılları)
+        """
+        if self._country_index is None:
+            frame = self.data.dropna(subset=['Year']).sort_values(['Country', 'Year'], kind='stable')
+            frame = frame.reset_index(drop=True)
+            countries = frame['Country'].to_numpy()
+            starts = np.flatnonzero(np.r_[True, countries[1:] != countries[:-1]]) if len(countries) else []
+            bounds = list(starts) + [len(countries)]
+            self._country_index = {
+                'frame': frame,
+                'years': frame['Year'].to_numpy(),
+                'rows': {countries[start]: range(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])}
+            }
+        rows = self._country_index['rows'].get(country_name, range(0))
+        return rows, self._country_index['years'][rows.start:rows.stop]
+    
     def get_country_metrics(self, country_name, metric, start_year, end_year):
         """
         Belirli bir ülkenin belirli bir metrik için yıllara göre verilerini döndürür
@@ -186,19 +214,16 @@ class DataService:
                 logger.warning(f"Metrik bulunamadı: {metric}")
                 return None
             
-            # Ülke ve yıl aralığına göre verileri filtrele
-            filtered_data = self.data[
-                (self.data['Country'] == country_name) & 
-                (self.data['Year'] >= start_year) & 
-                (self.data['Year'] <= end_year)
-            ]
+            # Ülkenin satırları yıla göre sıralı bir blokta; aralık ikili aramayla bulunur
+            rows, years = self._country_rows(country_name)
+            lo = rows.start + int(np.searchsorted(years, start_year, side='left'))
+            hi = rows.start + int(np.searchsorted(years, end_year, side='right'))
+            values = self._country_index['frame'][column_name].to_numpy()[lo:hi]
             
-            # Sonuçları yapılandır
+            # Sonuçları yapılandır (aynı yıl birden fazla kez geçerse son satır kullanılır)
             result = {}
-            for _, row in filtered_data.iterrows():
-                year = int(row['Year'])
-                value = row[column_name]
-                result[year] = float(value) if pd.notna(value) else None
+            for year, value in zip(self._country_index['years'][lo:hi].tolist(), values.tolist()):
+                result[int(year)] = float(value) if pd.notna(value) else None
             
             # Yılları sırala
             result = {year: result.get(year) for year in range(start_year, end_year + 1)}
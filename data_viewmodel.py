@@ -2,6 +2,8 @@ import numpy as np
 import pandas as pd
 import logging
 from data_service import DataService
+from app.service_container import resolve
+from app.utils import trends
 
 # Logger tanımlanması
 logger = logging.getLogger(__name__)
@@ -20,9 +22,9 @@ class DataViewModel:
         """
         DataViewModel sınıfının yapıcı metodu
         Args:
-            data_service (DataService, optional): Veri servisi örneği
+            data_service (DataService, optional): Veri servisi örneği. None ise paylaşılan örnek kullanılır
         """
-        self.data_service = data_service if data_service is not None else DataService()
+        self.data_service = data_service if data_service is not None else resolve('legacy_data_service', DataService)
         logger.info("DataViewModel başlatıldı.")
     
     def get_all_countries(self):
@@ -168,7 +170,8 @@ class DataViewModel:
                     'error': 'Verilen parametrelerle veri bulunamadı'
                 }
             
-            # İstatistikler hesapla
+            # İstatistikler hesapla (değişim oranları tüm ülkeler için tek geçişte)
+            change_rates = self._calculate_change_rates(countries_data)
             stats = {}
             for country, years_data in countries_data.items():
                 values = [v for v in years_data.values() if v is not None]
@@ -177,7 +180,7 @@ class DataViewModel:
                         'average': np.mean(values),
                         'min': np.min(values),
                         'max': np.max(values),
-                        'change_rate': self._calculate_change_rate(values),
+                        'change_rate': change_rates[country],
                         'std_dev': np.std(values)
                     }
             
@@ -206,24 +209,16 @@ class DataViewModel:
                 'error': str(e)
             }
     
-    def _calculate_change_rate(self, values):
+    def _calculate_change_rates(self, countries_data):
         """
-        Değerler listesi için değişim oranını hesaplar
+        Ülkelerin ilk ve son değerleri arasındaki değişim oranlarını tek geçişte hesaplar
         
         Args:
-            values (list): Hesaplanacak değerler listesi
+            countries_data (dict): Ülke adı -> {yıl: değer veya None}
             
         Returns:
-            float: Değişim oranı (yüzde olarak)
+            dict: Ülke adı -> değişim oranı (yüzde olarak)
         """
-        if len(values) < 2:
-            return 0
-        
-        first_value = values[0]
-        last_value = values[-1]
-        
-        if first_value == 0:
-            return float('inf') if last_value > 0 else 0
-        
-        change_rate = ((last_value - first_value) / first_value) * 100
-        return change_rate 
\ No newline at end of file
+        frame = pd.DataFrame.from_dict(countries_data, orient='index').sort_index(axis=1)
+        rates = trends.percent_change(frame.to_numpy(dtype=float), window=None, zero_start=float('inf'))
+        return {country: float(rate) for country, rate in zip(frame.index, rates)} 
\ No newline at end of file
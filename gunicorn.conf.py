@@ -0,0 +1,29 @@
+"""
+Gunicorn Yapılandırması
+
+Uygulama ana süreçte bir kez yüklenir (preload_app) ve veri seti bellek
+eşlemeli dosyalar olarak yayınlanır; fork edilen worker'lar değer
+matrislerini kopyalamadan, salt okunur olarak paylaşır.
+
+Kullanım:
+    gunicorn -c gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+# app.py içe aktarılmadan önce ayarlanmalı
+os.environ.setdefault('RENEWABLE_SHARED_DATASET', '1')
+
+wsgi_app = 'wsgi:app'
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', min(multiprocessing.cpu_count() * 2 + 1, 8)))
+preload_app = True
+timeout = 120
+
+
+def post_fork(server, worker):
+    """Ana süreçte başlatılan arka plan thread'lerini worker'da yeniden başlatır."""
+    from app import service_container
+
+    service_container.after_fork()
@@ -0,0 +1,21 @@
+"""
+WSGI Giriş Noktası
+
+`app` paketi kök dizindeki app.py ile aynı adı taşıdığından gunicorn
+`app:app` yolunu pakete çözer. Bu modül app.py dosyasını doğrudan yükleyip
+Flask uygulamasını `wsgi:app` olarak sunar.
+
+Kullanım:
+    gunicorn -c gunicorn.conf.py
+"""
+
+import importlib.util
+import os
+
+_spec = importlib.util.spec_from_file_location(
+    'app_main', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+)
+_module = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_module)
+
+app = _module.app